@@ -0,0 +1,399 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+import array
+import six
+import opentargets.model.fields as fields
+import opentargets.model.stream as stream
+import opentargets.model.eco as eco
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+"""
+Interned string column, enumerated values taking the first codes
+"""
+class _Strings(object):
+  kind = 'string'
+
+  def __init__(self, enum = None):
+    self.codes = array.array('l')
+    self.values = list(enum or [])
+    self.table = dict((value, code) for code, value in enumerate(self.values))
+
+  def intern(self, value):
+    code = self.table.get(value)
+    if code is None:
+      code = self.table[value] = len(self.values)
+      self.values.append(value)
+    return code
+
+  def append(self, value):
+    if value is None:
+      self.codes.append(-1)
+    elif isinstance(value, six.string_types):
+      self.codes.append(self.intern(value))
+    else:
+      self.codes.append(-1)
+      return False
+    return True
+
+  def get(self, row):
+    code = self.codes[row]
+    return None if code < 0 else self.values[code]
+
+"""
+Number column, integers being told apart from floats
+"""
+class _Numbers(object):
+  kind = 'number'
+
+  def __init__(self, enum = None):
+    self.values = array.array('d')
+    # 0 missing, 1 integer, 2 float
+    self.kinds = array.array('b')
+
+  def append(self, value):
+    if isinstance(value, six.integer_types) and not isinstance(value, bool):
+      self.values.append(value)
+      self.kinds.append(1)
+    elif isinstance(value, float):
+      self.values.append(value)
+      self.kinds.append(2)
+    else:
+      self.values.append(float('nan'))
+      self.kinds.append(0)
+      return value is None
+    return True
+
+  def get(self, row):
+    kind = self.kinds[row]
+    if kind == 0:
+      return None
+    return int(self.values[row]) if kind == 1 else self.values[row]
+
+class _Booleans(object):
+  kind = 'boolean'
+
+  def __init__(self, enum = None):
+    # -1 missing
+    self.values = array.array('b')
+
+  def append(self, value):
+    if isinstance(value, bool):
+      self.values.append(int(value))
+      return True
+    self.values.append(-1)
+    return value is None
+
+  def get(self, row):
+    value = self.values[row]
+    return None if value < 0 else bool(value)
+
+"""
+Array of strings column: items of row i are items[offsets[i]:offsets[i + 1]]
+"""
+class _StringLists(object):
+  kind = 'strings'
+
+  def __init__(self, enum = None):
+    self.offsets = array.array('l', [0])
+    self.present = array.array('b')
+    self.items = _Strings(enum)
+
+  def append(self, value):
+    if isinstance(value, list) and all(isinstance(item, six.string_types) for item in value):
+      self.items.codes.extend(self.items.intern(item) for item in value)
+      self.present.append(1)
+      ok = True
+    else:
+      self.present.append(0)
+      ok = value is None
+    self.offsets.append(len(self.items.codes))
+    return ok
+
+  def get(self, row):
+    if not self.present[row]:
+      return None
+    values = self.items.values
+    return [values[code] for code in self.items.codes[self.offsets[row]:self.offsets[row + 1]]]
+
+"""
+Enumerated array of strings column, e.g. evidence_codes, held as bitsets of
+registry codes; lists that a bitset does not give back, such as lists out
+of code order, are kept as they are
+"""
+class _Bitsets(object):
+  kind = 'bitset'
+
+  def __init__(self, registry):
+    self.registry = registry
+    self.values = array.array('Q')
+    self.present = array.array('b')
+    self.lists = dict()
+
+  def append(self, value):
+    if not isinstance(value, list):
+      self.present.append(0)
+      self.values.append(0)
+      return value is None
+    self.present.append(1)
+    if not all(isinstance(item, six.string_types) and item in self.registry for item in value):
+      # values outside the enumeration are kept aside, not registered
+      self.values.append(0)
+      return False
+    bits = self.registry.lookup(value)
+    if not self.registry.is_canonical(value):
+      self.lists[len(self.present) - 1] = list(value)
+    if isinstance(self.values, array.array) and bits >> 64:
+      # more than 64 codes registered
+      self.values = list(self.values)
+    self.values.append(bits)
+    return True
+
+  def get(self, row):
+    if not self.present[row]:
+      return None
+    if row in self.lists:
+      return self.lists[row]
+    return self.registry.decode(self.values[row])
+
+"""
+Column of JSON values kept as Python objects, arrays of objects being
+normalized through their class
+"""
+class _Values(object):
+  kind = 'json'
+
+  def __init__(self, item_class = None):
+    self.values = []
+    self.item_class = item_class
+
+  def append(self, value):
+    if self.item_class is not None and isinstance(value, list):
+      if not all(isinstance(item, dict) or hasattr(item, 'serialize') for item in value):
+        self.values.append(None)
+        return False
+      value = [(item if hasattr(item, 'serialize') else self.item_class.fromDict(item)).serialize() for item in value]
+    self.values.append(value)
+    return True
+
+  def get(self, row):
+    return self.values[row]
+
+_COLUMNS = {'string': _Strings, 'number': _Numbers, 'boolean': _Booleans}
+
+def _schema(cls, seen = ()):
+  """
+  Columns of a generated class: list of (name, column) and (name, schema)
+  pairs, the schema of a union merging the fields of its candidates
+  """
+  candidates = cls if isinstance(cls, tuple) else (cls,)
+  merged = []
+  names = dict()
+  for candidate in candidates:
+    for name, kind, enum in fields.class_fields(candidate):
+      if name in names:
+        previous = merged[names[name]]
+        if previous[1] == kind and enum:
+          merged[names[name]] = (name, kind, (previous[2] or []) + [value for value in enum if not value in (previous[2] or [])])
+        continue
+      names[name] = len(merged)
+      merged.append((name, kind, enum))
+  schema = []
+  for name, kind, enum in merged:
+    if isinstance(kind, six.string_types) and kind in _COLUMNS:
+      schema.append((name, _COLUMNS[kind](enum)))
+    elif kind == ['string'] and enum:
+      schema.append((name, _Bitsets(eco.ECO if name == 'evidence_codes' else eco.CodeRegistry(enum))))
+    elif kind == ['string']:
+      schema.append((name, _StringLists(enum)))
+    elif isinstance(kind, list):
+      item = kind[0][0] if isinstance(kind[0], tuple) else kind[0]
+      schema.append((name, _Values(item if isinstance(item, type) else None)))
+    elif isinstance(kind, (type, tuple)) and not kind in seen:
+      schema.append((name, _schema(kind, seen + (kind,))))
+    else:
+      schema.append((name, _Values()))
+  return {'present': array.array('b'), 'fields': schema}
+
+"""
+Evidence records of one class held as parallel columns
+"""
+class EvidenceBatch(object):
+  """
+  Each field of the class, nested objects flattened along the schema
+  (fields.class_fields), is a column: interned codes for strings, enumerated
+  values taking the first codes; doubles for numbers; bytes for booleans and
+  for the presence of nested objects; offsets into a shared interned column
+  for arrays of strings, and bitsets of eco.CodeRegistry codes for
+  enumerated arrays such as evidence_codes. Arrays of objects and free
+  form objects are kept as JSON values. Values not matching the type of
+  their field are kept aside per row, so that validate() still reports
+  them, while keys unknown to the schema are dropped as fromDict does.
+  Rows are materialized on demand, as raw dicts (row), evidence objects
+  (batch[i]) or JSON lines (to_jsonl).
+  Arguments:
+  :param cls = generated evidence class, e.g. core.Genetics
+  :param records = raw dicts or model objects to append
+  """
+  def __init__(self, cls, records = None):
+    self.cls = cls
+    self.schema = _schema(cls)
+    self.size = 0
+    # (row, path) -> value not matching the type of its field
+    self.mismatches = dict()
+    if records is not None:
+      self.extend(records)
+
+  def append(self, record):
+    """
+    Append a raw dict or a model object
+    """
+    if hasattr(record, 'serialize'):
+      record = record.serialize()
+    self._append(self.schema, record, ())
+    self.size += 1
+
+  def extend(self, records):
+    for record in records:
+      self.append(record)
+
+  def _append(self, schema, value, path):
+    if isinstance(value, dict):
+      schema['present'].append(1)
+    else:
+      schema['present'].append(0)
+      if value is not None:
+        self.mismatches[(self.size, path)] = value
+      value = {}
+    for name, column in schema['fields']:
+      if isinstance(column, dict):
+        self._append(column, value.get(name), path + (name,))
+      elif not column.append(value.get(name)):
+        self.mismatches[(self.size, path + (name,))] = value[name]
+
+  def __len__(self):
+    return self.size
+
+  def _row(self, schema, row, path):
+    if (row, path) in self.mismatches:
+      return self.mismatches[(row, path)]
+    if not schema['present'][row]:
+      return None
+    result = dict()
+    for name, column in schema['fields']:
+      if isinstance(column, dict):
+        value = self._row(column, row, path + (name,))
+      elif (row, path + (name,)) in self.mismatches:
+        value = self.mismatches[(row, path + (name,))]
+      else:
+        value = column.get(row)
+      if value is not None:
+        result[name] = value
+    return result
+
+  def row(self, index):
+    """
+    :returns: record index as a raw dict, serialized fields only
+    """
+    if index < 0:
+      index += self.size
+    if not 0 <= index < self.size:
+      raise IndexError("EvidenceBatch - row {0} out of range".format(index))
+    return self._row(self.schema, index, ())
+
+  def __getitem__(self, index):
+    """
+    :returns: record index as an evidence object
+    """
+    return self.cls.fromDict(self.row(index))
+
+  def __iter__(self):
+    for index in range(self.size):
+      yield self[index]
+
+  def column(self, path):
+    """
+    Values of a flattened field, e.g. 'evidence.variant2disease.resource_score.value'
+    :returns: array of doubles, NaN standing for missing values, for number fields, else list of values
+    """
+    segments = path.split('.')
+    schema = self.schema
+    for i, segment in enumerate(segments):
+      column = dict(schema['fields']).get(segment)
+      if column is None:
+        raise KeyError("EvidenceBatch - unknown field {0}".format(path))
+      if i < len(segments) - 1:
+        if not isinstance(column, dict):
+          raise KeyError("EvidenceBatch - unknown field {0}".format(path))
+        schema = column
+    if isinstance(column, dict):
+      return [self._row(column, row, tuple(segments)) for row in range(self.size)]
+    if isinstance(column, _Numbers):
+      return array.array('d', column.values)
+    return [column.get(row) for row in range(self.size)]
+
+  def bitsets(self, path):
+    """
+    Bitsets of an enumerated array field, e.g. 'evidence.variant2disease.evidence_codes',
+    to be tested with eco.has_any and eco.has_all; 0 stands for missing arrays
+    :returns: array of unsigned integers, or list when more than 64 codes are registered
+    """
+    segments = path.split('.')
+    schema = self.schema
+    for segment in segments[:-1]:
+      schema = dict(schema['fields']).get(segment)
+      if not isinstance(schema, dict):
+        raise KeyError("EvidenceBatch - unknown field {0}".format(path))
+    column = dict(schema['fields']).get(segments[-1])
+    if not isinstance(column, _Bitsets):
+      raise KeyError("EvidenceBatch - {0} is not an enumerated array".format(path))
+    return column.values
+
+  def validate(self, logger, path = "root"):
+    """
+    Validate every row, the path of row i being path[i]
+    :returns: number of errors found during validation
+    """
+    error = 0
+    for index in range(self.size):
+      error = error + self[index].validate(logger, path = '{0}[{1}]'.format(path, index))
+    return error
+
+  def to_jsonl(self, output):
+    """
+    Write the rows as JSON lines, as to_JSON(indentation=None) of their objects
+    Arguments:
+    :param output = file name, gzipped when it ends with .gz, or binary file object
+    :returns: number of lines written
+    """
+    if isinstance(output, six.string_types):
+      with stream.open_file(output, 'wb') as f:
+        return self.to_jsonl(f)
+    for index in range(self.size):
+      output.write(stream.to_line(self.row(index)))
+    return self.size
@@ -0,0 +1,245 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import zlib
+import struct
+import logging
+import multiprocessing
+import opentargets.model.stream as stream
+import opentargets.model.filters as filters
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+# largest uncompressed block, as written by bgzip
+MAX_BLOCK_SIZE = 0xff00
+# empty block marking the end of a BGZF file
+EOF_BLOCK = b'\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00\x1b\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+_HEADER = struct.Struct('<4BI2BH2BHH')
+
+def compress_block(data, compresslevel = 6):
+  """
+  :returns: data as one BGZF block, a gzip member whose extra field holds the block size
+  """
+  compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+  deflated = compressor.compress(data) + compressor.flush()
+  size = _HEADER.size + len(deflated) + 8
+  if size > 0x10000:
+    raise ValueError("compress_block - {0} bytes do not fit in a block".format(len(data)))
+  header = _HEADER.pack(0x1f, 0x8b, 8, 4, 0, 0, 0xff, 6, ord('B'), ord('C'), 2, size - 1)
+  return header + deflated + struct.pack('<II', zlib.crc32(data) & 0xffffffff, len(data) & 0xffffffff)
+
+"""
+Writer of BGZF (block gzip) files
+"""
+class BgzfWriter(object):
+  """
+  The output is a gzip file any gzip reader decompresses, made of
+  independent blocks of at most 64KB of data; lines are kept whole within a
+  block unless longer than a block. The block index (compressed and
+  uncompressed offsets of each block) is written next to the file as
+  filename + '.gzi', in the format of bgzip -i.
+  Arguments:
+  :param filename = output file
+  :param compresslevel = zlib compression level
+  :param index = False to write no index file
+  """
+  def __init__(self, filename, compresslevel = 6, index = True):
+    self.filename = filename
+    self.compresslevel = compresslevel
+    self.write_index = index
+    self.blocks = []
+    self._file = open(filename, 'wb')
+    self._buffer = []
+    self._buffered = 0
+    self._uncompressed = 0
+
+  def write(self, data):
+    """
+    Write bytes, or the serialization of a model object or raw dict as one line
+    """
+    if not isinstance(data, bytes):
+      data = stream.to_line(data)
+    self._buffer.append(data)
+    self._buffered += len(data)
+    if self._buffered >= MAX_BLOCK_SIZE:
+      self._write_blocks(final = False)
+
+  def _write_blocks(self, final):
+    data = b''.join(self._buffer)
+    start = 0
+    while len(data) - start >= MAX_BLOCK_SIZE or (final and start < len(data)):
+      end = min(start + MAX_BLOCK_SIZE, len(data))
+      if end < len(data):
+        newline = data.rfind(b'\n', start, end)
+        if newline >= 0:
+          end = newline + 1
+      self._write_block(data[start:end])
+      start = end
+    self._buffer = [data[start:]] if start < len(data) else []
+    self._buffered = len(data) - start
+
+  def _write_block(self, data):
+    self.blocks.append((self._file.tell(), self._uncompressed))
+    self._file.write(compress_block(data, self.compresslevel))
+    self._uncompressed += len(data)
+
+  def close(self):
+    if self._file is None:
+      return
+    self._write_blocks(final = True)
+    self._file.write(EOF_BLOCK)
+    self._file.close()
+    self._file = None
+    if self.write_index:
+      write_index(self.filename + '.gzi', self.blocks)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+
+def write_index(filename, blocks):
+  """
+  Write a block index in the bgzip -i format, the first block being implied
+  """
+  blocks = [block for block in blocks if block != (0, 0)]
+  with open(filename, 'wb') as f:
+    f.write(struct.pack('<Q', len(blocks)))
+    for compressed, uncompressed in blocks:
+      f.write(struct.pack('<QQ', compressed, uncompressed))
+
+def build_index(filename):
+  """
+  Index the blocks of a BGZF file from their headers, without decompressing them
+  :returns: list of (compressed offset, uncompressed offset) of the blocks holding data
+  """
+  blocks = []
+  uncompressed = 0
+  size = os.path.getsize(filename)
+  with open(filename, 'rb') as f:
+    offset = 0
+    while offset < size:
+      f.seek(offset)
+      header = f.read(_HEADER.size)
+      if len(header) < _HEADER.size:
+        raise ValueError("build_index - truncated block at {0} in {1}".format(offset, filename))
+      fields = _HEADER.unpack(header)
+      if fields[:4] != (0x1f, 0x8b, 8, 4) or fields[7:10] != (6, ord('B'), ord('C')):
+        raise ValueError("build_index - {0} is not a BGZF file (block at {1})".format(filename, offset))
+      block_size = fields[11] + 1
+      f.seek(offset + block_size - 4)
+      length = struct.unpack('<I', f.read(4))[0]
+      if length:
+        blocks.append((offset, uncompressed))
+      uncompressed += length
+      offset += block_size
+  return blocks
+
+def read_index(filename):
+  """
+  :returns: the block index of a BGZF file, read from filename + '.gzi' when
+  it is newer than the file, built from the block headers otherwise
+  """
+  index = filename + '.gzi'
+  if os.path.exists(index) and os.path.getmtime(index) >= os.path.getmtime(filename):
+    with open(index, 'rb') as f:
+      count = struct.unpack('<Q', f.read(8))[0]
+      blocks = [struct.unpack('<QQ', f.read(16)) for _ in range(count)]
+    return [(0, 0)] + blocks if not blocks or blocks[0] != (0, 0) else blocks
+  return build_index(filename)
+
+def split_ranges(filename, parts):
+  """
+  Split a BGZF file into ranges of blocks of similar compressed size
+  :returns: list of (start, end) compressed offsets of block boundaries, at most parts of them
+  """
+  blocks = read_index(filename)
+  size = os.path.getsize(filename)
+  if not blocks:
+    return []
+  starts = [blocks[0][0]]
+  for offset, _ in blocks[1:]:
+    if offset >= starts[-1] + float(size) / parts and len(starts) < parts:
+      starts.append(offset)
+  return list(zip(starts, starts[1:] + [size]))
+
+def read_range(filename, start, end, where = None):
+  """
+  Lines of a range of blocks: the lines starting in the range, the line
+  starting exactly at its end included, the partial or complete first line
+  of a range not starting the file excluded, so that the lines of adjacent
+  ranges neither overlap nor miss any line, wherever the lines are split.
+  The where filter is applied to each line before anything parses it: blank
+  lines are then dropped, and lines the filter cannot read are kept for the
+  caller to report.
+  Arguments:
+  :param where = filters.Filter or filter expression string, None keeps every line
+  :returns: generator of lines
+  """
+  where = filters.as_filter(where)
+  with stream.LineReader(filename, (start, 0)) as reader:
+    if start > 0:
+      reader.readline()
+    while reader.tell() <= (end, 0):
+      line = reader.readline()
+      if not line:
+        return
+      if where is not None:
+        if not line.strip():
+          continue
+        try:
+          keep = where.matches_line(line)[0]
+        except ValueError:
+          keep = True
+        if not keep:
+          continue
+      yield line
+
+def _apply(task):
+  function, filename, start, end, where = task
+  return function(filename, start, end, where)
+
+def map_ranges(function, filename, processes = None, where = None):
+  """
+  Run function(filename, start, end, where) over the ranges of a BGZF file
+  in a pool of processes, each decompressing and parsing its own range (see
+  read_range, to be given where); function should be defined at module level
+  Arguments:
+  :param where = filters.Filter or filter expression string, sent to each process
+  :returns: list of the results, in the order of the ranges
+  """
+  where = filters.as_filter(where)
+  processes = processes or multiprocessing.cpu_count()
+  tasks = [(function, filename, start, end, where) for start, end in split_ranges(filename, processes * 4)]
+  if processes == 1 or len(tasks) <= 1:
+    return [_apply(task) for task in tasks]
+  pool = multiprocessing.Pool(processes)
+  try:
+    return pool.map(_apply, tasks)
+  finally:
+    pool.close()
+    pool.join()
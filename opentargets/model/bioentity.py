@@ -23,6 +23,8 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
 import opentargets.model.evidence.drug as evidence_drug
 
 __author__ = "Gautier Koscielny"
@@ -45,6 +47,10 @@ class Base(object):
   Arguments:
   :param id = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['id']
+  cls_types = {'id': 'string'}
+  cls_enums = {}
   def __init__(self, id = None):
     
     """
@@ -62,13 +68,19 @@ class Base(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['id']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Base.cls_keys
+    fields = field_tree(fields)
+    if strict and cls is Base and isinstance(dict_obj, dict):
+      # subclasses check their keys, those of Base included, before calling super
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Base', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Base - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'id' in dict_obj:
+    if  'id' in dict_obj and (fields is None or 'id' in fields):
         obj.id = dict_obj['id']
     return obj
   
@@ -106,6 +118,15 @@ class Disease(Base):
   :param     biosample = None
   :param id = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['id','name','source_name','biosample','id']
+  cls_types = {'id': 'string', 'name': 'string', 'source_name': 'string', 'biosample': 'DiseaseBiosample'}
+  cls_enums = {}
+  # opt-in cache.FlyweightCache sharing the instances built by fromDict
+  flyweights = None
+  # opt-in cache.ValidationMemo replaying the validation of identical content
+  validation_memo = None
+
   def __init__(self, name = None, source_name = None,     biosample = None, id = None):
     """
     Call super constructor
@@ -157,24 +178,38 @@ class Disease(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['id','name','source_name','biosample','id']
-    obj = super(Disease, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Disease.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Disease', invalid_fields, cls_keys)
+    flyweight_key = None
+    if cls.flyweights is not None:
+      flyweight_key = cls.flyweights.key(cls, dict_obj, fields)
+      obj = cls.flyweights.lookup(flyweight_key) if flyweight_key is not None else None
+      if obj is not None:
+        return obj
+    obj = super(Disease, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Disease - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'id' in dict_obj:
+    if  'id' in dict_obj and (fields is None or 'id' in fields):
         obj.id = dict_obj['id']
-    if  'name' in dict_obj:
+    if  'name' in dict_obj and (fields is None or 'name' in fields):
         obj.name = dict_obj['name']
-    if  'source_name' in dict_obj:
+    if  'source_name' in dict_obj and (fields is None or 'source_name' in fields):
         obj.source_name = dict_obj['source_name']
-    if  'biosample' in dict_obj:
-        obj.biosample = DiseaseBiosample.fromDict(dict_obj['biosample'])
+    if  'biosample' in dict_obj and (fields is None or 'biosample' in fields):
+        obj.biosample = DiseaseBiosample.fromDict(dict_obj['biosample'], strict = strict, fields = fields and fields['biosample'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Disease - invalid field - {0} found".format(key))
         return
+    if flyweight_key is not None:
+      obj = cls.flyweights.store(flyweight_key, obj)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -182,6 +217,8 @@ class Disease(Base):
     Validate class Disease
     :returns: number of errors found during validation
     """
+    if self.validation_memo is not None and not self.validation_memo.recording:
+      return self.validation_memo.validate(self, logger, path)
     error = 0
     # cumulate errors from super class
     error = error + super(Disease, self).validate(logger, path = path)
@@ -238,6 +275,10 @@ class DiseaseBiosample(object):
   :param name = None
   :param id = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['name','id']
+  cls_types = {'name': 'string', 'id': 'string'}
+  cls_enums = {}
   def __init__(self, name = None, id = None):
     
     """
@@ -268,15 +309,21 @@ class DiseaseBiosample(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['name','id']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = DiseaseBiosample.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('DiseaseBiosample', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("DiseaseBiosample - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'name' in dict_obj:
+    if  'name' in dict_obj and (fields is None or 'name' in fields):
         obj.name = dict_obj['name']
-    if  'id' in dict_obj:
+    if  'id' in dict_obj and (fields is None or 'id' in fields):
         obj.id = dict_obj['id']
     return obj
   
@@ -327,6 +374,15 @@ class Target(Base):
   :param target_class = None
   :param id = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['id','tier','complex_id','complex_members','complex_type','target_type','activity','target_name','target_class','id']
+  cls_types = {'id': 'string', 'tier': 'string', 'complex_id': 'string', 'complex_members': ['string'], 'complex_type': 'string', 'target_type': 'string', 'activity': 'string', 'target_name': 'string', 'target_class': ['string']}
+  cls_enums = {'tier': ['tier 1', 'tier 2'], 'complex_type': ['http://identifiers.org/cttv.target/chimeric_protein', 'http://identifiers.org/cttv.target/protein_complex', 'http://identifiers.org/cttv.target/protein_complex_group', 'http://identifiers.org/cttv.target/protein_complex_heteropolymer', 'http://identifiers.org/cttv.target/protein_complex_homopolymer', 'http://identifiers.org/cttv.target/protein_family', 'http://identifiers.org/cttv.target/selectivity_group'], 'target_type': ['http://identifiers.org/cttv.target/gene_allele', 'http://identifiers.org/cttv.target/gene_evidence', 'http://identifiers.org/cttv.target/gene_in_LD_region', 'http://identifiers.org/cttv.target/gene_in_epigenetic_regulation_complex', 'http://identifiers.org/cttv.target/gene_variant', 'http://identifiers.org/cttv.target/pro_protein', 'http://identifiers.org/cttv.target/protein_evidence', 'http://identifiers.org/cttv.target/transcript_evidence', 'http://identifiers.org/cttv.target/transcript_isoform', 'http://identifiers.org/cttv.target/protein_isoform', 'http://identifiers.org/cttv.target/gene_or_protein_or_transcript'], 'activity': ['http://identifiers.org/cttv.activity/decreased_transcript_level', 'http://identifiers.org/cttv.activity/decreased_translational_product_level', 'http://identifiers.org/cttv.activity/drug_negative_modulator', 'http://identifiers.org/cttv.activity/drug_positive_modulator', 'http://identifiers.org/cttv.activity/gain_of_function', 'http://identifiers.org/cttv.activity/increased_transcript_level', 'http://identifiers.org/cttv.activity/increased_translational_product_level', 'http://identifiers.org/cttv.activity/loss_of_function', 'http://identifiers.org/cttv.activity/partial_loss_of_function', 'http://identifiers.org/cttv.activity/up_or_down', 'http://identifiers.org/cttv.activity/up', 'http://identifiers.org/cttv.activity/down', 'http://identifiers.org/cttv.activity/tolerated', 'http://identifiers.org/cttv.activity/predicted', 'http://identifiers.org/cttv.activity/damaging', 'http://identifiers.org/cttv.activity/damaging_to_target', 'http://identifiers.org/cttv.activity/predicted_tolerated', 'http://identifiers.org/cttv.activity/predicted_damaging', 'http://identifiers.org/cttv.activity/tolerated_by_target', 'http://identifiers.org/cttv.activity/unknown']}
+  # opt-in cache.FlyweightCache sharing the instances built by fromDict
+  flyweights = None
+  # opt-in cache.ValidationMemo replaying the validation of identical content
+  validation_memo = None
+
   def __init__(self, tier = None, complex_id = None, complex_members = None, complex_type = None, target_type = None, activity = None, target_name = None, target_class = None, id = None):
     """
     Call super constructor
@@ -432,34 +488,48 @@ class Target(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['id','tier','complex_id','complex_members','complex_type','target_type','activity','target_name','target_class','id']
-    obj = super(Target, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Target.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Target', invalid_fields, cls_keys)
+    flyweight_key = None
+    if cls.flyweights is not None:
+      flyweight_key = cls.flyweights.key(cls, dict_obj, fields)
+      obj = cls.flyweights.lookup(flyweight_key) if flyweight_key is not None else None
+      if obj is not None:
+        return obj
+    obj = super(Target, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Target - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'id' in dict_obj:
+    if  'id' in dict_obj and (fields is None or 'id' in fields):
         obj.id = dict_obj['id']
-    if  'tier' in dict_obj:
+    if  'tier' in dict_obj and (fields is None or 'tier' in fields):
         obj.tier = dict_obj['tier']
-    if  'complex_id' in dict_obj:
+    if  'complex_id' in dict_obj and (fields is None or 'complex_id' in fields):
         obj.complex_id = dict_obj['complex_id']
-    if  'complex_members' in dict_obj:
+    if  'complex_members' in dict_obj and (fields is None or 'complex_members' in fields):
         obj.complex_members = dict_obj['complex_members']
-    if  'complex_type' in dict_obj:
+    if  'complex_type' in dict_obj and (fields is None or 'complex_type' in fields):
         obj.complex_type = dict_obj['complex_type']
-    if  'target_type' in dict_obj:
+    if  'target_type' in dict_obj and (fields is None or 'target_type' in fields):
         obj.target_type = dict_obj['target_type']
-    if  'activity' in dict_obj:
+    if  'activity' in dict_obj and (fields is None or 'activity' in fields):
         obj.activity = dict_obj['activity']
-    if  'target_name' in dict_obj:
+    if  'target_name' in dict_obj and (fields is None or 'target_name' in fields):
         obj.target_name = dict_obj['target_name']
-    if  'target_class' in dict_obj:
+    if  'target_class' in dict_obj and (fields is None or 'target_class' in fields):
         obj.target_class = dict_obj['target_class']
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Target - invalid field - {0} found".format(key))
         return
+    if flyweight_key is not None:
+      obj = cls.flyweights.store(flyweight_key, obj)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -467,6 +537,8 @@ class Target(Base):
     Validate class Target
     :returns: number of errors found during validation
     """
+    if self.validation_memo is not None and not self.validation_memo.recording:
+      return self.validation_memo.validate(self, logger, path)
     error = 0
     # cumulate errors from super class
     error = error + super(Target, self).validate(logger, path = path)
@@ -574,6 +646,10 @@ class Phenotype(Base):
   :param species = None
   :param id = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['term_id','label','species','id']
+  cls_types = {'term_id': 'string', 'label': 'string', 'species': 'string'}
+  cls_enums = {'species': ['mouse', 'human', 'rat', 'zebrafish', 'dog']}
   def __init__(self, term_id = None, label = None, species = None, id = None):
     """
     Call super constructor
@@ -620,17 +696,23 @@ class Phenotype(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['term_id','label','species','id']
-    obj = super(Phenotype, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Phenotype.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Phenotype', invalid_fields, cls_keys)
+    obj = super(Phenotype, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Phenotype - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'term_id' in dict_obj:
+    if  'term_id' in dict_obj and (fields is None or 'term_id' in fields):
         obj.term_id = dict_obj['term_id']
-    if  'label' in dict_obj:
+    if  'label' in dict_obj and (fields is None or 'label' in fields):
         obj.label = dict_obj['label']
-    if  'species' in dict_obj:
+    if  'species' in dict_obj and (fields is None or 'species' in fields):
         obj.species = dict_obj['species']
     for key in dict_obj:
       if not key in cls_keys:
@@ -707,6 +789,13 @@ class Drug(Base):
   :param withdrawn_year = None
   :param id = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['id','molecule_name','molecule_type','max_phase_for_all_diseases','withdrawn_country','withdrawn_reason','withdrawn_year','id']
+  cls_types = {'id': 'string', 'molecule_name': 'string', 'molecule_type': 'string', 'max_phase_for_all_diseases': 'evidence_drug.Diseasephase', 'withdrawn_country': 'string', 'withdrawn_reason': 'string', 'withdrawn_year': 'string'}
+  cls_enums = {}
+  # opt-in cache.FlyweightCache sharing the instances built by fromDict
+  flyweights = None
+
   def __init__(self, molecule_name = None, molecule_type = None,     max_phase_for_all_diseases = None, withdrawn_country = None, withdrawn_reason = None, withdrawn_year = None, id = None):
     """
     Call super constructor
@@ -785,30 +874,44 @@ class Drug(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['id','molecule_name','molecule_type','max_phase_for_all_diseases','withdrawn_country','withdrawn_reason','withdrawn_year','id']
-    obj = super(Drug, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Drug.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Drug', invalid_fields, cls_keys)
+    flyweight_key = None
+    if cls.flyweights is not None:
+      flyweight_key = cls.flyweights.key(cls, dict_obj, fields)
+      obj = cls.flyweights.lookup(flyweight_key) if flyweight_key is not None else None
+      if obj is not None:
+        return obj
+    obj = super(Drug, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Drug - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'id' in dict_obj:
+    if  'id' in dict_obj and (fields is None or 'id' in fields):
         obj.id = dict_obj['id']
-    if  'molecule_name' in dict_obj:
+    if  'molecule_name' in dict_obj and (fields is None or 'molecule_name' in fields):
         obj.molecule_name = dict_obj['molecule_name']
-    if  'molecule_type' in dict_obj:
+    if  'molecule_type' in dict_obj and (fields is None or 'molecule_type' in fields):
         obj.molecule_type = dict_obj['molecule_type']
-    if  'max_phase_for_all_diseases' in dict_obj:
-        obj.max_phase_for_all_diseases = evidence_drug.Diseasephase.fromDict(dict_obj['max_phase_for_all_diseases'])
-    if  'withdrawn_country' in dict_obj:
+    if  'max_phase_for_all_diseases' in dict_obj and (fields is None or 'max_phase_for_all_diseases' in fields):
+        obj.max_phase_for_all_diseases = evidence_drug.Diseasephase.fromDict(dict_obj['max_phase_for_all_diseases'], strict = strict, fields = fields and fields['max_phase_for_all_diseases'] or None)
+    if  'withdrawn_country' in dict_obj and (fields is None or 'withdrawn_country' in fields):
         obj.withdrawn_country = dict_obj['withdrawn_country']
-    if  'withdrawn_reason' in dict_obj:
+    if  'withdrawn_reason' in dict_obj and (fields is None or 'withdrawn_reason' in fields):
         obj.withdrawn_reason = dict_obj['withdrawn_reason']
-    if  'withdrawn_year' in dict_obj:
+    if  'withdrawn_year' in dict_obj and (fields is None or 'withdrawn_year' in fields):
         obj.withdrawn_year = dict_obj['withdrawn_year']
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Drug - invalid field - {0} found".format(key))
         return
+    if flyweight_key is not None:
+      obj = cls.flyweights.store(flyweight_key, obj)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -892,6 +995,13 @@ class Variant(Base):
   :param type = None
   :param id = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['id','type','id']
+  cls_types = {'id': 'string', 'type': 'string'}
+  cls_enums = {'type': ['snp single', 'snp snp interaction', 'structural variant']}
+  # opt-in cache.ValidationMemo replaying the validation of identical content
+  validation_memo = None
+
   def __init__(self, type = None, id = None):
     """
     Call super constructor
@@ -927,15 +1037,21 @@ class Variant(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['id','type','id']
-    obj = super(Variant, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Variant.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Variant', invalid_fields, cls_keys)
+    obj = super(Variant, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Variant - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'id' in dict_obj:
+    if  'id' in dict_obj and (fields is None or 'id' in fields):
         obj.id = dict_obj['id']
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
     for key in dict_obj:
       if not key in cls_keys:
@@ -948,6 +1064,8 @@ class Variant(Base):
     Validate class Variant
     :returns: number of errors found during validation
     """
+    if self.validation_memo is not None and not self.validation_memo.recording:
+      return self.validation_memo.validate(self, logger, path)
     error = 0
     # cumulate errors from super class
     error = error + super(Variant, self).validate(logger, path = path)
@@ -0,0 +1,780 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import re
+import abc
+import json
+import math
+import collections
+import logging
+import six
+import opentargets.model.core as core
+import opentargets.model.bioentity as bioentity
+import opentargets.model.evidence.core as evidence_core
+import opentargets.model.evidence.genetics as evidence_genetics
+import opentargets.model.evidence.drug as evidence_drug
+import opentargets.model.evidence.linkout as evidence_linkout
+import opentargets.model.evidence.association_score as evidence_score
+import opentargets.model.stream as stream
+import opentargets.model.loggers as loggers
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+_SENTINEL = re.compile(b'"\\\\u0000(\\w+)\\\\u0000"')
+
+def _sentinel(name):
+  return '\x00' + name + '\x00'
+
+def _as_list(column):
+  return column.tolist() if hasattr(column, 'tolist') else list(column)
+
+def _uri(value, prefix):
+  """
+  :returns: value expanded to a URI with prefix unless it already is one
+  """
+  # template sentinels are kept as they are
+  if isinstance(value, six.string_types) and not value.startswith('http') and not value.startswith('\x00'):
+    return prefix + value
+  return value
+
+def _missing(value):
+  return value is None or (isinstance(value, float) and math.isnan(value))
+
+def _number(value, cast):
+  """
+  :returns: value cast to a python number, numeric strings of text input
+  such as '0.5' included, None when missing (blank strings included);
+  anything else, template sentinels included, is kept for validate() to report
+  """
+  if isinstance(value, six.string_types):
+    if not value.strip():
+      return None
+    try:
+      value = float(value)
+    except ValueError:
+      return value
+  if _missing(value):
+    return None
+  if isinstance(value, bool) or not isinstance(value, (float,) + six.integer_types) and not hasattr(value, 'dtype'):
+    return value
+  if not isinstance(value, six.integer_types) and math.isinf(value):
+    # no int for it, validate() reports it
+    return float(value)
+  return cast(value)
+
+def _floats(column):
+  """
+  Numeric column as a float array, cell by cell unless it already is a
+  numeric array, so that a cell such as 'NA' only affects its row
+  :returns: numpy array, NaN standing for missing and non-numeric cells
+  """
+  if hasattr(column, 'dtype') and column.dtype.kind in 'fiu':
+    return numpy.asarray(column, dtype=float)
+  cells = _as_list(column)
+  values = numpy.empty(len(cells), dtype=float)
+  for i, cell in enumerate(cells):
+    value = _number(cell, float)
+    values[i] = value if isinstance(value, float) else numpy.nan
+  return values
+
+# id patterns of the schema, matched as the generated validate() methods do
+SCHEMA_ID_PATTERNS = {
+  'target': re.compile('^http://identifiers.org/ensembl/ENSG[0-9]{4,}$|^http://identifiers.org/uniprot/.{4,}$'),
+  'disease': re.compile('^http://purl.bioontology.org/omim/OMIM_[0-9]{1,}|http://www.orpha.net/ORDO/Orphanet_[0-9]{1,}|http://purl.obolibrary.org/obo/DOID_[0-9]{2,}|http://www.ebi.ac.uk/efo/EFO_[0-9]{7,}|http://purl.obolibrary.org/obo/HP_[0-9]{4,}|http://purl.obolibrary.org/obo/GO_[0-9]{4,}|http://purl.obolibrary.org/obo/MP_[0-9]{3,}|http://purl.obolibrary.org/obo/PATO_[0-9]{4,}|http://purl.obolibrary.org/obo/MPATH_[0-9]{1,}$'),
+  'drug': re.compile('^http://identifiers.org/chembl.compound/CHEMBL[0-9]+$|^http://private/.+$'),
+  'variant': re.compile('^http://www.ncbi.nlm.nih.gov/clinvar/RCV[0-9]{9}|http://identifiers.org/dbsnp/rs[0-9]{1,}|http://identifiers.org/dbsnp/esv[0-9]{1,}|http://identifiers.org/dbsnp/nsv[0-9]{1,}$'),
+}
+
+def format_ids(column, prefix, pattern, entity):
+  """
+  Expand short ids to URIs and check them against a pattern restricted to
+  characters needing no JSON escaping; other ids matching the schema
+  pattern of the entity are left to the evidence objects
+  Arguments:
+  :param entity = key of SCHEMA_ID_PATTERNS
+  :returns: tuple of (JSON encoded URIs, list of row checks: True when
+  valid, None when only the schema pattern matches, False otherwise)
+  """
+  schema_pattern = SCHEMA_ID_PATTERNS[entity]
+  encoded = []
+  valid = []
+  for value in _as_list(column):
+    value = _uri(value, prefix)
+    if isinstance(value, six.string_types) and pattern.match(value):
+      encoded.append('"' + value + '"')
+      valid.append(True)
+    else:
+      encoded.append(None)
+      valid.append(None if isinstance(value, six.string_types) and schema_pattern.match(value) else False)
+  return encoded, valid
+
+def format_numbers(column, minimum = None, maximum = None, exclusive_minimum = False, integer = False, required = True):
+  """
+  Range check a numeric column, with numpy when it is installed
+  Arguments:
+  :param required = False when a missing value (None or NaN) leaves the field out of the record
+  :returns: tuple of (JSON encoded numbers, list of row checks: True when
+  valid, None when missing from an optional column, False otherwise)
+  """
+  if numpy is not None:
+    values = _floats(column)
+    valid = numpy.isfinite(values)
+    if minimum is not None:
+      valid &= (values > minimum) if exclusive_minimum else (values >= minimum)
+    if maximum is not None:
+      valid &= values <= maximum
+    if integer:
+      valid &= numpy.floor(values) == values
+    values = values.tolist()
+    valid = valid.tolist()
+  else:
+    values = []
+    valid = []
+    for cell in _as_list(column):
+      value = _number(cell, float)
+      ok = isinstance(value, float) and not math.isinf(value)
+      if ok and minimum is not None:
+        ok = value > minimum if exclusive_minimum else value >= minimum
+      if ok and maximum is not None:
+        ok = value <= maximum
+      if ok and integer:
+        ok = float(value).is_integer()
+      values.append(value)
+      valid.append(ok)
+  # repr of a float is what json.dumps writes
+  encoded = [(str(int(v)) if integer else repr(float(v))) if ok else None for v, ok in zip(values, valid)]
+  if not required:
+    valid = [None if not ok and _number(cell, float) is None else ok for ok, cell in zip(valid, _as_list(column))]
+  return encoded, valid
+
+"""
+Column-oriented construction of serialized evidence lines
+"""
+@six.add_metaclass(abc.ABCMeta)
+class TemplateBuilder(object):
+  """
+  Rows whose values pass the column checks are written by filling a line
+  template, made once by serializing an evidence object holding sentinel
+  values, with JSON encoded column values; no object is built for them.
+  Rows failing a column check are rejected, the invalid columns being
+  logged. Rows only missing optional values go through the evidence
+  objects and validate(), and are written when they validate.
+  Subclasses define the columns, build_object(row) and encode(columns);
+  categorical columns are validated once per distinct value against a
+  probe row, which also validates the builder constants. A subclass whose
+  input rows are not the records written, e.g. because rows are grouped,
+  names its input_columns and turns them into record columns in prepare().
+  Arguments:
+  :param logger = logger receiving the validation errors of rejected rows
+  """
+  columns = ()
+  input_columns = None
+  categorical = ()
+  probe = {}
+
+  def __init__(self, logger = logger):
+    self.logger = logger
+    self.fallbacks = 0
+    self.rejected = []
+    self._categories = dict()
+    self._template = None
+    recorder = loggers.Recorder(levels = ('error',))
+    if self.build_object(self.probe).validate(recorder) > 0:
+      raise ValueError("{0} - invalid constants: {1}".format(type(self).__name__, '; '.join(recorder.errors())))
+
+  @abc.abstractmethod
+  def build_object(self, row):
+    """
+    :returns: the evidence object of a row given as a dict of column values
+    """
+
+  @abc.abstractmethod
+  def encode(self, columns, size):
+    """
+    Encode and check the record columns. A row check is True when the value
+    fits the template, None when it is missing from an optional field,
+    which leaves the row to the evidence objects, and False when the value
+    is invalid, which rejects the row.
+    :returns: tuple of (dict of column name to JSON encoded values, list of (column name, list of row checks))
+    """
+
+  def prepare(self, columns, size):
+    """
+    Turn the input columns into the columns of the records to write, one
+    record per input row by default
+    :returns: tuple of (dict of record column name to values, number of records)
+    """
+    return columns, size
+
+  def template(self):
+    """
+    :returns: tuple of (line fragments, names of the columns between them)
+    """
+    if self._template is None:
+      line = stream.to_line(self.build_object(dict((name, _sentinel(name)) for name in self.columns)))
+      fragments = _SENTINEL.split(line)
+      self._template = ([fragment.decode('utf-8') for fragment in fragments[0::2]],
+                        [name.decode('utf-8') for name in fragments[1::2]])
+    return self._template
+
+  def valid_categories(self, name, column):
+    """
+    Validate each distinct value of a categorical column once
+    :returns: list of row checks: True when valid, None when missing, False otherwise
+    """
+    known = self._categories.setdefault(name, dict())
+    values = _as_list(column)
+    for value in set(v for v in values if isinstance(v, six.string_types)):
+      if not value in known:
+        row = dict(self.probe)
+        row[name] = value
+        known[value] = self.build_object(row).validate(loggers.Silent()) == 0
+    return [known[v] if isinstance(v, six.string_types) else (None if _missing(v) else False) for v in values]
+
+  def lines(self, **columns):
+    """
+    Build the evidence of a batch of rows given as columns (lists or arrays of equal length)
+    :returns: generator of utf-8 encoded, newline terminated, JSON lines
+    """
+    names = self.input_columns or self.columns
+    missing = [name for name in names if not name in columns]
+    if missing:
+      raise ValueError("{0} - missing columns {1}".format(type(self).__name__, ', '.join(missing)))
+    sizes = set(len(columns[name]) for name in names)
+    if len(sizes) > 1:
+      raise ValueError("{0} - columns should have the same length".format(type(self).__name__))
+    size = sizes.pop() if sizes else 0
+    columns, size = self.prepare(columns, size)
+    encoded, checks = self.encode(columns, size)
+    fragments, names = self.template()
+    head = fragments[0]
+    tail = list(zip(names, fragments[1:]))
+    for i in range(size):
+      failed = [name for name, check in checks if check[i] is False]
+      if failed:
+        for name in failed:
+          self.logger.error("{0} - row {1}: invalid {2} {3!r}".format(type(self).__name__, i, name, _as_list(columns[name])[i] if name in columns else None))
+        self.rejected.append((i, len(failed)))
+      elif all(check[i] for name, check in checks):
+        parts = [head]
+        for name, fragment in tail:
+          parts.append(encoded[name][i])
+          parts.append(fragment)
+        yield ''.join(parts).encode('utf-8')
+      else:
+        line = self._fallback(dict((name, _as_list(columns[name])[i]) for name in self.columns), i)
+        if line is not None:
+          yield line
+
+  def write(self, out, **columns):
+    """
+    Write the evidence of a batch of rows to a binary file or a stream.PartitionedWriter
+    :returns: number of lines written
+    """
+    count = 0
+    for line in self.lines(**columns):
+      if hasattr(out, 'write_raw'):
+        out.write_raw(line)
+      else:
+        out.write(line)
+      count = count + 1
+    return count
+
+  def _fallback(self, row, index):
+    self.fallbacks = self.fallbacks + 1
+    try:
+      obj = self.build_object(row)
+    except (TypeError, ValueError) as e:
+      self.logger.error("{0} - row {1} can not be built: {2}".format(type(self).__name__, index, e))
+      self.rejected.append((index, 1))
+      return None
+    try:
+      error = obj.validate(self.logger, path = 'row{0}'.format(index))
+    except TypeError as e:
+      # e.g. a string compared to a number bound
+      self.logger.error("{0} - row {1} can not be validated: {2}".format(type(self).__name__, index, e))
+      error = 1
+    if error > 0:
+      self.rejected.append((index, error))
+      return None
+    return stream.to_line(obj)
+
+class _Placeholder(object):
+  """
+  Stands for the elements of a list in a line template
+  """
+  def __init__(self, value):
+    self.value = value
+
+  def serialize(self):
+    return self.value
+
+"""
+Genetics evidence from association tables
+"""
+class GeneticsBuilder(TemplateBuilder):
+  """
+  One genetic_association evidence per row of variant, gene and disease
+  ids, association p-value, GWAS sample size and functional consequence.
+  Short ids ('rs123', 'ENSG00000157764', 'EFO_0003767', 'SO_0001631') are
+  expanded to URIs, full URIs are kept as given.
+  Arguments:
+  :param sourceID = datasource name
+  :param unique_experiment_reference = reference of the study, e.g. http://europepmc.org/abstract/MED/23128233
+  :param date_asserted = ISO 8601 date of the assertion
+  :param access_level = 'public' or 'private'
+  :param provenance_type = dict of the provenance, defaults to no provenance details
+  :param gene2variant_evidence_codes = evidence codes of the gene to variant link
+  :param variant2disease_evidence_codes = evidence codes of the variant to disease link
+  :param target_type = target type URI
+  :param activity = target activity URI
+  :param variant_type = variant type
+  :param logger = logger receiving the validation errors of rejected rows
+  """
+  columns = ('variant_id', 'gene_id', 'efo_id', 'pvalue', 'sample_size', 'functional_consequence')
+  categorical = ('functional_consequence',)
+  probe = {'variant_id': 'rs1', 'gene_id': 'ENSG00000000001', 'efo_id': 'EFO_0000001', 'pvalue': 0.5,
+           'sample_size': 1, 'functional_consequence': 'SO_0001631'}
+
+  variant_prefix = 'http://identifiers.org/dbsnp/'
+  gene_prefix = 'http://identifiers.org/ensembl/'
+  efo_prefix = 'http://www.ebi.ac.uk/efo/'
+  consequence_prefix = 'http://purl.obolibrary.org/obo/'
+  # subsets of the schema patterns needing no JSON escaping
+  variant_pattern = re.compile('^http://identifiers\\.org/dbsnp/rs[0-9]+$')
+  gene_pattern = re.compile('^http://identifiers\\.org/ensembl/ENSG[0-9]{4,}$')
+  efo_pattern = re.compile('^http://www\\.ebi\\.ac\\.uk/efo/EFO_[0-9]{7,}$')
+
+  def __init__(self, sourceID, unique_experiment_reference, date_asserted, access_level = 'public', provenance_type = None,
+               gene2variant_evidence_codes = ('http://purl.obolibrary.org/obo/ECO_0000205', 'http://identifiers.org/eco/cttv_mapping_pipeline'),
+               variant2disease_evidence_codes = ('http://identifiers.org/eco/GWAS',),
+               target_type = 'http://identifiers.org/cttv.target/gene_evidence',
+               activity = 'http://identifiers.org/cttv.activity/predicted_damaging',
+               variant_type = 'snp single', logger = logger):
+    self.sourceID = sourceID
+    self.unique_experiment_reference = unique_experiment_reference
+    self.date_asserted = date_asserted
+    self.access_level = access_level
+    self.provenance_type = provenance_type or {}
+    self.gene2variant_evidence_codes = list(gene2variant_evidence_codes)
+    self.variant2disease_evidence_codes = list(variant2disease_evidence_codes)
+    self.target_type = target_type
+    self.activity = activity
+    self.variant_type = variant_type
+    super(GeneticsBuilder, self).__init__(logger)
+
+  def build_object(self, row):
+    gene = _uri(row['gene_id'], self.gene_prefix)
+    disease = _uri(row['efo_id'], self.efo_prefix)
+    variant = _uri(row['variant_id'], self.variant_prefix)
+    obj = core.Genetics(type = 'genetic_association')
+    obj.sourceID = self.sourceID
+    obj.access_level = self.access_level
+    obj.validated_against_schema_version = core.__version__
+    obj.unique_association_fields = {'target': gene, 'disease': disease, 'variant': variant,
+                                     'study': self.unique_experiment_reference}
+    obj.target = bioentity.Target(id = gene, target_type = self.target_type, activity = self.activity)
+    obj.disease = bioentity.Disease(id = disease)
+    obj.variant = bioentity.Variant(id = variant, type = self.variant_type)
+    obj.evidence = core.GeneticsEvidence(
+      gene2variant = evidence_genetics.Gene2Variant(
+        evidence_codes = list(self.gene2variant_evidence_codes),
+        functional_consequence = _uri(row['functional_consequence'], self.consequence_prefix),
+        provenance_type = evidence_core.BaseProvenance_Type.fromDict(self.provenance_type),
+        date_asserted = self.date_asserted,
+        is_associated = True),
+      variant2disease = evidence_genetics.Variant2Disease(
+        evidence_codes = list(self.variant2disease_evidence_codes),
+        unique_experiment_reference = self.unique_experiment_reference,
+        provenance_type = evidence_core.BaseProvenance_Type.fromDict(self.provenance_type),
+        date_asserted = self.date_asserted,
+        is_associated = True,
+        gwas_sample_size = _number(row['sample_size'], int),
+        resource_score = evidence_score.Pvalue(type = 'pvalue', value = _number(row['pvalue'], float))))
+    return obj
+
+  def encode(self, columns, size):
+    encoded = dict()
+    checks = []
+    for name, prefix, pattern, entity in (('variant_id', self.variant_prefix, self.variant_pattern, 'variant'),
+                                          ('gene_id', self.gene_prefix, self.gene_pattern, 'target'),
+                                          ('efo_id', self.efo_prefix, self.efo_pattern, 'disease')):
+      encoded[name], valid = format_ids(columns[name], prefix, pattern, entity)
+      checks.append((name, valid))
+    encoded['pvalue'], valid = format_numbers(columns['pvalue'], minimum = 0, maximum = 1, exclusive_minimum = True)
+    checks.append(('pvalue', valid))
+    encoded['sample_size'], valid = format_numbers(columns['sample_size'], minimum = 0, exclusive_minimum = True, integer = True, required = False)
+    checks.append(('sample_size', valid))
+    checks.append(('functional_consequence', self.valid_categories('functional_consequence', columns['functional_consequence'])))
+    encoded['functional_consequence'] = [json.dumps(_uri(value, self.consequence_prefix)) if isinstance(value, six.string_types) else None
+                                         for value in _as_list(columns['functional_consequence'])]
+    return encoded, checks
+
+def percentile_ranks(column, absolute = True):
+  """
+  Percentile ranks of a numeric column from a single sort: the percentage,
+  rounded down, of the finite values lower than or equal to each value,
+  ties sharing their rank
+  Arguments:
+  :param column = list or array of numbers
+  :param absolute = True to rank the absolute values
+  :returns: list of ints from 0 to 100, None for non-finite values
+  """
+  if numpy is not None:
+    values = _floats(column)
+    if absolute:
+      values = numpy.abs(values)
+    finite = numpy.flatnonzero(numpy.isfinite(values))
+    ranks = [None] * len(values)
+    if len(finite) == 0:
+      return ranks
+    order = finite[numpy.argsort(values[finite], kind='mergesort')]
+    ordered = values[order]
+    # every value of a run of ties ranks with the last one
+    last = numpy.append(ordered[1:] != ordered[:-1], True)
+    counts = numpy.where(last, numpy.arange(1, len(order) + 1), len(order) + 1)
+    counts = numpy.minimum.accumulate(counts[::-1])[::-1]
+    for index, count in zip(order.tolist(), (counts * 100 // len(order)).tolist()):
+      ranks[index] = count
+    return ranks
+  values = []
+  for cell in _as_list(column):
+    value = _number(cell, float)
+    if not isinstance(value, float) or math.isinf(value):
+      values.append(None)
+    else:
+      values.append(abs(value) if absolute else value)
+  order = sorted((i for i, value in enumerate(values) if value is not None), key=values.__getitem__)
+  ranks = [None] * len(values)
+  count = len(order)
+  for position in range(count - 1, -1, -1):
+    index = order[position]
+    if position == count - 1 or values[order[position + 1]] != values[index]:
+      rank = (position + 1) * 100 // count
+    ranks[index] = rank
+  return ranks
+
+def _strings(column):
+  """
+  :returns: tuple of (JSON encoded strings, list of row checks: True when valid, None when missing, False otherwise)
+  """
+  values = _as_list(column)
+  encoded = [json.dumps(value) if isinstance(value, six.string_types) else None for value in values]
+  return encoded, [True if text is not None else (None if _missing(value) else False) for text, value in zip(encoded, values)]
+
+"""
+Known drug evidence from ChEMBL-style clinical trial tables
+"""
+class DrugBuilder(TemplateBuilder):
+  """
+  One known_drug evidence per distinct molecule, target and disease of rows
+  of molecule, target and disease ids, clinical phase, mechanism of action,
+  action type and trial URL. Rows of a record are merged: the record holds
+  the highest phase of its rows and the distinct trial URLs as urls; the
+  names and mechanism are taken from the first row giving them. The highest
+  phase of a molecule for all diseases is computed over the batch, so a
+  molecule should not be split over several batches. The indices of rejected
+  records are the positions of the records in the order of their first row.
+  Arguments:
+  :param sourceID = datasource name
+  :param date_asserted = ISO 8601 date of the assertion
+  :param access_level = 'public' or 'private'
+  :param provenance_type = dict of the provenance, defaults to no provenance details
+  :param target2drug_evidence_codes = evidence codes of the target to drug link
+  :param drug2clinic_evidence_codes = evidence codes of the drug to clinic link
+  :param url_nice_name = displayed name of the trial URLs
+  :param target_type = target type URI
+  :param activity = target activity URI
+  :param logger = logger receiving the validation errors of rejected records
+  """
+  input_columns = ('molecule_id', 'molecule_name', 'molecule_type', 'target_id', 'disease_id', 'phase',
+                   'mechanism_of_action', 'action_type', 'trial_url')
+  columns = ('molecule_id', 'molecule_name', 'molecule_type', 'target_id', 'disease_id', 'phase', 'phase_label',
+             'max_phase', 'max_phase_label', 'mechanism_of_action', 'action_type', 'urls')
+  probe = {'molecule_id': 'CHEMBL1', 'molecule_name': 'ASPIRIN', 'molecule_type': 'Small molecule',
+           'target_id': 'ENSG00000000001', 'disease_id': 'EFO_0000001', 'phase': 4, 'phase_label': 'Phase IV',
+           'max_phase': 4, 'max_phase_label': 'Phase IV', 'mechanism_of_action': 'Cyclooxygenase inhibitor',
+           'action_type': 'INHIBITOR', 'urls': ['https://clinicaltrials.gov/search?id=NCT00000001']}
+  phase_labels = {0: 'Phase 0', 1: 'Phase I', 2: 'Phase II', 3: 'Phase III', 4: 'Phase IV'}
+
+  molecule_prefix = 'http://identifiers.org/chembl.compound/'
+  gene_prefix = 'http://identifiers.org/ensembl/'
+  efo_prefix = 'http://www.ebi.ac.uk/efo/'
+  # subsets of the schema patterns needing no JSON escaping
+  molecule_pattern = re.compile('^http://identifiers\\.org/chembl\\.compound/CHEMBL[0-9]+$')
+  gene_pattern = re.compile('^http://identifiers\\.org/ensembl/ENSG[0-9]{4,}$')
+  efo_pattern = re.compile('^http://www\\.ebi\\.ac\\.uk/efo/EFO_[0-9]{7,}$')
+
+  def __init__(self, sourceID, date_asserted, access_level = 'public', provenance_type = None,
+               target2drug_evidence_codes = ('http://identifiers.org/eco/target_drug',),
+               drug2clinic_evidence_codes = ('http://identifiers.org/eco/drug_disease',),
+               url_nice_name = 'Clinical Trials Information',
+               target_type = 'http://identifiers.org/cttv.target/protein_evidence',
+               activity = 'http://identifiers.org/cttv.activity/drug_negative_modulator',
+               logger = logger):
+    self.sourceID = sourceID
+    self.date_asserted = date_asserted
+    self.access_level = access_level
+    self.provenance_type = provenance_type or {}
+    self.target2drug_evidence_codes = list(target2drug_evidence_codes)
+    self.drug2clinic_evidence_codes = list(drug2clinic_evidence_codes)
+    self.url_nice_name = url_nice_name
+    self.target_type = target_type
+    self.activity = activity
+    super(DrugBuilder, self).__init__(logger)
+
+  def build_object(self, row):
+    molecule = _uri(row['molecule_id'], self.molecule_prefix)
+    gene = _uri(row['target_id'], self.gene_prefix)
+    disease = _uri(row['disease_id'], self.efo_prefix)
+    urls = row['urls']
+    if isinstance(urls, six.string_types):
+      # template sentinel standing for the whole list
+      urls = [_Placeholder(urls)]
+    elif urls:
+      urls = [evidence_linkout.Linkout(nice_name = self.url_nice_name, url = url) for url in urls]
+    else:
+      urls = None
+    obj = core.Drug(type = 'known_drug')
+    obj.sourceID = self.sourceID
+    obj.access_level = self.access_level
+    obj.validated_against_schema_version = core.__version__
+    obj.unique_association_fields = {'target': gene, 'disease': disease, 'chembl_molecule': molecule}
+    obj.target = bioentity.Target(id = gene, target_type = self.target_type, activity = self.activity)
+    obj.disease = bioentity.Disease(id = disease)
+    obj.drug = bioentity.Drug(
+      id = molecule,
+      molecule_name = row['molecule_name'],
+      molecule_type = row['molecule_type'],
+      max_phase_for_all_diseases = evidence_drug.Diseasephase(numeric_index = _number(row['max_phase'], int),
+                                                              label = row['max_phase_label']))
+    obj.evidence = core.DrugEvidence(
+      target2drug = evidence_drug.Target2Drug(
+        evidence_codes = list(self.target2drug_evidence_codes),
+        mechanism_of_action = row['mechanism_of_action'],
+        action_type = row['action_type'],
+        provenance_type = evidence_core.BaseProvenance_Type.fromDict(self.provenance_type),
+        date_asserted = self.date_asserted,
+        is_associated = True,
+        resource_score = evidence_score.Probability(type = 'probability', value = 1)),
+      drug2clinic = evidence_drug.Drug2Clinic(
+        evidence_codes = list(self.drug2clinic_evidence_codes),
+        max_phase_for_disease = evidence_drug.Diseasephase(numeric_index = _number(row['phase'], int),
+                                                           label = row['phase_label']),
+        urls = urls,
+        provenance_type = evidence_core.BaseProvenance_Type.fromDict(self.provenance_type),
+        date_asserted = self.date_asserted,
+        is_associated = True,
+        resource_score = evidence_score.Probability(type = 'probability', value = 1)))
+    return obj
+
+  def _phase(self, value):
+    """
+    :returns: value as an int when it is a known phase, None otherwise
+    """
+    value = _number(value, float)
+    if isinstance(value, float) and value.is_integer() and int(value) in self.phase_labels:
+      return int(value)
+    return None
+
+  def prepare(self, columns, size):
+    columns = dict((name, _as_list(columns[name])) for name in self.input_columns)
+    records = collections.OrderedDict()
+    for i in range(size):
+      key = (_uri(columns['molecule_id'][i], self.molecule_prefix),
+             _uri(columns['target_id'][i], self.gene_prefix),
+             _uri(columns['disease_id'][i], self.efo_prefix))
+      record = records.get(key)
+      if record is None:
+        record = records[key] = {'molecule_id': key[0], 'target_id': key[1], 'disease_id': key[2],
+                                 'phase': None, 'urls': []}
+      phase = self._phase(columns['phase'][i])
+      if phase is None:
+        # unknown phases are kept for validate() to report unless a row gives a known one
+        if record['phase'] is None and _number(columns['phase'][i], float) is not None:
+          record['phase'] = columns['phase'][i]
+      elif self._phase(record['phase']) is None or phase > record['phase']:
+        record['phase'] = phase
+      for name in ('molecule_name', 'molecule_type', 'mechanism_of_action', 'action_type'):
+        if record.get(name) is None and not _missing(columns[name][i]):
+          record[name] = columns[name][i]
+      url = columns['trial_url'][i]
+      if isinstance(url, six.string_types) and url and not url in record['urls']:
+        record['urls'].append(url)
+    max_phases = dict()
+    for record in records.values():
+      if self._phase(record['phase']) is not None:
+        max_phases[record['molecule_id']] = max(record['phase'], max_phases.get(record['molecule_id'], 0))
+    prepared = dict((name, []) for name in self.columns)
+    for record in records.values():
+      record['phase_label'] = self.phase_labels.get(record['phase'])
+      record['max_phase'] = max_phases.get(record['molecule_id'])
+      record['max_phase_label'] = self.phase_labels.get(record['max_phase'])
+      for name in self.columns:
+        prepared[name].append(record.get(name))
+    return prepared, len(records)
+
+  def encode(self, columns, size):
+    encoded = dict()
+    checks = []
+    for name, prefix, pattern, entity in (('molecule_id', self.molecule_prefix, self.molecule_pattern, 'drug'),
+                                          ('target_id', self.gene_prefix, self.gene_pattern, 'target'),
+                                          ('disease_id', self.efo_prefix, self.efo_pattern, 'disease')):
+      encoded[name], valid = format_ids(columns[name], prefix, pattern, entity)
+      checks.append((name, valid))
+    for name in ('phase', 'max_phase'):
+      encoded[name] = [str(value) if self._phase(value) is not None else None for value in columns[name]]
+      checks.append((name, [True if text is not None else (None if _number(value, float) is None else False) for text, value in zip(encoded[name], columns[name])]))
+    for name in ('molecule_name', 'molecule_type', 'mechanism_of_action', 'action_type', 'phase_label', 'max_phase_label'):
+      encoded[name], valid = _strings(columns[name])
+      checks.append((name, valid))
+    nice_name = '{"nice_name": ' + json.dumps(self.url_nice_name) + ', "url": '
+    encoded['urls'] = [', '.join(nice_name + json.dumps(url) + '}' for url in urls) if urls else None for urls in columns['urls']]
+    checks.append(('urls', [True if value is not None else None for value in encoded['urls']]))
+    return encoded, checks
+
+"""
+Expression evidence from differential expression tables
+"""
+class ExpressionBuilder(TemplateBuilder):
+  """
+  One rna_expression evidence per row of gene and disease ids, comparison
+  name, log2 fold change, p-value, test and reference samples and replicate
+  counts and confidence level. The percentile ranks of the fold changes are
+  computed over the whole batch, which should therefore hold the table of
+  one experiment, and the target activity follows the sign of the fold
+  change.
+  Arguments:
+  :param sourceID = datasource name
+  :param unique_experiment_reference = reference of the experiment, e.g. STUDYID_E-GEOD-25628
+  :param experiment_overview = description of the experiment
+  :param date_asserted = ISO 8601 date of the assertion
+  :param access_level = 'public' or 'private'
+  :param provenance_type = dict of the provenance, defaults to no provenance details
+  :param evidence_codes = evidence codes of the expression
+  :param organism_part = organism part of the samples, if any
+  :param target_type = target type URI
+  :param absolute = True to rank the absolute fold changes
+  :param logger = logger receiving the validation errors of rejected rows
+  """
+  input_columns = ('gene_id', 'efo_id', 'comparison_name', 'log2_fold_change', 'pvalue', 'test_sample', 'reference_sample',
+                   'test_replicates_n', 'reference_replicates_n', 'confidence_level')
+  columns = input_columns + ('percentile_rank', 'activity')
+  categorical = ('confidence_level',)
+  probe = {'gene_id': 'ENSG00000000001', 'efo_id': 'EFO_0000001', 'comparison_name': 'disease vs normal',
+           'log2_fold_change': 1.0, 'pvalue': 0.5, 'test_sample': 'disease', 'reference_sample': 'normal',
+           'test_replicates_n': 3, 'reference_replicates_n': 3, 'confidence_level': 'medium', 'percentile_rank': 50,
+           'activity': 'http://identifiers.org/cttv.activity/increased_transcript_level'}
+  activities = ('http://identifiers.org/cttv.activity/decreased_transcript_level',
+                'http://identifiers.org/cttv.activity/increased_transcript_level')
+
+  gene_prefix = 'http://identifiers.org/ensembl/'
+  efo_prefix = 'http://www.ebi.ac.uk/efo/'
+  # subsets of the schema patterns needing no JSON escaping
+  gene_pattern = re.compile('^http://identifiers\\.org/ensembl/ENSG[0-9]{4,}$')
+  efo_pattern = re.compile('^http://www\\.ebi\\.ac\\.uk/efo/EFO_[0-9]{7,}$')
+
+  def __init__(self, sourceID, unique_experiment_reference, experiment_overview, date_asserted, access_level = 'public',
+               provenance_type = None, evidence_codes = ('http://purl.obolibrary.org/obo/ECO_0000356',),
+               organism_part = None, target_type = 'http://identifiers.org/cttv.target/transcript_evidence',
+               absolute = True, logger = logger):
+    self.sourceID = sourceID
+    self.unique_experiment_reference = unique_experiment_reference
+    self.experiment_overview = experiment_overview
+    self.date_asserted = date_asserted
+    self.access_level = access_level
+    self.provenance_type = provenance_type or {}
+    self.evidence_codes = list(evidence_codes)
+    self.organism_part = organism_part
+    self.target_type = target_type
+    self.absolute = absolute
+    super(ExpressionBuilder, self).__init__(logger)
+
+  def build_object(self, row):
+    gene = _uri(row['gene_id'], self.gene_prefix)
+    disease = _uri(row['efo_id'], self.efo_prefix)
+    obj = core.Expression(type = 'rna_expression')
+    obj.sourceID = self.sourceID
+    obj.access_level = self.access_level
+    obj.validated_against_schema_version = core.__version__
+    obj.unique_association_fields = {'target': gene, 'disease': disease, 'study': self.unique_experiment_reference,
+                                     'comparison_name': row['comparison_name']}
+    obj.target = bioentity.Target(id = gene, target_type = self.target_type, activity = row['activity'])
+    obj.disease = bioentity.Disease(id = disease)
+    obj.evidence = evidence_core.Expression(
+      organism_part = self.organism_part,
+      comparison_name = row['comparison_name'],
+      log2_fold_change = evidence_core.ExpressionLog2_Fold_Change(value = _number(row['log2_fold_change'], float),
+                                                                  percentile_rank = _number(row['percentile_rank'], int)),
+      test_sample = row['test_sample'],
+      reference_sample = row['reference_sample'],
+      test_replicates_n = _number(row['test_replicates_n'], int),
+      reference_replicates_n = _number(row['reference_replicates_n'], int),
+      confidence_level = row['confidence_level'],
+      experiment_overview = self.experiment_overview,
+      evidence_codes = list(self.evidence_codes),
+      unique_experiment_reference = self.unique_experiment_reference,
+      provenance_type = evidence_core.BaseProvenance_Type.fromDict(self.provenance_type),
+      date_asserted = self.date_asserted,
+      is_associated = True,
+      resource_score = evidence_score.Pvalue(type = 'pvalue', value = _number(row['pvalue'], float)))
+    return obj
+
+  def prepare(self, columns, size):
+    columns = dict(columns)
+    columns['percentile_rank'] = percentile_ranks(columns['log2_fold_change'], absolute = self.absolute)
+    if numpy is not None:
+      values = _floats(columns['log2_fold_change'])
+      columns['activity'] = numpy.where(values < 0, self.activities[0], self.activities[1]).tolist()
+    else:
+      columns['activity'] = [self.activities[0] if isinstance(value, float) and value < 0 else self.activities[1]
+                             for value in (_number(cell, float) for cell in _as_list(columns['log2_fold_change']))]
+    return columns, size
+
+  def encode(self, columns, size):
+    encoded = dict()
+    checks = []
+    for name, prefix, pattern, entity in (('gene_id', self.gene_prefix, self.gene_pattern, 'target'), ('efo_id', self.efo_prefix, self.efo_pattern, 'disease')):
+      encoded[name], valid = format_ids(columns[name], prefix, pattern, entity)
+      checks.append((name, valid))
+    encoded['log2_fold_change'], valid = format_numbers(columns['log2_fold_change'])
+    checks.append(('log2_fold_change', valid))
+    encoded['pvalue'], valid = format_numbers(columns['pvalue'], minimum = 0, maximum = 1, exclusive_minimum = True)
+    checks.append(('pvalue', valid))
+    for name in ('test_replicates_n', 'reference_replicates_n'):
+      encoded[name], valid = format_numbers(columns[name], minimum = 1, integer = True)
+      checks.append((name, valid))
+    # no rank for an invalid fold change, already rejected by its own check
+    encoded['percentile_rank'] = [str(value) if value is not None else None for value in columns['percentile_rank']]
+    for name in ('comparison_name', 'test_sample', 'reference_sample', 'activity', 'confidence_level'):
+      encoded[name], valid = _strings(columns[name])
+      checks.append((name, valid))
+    checks.append(('confidence_level', self.valid_categories('confidence_level', columns['confidence_level'])))
+    return encoded, checks
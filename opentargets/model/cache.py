@@ -0,0 +1,255 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+import collections
+import six
+import opentargets.model.bioentity as bioentity
+import opentargets.model.evidence.linkout as evidence_linkout
+import opentargets.model.fields as fields
+import opentargets.model.loggers as loggers
+import opentargets.model.overlays as overlays
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+def structural_key(value):
+  """
+  Hashable form of a JSON value, model objects being taken through their attributes;
+  scalars are tagged with their type so that 1, 1.0 and True stay distinct
+  :returns: nested tuples
+  """
+  if isinstance(value, dict):
+    return ('{}',) + tuple(sorted((key, structural_key(item)) for key, item in value.items()))
+  if isinstance(value, (list, tuple)):
+    return ('[]',) + tuple(structural_key(item) for item in value)
+  if value is None or isinstance(value, six.string_types):
+    return value
+  if isinstance(value, (bool, float) + six.integer_types):
+    return (type(value).__name__, value)
+  return (type(value).__name__, structural_key(vars(value)))
+
+def _frozen_setattr(self, name, value):
+  raise AttributeError("{0} - shared flyweight instances are read-only, use cloneObject to get a mutable copy".format(type(self).__name__))
+
+def _frozen_delattr(self, name):
+  raise AttributeError("{0} - shared flyweight instances are read-only, use cloneObject to get a mutable copy".format(type(self).__name__))
+
+"""
+List held by a shared flyweight instance
+"""
+class _FrozenList(list):
+  """
+  Still a list to validate() and serialize(), raising TypeError on in place
+  changes; pickles and copies to a plain list
+  """
+  def _read_only(self, *args, **kwargs):
+    raise TypeError("lists of shared flyweight instances are read-only, use cloneObject to get a mutable copy")
+
+  append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+  __setitem__ = __delitem__ = __iadd__ = __imul__ = __setslice__ = __delslice__ = _read_only
+
+  def __reduce_ex__(self, protocol):
+    return (list, (list(self),))
+
+def _frozen_reduce_ex(self, protocol):
+  # pickled as a mutable instance of the generated class
+  return _frozen.reduce(self)
+
+def _frozen_cloneObject(cls, clone):
+  return _frozen.base(cls).cloneObject(clone)
+
+def _frozen_fromDict(cls, dict_obj, *args, **kwargs):
+  return _frozen.base(cls).fromDict(dict_obj, *args, **kwargs)
+
+_frozen = overlays.Overlay({
+  '__setattr__': _frozen_setattr, '__delattr__': _frozen_delattr, '__reduce_ex__': _frozen_reduce_ex,
+  'cloneObject': classmethod(_frozen_cloneObject), 'fromDict': classmethod(_frozen_fromDict)})
+
+"""
+Size-bounded LRU installed on model classes as a class attribute
+"""
+class _InstalledCache(object):
+  """
+  Arguments:
+  :param max_size = maximum number of entries kept
+  :param classes = classes the cache is installed on
+  """
+  attribute = None
+  classes = ()
+
+  def __init__(self, max_size = 100000, classes = None):
+    if max_size < 1:
+      raise ValueError("{0} - max_size should be greater than or equal to 1".format(type(self).__name__))
+    self.max_size = max_size
+    if classes is not None:
+      self.classes = tuple(classes)
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self._entries = collections.OrderedDict()
+
+  def lookup(self, key):
+    """
+    :returns: the entry stored under key, None on a miss
+    """
+    entry = self._entries.pop(key, None)
+    if entry is None:
+      self.misses = self.misses + 1
+      return None
+    # move to the most recently used end
+    self._entries[key] = entry
+    self.hits = self.hits + 1
+    return entry
+
+  def _put(self, key, entry):
+    if len(self._entries) >= self.max_size:
+      self._entries.popitem(last=False)
+      self.evictions = self.evictions + 1
+    self._entries[key] = entry
+
+  def stats(self):
+    """
+    :returns: dict of hits, misses, evictions, size and hit ratio
+    """
+    lookups = self.hits + self.misses
+    return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self._entries),
+            'hit_ratio': float(self.hits) / lookups if lookups else 0.0}
+
+  def clear(self):
+    self._entries.clear()
+
+  def install(self):
+    for cls in self.classes:
+      setattr(cls, self.attribute, self)
+    return self
+
+  def uninstall(self):
+    for cls in self.classes:
+      if cls.__dict__.get(self.attribute) is self:
+        setattr(cls, self.attribute, None)
+
+  def __enter__(self):
+    return self.install()
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.uninstall()
+
+"""
+Opt-in sharing of identical Target, Disease and Drug sub-objects
+"""
+class FlyweightCache(_InstalledCache):
+  """
+  Once installed, fromDict of the cached classes returns one shared
+  instance per distinct payload instead of a new object. Shared instances
+  are frozen with the model objects they hold: these belong to read-only
+  subclasses raising AttributeError on assignment, and their lists to a
+  list subclass raising TypeError on in place changes. cloneObject and
+  pickling still give mutable copies. Entries are kept in a size-bounded LRU.
+  Arguments:
+  :param max_size = maximum number of shared instances kept
+  :param classes = classes sharing their instances
+  """
+  attribute = 'flyweights'
+  classes = (bioentity.Target, bioentity.Disease, bioentity.Drug)
+
+  def __init__(self, max_size = 100000, classes = None):
+    super(FlyweightCache, self).__init__(max_size, classes)
+
+  def key(self, cls, dict_obj, mask = None):
+    """
+    :returns: cache key of the instance of cls built from dict_obj, None when it can not be shared
+    """
+    if not isinstance(dict_obj, dict):
+      return None
+    return (cls, structural_key(dict_obj), None if mask is None else structural_key(fields.field_tree(mask)))
+
+  def store(self, key, obj):
+    """
+    Freeze obj, its nested model objects and lists included, and share it
+    under key, the key computed for the lookup that missed
+    :returns: the frozen instance
+    """
+    if obj is None or key is None:
+      return obj
+    self._put(key, self._freeze(obj))
+    return obj
+
+  def _freeze(self, value):
+    if isinstance(value, list):
+      if isinstance(value, _FrozenList):
+        return value
+      # a new list, the one of the dict decoded by fromDict staying the caller's
+      return _FrozenList(self._freeze(item) for item in value)
+    cls = type(value)
+    if not hasattr(cls, 'cls_keys') or cls in _frozen:
+      return value
+    for name, item in list(vars(value).items()):
+      frozen = self._freeze(item)
+      if frozen is not item:
+        value.__dict__[name] = frozen
+    return _frozen.switch(value)
+
+"""
+Opt-in memoization of the validation of identical leaf sub-objects
+"""
+class ValidationMemo(_InstalledCache):
+  """
+  Once installed, validate() of the memoized classes runs once per
+  distinct content: the error count and the logged messages are kept, the
+  messages being recorded against a placeholder path and rewritten to the
+  current path when replayed. Meant to live for one validation run.
+  Arguments:
+  :param max_size = maximum number of distinct contents kept
+  :param classes = leaf classes whose validation is memoized
+  """
+  attribute = 'validation_memo'
+  classes = (bioentity.Target, bioentity.Disease, bioentity.Variant, evidence_linkout.Linkout)
+  placeholder = '\x00path\x00'
+
+  def __init__(self, max_size = 100000, classes = None):
+    super(ValidationMemo, self).__init__(max_size, classes)
+    self.recording = False
+
+  def validate(self, obj, logger, path = "root"):
+    """
+    Validate obj, or replay the outcome of an identical object
+    :returns: number of errors found during validation
+    """
+    key = (type(obj), structural_key(vars(obj)))
+    entry = self.lookup(key)
+    if entry is None:
+      recorder = loggers.Recorder()
+      self.recording = True
+      try:
+        error = obj.validate(recorder, path = self.placeholder)
+      finally:
+        self.recording = False
+      entry = (error, recorder.messages)
+      self._put(key, entry)
+    error, messages = entry
+    for level, message in messages:
+      getattr(logger, level)(message.replace(self.placeholder, path))
+    return error
@@ -23,6 +23,9 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
+from opentargets.model.exceptions import JSONException, InvalidFieldsException
 import opentargets.model.bioentity as bioentity
 import opentargets.model.evidence.core as evidence_core
 import opentargets.model.evidence.phenotype as evidence_phenotype
@@ -40,10 +43,6 @@ __status__ = "Production"
 
 logger = logging.getLogger(__name__)
 
-class JSONException(Exception):
-  pass
-
-
 """
 https://raw.githubusercontent.com/opentargets/json_schema/master/src/base.json
 """
@@ -59,6 +58,10 @@ class Base(object):
   :param     disease = None
   :param     literature = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
+  cls_types = {'sourceID': 'string', 'access_level': 'string', 'validated_against_schema_version': 'string', 'unique_association_fields': 'object', 'target': 'bioentity.Target', 'disease': 'bioentity.Disease', 'literature': 'BaseLiterature'}
+  cls_enums = {'access_level': ['public', 'private'], 'validated_against_schema_version': ['1.2.8']}
   def __init__(self, sourceID = None, access_level = None, validated_against_schema_version = None, unique_association_fields = None,     target = None,     disease = None,     literature = None):
     
     """
@@ -121,26 +124,32 @@ class Base(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Base.cls_keys
+    fields = field_tree(fields)
+    if strict and cls is Base and isinstance(dict_obj, dict):
+      # subclasses check their keys, those of Base included, before calling super
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Base', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Base - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'sourceID' in dict_obj:
+    if  'sourceID' in dict_obj and (fields is None or 'sourceID' in fields):
         obj.sourceID = dict_obj['sourceID']
-    if  'access_level' in dict_obj:
+    if  'access_level' in dict_obj and (fields is None or 'access_level' in fields):
         obj.access_level = dict_obj['access_level']
-    if  'validated_against_schema_version' in dict_obj:
+    if  'validated_against_schema_version' in dict_obj and (fields is None or 'validated_against_schema_version' in fields):
         obj.validated_against_schema_version = dict_obj['validated_against_schema_version']
-    if  'unique_association_fields' in dict_obj:
+    if  'unique_association_fields' in dict_obj and (fields is None or 'unique_association_fields' in fields):
         obj.unique_association_fields = dict_obj['unique_association_fields']
-    if  'target' in dict_obj:
-        obj.target = bioentity.Target.fromDict(dict_obj['target'])
-    if  'disease' in dict_obj:
-        obj.disease = bioentity.Disease.fromDict(dict_obj['disease'])
-    if  'literature' in dict_obj:
-        obj.literature = BaseLiterature.fromDict(dict_obj['literature'])
+    if  'target' in dict_obj and (fields is None or 'target' in fields):
+        obj.target = bioentity.Target.fromDict(dict_obj['target'], strict = strict, fields = fields and fields['target'] or None)
+    if  'disease' in dict_obj and (fields is None or 'disease' in fields):
+        obj.disease = bioentity.Disease.fromDict(dict_obj['disease'], strict = strict, fields = fields and fields['disease'] or None)
+    if  'literature' in dict_obj and (fields is None or 'literature' in fields):
+        obj.literature = BaseLiterature.fromDict(dict_obj['literature'], strict = strict, fields = fields and fields['literature'] or None)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -220,6 +229,10 @@ class BaseLiterature(object):
   Arguments:
   :param references = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['references']
+  cls_types = {'references': ['evidence_core.Single_Lit_Reference']}
+  cls_enums = {}
   def __init__(self, references = None):
     
     """
@@ -237,16 +250,22 @@ class BaseLiterature(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['references']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = BaseLiterature.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('BaseLiterature', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("BaseLiterature - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if 'references' in dict_obj and isinstance(dict_obj['references'], list):
+    if 'references' in dict_obj and (fields is None or 'references' in fields) and isinstance(dict_obj['references'], list):
         obj.references = list()
         for item in dict_obj['references']:
-            obj.references.append(evidence_core.Single_Lit_Reference.fromDict(item))
+            obj.references.append(evidence_core.Single_Lit_Reference.fromDict(item, strict = strict, fields = fields and fields['references'] or None))
     return obj
   
   def validate(self, logger, path = "root"):
@@ -294,6 +313,10 @@ class Animal_Models(Base):
   :param     disease = None
   :param     literature = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
+  cls_types = {'type': 'string', 'evidence': 'Animal_ModelsEvidence'}
+  cls_enums = {'type': ['animal_model']}
   def __init__(self, type = None, evidence = None, sourceID = None, access_level = None, validated_against_schema_version = None, unique_association_fields = None,     target = None,     disease = None,     literature = None):
     """
     Call super constructor
@@ -323,16 +346,22 @@ class Animal_Models(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
-    obj = super(Animal_Models, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Animal_Models.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Animal_Models', invalid_fields, cls_keys)
+    obj = super(Animal_Models, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Animal_Models - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'evidence' in dict_obj:
-        obj.evidence = Animal_ModelsEvidence.fromDict(dict_obj['evidence'])
+    if  'evidence' in dict_obj and (fields is None or 'evidence' in fields):
+        obj.evidence = Animal_ModelsEvidence.fromDict(dict_obj['evidence'], strict = strict, fields = fields and fields['evidence'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Animal_Models - invalid field - {0} found".format(key))
@@ -409,6 +438,10 @@ class Animal_ModelsEvidence(object):
   :param biological_model = None
   :param disease_model_association = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['orthologs','biological_model','disease_model_association']
+  cls_types = {'orthologs': 'evidence_phenotype.Orthologs', 'biological_model': 'evidence_phenotype.Biological_Model', 'disease_model_association': 'evidence_phenotype.Disease_Model_Association'}
+  cls_enums = {}
   def __init__(self, orthologs = None, biological_model = None, disease_model_association = None):
     """
     Name: orthologs
@@ -432,18 +465,24 @@ class Animal_ModelsEvidence(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['orthologs','biological_model','disease_model_association']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Animal_ModelsEvidence.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Animal_ModelsEvidence', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Animal_ModelsEvidence - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'orthologs' in dict_obj:
-        obj.orthologs = evidence_phenotype.Orthologs.fromDict(dict_obj['orthologs'])
-    if  'biological_model' in dict_obj:
-        obj.biological_model = evidence_phenotype.Biological_Model.fromDict(dict_obj['biological_model'])
-    if  'disease_model_association' in dict_obj:
-        obj.disease_model_association = evidence_phenotype.Disease_Model_Association.fromDict(dict_obj['disease_model_association'])
+    if  'orthologs' in dict_obj and (fields is None or 'orthologs' in fields):
+        obj.orthologs = evidence_phenotype.Orthologs.fromDict(dict_obj['orthologs'], strict = strict, fields = fields and fields['orthologs'] or None)
+    if  'biological_model' in dict_obj and (fields is None or 'biological_model' in fields):
+        obj.biological_model = evidence_phenotype.Biological_Model.fromDict(dict_obj['biological_model'], strict = strict, fields = fields and fields['biological_model'] or None)
+    if  'disease_model_association' in dict_obj and (fields is None or 'disease_model_association' in fields):
+        obj.disease_model_association = evidence_phenotype.Disease_Model_Association.fromDict(dict_obj['disease_model_association'], strict = strict, fields = fields and fields['disease_model_association'] or None)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -512,6 +551,10 @@ class Drug(Base):
   :param     disease = None
   :param     literature = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','drug','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
+  cls_types = {'type': 'string', 'drug': 'bioentity.Drug', 'evidence': 'DrugEvidence'}
+  cls_enums = {'type': ['known_drug']}
   def __init__(self, type = None, drug = None, evidence = None, sourceID = None, access_level = None, validated_against_schema_version = None, unique_association_fields = None,     target = None,     disease = None,     literature = None):
     """
     Call super constructor
@@ -546,18 +589,24 @@ class Drug(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','drug','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
-    obj = super(Drug, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Drug.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Drug', invalid_fields, cls_keys)
+    obj = super(Drug, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Drug - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'drug' in dict_obj:
-        obj.drug = bioentity.Drug.fromDict(dict_obj['drug'])
-    if  'evidence' in dict_obj:
-        obj.evidence = DrugEvidence.fromDict(dict_obj['evidence'])
+    if  'drug' in dict_obj and (fields is None or 'drug' in fields):
+        obj.drug = bioentity.Drug.fromDict(dict_obj['drug'], strict = strict, fields = fields and fields['drug'] or None)
+    if  'evidence' in dict_obj and (fields is None or 'evidence' in fields):
+        obj.evidence = DrugEvidence.fromDict(dict_obj['evidence'], strict = strict, fields = fields and fields['evidence'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Drug - invalid field - {0} found".format(key))
@@ -643,6 +692,10 @@ class DrugEvidence(object):
   :param target2drug = None
   :param drug2clinic = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['target2drug','drug2clinic']
+  cls_types = {'target2drug': 'evidence_drug.Target2Drug', 'drug2clinic': 'evidence_drug.Drug2Clinic'}
+  cls_enums = {}
   def __init__(self, target2drug = None, drug2clinic = None):
     """
     Name: target2drug
@@ -661,16 +714,22 @@ class DrugEvidence(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['target2drug','drug2clinic']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = DrugEvidence.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('DrugEvidence', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("DrugEvidence - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'target2drug' in dict_obj:
-        obj.target2drug = evidence_drug.Target2Drug.fromDict(dict_obj['target2drug'])
-    if  'drug2clinic' in dict_obj:
-        obj.drug2clinic = evidence_drug.Drug2Clinic.fromDict(dict_obj['drug2clinic'])
+    if  'target2drug' in dict_obj and (fields is None or 'target2drug' in fields):
+        obj.target2drug = evidence_drug.Target2Drug.fromDict(dict_obj['target2drug'], strict = strict, fields = fields and fields['target2drug'] or None)
+    if  'drug2clinic' in dict_obj and (fields is None or 'drug2clinic' in fields):
+        obj.drug2clinic = evidence_drug.Drug2Clinic.fromDict(dict_obj['drug2clinic'], strict = strict, fields = fields and fields['drug2clinic'] or None)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -728,6 +787,10 @@ class Expression(Base):
   :param     disease = None
   :param     literature = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
+  cls_types = {'type': 'string', 'evidence': 'evidence_core.Expression'}
+  cls_enums = {'type': ['rna_expression']}
   def __init__(self, type = None, evidence = None, sourceID = None, access_level = None, validated_against_schema_version = None, unique_association_fields = None,     target = None,     disease = None,     literature = None):
     """
     Call super constructor
@@ -757,16 +820,22 @@ class Expression(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
-    obj = super(Expression, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Expression.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Expression', invalid_fields, cls_keys)
+    obj = super(Expression, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Expression - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'evidence' in dict_obj:
-        obj.evidence = evidence_core.Expression.fromDict(dict_obj['evidence'])
+    if  'evidence' in dict_obj and (fields is None or 'evidence' in fields):
+        obj.evidence = evidence_core.Expression.fromDict(dict_obj['evidence'], strict = strict, fields = fields and fields['evidence'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Expression - invalid field - {0} found".format(key))
@@ -850,6 +919,10 @@ class Genetics(Base):
   :param     disease = None
   :param     literature = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','variant','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
+  cls_types = {'type': 'string', 'variant': 'bioentity.Variant', 'evidence': 'GeneticsEvidence'}
+  cls_enums = {'type': ['genetic_association']}
   def __init__(self, type = None, variant = None, evidence = None, sourceID = None, access_level = None, validated_against_schema_version = None, unique_association_fields = None,     target = None,     disease = None,     literature = None):
     """
     Call super constructor
@@ -884,18 +957,24 @@ class Genetics(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','variant','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
-    obj = super(Genetics, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Genetics.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Genetics', invalid_fields, cls_keys)
+    obj = super(Genetics, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Genetics - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'variant' in dict_obj:
-        obj.variant = bioentity.Variant.fromDict(dict_obj['variant'])
-    if  'evidence' in dict_obj:
-        obj.evidence = GeneticsEvidence.fromDict(dict_obj['evidence'])
+    if  'variant' in dict_obj and (fields is None or 'variant' in fields):
+        obj.variant = bioentity.Variant.fromDict(dict_obj['variant'], strict = strict, fields = fields and fields['variant'] or None)
+    if  'evidence' in dict_obj and (fields is None or 'evidence' in fields):
+        obj.evidence = GeneticsEvidence.fromDict(dict_obj['evidence'], strict = strict, fields = fields and fields['evidence'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Genetics - invalid field - {0} found".format(key))
@@ -981,6 +1060,10 @@ class GeneticsEvidence(object):
   :param gene2variant = None
   :param variant2disease = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['gene2variant','variant2disease']
+  cls_types = {'gene2variant': 'evidence_genetics.Gene2Variant', 'variant2disease': 'evidence_genetics.Variant2Disease'}
+  cls_enums = {}
   def __init__(self, gene2variant = None, variant2disease = None):
     """
     Name: gene2variant
@@ -999,16 +1082,22 @@ class GeneticsEvidence(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['gene2variant','variant2disease']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = GeneticsEvidence.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('GeneticsEvidence', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("GeneticsEvidence - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'gene2variant' in dict_obj:
-        obj.gene2variant = evidence_genetics.Gene2Variant.fromDict(dict_obj['gene2variant'])
-    if  'variant2disease' in dict_obj:
-        obj.variant2disease = evidence_genetics.Variant2Disease.fromDict(dict_obj['variant2disease'])
+    if  'gene2variant' in dict_obj and (fields is None or 'gene2variant' in fields):
+        obj.gene2variant = evidence_genetics.Gene2Variant.fromDict(dict_obj['gene2variant'], strict = strict, fields = fields and fields['gene2variant'] or None)
+    if  'variant2disease' in dict_obj and (fields is None or 'variant2disease' in fields):
+        obj.variant2disease = evidence_genetics.Variant2Disease.fromDict(dict_obj['variant2disease'], strict = strict, fields = fields and fields['variant2disease'] or None)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -1066,6 +1155,10 @@ class Literature_Curated(Base):
   :param     disease = None
   :param     literature = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
+  cls_types = {'type': 'string', 'evidence': 'evidence_core.Literature_Curated'}
+  cls_enums = {'type': ['genetic_literature', 'affected_pathway', 'somatic_mutation']}
   def __init__(self, type = None, evidence = None, sourceID = None, access_level = None, validated_against_schema_version = None, unique_association_fields = None,     target = None,     disease = None,     literature = None):
     """
     Call super constructor
@@ -1095,16 +1188,22 @@ class Literature_Curated(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
-    obj = super(Literature_Curated, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Literature_Curated.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Literature_Curated', invalid_fields, cls_keys)
+    obj = super(Literature_Curated, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Literature_Curated - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'evidence' in dict_obj:
-        obj.evidence = evidence_core.Literature_Curated.fromDict(dict_obj['evidence'])
+    if  'evidence' in dict_obj and (fields is None or 'evidence' in fields):
+        obj.evidence = evidence_core.Literature_Curated.fromDict(dict_obj['evidence'], strict = strict, fields = fields and fields['evidence'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Literature_Curated - invalid field - {0} found".format(key))
@@ -1187,6 +1286,10 @@ class Literature_Mining(Base):
   :param     disease = None
   :param     literature = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
+  cls_types = {'type': 'string', 'evidence': 'evidence_core.Literature_Mining'}
+  cls_enums = {'type': ['literature']}
   def __init__(self, type = None, evidence = None, sourceID = None, access_level = None, validated_against_schema_version = None, unique_association_fields = None,     target = None,     disease = None,     literature = None):
     """
     Call super constructor
@@ -1216,16 +1319,22 @@ class Literature_Mining(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','evidence','sourceID','access_level','validated_against_schema_version','unique_association_fields','target','disease','literature']
-    obj = super(Literature_Mining, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Literature_Mining.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Literature_Mining', invalid_fields, cls_keys)
+    obj = super(Literature_Mining, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Literature_Mining - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'evidence' in dict_obj:
-        obj.evidence = evidence_core.Literature_Mining.fromDict(dict_obj['evidence'])
+    if  'evidence' in dict_obj and (fields is None or 'evidence' in fields):
+        obj.evidence = evidence_core.Literature_Mining.fromDict(dict_obj['evidence'], strict = strict, fields = fields and fields['evidence'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Literature_Mining - invalid field - {0} found".format(key))
@@ -1290,3 +1399,28 @@ class Literature_Mining(Base):
       return json.dumps(self.serialize(), sort_keys=True, check_circular=False, indent=indentation)
     elif sys.version_info[0] == 2:
       return json.dumps(self, default=lambda o: o.serialize(), sort_keys=True, check_circular=False, indent=indentation)
+
+"""
+Evidence class of each value of the type field
+"""
+EVIDENCE_CLASSES = {
+  'animal_model': Animal_Models,
+  'known_drug': Drug,
+  'rna_expression': Expression,
+  'genetic_association': Genetics,
+  'genetic_literature': Literature_Curated,
+  'affected_pathway': Literature_Curated,
+  'somatic_mutation': Literature_Curated,
+  'literature': Literature_Mining,
+}
+
+def evidence_fromDict(dict_obj, strict = False, fields = None):
+  """
+  Build the evidence object matching the type of a raw evidence dict
+  :returns: the evidence object, None when the type is unknown or the dict is invalid
+  """
+  cls = EVIDENCE_CLASSES.get(dict_obj.get('type')) if isinstance(dict_obj, dict) else None
+  if cls is None:
+    logger.warn("evidence_fromDict - unknown evidence type {0}".format(dict_obj.get('type') if isinstance(dict_obj, dict) else type(dict_obj)))
+    return
+  return cls.fromDict(dict_obj, strict = strict, fields = fields)
@@ -0,0 +1,224 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+import six
+import opentargets.model.core as core
+import opentargets.model.fields as fields
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+"""
+Small integer codes of URIs, a set of URIs being an int with their bits set
+"""
+class CodeRegistry(object):
+  """
+  Codes are given in registration order, unknown URIs being registered when
+  first met, so that a bitset always decodes back to its URIs. Sets decode
+  in code order: lists in another order, or with duplicates, do not round
+  trip (see is_canonical).
+  Arguments:
+  :param uris = URIs taking the first codes
+  """
+  def __init__(self, uris = None):
+    self.uris = []
+    self.codes = dict()
+    for uri in uris or []:
+      self.register(uri)
+
+  def register(self, uri):
+    """
+    :returns: the code of uri
+    """
+    code = self.codes.get(uri)
+    if code is None:
+      code = self.codes[uri] = len(self.uris)
+      self.uris.append(uri)
+    return code
+
+  def encode(self, uris):
+    """
+    :returns: bitset of an iterable of URIs
+    """
+    bits = 0
+    for uri in uris:
+      bits |= 1 << self.register(uri)
+    return bits
+
+  def lookup(self, uris):
+    """
+    Bitset of the URIs already registered, the unknown ones being left out
+    rather than registered: checks and lookups use it, so that invalid
+    values do not grow the registry
+    :returns: bitset of an iterable of URIs
+    """
+    bits = 0
+    for uri in uris:
+      code = self.codes.get(uri)
+      if code is not None:
+        bits |= 1 << code
+    return bits
+
+  def decode(self, bits):
+    """
+    :returns: list of the URIs of a bitset, in code order
+    """
+    uris = []
+    code = 0
+    while bits:
+      if bits & 1:
+        uris.append(self.uris[code])
+      bits >>= 1
+      code += 1
+    return uris
+
+  def is_canonical(self, uris):
+    """
+    :returns: True when decode(encode(uris)) gives uris back
+    """
+    codes = [self.codes.get(uri) for uri in uris]
+    return all(code is not None for code in codes) and all(a < b for a, b in zip(codes, codes[1:]))
+
+  def __len__(self):
+    return len(self.uris)
+
+  def __contains__(self, uri):
+    return uri in self.codes
+
+def has_any(bits, mask):
+  return bits & mask != 0
+
+def has_all(bits, mask):
+  return bits & mask == mask
+
+def _walk(cls, visit, segments = (), seen = ()):
+  """
+  Call visit(declaring class, segments, name, enum) for the enumerated arrays of strings reachable from cls
+  """
+  for name, kind, enum in fields.class_fields(cls):
+    if kind == ['string'] and enum:
+      visit(cls, segments, name, enum)
+      continue
+    path = segments + (name,)
+    if isinstance(kind, list):
+      kind, path = kind[0], path + (None,)
+    for candidate in (kind if isinstance(kind, tuple) else (kind,)):
+      if isinstance(candidate, type) and not candidate in seen:
+        _walk(candidate, visit, path, seen + (candidate,))
+
+def _schema_codes(field):
+  codes = []
+  def visit(cls, segments, name, enum):
+    if name == field:
+      codes.extend(uri for uri in enum if not uri in codes)
+  for cls in core.EVIDENCE_CLASSES.values():
+    _walk(cls, visit, seen = (cls,))
+  return codes
+
+# evidence codes of the schema, in the order of the evidence classes
+ECO = CodeRegistry(_schema_codes('evidence_codes'))
+
+_allowed = dict()
+_code_paths = dict()
+
+def allowed(cls, field = 'evidence_codes', registry = ECO):
+  """
+  :returns: bitset of the values accepted by an enumerated array of strings of cls
+  """
+  key = (cls, field, id(registry))
+  if not key in _allowed:
+    enums = dict((name, enum) for name, kind, enum in fields.class_fields(cls))
+    _allowed[key] = registry.encode(enums.get(field) or [])
+  return _allowed[key]
+
+def code_paths(cls, field = 'evidence_codes'):
+  """
+  :returns: list of (segments, declaring class) of the field among the objects reachable
+  from cls, None standing for array items in segments
+  """
+  if not (cls, field) in _code_paths:
+    result = []
+    def visit(klass, segments, name, enum):
+      if name == field:
+        result.append((segments, klass))
+    _walk(cls, visit, seen = (cls,))
+    _code_paths[(cls, field)] = result
+  return _code_paths[(cls, field)]
+
+def _codes(holder, field):
+  uris = holder.get(field) if isinstance(holder, dict) else getattr(holder, field, None)
+  if not isinstance(uris, list):
+    return None
+  return [uri for uri in uris if isinstance(uri, six.string_types)]
+
+def record_bits(record, field = 'evidence_codes', registry = ECO):
+  """
+  Evidence codes of a raw evidence dict or model object, all its sub-evidence
+  included, codes unknown to the registry being left out
+  :returns: bitset, 0 for records of unknown type
+  """
+  cls = core.EVIDENCE_CLASSES.get(record.get('type') if isinstance(record, dict) else getattr(record, 'type', None))
+  bits = 0
+  if cls is not None:
+    for segments, klass in code_paths(cls, field):
+      for label, holder in fields.holders(record, segments, ''):
+        uris = _codes(holder, field)
+        if uris:
+          bits |= registry.lookup(uris)
+  return bits
+
+def check_codes(record, logger = None, path = "root", field = 'evidence_codes', registry = ECO):
+  """
+  Check the evidence codes of a raw evidence dict or model object against
+  the values accepted by the classes holding them, one bitwise operation
+  per array rather than a scan of the accepted values per item. Values
+  unknown to the registry are not accepted, and not registered either.
+  Arguments:
+  :param logger = logger receiving the messages, in the format of the generated classes
+  :returns: number of values not accepted
+  """
+  cls = core.EVIDENCE_CLASSES.get(record.get('type') if isinstance(record, dict) else getattr(record, 'type', None))
+  if cls is None:
+    return 0
+  error = 0
+  for segments, klass in code_paths(cls, field):
+    for label, holder in fields.holders(record, segments, path):
+      uris = _codes(holder, field)
+      if not uris:
+        continue
+      mask = allowed(klass, field, registry)
+      invalid = registry.lookup(uris) & ~mask
+      if not invalid and all(uri in registry for uri in uris):
+        continue
+      enum = [field_enum for name, kind, field_enum in fields.class_fields(klass) if name == field][0]
+      accepted = ','.join("'{0}'".format(uri) for uri in enum)
+      for uri in uris:
+        code = registry.codes.get(uri)
+        if code is None or (1 << code) & invalid:
+          error = error + 1
+          if logger is not None:
+            logger.error("{0} - {1}.{2} value is restricted to the fixed set of values {3} ('{4}' given)".format(klass.__name__, label, field, accepted, uri))
+  return error
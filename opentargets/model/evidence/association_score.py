@@ -23,6 +23,8 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
 
 __author__ = "Gautier Koscielny"
 __copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
@@ -39,6 +41,10 @@ logger = logging.getLogger(__name__)
 https://raw.githubusercontent.com/opentargets/json_schema/master/src/evidence/association_score/base.json
 """
 class Base(object):
+  # schema fields, see fields.class_fields
+  cls_keys = ['']
+  cls_types = {}
+  cls_enums = {}
   
   @classmethod
   def cloneObject(cls, clone):
@@ -46,8 +52,14 @@ class Base(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Base.cls_keys
+    fields = field_tree(fields)
+    if strict and cls is Base and isinstance(dict_obj, dict):
+      # subclasses check their keys, those of Base included, before calling super
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Base', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Base - DictType expected - {0} found\n".format(type(dict_obj)))
@@ -83,6 +95,10 @@ class Method(object):
   :param reference = None
   :param url = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['description','reference','url']
+  cls_types = {'description': 'string', 'reference': 'string', 'url': 'string'}
+  cls_enums = {}
   def __init__(self, description = None, reference = None, url = None):
     
     """
@@ -120,17 +136,23 @@ class Method(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['description','reference','url']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Method.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Method', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Method - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'description' in dict_obj:
+    if  'description' in dict_obj and (fields is None or 'description' in fields):
         obj.description = dict_obj['description']
-    if  'reference' in dict_obj:
+    if  'reference' in dict_obj and (fields is None or 'reference' in fields):
         obj.reference = dict_obj['reference']
-    if  'url' in dict_obj:
+    if  'url' in dict_obj and (fields is None or 'url' in fields):
         obj.url = dict_obj['url']
     return obj
   
@@ -179,6 +201,10 @@ class Probability(Base):
   :param value = 0
   :param     method = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','value','method']
+  cls_types = {'type': 'string', 'value': 'number', 'method': 'Method'}
+  cls_enums = {'type': ['probability']}
   def __init__(self, type = None, value = 0,     method = None):
     
     """
@@ -214,18 +240,24 @@ class Probability(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','value','method']
-    obj = super(Probability, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Probability.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Probability', invalid_fields, cls_keys)
+    obj = super(Probability, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Probability - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'value' in dict_obj:
+    if  'value' in dict_obj and (fields is None or 'value' in fields):
         obj.value = dict_obj['value']
-    if  'method' in dict_obj:
-        obj.method = Method.fromDict(dict_obj['method'])
+    if  'method' in dict_obj and (fields is None or 'method' in fields):
+        obj.method = Method.fromDict(dict_obj['method'], strict = strict, fields = fields and fields['method'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Probability - invalid field - {0} found".format(key))
@@ -290,6 +322,10 @@ class Pvalue(Base):
   :param value = 0
   :param     method = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','value','method']
+  cls_types = {'type': 'string', 'value': 'number', 'method': 'Method'}
+  cls_enums = {'type': ['pvalue']}
   def __init__(self, type = None, value = 0,     method = None):
     
     """
@@ -325,18 +361,24 @@ class Pvalue(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','value','method']
-    obj = super(Pvalue, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Pvalue.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Pvalue', invalid_fields, cls_keys)
+    obj = super(Pvalue, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Pvalue - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'value' in dict_obj:
+    if  'value' in dict_obj and (fields is None or 'value' in fields):
         obj.value = dict_obj['value']
-    if  'method' in dict_obj:
-        obj.method = Method.fromDict(dict_obj['method'])
+    if  'method' in dict_obj and (fields is None or 'method' in fields):
+        obj.method = Method.fromDict(dict_obj['method'], strict = strict, fields = fields and fields['method'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Pvalue - invalid field - {0} found".format(key))
@@ -402,6 +444,10 @@ class Rank(object):
   :param sample_size = 0
   :param     method = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','position','sample_size','method']
+  cls_types = {'type': 'string', 'position': 'number', 'sample_size': 'number', 'method': 'Method'}
+  cls_enums = {'type': ['rank']}
   def __init__(self, type = None, position = 0, sample_size = 0,     method = None):
     
     """
@@ -446,20 +492,26 @@ class Rank(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','position','sample_size','method']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Rank.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Rank', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Rank - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'position' in dict_obj:
+    if  'position' in dict_obj and (fields is None or 'position' in fields):
         obj.position = dict_obj['position']
-    if  'sample_size' in dict_obj:
+    if  'sample_size' in dict_obj and (fields is None or 'sample_size' in fields):
         obj.sample_size = dict_obj['sample_size']
-    if  'method' in dict_obj:
-        obj.method = Method.fromDict(dict_obj['method'])
+    if  'method' in dict_obj and (fields is None or 'method' in fields):
+        obj.method = Method.fromDict(dict_obj['method'], strict = strict, fields = fields and fields['method'] or None)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -526,6 +578,10 @@ class Summed_Total(Base):
   :param value = 0
   :param     method = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['type','value','method']
+  cls_types = {'type': 'string', 'value': 'number', 'method': 'Method'}
+  cls_enums = {'type': ['summed_total']}
   def __init__(self, type = None, value = 0,     method = None):
     
     """
@@ -561,18 +617,24 @@ class Summed_Total(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['type','value','method']
-    obj = super(Summed_Total, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Summed_Total.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Summed_Total', invalid_fields, cls_keys)
+    obj = super(Summed_Total, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Summed_Total - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'type' in dict_obj:
+    if  'type' in dict_obj and (fields is None or 'type' in fields):
         obj.type = dict_obj['type']
-    if  'value' in dict_obj:
+    if  'value' in dict_obj and (fields is None or 'value' in fields):
         obj.value = dict_obj['value']
-    if  'method' in dict_obj:
-        obj.method = Method.fromDict(dict_obj['method'])
+    if  'method' in dict_obj and (fields is None or 'method' in fields):
+        obj.method = Method.fromDict(dict_obj['method'], strict = strict, fields = fields and fields['method'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Summed_Total - invalid field - {0} found".format(key))
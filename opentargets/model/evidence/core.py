@@ -23,6 +23,8 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
 import opentargets.model.evidence.association_score as evidence_association_score
 import opentargets.model.evidence.linkout as evidence_linkout
 import opentargets.model.evidence.mutation as evidence_mutation
@@ -51,6 +53,10 @@ class Base(object):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'unique_experiment_reference': 'string', 'is_associated': 'boolean', 'date_asserted': 'string', 'resource_score': ('evidence_association_score.Pvalue', 'evidence_association_score.Probability', 'evidence_association_score.Rank', 'evidence_association_score.Summed_Total'), 'provenance_type': 'BaseProvenance_Type'}
+  cls_enums = {}
   def __init__(self, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     
     """
@@ -101,31 +107,37 @@ class Base(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Base.cls_keys
+    fields = field_tree(fields)
+    if strict and cls is Base and isinstance(dict_obj, dict):
+      # subclasses check their keys, those of Base included, before calling super
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Base', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Base - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'unique_experiment_reference' in dict_obj:
+    if  'unique_experiment_reference' in dict_obj and (fields is None or 'unique_experiment_reference' in fields):
         obj.unique_experiment_reference = dict_obj['unique_experiment_reference']
-    if  'is_associated' in dict_obj:
+    if  'is_associated' in dict_obj and (fields is None or 'is_associated' in fields):
         obj.is_associated = dict_obj['is_associated']
-    if  'date_asserted' in dict_obj:
+    if  'date_asserted' in dict_obj and (fields is None or 'date_asserted' in fields):
         obj.date_asserted = dict_obj['date_asserted']
-    if 'resource_score' in dict_obj:
+    if 'resource_score' in dict_obj and (fields is None or 'resource_score' in fields):
         if not evidence_association_score.Pvalue.fromDict(dict_obj['resource_score']) is None:
-            obj.resource_score = evidence_association_score.Pvalue.fromDict(dict_obj['resource_score'])
+            obj.resource_score = evidence_association_score.Pvalue.fromDict(dict_obj['resource_score'], strict = strict, fields = fields and fields['resource_score'] or None)
         elif not evidence_association_score.Probability.fromDict(dict_obj['resource_score']) is None:
-            obj.resource_score = evidence_association_score.Probability.fromDict(dict_obj['resource_score'])
+            obj.resource_score = evidence_association_score.Probability.fromDict(dict_obj['resource_score'], strict = strict, fields = fields and fields['resource_score'] or None)
         elif not evidence_association_score.Rank.fromDict(dict_obj['resource_score']) is None:
-            obj.resource_score = evidence_association_score.Rank.fromDict(dict_obj['resource_score'])
+            obj.resource_score = evidence_association_score.Rank.fromDict(dict_obj['resource_score'], strict = strict, fields = fields and fields['resource_score'] or None)
         elif not evidence_association_score.Summed_Total.fromDict(dict_obj['resource_score']) is None:
-            obj.resource_score = evidence_association_score.Summed_Total.fromDict(dict_obj['resource_score'])
+            obj.resource_score = evidence_association_score.Summed_Total.fromDict(dict_obj['resource_score'], strict = strict, fields = fields and fields['resource_score'] or None)
         else:
             raise opentargets.model.core.JSONException("resource_score can't be cast to any class")
-    if  'provenance_type' in dict_obj:
-        obj.provenance_type = BaseProvenance_Type.fromDict(dict_obj['provenance_type'])
+    if  'provenance_type' in dict_obj and (fields is None or 'provenance_type' in fields):
+        obj.provenance_type = BaseProvenance_Type.fromDict(dict_obj['provenance_type'], strict = strict, fields = fields and fields['provenance_type'] or None)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -196,6 +208,10 @@ class Single_Lit_Reference(object):
   :param     rank = None
   :param mined_sentences = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['lit_id','rank','mined_sentences']
+  cls_types = {'lit_id': 'string', 'rank': 'evidence_association_score.Rank', 'mined_sentences': ['Base_Mined_Sentences_Item']}
+  cls_enums = {}
   def __init__(self, lit_id = None,     rank = None, mined_sentences = None):
     
     """
@@ -230,20 +246,26 @@ class Single_Lit_Reference(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['lit_id','rank','mined_sentences']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Single_Lit_Reference.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Single_Lit_Reference', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Single_Lit_Reference - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'lit_id' in dict_obj:
+    if  'lit_id' in dict_obj and (fields is None or 'lit_id' in fields):
         obj.lit_id = dict_obj['lit_id']
-    if  'rank' in dict_obj:
-        obj.rank = evidence_association_score.Rank.fromDict(dict_obj['rank'])
-    if 'mined_sentences' in dict_obj and isinstance(dict_obj['mined_sentences'], list):
+    if  'rank' in dict_obj and (fields is None or 'rank' in fields):
+        obj.rank = evidence_association_score.Rank.fromDict(dict_obj['rank'], strict = strict, fields = fields and fields['rank'] or None)
+    if 'mined_sentences' in dict_obj and (fields is None or 'mined_sentences' in fields) and isinstance(dict_obj['mined_sentences'], list):
         obj.mined_sentences = list()
         for item in dict_obj['mined_sentences']:
-            obj.mined_sentences.append(Base_Mined_Sentences_Item.fromDict(item))
+            obj.mined_sentences.append(Base_Mined_Sentences_Item.fromDict(item, strict = strict, fields = fields and fields['mined_sentences'] or None))
     return obj
   
   def validate(self, logger, path = "root"):
@@ -305,6 +327,10 @@ class Base_Mined_Sentences_Item(object):
   :param d_start = None
   :param d_end = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['text','section','t_start','t_end','d_start','d_end']
+  cls_types = {'text': 'string', 'section': 'string', 't_start': 'number', 't_end': 'number', 'd_start': 'number', 'd_end': 'number'}
+  cls_enums = {'section': ['title', 'abstract', 'introduction_and_background', 'results', 'discussion', 'case_study', 'conclusion_and_future_work', 'appendix', 'figure', 'table', 'other']}
   def __init__(self, text = None, section = None, t_start = None, t_end = None, d_start = None, d_end = None):
     
     """
@@ -374,23 +400,29 @@ class Base_Mined_Sentences_Item(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['text','section','t_start','t_end','d_start','d_end']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Base_Mined_Sentences_Item.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Base_Mined_Sentences_Item', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Base_Mined_Sentences_Item - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'text' in dict_obj:
+    if  'text' in dict_obj and (fields is None or 'text' in fields):
         obj.text = dict_obj['text']
-    if  'section' in dict_obj:
+    if  'section' in dict_obj and (fields is None or 'section' in fields):
         obj.section = dict_obj['section']
-    if  't_start' in dict_obj:
+    if  't_start' in dict_obj and (fields is None or 't_start' in fields):
         obj.t_start = dict_obj['t_start']
-    if  't_end' in dict_obj:
+    if  't_end' in dict_obj and (fields is None or 't_end' in fields):
         obj.t_end = dict_obj['t_end']
-    if  'd_start' in dict_obj:
+    if  'd_start' in dict_obj and (fields is None or 'd_start' in fields):
         obj.d_start = dict_obj['d_start']
-    if  'd_end' in dict_obj:
+    if  'd_end' in dict_obj and (fields is None or 'd_end' in fields):
         obj.d_end = dict_obj['d_end']
     return obj
   
@@ -458,6 +490,10 @@ class BaseProvenance_Type(object):
   :param     literature = None
   :param     database = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['expert','literature','database']
+  cls_types = {'expert': 'BaseExpert', 'literature': 'BaseLiterature', 'database': 'BaseDatabase'}
+  cls_enums = {}
   def __init__(self,     expert = None,     literature = None,     database = None):
     """
     Name: expert
@@ -484,18 +520,24 @@ class BaseProvenance_Type(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['expert','literature','database']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = BaseProvenance_Type.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('BaseProvenance_Type', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("BaseProvenance_Type - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'expert' in dict_obj:
-        obj.expert = BaseExpert.fromDict(dict_obj['expert'])
-    if  'literature' in dict_obj:
-        obj.literature = BaseLiterature.fromDict(dict_obj['literature'])
-    if  'database' in dict_obj:
-        obj.database = BaseDatabase.fromDict(dict_obj['database'])
+    if  'expert' in dict_obj and (fields is None or 'expert' in fields):
+        obj.expert = BaseExpert.fromDict(dict_obj['expert'], strict = strict, fields = fields and fields['expert'] or None)
+    if  'literature' in dict_obj and (fields is None or 'literature' in fields):
+        obj.literature = BaseLiterature.fromDict(dict_obj['literature'], strict = strict, fields = fields and fields['literature'] or None)
+    if  'database' in dict_obj and (fields is None or 'database' in fields):
+        obj.database = BaseDatabase.fromDict(dict_obj['database'], strict = strict, fields = fields and fields['database'] or None)
     return obj
   
   def validate(self, logger, path = "root"):
@@ -551,6 +593,10 @@ class BaseExpert(object):
   :param     author = None
   :param status = False
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['statement','author','status']
+  cls_types = {'statement': 'string', 'author': 'BaseAuthor', 'status': 'boolean'}
+  cls_enums = {}
   def __init__(self, statement = None,     author = None, status = False):
     
     """
@@ -584,17 +630,23 @@ class BaseExpert(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['statement','author','status']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = BaseExpert.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('BaseExpert', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("BaseExpert - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'statement' in dict_obj:
+    if  'statement' in dict_obj and (fields is None or 'statement' in fields):
         obj.statement = dict_obj['statement']
-    if  'author' in dict_obj:
-        obj.author = BaseAuthor.fromDict(dict_obj['author'])
-    if  'status' in dict_obj:
+    if  'author' in dict_obj and (fields is None or 'author' in fields):
+        obj.author = BaseAuthor.fromDict(dict_obj['author'], strict = strict, fields = fields and fields['author'] or None)
+    if  'status' in dict_obj and (fields is None or 'status' in fields):
         obj.status = dict_obj['status']
     return obj
   
@@ -647,6 +699,10 @@ class BaseAuthor(object):
   :param email = None
   :param name = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['organization','email','name']
+  cls_types = {'organization': 'string', 'email': 'string', 'name': 'string'}
+  cls_enums = {}
   def __init__(self, organization = None, email = None, name = None):
     
     """
@@ -683,17 +739,23 @@ class BaseAuthor(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['organization','email','name']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = BaseAuthor.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('BaseAuthor', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("BaseAuthor - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'organization' in dict_obj:
+    if  'organization' in dict_obj and (fields is None or 'organization' in fields):
         obj.organization = dict_obj['organization']
-    if  'email' in dict_obj:
+    if  'email' in dict_obj and (fields is None or 'email' in fields):
         obj.email = dict_obj['email']
-    if  'name' in dict_obj:
+    if  'name' in dict_obj and (fields is None or 'name' in fields):
         obj.name = dict_obj['name']
     return obj
   
@@ -740,6 +802,10 @@ class BaseLiterature(object):
   Arguments:
   :param references = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['references']
+  cls_types = {'references': ['Single_Lit_Reference']}
+  cls_enums = {}
   def __init__(self, references = None):
     
     """
@@ -758,16 +824,22 @@ class BaseLiterature(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['references']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = BaseLiterature.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('BaseLiterature', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("BaseLiterature - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if 'references' in dict_obj and isinstance(dict_obj['references'], list):
+    if 'references' in dict_obj and (fields is None or 'references' in fields) and isinstance(dict_obj['references'], list):
         obj.references = list()
         for item in dict_obj['references']:
-            obj.references.append(Single_Lit_Reference.fromDict(item))
+            obj.references.append(Single_Lit_Reference.fromDict(item, strict = strict, fields = fields and fields['references'] or None))
     return obj
   
   def validate(self, logger, path = "root"):
@@ -813,6 +885,10 @@ class BaseDatabase(object):
   :param id = None
   :param version = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['dbxref','id','version']
+  cls_types = {'dbxref': 'BaseDbxref', 'id': 'string', 'version': 'string'}
+  cls_enums = {}
   def __init__(self,     dbxref = None, id = None, version = None):
     """
     Name: dbxref
@@ -847,17 +923,23 @@ class BaseDatabase(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['dbxref','id','version']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = BaseDatabase.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('BaseDatabase', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("BaseDatabase - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'dbxref' in dict_obj:
-        obj.dbxref = BaseDbxref.fromDict(dict_obj['dbxref'])
-    if  'id' in dict_obj:
+    if  'dbxref' in dict_obj and (fields is None or 'dbxref' in fields):
+        obj.dbxref = BaseDbxref.fromDict(dict_obj['dbxref'], strict = strict, fields = fields and fields['dbxref'] or None)
+    if  'id' in dict_obj and (fields is None or 'id' in fields):
         obj.id = dict_obj['id']
-    if  'version' in dict_obj:
+    if  'version' in dict_obj and (fields is None or 'version' in fields):
         obj.version = dict_obj['version']
     return obj
   
@@ -914,6 +996,10 @@ class BaseDbxref(object):
   :param url = None
   :param version = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['id','url','version']
+  cls_types = {'id': 'string', 'url': 'string', 'version': 'string'}
+  cls_enums = {}
   def __init__(self, id = None, url = None, version = None):
     
     """
@@ -954,17 +1040,23 @@ class BaseDbxref(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['id','url','version']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = BaseDbxref.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('BaseDbxref', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("BaseDbxref - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'id' in dict_obj:
+    if  'id' in dict_obj and (fields is None or 'id' in fields):
         obj.id = dict_obj['id']
-    if  'url' in dict_obj:
+    if  'url' in dict_obj and (fields is None or 'url' in fields):
         obj.url = dict_obj['url']
-    if  'version' in dict_obj:
+    if  'version' in dict_obj and (fields is None or 'version' in fields):
         obj.version = dict_obj['version']
     return obj
   
@@ -1030,6 +1122,10 @@ class Expression(Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['organism_part','comparison_name','log2_fold_change','test_sample','reference_sample','test_replicates_n','reference_replicates_n','confidence_level','experiment_overview','evidence_codes','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'organism_part': 'string', 'comparison_name': 'string', 'log2_fold_change': 'ExpressionLog2_Fold_Change', 'test_sample': 'string', 'reference_sample': 'string', 'test_replicates_n': 'number', 'reference_replicates_n': 'number', 'confidence_level': 'string', 'experiment_overview': 'string', 'evidence_codes': ['string'], 'urls': ['evidence_linkout.Linkout']}
+  cls_enums = {'confidence_level': ['high', 'medium', 'low'], 'evidence_codes': ['http://purl.obolibrary.org/obo/ECO_0000356', 'http://purl.obolibrary.org/obo/ECO_0000357', 'http://purl.obolibrary.org/obo/ECO_0000358', 'http://purl.obolibrary.org/obo/ECO_0000359', 'http://purl.obolibrary.org/obo/ECO_0000205']}
   def __init__(self, organism_part = None, comparison_name = None, log2_fold_change = None, test_sample = None, reference_sample = None, test_replicates_n = 0, reference_replicates_n = 0, confidence_level = None, experiment_overview = None, evidence_codes = None, urls = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -1153,36 +1249,42 @@ class Expression(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['organism_part','comparison_name','log2_fold_change','test_sample','reference_sample','test_replicates_n','reference_replicates_n','confidence_level','experiment_overview','evidence_codes','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Expression, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Expression.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Expression', invalid_fields, cls_keys)
+    obj = super(Expression, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Expression - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'organism_part' in dict_obj:
+    if  'organism_part' in dict_obj and (fields is None or 'organism_part' in fields):
         obj.organism_part = dict_obj['organism_part']
-    if  'comparison_name' in dict_obj:
+    if  'comparison_name' in dict_obj and (fields is None or 'comparison_name' in fields):
         obj.comparison_name = dict_obj['comparison_name']
-    if  'log2_fold_change' in dict_obj:
-        obj.log2_fold_change = ExpressionLog2_Fold_Change.fromDict(dict_obj['log2_fold_change'])
-    if  'test_sample' in dict_obj:
+    if  'log2_fold_change' in dict_obj and (fields is None or 'log2_fold_change' in fields):
+        obj.log2_fold_change = ExpressionLog2_Fold_Change.fromDict(dict_obj['log2_fold_change'], strict = strict, fields = fields and fields['log2_fold_change'] or None)
+    if  'test_sample' in dict_obj and (fields is None or 'test_sample' in fields):
         obj.test_sample = dict_obj['test_sample']
-    if  'reference_sample' in dict_obj:
+    if  'reference_sample' in dict_obj and (fields is None or 'reference_sample' in fields):
         obj.reference_sample = dict_obj['reference_sample']
-    if  'test_replicates_n' in dict_obj:
+    if  'test_replicates_n' in dict_obj and (fields is None or 'test_replicates_n' in fields):
         obj.test_replicates_n = dict_obj['test_replicates_n']
-    if  'reference_replicates_n' in dict_obj:
+    if  'reference_replicates_n' in dict_obj and (fields is None or 'reference_replicates_n' in fields):
         obj.reference_replicates_n = dict_obj['reference_replicates_n']
-    if  'confidence_level' in dict_obj:
+    if  'confidence_level' in dict_obj and (fields is None or 'confidence_level' in fields):
         obj.confidence_level = dict_obj['confidence_level']
-    if  'experiment_overview' in dict_obj:
+    if  'experiment_overview' in dict_obj and (fields is None or 'experiment_overview' in fields):
         obj.experiment_overview = dict_obj['experiment_overview']
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Expression - invalid field - {0} found".format(key))
@@ -1328,6 +1430,10 @@ class ExpressionLog2_Fold_Change(object):
   :param value = 0
   :param percentile_rank = 0
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['value','percentile_rank']
+  cls_types = {'value': 'number', 'percentile_rank': 'number'}
+  cls_enums = {}
   def __init__(self, value = 0, percentile_rank = 0):
     
     """
@@ -1356,15 +1462,21 @@ class ExpressionLog2_Fold_Change(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['value','percentile_rank']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = ExpressionLog2_Fold_Change.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('ExpressionLog2_Fold_Change', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("ExpressionLog2_Fold_Change - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'value' in dict_obj:
+    if  'value' in dict_obj and (fields is None or 'value' in fields):
         obj.value = dict_obj['value']
-    if  'percentile_rank' in dict_obj:
+    if  'percentile_rank' in dict_obj and (fields is None or 'percentile_rank' in fields):
         obj.percentile_rank = dict_obj['percentile_rank']
     return obj
   
@@ -1413,6 +1525,10 @@ class Literature_Curated(Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['clinical_significance','evidence_codes','known_mutations','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'clinical_significance': 'string', 'evidence_codes': ['string'], 'known_mutations': ['evidence_mutation.Mutation'], 'urls': ['evidence_linkout.Linkout']}
+  cls_enums = {'clinical_significance': ['Pathogenic', 'Likely pathogenic', 'protective', 'association', 'risk_factor', 'Affects', 'drug response'], 'evidence_codes': ['http://purl.obolibrary.org/obo/ECO_0000213', 'http://purl.obolibrary.org/obo/ECO_0000305', 'http://www.targetvalidation.org/evidence/literature_mining', 'http://purl.obolibrary.org/obo/ECO_0000204', 'http://purl.obolibrary.org/obo/ECO_0000205', 'http://purl.obolibrary.org/obo/ECO_0000053']}
   def __init__(self, clinical_significance = None, evidence_codes = None, known_mutations = None, urls = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -1466,24 +1582,30 @@ class Literature_Curated(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['clinical_significance','evidence_codes','known_mutations','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Literature_Curated, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Literature_Curated.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Literature_Curated', invalid_fields, cls_keys)
+    obj = super(Literature_Curated, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Literature_Curated - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'clinical_significance' in dict_obj:
+    if  'clinical_significance' in dict_obj and (fields is None or 'clinical_significance' in fields):
         obj.clinical_significance = dict_obj['clinical_significance']
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if 'known_mutations' in dict_obj and isinstance(dict_obj['known_mutations'], list):
+    if 'known_mutations' in dict_obj and (fields is None or 'known_mutations' in fields) and isinstance(dict_obj['known_mutations'], list):
         obj.known_mutations = list()
         for item in dict_obj['known_mutations']:
-            obj.known_mutations.append(evidence_mutation.Mutation.fromDict(item))
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+            obj.known_mutations.append(evidence_mutation.Mutation.fromDict(item, strict = strict, fields = fields and fields['known_mutations'] or None))
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Literature_Curated - invalid field - {0} found".format(key))
@@ -1572,6 +1694,10 @@ class Literature_Mining(Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['evidence_codes','literature_ref','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'evidence_codes': ['string'], 'literature_ref': 'Single_Lit_Reference'}
+  cls_enums = {'evidence_codes': ['http://www.targetvalidation.org/evidence/literature_mining', 'http://purl.obolibrary.org/obo/ECO_0000213']}
   def __init__(self, evidence_codes = None, literature_ref = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -1602,16 +1728,22 @@ class Literature_Mining(Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['evidence_codes','literature_ref','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Literature_Mining, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Literature_Mining.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Literature_Mining', invalid_fields, cls_keys)
+    obj = super(Literature_Mining, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Literature_Mining - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if  'literature_ref' in dict_obj:
-        obj.literature_ref = Single_Lit_Reference.fromDict(dict_obj['literature_ref'])
+    if  'literature_ref' in dict_obj and (fields is None or 'literature_ref' in fields):
+        obj.literature_ref = Single_Lit_Reference.fromDict(dict_obj['literature_ref'], strict = strict, fields = fields and fields['literature_ref'] or None)
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Literature_Mining - invalid field - {0} found".format(key))
@@ -23,6 +23,8 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
 import opentargets.model.evidence.core
 import opentargets.model.evidence.linkout as evidence_linkout
 
@@ -54,6 +56,10 @@ class Target2Drug(evidence_core.Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['evidence_codes','mechanism_of_action','action_type','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'evidence_codes': ['string'], 'mechanism_of_action': 'string', 'action_type': 'string', 'urls': ['evidence_linkout.Linkout']}
+  cls_enums = {'evidence_codes': ['http://identifiers.org/eco/target_drug', 'http://purl.obolibrary.org/obo/ECO_0000205']}
   def __init__(self, evidence_codes = None, mechanism_of_action = None, action_type = None, urls = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -108,22 +114,28 @@ class Target2Drug(evidence_core.Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['evidence_codes','mechanism_of_action','action_type','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Target2Drug, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Target2Drug.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Target2Drug', invalid_fields, cls_keys)
+    obj = super(Target2Drug, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Target2Drug - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if  'mechanism_of_action' in dict_obj:
+    if  'mechanism_of_action' in dict_obj and (fields is None or 'mechanism_of_action' in fields):
         obj.mechanism_of_action = dict_obj['mechanism_of_action']
-    if  'action_type' in dict_obj:
+    if  'action_type' in dict_obj and (fields is None or 'action_type' in fields):
         obj.action_type = dict_obj['action_type']
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Target2Drug - invalid field - {0} found".format(key))
@@ -216,6 +228,10 @@ class Drug2Clinic(evidence_core.Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['evidence_codes','max_phase_for_disease','urls','status','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'evidence_codes': ['string'], 'max_phase_for_disease': 'Diseasephase', 'urls': ['evidence_linkout.Linkout'], 'status': 'string'}
+  cls_enums = {'evidence_codes': ['http://identifiers.org/eco/drug_disease', 'http://purl.obolibrary.org/obo/ECO_0000205']}
   def __init__(self, evidence_codes = None, max_phase_for_disease = None, urls = None, status = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -264,21 +280,27 @@ class Drug2Clinic(evidence_core.Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['evidence_codes','max_phase_for_disease','urls','status','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Drug2Clinic, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Drug2Clinic.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Drug2Clinic', invalid_fields, cls_keys)
+    obj = super(Drug2Clinic, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Drug2Clinic - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if  'max_phase_for_disease' in dict_obj:
-        obj.max_phase_for_disease = Diseasephase.fromDict(dict_obj['max_phase_for_disease'])
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+    if  'max_phase_for_disease' in dict_obj and (fields is None or 'max_phase_for_disease' in fields):
+        obj.max_phase_for_disease = Diseasephase.fromDict(dict_obj['max_phase_for_disease'], strict = strict, fields = fields and fields['max_phase_for_disease'] or None)
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
-    if  'status' in dict_obj:
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
+    if  'status' in dict_obj and (fields is None or 'status' in fields):
         obj.status = dict_obj['status']
     for key in dict_obj:
       if not key in cls_keys:
@@ -363,6 +385,10 @@ class Diseasephase(object):
   :param numeric_index = 0
   :param label = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['numeric_index','label']
+  cls_types = {'numeric_index': 'number', 'label': 'string'}
+  cls_enums = {}
   def __init__(self, numeric_index = 0, label = None):
     
     """
@@ -392,15 +418,21 @@ class Diseasephase(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['numeric_index','label']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Diseasephase.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Diseasephase', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Diseasephase - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'numeric_index' in dict_obj:
+    if  'numeric_index' in dict_obj and (fields is None or 'numeric_index' in fields):
         obj.numeric_index = dict_obj['numeric_index']
-    if  'label' in dict_obj:
+    if  'label' in dict_obj and (fields is None or 'label' in fields):
         obj.label = dict_obj['label']
     return obj
   
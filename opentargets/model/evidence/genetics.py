@@ -23,6 +23,8 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
 import opentargets.model.evidence.core
 import opentargets.model.evidence.linkout as evidence_linkout
 
@@ -53,6 +55,10 @@ class Gene2Variant(evidence_core.Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['evidence_codes','functional_consequence','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'evidence_codes': ['string'], 'functional_consequence': 'string', 'urls': ['evidence_linkout.Linkout']}
+  cls_enums = {'evidence_codes': ['http://identifiers.org/eco/cttv_mapping_pipeline', 'http://purl.obolibrary.org/obo/ECO_0000205', 'http://purl.obolibrary.org/obo/ECO_0000305'], 'functional_consequence': ['http://targetvalidation.org/sequence/nearest_gene_five_prime_end', 'http://targetvalidation.org/sequence/regulatory_nearest_gene_five_prime_end', 'http://purl.obolibrary.org/obo/SO_0002165', 'http://purl.obolibrary.org/obo/SO_0001060', 'http://purl.obolibrary.org/obo/SO_0000000', 'http://purl.obolibrary.org/obo/SO_0000001', 'http://purl.obolibrary.org/obo/SO_0000002', 'http://purl.obolibrary.org/obo/SO_0000003', 'http://purl.obolibrary.org/obo/SO_0000004', 'http://purl.obolibrary.org/obo/SO_0000005', 'http://purl.obolibrary.org/obo/SO_0000006', 'http://purl.obolibrary.org/obo/SO_0000007', 'http://purl.obolibrary.org/obo/SO_0000008', 'http://purl.obolibrary.org/obo/SO_0000009', 'http://purl.obolibrary.org/obo/SO_0000010', 'http://purl.obolibrary.org/obo/SO_0000011', 'http://purl.obolibrary.org/obo/SO_0000012', 'http://purl.obolibrary.org/obo/SO_0000013', 'http://purl.obolibrary.org/obo/SO_0000014', 'http://purl.obolibrary.org/obo/SO_0000015', 'http://purl.obolibrary.org/obo/SO_0000016', 'http://purl.obolibrary.org/obo/SO_0000017', 'http://purl.obolibrary.org/obo/SO_0000018', 'http://purl.obolibrary.org/obo/SO_0000020', 'http://purl.obolibrary.org/obo/SO_0000021', 'http://purl.obolibrary.org/obo/SO_0000022', 'http://purl.obolibrary.org/obo/SO_0000023', 'http://purl.obolibrary.org/obo/SO_0000024', 'http://purl.obolibrary.org/obo/SO_0000025', 'http://purl.obolibrary.org/obo/SO_0000026', 'http://purl.obolibrary.org/obo/SO_0000027', 'http://purl.obolibrary.org/obo/SO_0000028', 'http://purl.obolibrary.org/obo/SO_0000029', 'http://purl.obolibrary.org/obo/SO_0000030', 'http://purl.obolibrary.org/obo/SO_0000031', 'http://purl.obolibrary.org/obo/SO_0000032', 'http://purl.obolibrary.org/obo/SO_0000033', 'http://purl.obolibrary.org/obo/SO_0000034', 'http://purl.obolibrary.org/obo/SO_0000035', 'http://purl.obolibrary.org/obo/SO_0000036', 'http://purl.obolibrary.org/obo/SO_0000037', 'http://purl.obolibrary.org/obo/SO_0000038', 'http://purl.obolibrary.org/obo/SO_0000039', 'http://purl.obolibrary.org/obo/SO_0000040', 'http://purl.obolibrary.org/obo/SO_0000041', 'http://purl.obolibrary.org/obo/SO_0000042', 'http://purl.obolibrary.org/obo/SO_0000043', 'http://purl.obolibrary.org/obo/SO_0000044', 'http://purl.obolibrary.org/obo/SO_0000045', 'http://purl.obolibrary.org/obo/SO_0000046', 'http://purl.obolibrary.org/obo/SO_0000047', 'http://purl.obolibrary.org/obo/SO_0000048', 'http://purl.obolibrary.org/obo/SO_0000049', 'http://purl.obolibrary.org/obo/SO_0000050', 'http://purl.obolibrary.org/obo/SO_0000051', 'http://purl.obolibrary.org/obo/SO_0000052', 'http://purl.obolibrary.org/obo/SO_0000053', 'http://purl.obolibrary.org/obo/SO_0000054', 'http://purl.obolibrary.org/obo/SO_0000055', 'http://purl.obolibrary.org/obo/SO_0000056', 'http://purl.obolibrary.org/obo/SO_0000057', 'http://purl.obolibrary.org/obo/SO_0000058', 'http://purl.obolibrary.org/obo/SO_0000059', 'http://purl.obolibrary.org/obo/SO_0000060', 'http://purl.obolibrary.org/obo/SO_0000061', 'http://purl.obolibrary.org/obo/SO_0000062', 'http://purl.obolibrary.org/obo/SO_0000063', 'http://purl.obolibrary.org/obo/SO_0000064', 'http://purl.obolibrary.org/obo/SO_0000065', 'http://purl.obolibrary.org/obo/SO_0000066', 'http://purl.obolibrary.org/obo/SO_0000067', 'http://purl.obolibrary.org/obo/SO_0000068', 'http://purl.obolibrary.org/obo/SO_0000069', 'http://purl.obolibrary.org/obo/SO_0000070', 'http://purl.obolibrary.org/obo/SO_0000071', 'http://purl.obolibrary.org/obo/SO_0000072', 'http://purl.obolibrary.org/obo/SO_0000073', 'http://purl.obolibrary.org/obo/SO_0000074', 'http://purl.obolibrary.org/obo/SO_0000075', 'http://purl.obolibrary.org/obo/SO_0000076', 'http://purl.obolibrary.org/obo/SO_0000077', 'http://purl.obolibrary.org/obo/SO_0000078', 'http://purl.obolibrary.org/obo/SO_0000079', 'http://purl.obolibrary.org/obo/SO_0000080', 'http://purl.obolibrary.org/obo/SO_0000081', 'http://purl.obolibrary.org/obo/SO_0000082', 'http://purl.obolibrary.org/obo/SO_0000083', 'http://purl.obolibrary.org/obo/SO_0000084', 'http://purl.obolibrary.org/obo/SO_0000085', 'http://purl.obolibrary.org/obo/SO_0000086', 'http://purl.obolibrary.org/obo/SO_0000087', 'http://purl.obolibrary.org/obo/SO_0000088', 'http://purl.obolibrary.org/obo/SO_0000089', 'http://purl.obolibrary.org/obo/SO_0000090', 'http://purl.obolibrary.org/obo/SO_0000091', 'http://purl.obolibrary.org/obo/SO_0000092', 'http://purl.obolibrary.org/obo/SO_0000093', 'http://purl.obolibrary.org/obo/SO_0000094', 'http://purl.obolibrary.org/obo/SO_0000095', 'http://purl.obolibrary.org/obo/SO_0000096', 'http://purl.obolibrary.org/obo/SO_0000097', 'http://purl.obolibrary.org/obo/SO_0000098', 'http://purl.obolibrary.org/obo/SO_0000099', 'http://purl.obolibrary.org/obo/SO_0000100', 'http://purl.obolibrary.org/obo/SO_0000101', 'http://purl.obolibrary.org/obo/SO_0000102', 'http://purl.obolibrary.org/obo/SO_0000103', 'http://purl.obolibrary.org/obo/SO_0000104', 'http://purl.obolibrary.org/obo/SO_0000105', 'http://purl.obolibrary.org/obo/SO_0000106', 'http://purl.obolibrary.org/obo/SO_0000107', 'http://purl.obolibrary.org/obo/SO_0000108', 'http://purl.obolibrary.org/obo/SO_0000109', 'http://purl.obolibrary.org/obo/SO_0000110', 'http://purl.obolibrary.org/obo/SO_0000111', 'http://purl.obolibrary.org/obo/SO_0000112', 'http://purl.obolibrary.org/obo/SO_0000113', 'http://purl.obolibrary.org/obo/SO_0000114', 'http://purl.obolibrary.org/obo/SO_0000115', 'http://purl.obolibrary.org/obo/SO_0000116', 'http://purl.obolibrary.org/obo/SO_0000117', 'http://purl.obolibrary.org/obo/SO_0000118', 'http://purl.obolibrary.org/obo/SO_0000119', 'http://purl.obolibrary.org/obo/SO_0000120', 'http://purl.obolibrary.org/obo/SO_0000121', 'http://purl.obolibrary.org/obo/SO_0000122', 'http://purl.obolibrary.org/obo/SO_0000123', 'http://purl.obolibrary.org/obo/SO_0000124', 'http://purl.obolibrary.org/obo/SO_0000125', 'http://purl.obolibrary.org/obo/SO_0000126', 'http://purl.obolibrary.org/obo/SO_0000127', 'http://purl.obolibrary.org/obo/SO_0000128', 'http://purl.obolibrary.org/obo/SO_0000129', 'http://purl.obolibrary.org/obo/SO_0000130', 'http://purl.obolibrary.org/obo/SO_0000131', 'http://purl.obolibrary.org/obo/SO_0000132', 'http://purl.obolibrary.org/obo/SO_0000133', 'http://purl.obolibrary.org/obo/SO_0000134', 'http://purl.obolibrary.org/obo/SO_0000135', 'http://purl.obolibrary.org/obo/SO_0000136', 'http://purl.obolibrary.org/obo/SO_0000137', 'http://purl.obolibrary.org/obo/SO_0000138', 'http://purl.obolibrary.org/obo/SO_0000139', 'http://purl.obolibrary.org/obo/SO_0000140', 'http://purl.obolibrary.org/obo/SO_0000141', 'http://purl.obolibrary.org/obo/SO_0000142', 'http://purl.obolibrary.org/obo/SO_0000143', 'http://purl.obolibrary.org/obo/SO_0000144', 'http://purl.obolibrary.org/obo/SO_0000145', 'http://purl.obolibrary.org/obo/SO_0000146', 'http://purl.obolibrary.org/obo/SO_0000147', 'http://purl.obolibrary.org/obo/SO_0000148', 'http://purl.obolibrary.org/obo/SO_0000149', 'http://purl.obolibrary.org/obo/SO_0000150', 'http://purl.obolibrary.org/obo/SO_0000151', 'http://purl.obolibrary.org/obo/SO_0000152', 'http://purl.obolibrary.org/obo/SO_0000153', 'http://purl.obolibrary.org/obo/SO_0000154', 'http://purl.obolibrary.org/obo/SO_0000155', 'http://purl.obolibrary.org/obo/SO_0000156', 'http://purl.obolibrary.org/obo/SO_0000157', 'http://purl.obolibrary.org/obo/SO_0000158', 'http://purl.obolibrary.org/obo/SO_0000159', 'http://purl.obolibrary.org/obo/SO_0000160', 'http://purl.obolibrary.org/obo/SO_0000161', 'http://purl.obolibrary.org/obo/SO_0000162', 'http://purl.obolibrary.org/obo/SO_0000163', 'http://purl.obolibrary.org/obo/SO_0000164', 'http://purl.obolibrary.org/obo/SO_0000165', 'http://purl.obolibrary.org/obo/SO_0000166', 'http://purl.obolibrary.org/obo/SO_0000167', 'http://purl.obolibrary.org/obo/SO_0000168', 'http://purl.obolibrary.org/obo/SO_0000169', 'http://purl.obolibrary.org/obo/SO_0000170', 'http://purl.obolibrary.org/obo/SO_0000171', 'http://purl.obolibrary.org/obo/SO_0000172', 'http://purl.obolibrary.org/obo/SO_0000173', 'http://purl.obolibrary.org/obo/SO_0000174', 'http://purl.obolibrary.org/obo/SO_0000175', 'http://purl.obolibrary.org/obo/SO_0000176', 'http://purl.obolibrary.org/obo/SO_0000177', 'http://purl.obolibrary.org/obo/SO_0000178', 'http://purl.obolibrary.org/obo/SO_0000179', 'http://purl.obolibrary.org/obo/SO_0000180', 'http://purl.obolibrary.org/obo/SO_0000181', 'http://purl.obolibrary.org/obo/SO_0000182', 'http://purl.obolibrary.org/obo/SO_0000183', 'http://purl.obolibrary.org/obo/SO_0000184', 'http://purl.obolibrary.org/obo/SO_0000185', 'http://purl.obolibrary.org/obo/SO_0000186', 'http://purl.obolibrary.org/obo/SO_0000187', 'http://purl.obolibrary.org/obo/SO_0000188', 'http://purl.obolibrary.org/obo/SO_0000189', 'http://purl.obolibrary.org/obo/SO_0000190', 'http://purl.obolibrary.org/obo/SO_0000191', 'http://purl.obolibrary.org/obo/SO_0000192', 'http://purl.obolibrary.org/obo/SO_0000193', 'http://purl.obolibrary.org/obo/SO_0000194', 'http://purl.obolibrary.org/obo/SO_0000195', 'http://purl.obolibrary.org/obo/SO_0000196', 'http://purl.obolibrary.org/obo/SO_0000197', 'http://purl.obolibrary.org/obo/SO_0000198', 'http://purl.obolibrary.org/obo/SO_0000199', 'http://purl.obolibrary.org/obo/SO_0000200', 'http://purl.obolibrary.org/obo/SO_0000201', 'http://purl.obolibrary.org/obo/SO_0000202', 'http://purl.obolibrary.org/obo/SO_0000203', 'http://purl.obolibrary.org/obo/SO_0000204', 'http://purl.obolibrary.org/obo/SO_0000205', 'http://purl.obolibrary.org/obo/SO_0000206', 'http://purl.obolibrary.org/obo/SO_0000207', 'http://purl.obolibrary.org/obo/SO_0000208', 'http://purl.obolibrary.org/obo/SO_0000209', 'http://purl.obolibrary.org/obo/SO_0000210', 'http://purl.obolibrary.org/obo/SO_0000211', 'http://purl.obolibrary.org/obo/SO_0000212', 'http://purl.obolibrary.org/obo/SO_0000213', 'http://purl.obolibrary.org/obo/SO_0000214', 'http://purl.obolibrary.org/obo/SO_0000215', 'http://purl.obolibrary.org/obo/SO_0000216', 'http://purl.obolibrary.org/obo/SO_0000217', 'http://purl.obolibrary.org/obo/SO_0000218', 'http://purl.obolibrary.org/obo/SO_0000219', 'http://purl.obolibrary.org/obo/SO_0000220', 'http://purl.obolibrary.org/obo/SO_0000221', 'http://purl.obolibrary.org/obo/SO_0000222', 'http://purl.obolibrary.org/obo/SO_0000223', 'http://purl.obolibrary.org/obo/SO_0000224', 'http://purl.obolibrary.org/obo/SO_0000225', 'http://purl.obolibrary.org/obo/SO_0000226', 'http://purl.obolibrary.org/obo/SO_0000227', 'http://purl.obolibrary.org/obo/SO_0000228', 'http://purl.obolibrary.org/obo/SO_0000229', 'http://purl.obolibrary.org/obo/SO_0000230', 'http://purl.obolibrary.org/obo/SO_0000231', 'http://purl.obolibrary.org/obo/SO_0000232', 'http://purl.obolibrary.org/obo/SO_0000233', 'http://purl.obolibrary.org/obo/SO_0000234', 'http://purl.obolibrary.org/obo/SO_0000235', 'http://purl.obolibrary.org/obo/SO_0000236', 'http://purl.obolibrary.org/obo/SO_0000237', 'http://purl.obolibrary.org/obo/SO_0000238', 'http://purl.obolibrary.org/obo/SO_0000239', 'http://purl.obolibrary.org/obo/SO_0000240', 'http://purl.obolibrary.org/obo/SO_0000241', 'http://purl.obolibrary.org/obo/SO_0000242', 'http://purl.obolibrary.org/obo/SO_0000243', 'http://purl.obolibrary.org/obo/SO_0000244', 'http://purl.obolibrary.org/obo/SO_0000245', 'http://purl.obolibrary.org/obo/SO_0000246', 'http://purl.obolibrary.org/obo/SO_0000247', 'http://purl.obolibrary.org/obo/SO_0000248', 'http://purl.obolibrary.org/obo/SO_0000249', 'http://purl.obolibrary.org/obo/SO_0000250', 'http://purl.obolibrary.org/obo/SO_0000251', 'http://purl.obolibrary.org/obo/SO_0000252', 'http://purl.obolibrary.org/obo/SO_0000253', 'http://purl.obolibrary.org/obo/SO_0000254', 'http://purl.obolibrary.org/obo/SO_0000255', 'http://purl.obolibrary.org/obo/SO_0000256', 'http://purl.obolibrary.org/obo/SO_0000257', 'http://purl.obolibrary.org/obo/SO_0000258', 'http://purl.obolibrary.org/obo/SO_0000259', 'http://purl.obolibrary.org/obo/SO_0000260', 'http://purl.obolibrary.org/obo/SO_0000261', 'http://purl.obolibrary.org/obo/SO_0000262', 'http://purl.obolibrary.org/obo/SO_0000263', 'http://purl.obolibrary.org/obo/SO_0000264', 'http://purl.obolibrary.org/obo/SO_0000265', 'http://purl.obolibrary.org/obo/SO_0000266', 'http://purl.obolibrary.org/obo/SO_0000267', 'http://purl.obolibrary.org/obo/SO_0000268', 'http://purl.obolibrary.org/obo/SO_0000269', 'http://purl.obolibrary.org/obo/SO_0000270', 'http://purl.obolibrary.org/obo/SO_0000271', 'http://purl.obolibrary.org/obo/SO_0000272', 'http://purl.obolibrary.org/obo/SO_0000273', 'http://purl.obolibrary.org/obo/SO_0000275', 'http://purl.obolibrary.org/obo/SO_0000276', 'http://purl.obolibrary.org/obo/SO_0000277', 'http://purl.obolibrary.org/obo/SO_0000278', 'http://purl.obolibrary.org/obo/SO_0000279', 'http://purl.obolibrary.org/obo/SO_0000280', 'http://purl.obolibrary.org/obo/SO_0000281', 'http://purl.obolibrary.org/obo/SO_0000282', 'http://purl.obolibrary.org/obo/SO_0000283', 'http://purl.obolibrary.org/obo/SO_0000284', 'http://purl.obolibrary.org/obo/SO_0000285', 'http://purl.obolibrary.org/obo/SO_0000286', 'http://purl.obolibrary.org/obo/SO_0000287', 'http://purl.obolibrary.org/obo/SO_0000288', 'http://purl.obolibrary.org/obo/SO_0000289', 'http://purl.obolibrary.org/obo/SO_0000290', 'http://purl.obolibrary.org/obo/SO_0000291', 'http://purl.obolibrary.org/obo/SO_0000292', 'http://purl.obolibrary.org/obo/SO_0000293', 'http://purl.obolibrary.org/obo/SO_0000294', 'http://purl.obolibrary.org/obo/SO_0000295', 'http://purl.obolibrary.org/obo/SO_0000296', 'http://purl.obolibrary.org/obo/SO_0000297', 'http://purl.obolibrary.org/obo/SO_0000298', 'http://purl.obolibrary.org/obo/SO_0000299', 'http://purl.obolibrary.org/obo/SO_0000300', 'http://purl.obolibrary.org/obo/SO_0000301', 'http://purl.obolibrary.org/obo/SO_0000302', 'http://purl.obolibrary.org/obo/SO_0000303', 'http://purl.obolibrary.org/obo/SO_0000304', 'http://purl.obolibrary.org/obo/SO_0000305', 'http://purl.obolibrary.org/obo/SO_0000306', 'http://purl.obolibrary.org/obo/SO_0000307', 'http://purl.obolibrary.org/obo/SO_0000308', 'http://purl.obolibrary.org/obo/SO_0000309', 'http://purl.obolibrary.org/obo/SO_0000310', 'http://purl.obolibrary.org/obo/SO_0000311', 'http://purl.obolibrary.org/obo/SO_0000312', 'http://purl.obolibrary.org/obo/SO_0000313', 'http://purl.obolibrary.org/obo/SO_0000314', 'http://purl.obolibrary.org/obo/SO_0000315', 'http://purl.obolibrary.org/obo/SO_0000316', 'http://purl.obolibrary.org/obo/SO_0000317', 'http://purl.obolibrary.org/obo/SO_0000318', 'http://purl.obolibrary.org/obo/SO_0000319', 'http://purl.obolibrary.org/obo/SO_0000320', 'http://purl.obolibrary.org/obo/SO_0000321', 'http://purl.obolibrary.org/obo/SO_0000322', 'http://purl.obolibrary.org/obo/SO_0000323', 'http://purl.obolibrary.org/obo/SO_0000324', 'http://purl.obolibrary.org/obo/SO_0000325', 'http://purl.obolibrary.org/obo/SO_0000326', 'http://purl.obolibrary.org/obo/SO_0000327', 'http://purl.obolibrary.org/obo/SO_0000328', 'http://purl.obolibrary.org/obo/SO_0000329', 'http://purl.obolibrary.org/obo/SO_0000330', 'http://purl.obolibrary.org/obo/SO_0000331', 'http://purl.obolibrary.org/obo/SO_0000332', 'http://purl.obolibrary.org/obo/SO_0000333', 'http://purl.obolibrary.org/obo/SO_0000334', 'http://purl.obolibrary.org/obo/SO_0000335', 'http://purl.obolibrary.org/obo/SO_0000336', 'http://purl.obolibrary.org/obo/SO_0000337', 'http://purl.obolibrary.org/obo/SO_0000338', 'http://purl.obolibrary.org/obo/SO_0000339', 'http://purl.obolibrary.org/obo/SO_0000340', 'http://purl.obolibrary.org/obo/SO_0000341', 'http://purl.obolibrary.org/obo/SO_0000342', 'http://purl.obolibrary.org/obo/SO_0000343', 'http://purl.obolibrary.org/obo/SO_0000344', 'http://purl.obolibrary.org/obo/SO_0000345', 'http://purl.obolibrary.org/obo/SO_0000346', 'http://purl.obolibrary.org/obo/SO_0000347', 'http://purl.obolibrary.org/obo/SO_0000348', 'http://purl.obolibrary.org/obo/SO_0000349', 'http://purl.obolibrary.org/obo/SO_0000350', 'http://purl.obolibrary.org/obo/SO_0000351', 'http://purl.obolibrary.org/obo/SO_0000352', 'http://purl.obolibrary.org/obo/SO_0000353', 'http://purl.obolibrary.org/obo/SO_0000354', 'http://purl.obolibrary.org/obo/SO_0000355', 'http://purl.obolibrary.org/obo/SO_0000356', 'http://purl.obolibrary.org/obo/SO_0000357', 'http://purl.obolibrary.org/obo/SO_0000359', 'http://purl.obolibrary.org/obo/SO_0000360', 'http://purl.obolibrary.org/obo/SO_0000361', 'http://purl.obolibrary.org/obo/SO_0000362', 'http://purl.obolibrary.org/obo/SO_0000363', 'http://purl.obolibrary.org/obo/SO_0000364', 'http://purl.obolibrary.org/obo/SO_0000365', 'http://purl.obolibrary.org/obo/SO_0000366', 'http://purl.obolibrary.org/obo/SO_0000367', 'http://purl.obolibrary.org/obo/SO_0000368', 'http://purl.obolibrary.org/obo/SO_0000369', 'http://purl.obolibrary.org/obo/SO_0000370', 'http://purl.obolibrary.org/obo/SO_0000371', 'http://purl.obolibrary.org/obo/SO_0000372', 'http://purl.obolibrary.org/obo/SO_0000373', 'http://purl.obolibrary.org/obo/SO_0000374', 'http://purl.obolibrary.org/obo/SO_0000375', 'http://purl.obolibrary.org/obo/SO_0000376', 'http://purl.obolibrary.org/obo/SO_0000377', 'http://purl.obolibrary.org/obo/SO_0000378', 'http://purl.obolibrary.org/obo/SO_0000379', 'http://purl.obolibrary.org/obo/SO_0000380', 'http://purl.obolibrary.org/obo/SO_0000381', 'http://purl.obolibrary.org/obo/SO_0000382', 'http://purl.obolibrary.org/obo/SO_0000383', 'http://purl.obolibrary.org/obo/SO_0000384', 'http://purl.obolibrary.org/obo/SO_0000385', 'http://purl.obolibrary.org/obo/SO_0000386', 'http://purl.obolibrary.org/obo/SO_0000387', 'http://purl.obolibrary.org/obo/SO_0000388', 'http://purl.obolibrary.org/obo/SO_0000389', 'http://purl.obolibrary.org/obo/SO_0000390', 'http://purl.obolibrary.org/obo/SO_0000391', 'http://purl.obolibrary.org/obo/SO_0000392', 'http://purl.obolibrary.org/obo/SO_0000393', 'http://purl.obolibrary.org/obo/SO_0000394', 'http://purl.obolibrary.org/obo/SO_0000395', 'http://purl.obolibrary.org/obo/SO_0000396', 'http://purl.obolibrary.org/obo/SO_0000397', 'http://purl.obolibrary.org/obo/SO_0000398', 'http://purl.obolibrary.org/obo/SO_0000399', 'http://purl.obolibrary.org/obo/SO_0000400', 'http://purl.obolibrary.org/obo/SO_0000401', 'http://purl.obolibrary.org/obo/SO_0000402', 'http://purl.obolibrary.org/obo/SO_0000403', 'http://purl.obolibrary.org/obo/SO_0000404', 'http://purl.obolibrary.org/obo/SO_0000405', 'http://purl.obolibrary.org/obo/SO_0000406', 'http://purl.obolibrary.org/obo/SO_0000407', 'http://purl.obolibrary.org/obo/SO_0000408', 'http://purl.obolibrary.org/obo/SO_0000409', 'http://purl.obolibrary.org/obo/SO_0000410', 'http://purl.obolibrary.org/obo/SO_0000411', 'http://purl.obolibrary.org/obo/SO_0000412', 'http://purl.obolibrary.org/obo/SO_0000413', 'http://purl.obolibrary.org/obo/SO_0000414', 'http://purl.obolibrary.org/obo/SO_0000415', 'http://purl.obolibrary.org/obo/SO_0000416', 'http://purl.obolibrary.org/obo/SO_0000417', 'http://purl.obolibrary.org/obo/SO_0000418', 'http://purl.obolibrary.org/obo/SO_0000419', 'http://purl.obolibrary.org/obo/SO_0000420', 'http://purl.obolibrary.org/obo/SO_0000421', 'http://purl.obolibrary.org/obo/SO_0000422', 'http://purl.obolibrary.org/obo/SO_0000423', 'http://purl.obolibrary.org/obo/SO_0000424', 'http://purl.obolibrary.org/obo/SO_0000425', 'http://purl.obolibrary.org/obo/SO_0000426', 'http://purl.obolibrary.org/obo/SO_0000427', 'http://purl.obolibrary.org/obo/SO_0000428', 'http://purl.obolibrary.org/obo/SO_0000429', 'http://purl.obolibrary.org/obo/SO_0000430', 'http://purl.obolibrary.org/obo/SO_0000431', 'http://purl.obolibrary.org/obo/SO_0000432', 'http://purl.obolibrary.org/obo/SO_0000433', 'http://purl.obolibrary.org/obo/SO_0000434', 'http://purl.obolibrary.org/obo/SO_0000435', 'http://purl.obolibrary.org/obo/SO_0000436', 'http://purl.obolibrary.org/obo/SO_0000437', 'http://purl.obolibrary.org/obo/SO_0000438', 'http://purl.obolibrary.org/obo/SO_0000439', 'http://purl.obolibrary.org/obo/SO_0000440', 'http://purl.obolibrary.org/obo/SO_0000441', 'http://purl.obolibrary.org/obo/SO_0000442', 'http://purl.obolibrary.org/obo/SO_0000443', 'http://purl.obolibrary.org/obo/SO_0000444', 'http://purl.obolibrary.org/obo/SO_0000445', 'http://purl.obolibrary.org/obo/SO_0000446', 'http://purl.obolibrary.org/obo/SO_0000447', 'http://purl.obolibrary.org/obo/SO_0000448', 'http://purl.obolibrary.org/obo/SO_0000449', 'http://purl.obolibrary.org/obo/SO_0000450', 'http://purl.obolibrary.org/obo/SO_0000451', 'http://purl.obolibrary.org/obo/SO_0000452', 'http://purl.obolibrary.org/obo/SO_0000453', 'http://purl.obolibrary.org/obo/SO_0000454', 'http://purl.obolibrary.org/obo/SO_0000455', 'http://purl.obolibrary.org/obo/SO_0000456', 'http://purl.obolibrary.org/obo/SO_0000457', 'http://purl.obolibrary.org/obo/SO_0000458', 'http://purl.obolibrary.org/obo/SO_0000459', 'http://purl.obolibrary.org/obo/SO_0000460', 'http://purl.obolibrary.org/obo/SO_0000461', 'http://purl.obolibrary.org/obo/SO_0000462', 'http://purl.obolibrary.org/obo/SO_0000463', 'http://purl.obolibrary.org/obo/SO_0000464', 'http://purl.obolibrary.org/obo/SO_0000465', 'http://purl.obolibrary.org/obo/SO_0000466', 'http://purl.obolibrary.org/obo/SO_0000467', 'http://purl.obolibrary.org/obo/SO_0000468', 'http://purl.obolibrary.org/obo/SO_0000469', 'http://purl.obolibrary.org/obo/SO_0000470', 'http://purl.obolibrary.org/obo/SO_0000471', 'http://purl.obolibrary.org/obo/SO_0000472', 'http://purl.obolibrary.org/obo/SO_0000473', 'http://purl.obolibrary.org/obo/SO_0000474', 'http://purl.obolibrary.org/obo/SO_0000475', 'http://purl.obolibrary.org/obo/SO_0000476', 'http://purl.obolibrary.org/obo/SO_0000477', 'http://purl.obolibrary.org/obo/SO_0000478', 'http://purl.obolibrary.org/obo/SO_0000479', 'http://purl.obolibrary.org/obo/SO_0000480', 'http://purl.obolibrary.org/obo/SO_0000481', 'http://purl.obolibrary.org/obo/SO_0000482', 'http://purl.obolibrary.org/obo/SO_0000483', 'http://purl.obolibrary.org/obo/SO_0000484', 'http://purl.obolibrary.org/obo/SO_0000485', 'http://purl.obolibrary.org/obo/SO_0000486', 'http://purl.obolibrary.org/obo/SO_0000487', 'http://purl.obolibrary.org/obo/SO_0000488', 'http://purl.obolibrary.org/obo/SO_0000489', 'http://purl.obolibrary.org/obo/SO_0000490', 'http://purl.obolibrary.org/obo/SO_0000491', 'http://purl.obolibrary.org/obo/SO_0000492', 'http://purl.obolibrary.org/obo/SO_0000493', 'http://purl.obolibrary.org/obo/SO_0000494', 'http://purl.obolibrary.org/obo/SO_0000495', 'http://purl.obolibrary.org/obo/SO_0000496', 'http://purl.obolibrary.org/obo/SO_0000497', 'http://purl.obolibrary.org/obo/SO_0000498', 'http://purl.obolibrary.org/obo/SO_0000499', 'http://purl.obolibrary.org/obo/SO_0000500', 'http://purl.obolibrary.org/obo/SO_0000501', 'http://purl.obolibrary.org/obo/SO_0000502', 'http://purl.obolibrary.org/obo/SO_0000503', 'http://purl.obolibrary.org/obo/SO_0000504', 'http://purl.obolibrary.org/obo/SO_0000505', 'http://purl.obolibrary.org/obo/SO_0000506', 'http://purl.obolibrary.org/obo/SO_0000507', 'http://purl.obolibrary.org/obo/SO_0000508', 'http://purl.obolibrary.org/obo/SO_0000509', 'http://purl.obolibrary.org/obo/SO_0000510', 'http://purl.obolibrary.org/obo/SO_0000511', 'http://purl.obolibrary.org/obo/SO_0000512', 'http://purl.obolibrary.org/obo/SO_0000513', 'http://purl.obolibrary.org/obo/SO_0000514', 'http://purl.obolibrary.org/obo/SO_0000515', 'http://purl.obolibrary.org/obo/SO_0000516', 'http://purl.obolibrary.org/obo/SO_0000517', 'http://purl.obolibrary.org/obo/SO_0000518', 'http://purl.obolibrary.org/obo/SO_0000519', 'http://purl.obolibrary.org/obo/SO_0000520', 'http://purl.obolibrary.org/obo/SO_0000521', 'http://purl.obolibrary.org/obo/SO_0000522', 'http://purl.obolibrary.org/obo/SO_0000523', 'http://purl.obolibrary.org/obo/SO_0000524', 'http://purl.obolibrary.org/obo/SO_0000525', 'http://purl.obolibrary.org/obo/SO_0000526', 'http://purl.obolibrary.org/obo/SO_0000527', 'http://purl.obolibrary.org/obo/SO_0000528', 'http://purl.obolibrary.org/obo/SO_0000529', 'http://purl.obolibrary.org/obo/SO_0000530', 'http://purl.obolibrary.org/obo/SO_0000531', 'http://purl.obolibrary.org/obo/SO_0000532', 'http://purl.obolibrary.org/obo/SO_0000533', 'http://purl.obolibrary.org/obo/SO_0000534', 'http://purl.obolibrary.org/obo/SO_0000535', 'http://purl.obolibrary.org/obo/SO_0000536', 'http://purl.obolibrary.org/obo/SO_0000537', 'http://purl.obolibrary.org/obo/SO_0000538', 'http://purl.obolibrary.org/obo/SO_0000539', 'http://purl.obolibrary.org/obo/SO_0000540', 'http://purl.obolibrary.org/obo/SO_0000541', 'http://purl.obolibrary.org/obo/SO_0000542', 'http://purl.obolibrary.org/obo/SO_0000543', 'http://purl.obolibrary.org/obo/SO_0000544', 'http://purl.obolibrary.org/obo/SO_0000545', 'http://purl.obolibrary.org/obo/SO_0000546', 'http://purl.obolibrary.org/obo/SO_0000547', 'http://purl.obolibrary.org/obo/SO_0000548', 'http://purl.obolibrary.org/obo/SO_0000549', 'http://purl.obolibrary.org/obo/SO_0000550', 'http://purl.obolibrary.org/obo/SO_0000551', 'http://purl.obolibrary.org/obo/SO_0000552', 'http://purl.obolibrary.org/obo/SO_0000553', 'http://purl.obolibrary.org/obo/SO_0000554', 'http://purl.obolibrary.org/obo/SO_0000555', 'http://purl.obolibrary.org/obo/SO_0000556', 'http://purl.obolibrary.org/obo/SO_0000557', 'http://purl.obolibrary.org/obo/SO_0000558', 'http://purl.obolibrary.org/obo/SO_0000559', 'http://purl.obolibrary.org/obo/SO_0000560', 'http://purl.obolibrary.org/obo/SO_0000561', 'http://purl.obolibrary.org/obo/SO_0000562', 'http://purl.obolibrary.org/obo/SO_0000563', 'http://purl.obolibrary.org/obo/SO_0000564', 'http://purl.obolibrary.org/obo/SO_0000565', 'http://purl.obolibrary.org/obo/SO_0000566', 'http://purl.obolibrary.org/obo/SO_0000567', 'http://purl.obolibrary.org/obo/SO_0000568', 'http://purl.obolibrary.org/obo/SO_0000569', 'http://purl.obolibrary.org/obo/SO_0000570', 'http://purl.obolibrary.org/obo/SO_0000571', 'http://purl.obolibrary.org/obo/SO_0000572', 'http://purl.obolibrary.org/obo/SO_0000573', 'http://purl.obolibrary.org/obo/SO_0000574', 'http://purl.obolibrary.org/obo/SO_0000575', 'http://purl.obolibrary.org/obo/SO_0000576', 'http://purl.obolibrary.org/obo/SO_0000577', 'http://purl.obolibrary.org/obo/SO_0000578', 'http://purl.obolibrary.org/obo/SO_0000579', 'http://purl.obolibrary.org/obo/SO_0000580', 'http://purl.obolibrary.org/obo/SO_0000581', 'http://purl.obolibrary.org/obo/SO_0000582', 'http://purl.obolibrary.org/obo/SO_0000583', 'http://purl.obolibrary.org/obo/SO_0000584', 'http://purl.obolibrary.org/obo/SO_0000585', 'http://purl.obolibrary.org/obo/SO_0000586', 'http://purl.obolibrary.org/obo/SO_0000587', 'http://purl.obolibrary.org/obo/SO_0000588', 'http://purl.obolibrary.org/obo/SO_0000589', 'http://purl.obolibrary.org/obo/SO_0000590', 'http://purl.obolibrary.org/obo/SO_0000591', 'http://purl.obolibrary.org/obo/SO_0000592', 'http://purl.obolibrary.org/obo/SO_0000593', 'http://purl.obolibrary.org/obo/SO_0000594', 'http://purl.obolibrary.org/obo/SO_0000595', 'http://purl.obolibrary.org/obo/SO_0000596', 'http://purl.obolibrary.org/obo/SO_0000597', 'http://purl.obolibrary.org/obo/SO_0000598', 'http://purl.obolibrary.org/obo/SO_0000599', 'http://purl.obolibrary.org/obo/SO_0000600', 'http://purl.obolibrary.org/obo/SO_0000601', 'http://purl.obolibrary.org/obo/SO_0000602', 'http://purl.obolibrary.org/obo/SO_0000603', 'http://purl.obolibrary.org/obo/SO_0000604', 'http://purl.obolibrary.org/obo/SO_0000605', 'http://purl.obolibrary.org/obo/SO_0000606', 'http://purl.obolibrary.org/obo/SO_0000607', 'http://purl.obolibrary.org/obo/SO_0000608', 'http://purl.obolibrary.org/obo/SO_0000609', 'http://purl.obolibrary.org/obo/SO_0000610', 'http://purl.obolibrary.org/obo/SO_0000611', 'http://purl.obolibrary.org/obo/SO_0000612', 'http://purl.obolibrary.org/obo/SO_0000613', 'http://purl.obolibrary.org/obo/SO_0000614', 'http://purl.obolibrary.org/obo/SO_0000615', 'http://purl.obolibrary.org/obo/SO_0000616', 'http://purl.obolibrary.org/obo/SO_0000617', 'http://purl.obolibrary.org/obo/SO_0000618', 'http://purl.obolibrary.org/obo/SO_0000619', 'http://purl.obolibrary.org/obo/SO_0000620', 'http://purl.obolibrary.org/obo/SO_0000621', 'http://purl.obolibrary.org/obo/SO_0000622', 'http://purl.obolibrary.org/obo/SO_0000623', 'http://purl.obolibrary.org/obo/SO_0000624', 'http://purl.obolibrary.org/obo/SO_0000625', 'http://purl.obolibrary.org/obo/SO_0000626', 'http://purl.obolibrary.org/obo/SO_0000627', 'http://purl.obolibrary.org/obo/SO_0000628', 'http://purl.obolibrary.org/obo/SO_0000629', 'http://purl.obolibrary.org/obo/SO_0000630', 'http://purl.obolibrary.org/obo/SO_0000631', 'http://purl.obolibrary.org/obo/SO_0000632', 'http://purl.obolibrary.org/obo/SO_0000633', 'http://purl.obolibrary.org/obo/SO_0000634', 'http://purl.obolibrary.org/obo/SO_0000635', 'http://purl.obolibrary.org/obo/SO_0000636', 'http://purl.obolibrary.org/obo/SO_0000637', 'http://purl.obolibrary.org/obo/SO_0000638', 'http://purl.obolibrary.org/obo/SO_0000639', 'http://purl.obolibrary.org/obo/SO_0000640', 'http://purl.obolibrary.org/obo/SO_0000641', 'http://purl.obolibrary.org/obo/SO_0000642', 'http://purl.obolibrary.org/obo/SO_0000643', 'http://purl.obolibrary.org/obo/SO_0000644', 'http://purl.obolibrary.org/obo/SO_0000645', 'http://purl.obolibrary.org/obo/SO_0000646', 'http://purl.obolibrary.org/obo/SO_0000647', 'http://purl.obolibrary.org/obo/SO_0000648', 'http://purl.obolibrary.org/obo/SO_0000649', 'http://purl.obolibrary.org/obo/SO_0000650', 'http://purl.obolibrary.org/obo/SO_0000651', 'http://purl.obolibrary.org/obo/SO_0000652', 'http://purl.obolibrary.org/obo/SO_0000653', 'http://purl.obolibrary.org/obo/SO_0000654', 'http://purl.obolibrary.org/obo/SO_0000656', 'http://purl.obolibrary.org/obo/SO_0000657', 'http://purl.obolibrary.org/obo/SO_0000658', 'http://purl.obolibrary.org/obo/SO_0000659', 'http://purl.obolibrary.org/obo/SO_0000660', 'http://purl.obolibrary.org/obo/SO_0000661', 'http://purl.obolibrary.org/obo/SO_0000662', 'http://purl.obolibrary.org/obo/SO_0000663', 'http://purl.obolibrary.org/obo/SO_0000664', 'http://purl.obolibrary.org/obo/SO_0000665', 'http://purl.obolibrary.org/obo/SO_0000666', 'http://purl.obolibrary.org/obo/SO_0000667', 'http://purl.obolibrary.org/obo/SO_0000668', 'http://purl.obolibrary.org/obo/SO_0000669', 'http://purl.obolibrary.org/obo/SO_0000670', 'http://purl.obolibrary.org/obo/SO_0000671', 'http://purl.obolibrary.org/obo/SO_0000672', 'http://purl.obolibrary.org/obo/SO_0000673', 'http://purl.obolibrary.org/obo/SO_0000674', 'http://purl.obolibrary.org/obo/SO_0000675', 'http://purl.obolibrary.org/obo/SO_0000676', 'http://purl.obolibrary.org/obo/SO_0000677', 'http://purl.obolibrary.org/obo/SO_0000678', 'http://purl.obolibrary.org/obo/SO_0000679', 'http://purl.obolibrary.org/obo/SO_0000680', 'http://purl.obolibrary.org/obo/SO_0000681', 'http://purl.obolibrary.org/obo/SO_0000682', 'http://purl.obolibrary.org/obo/SO_0000683', 'http://purl.obolibrary.org/obo/SO_0000684', 'http://purl.obolibrary.org/obo/SO_0000685', 'http://purl.obolibrary.org/obo/SO_0000686', 'http://purl.obolibrary.org/obo/SO_0000687', 'http://purl.obolibrary.org/obo/SO_0000688', 'http://purl.obolibrary.org/obo/SO_0000689', 'http://purl.obolibrary.org/obo/SO_0000690', 'http://purl.obolibrary.org/obo/SO_0000691', 'http://purl.obolibrary.org/obo/SO_0000692', 'http://purl.obolibrary.org/obo/SO_0000693', 'http://purl.obolibrary.org/obo/SO_0000694', 'http://purl.obolibrary.org/obo/SO_0000695', 'http://purl.obolibrary.org/obo/SO_0000696', 'http://purl.obolibrary.org/obo/SO_0000697', 'http://purl.obolibrary.org/obo/SO_0000698', 'http://purl.obolibrary.org/obo/SO_0000699', 'http://purl.obolibrary.org/obo/SO_0000700', 'http://purl.obolibrary.org/obo/SO_0000701', 'http://purl.obolibrary.org/obo/SO_0000702', 'http://purl.obolibrary.org/obo/SO_0000703', 'http://purl.obolibrary.org/obo/SO_0000705', 'http://purl.obolibrary.org/obo/SO_0000706', 'http://purl.obolibrary.org/obo/SO_0000707', 'http://purl.obolibrary.org/obo/SO_0000708', 'http://purl.obolibrary.org/obo/SO_0000709', 'http://purl.obolibrary.org/obo/SO_0000710', 'http://purl.obolibrary.org/obo/SO_0000711', 'http://purl.obolibrary.org/obo/SO_0000712', 'http://purl.obolibrary.org/obo/SO_0000713', 'http://purl.obolibrary.org/obo/SO_0000714', 'http://purl.obolibrary.org/obo/SO_0000715', 'http://purl.obolibrary.org/obo/SO_0000716', 'http://purl.obolibrary.org/obo/SO_0000717', 'http://purl.obolibrary.org/obo/SO_0000718', 'http://purl.obolibrary.org/obo/SO_0000719', 'http://purl.obolibrary.org/obo/SO_0000720', 'http://purl.obolibrary.org/obo/SO_0000721', 'http://purl.obolibrary.org/obo/SO_0000722', 'http://purl.obolibrary.org/obo/SO_0000723', 'http://purl.obolibrary.org/obo/SO_0000724', 'http://purl.obolibrary.org/obo/SO_0000725', 'http://purl.obolibrary.org/obo/SO_0000726', 'http://purl.obolibrary.org/obo/SO_0000727', 'http://purl.obolibrary.org/obo/SO_0000728', 'http://purl.obolibrary.org/obo/SO_0000729', 'http://purl.obolibrary.org/obo/SO_0000730', 'http://purl.obolibrary.org/obo/SO_0000731', 'http://purl.obolibrary.org/obo/SO_0000732', 'http://purl.obolibrary.org/obo/SO_0000733', 'http://purl.obolibrary.org/obo/SO_0000734', 'http://purl.obolibrary.org/obo/SO_0000735', 'http://purl.obolibrary.org/obo/SO_0000736', 'http://purl.obolibrary.org/obo/SO_0000737', 'http://purl.obolibrary.org/obo/SO_0000738', 'http://purl.obolibrary.org/obo/SO_0000739', 'http://purl.obolibrary.org/obo/SO_0000740', 'http://purl.obolibrary.org/obo/SO_0000741', 'http://purl.obolibrary.org/obo/SO_0000742', 'http://purl.obolibrary.org/obo/SO_0000743', 'http://purl.obolibrary.org/obo/SO_0000744', 'http://purl.obolibrary.org/obo/SO_0000745', 'http://purl.obolibrary.org/obo/SO_0000746', 'http://purl.obolibrary.org/obo/SO_0000747', 'http://purl.obolibrary.org/obo/SO_0000748', 'http://purl.obolibrary.org/obo/SO_0000749', 'http://purl.obolibrary.org/obo/SO_0000750', 'http://purl.obolibrary.org/obo/SO_0000751', 'http://purl.obolibrary.org/obo/SO_0000752', 'http://purl.obolibrary.org/obo/SO_0000753', 'http://purl.obolibrary.org/obo/SO_0000754', 'http://purl.obolibrary.org/obo/SO_0000755', 'http://purl.obolibrary.org/obo/SO_0000756', 'http://purl.obolibrary.org/obo/SO_0000757', 'http://purl.obolibrary.org/obo/SO_0000758', 'http://purl.obolibrary.org/obo/SO_0000759', 'http://purl.obolibrary.org/obo/SO_0000760', 'http://purl.obolibrary.org/obo/SO_0000761', 'http://purl.obolibrary.org/obo/SO_0000762', 'http://purl.obolibrary.org/obo/SO_0000763', 'http://purl.obolibrary.org/obo/SO_0000764', 'http://purl.obolibrary.org/obo/SO_0000765', 'http://purl.obolibrary.org/obo/SO_0000766', 'http://purl.obolibrary.org/obo/SO_0000767', 'http://purl.obolibrary.org/obo/SO_0000768', 'http://purl.obolibrary.org/obo/SO_0000769', 'http://purl.obolibrary.org/obo/SO_0000770', 'http://purl.obolibrary.org/obo/SO_0000771', 'http://purl.obolibrary.org/obo/SO_0000772', 'http://purl.obolibrary.org/obo/SO_0000773', 'http://purl.obolibrary.org/obo/SO_0000774', 'http://purl.obolibrary.org/obo/SO_0000775', 'http://purl.obolibrary.org/obo/SO_0000776', 'http://purl.obolibrary.org/obo/SO_0000777', 'http://purl.obolibrary.org/obo/SO_0000778', 'http://purl.obolibrary.org/obo/SO_0000779', 'http://purl.obolibrary.org/obo/SO_0000780', 'http://purl.obolibrary.org/obo/SO_0000781', 'http://purl.obolibrary.org/obo/SO_0000782', 'http://purl.obolibrary.org/obo/SO_0000783', 'http://purl.obolibrary.org/obo/SO_0000784', 'http://purl.obolibrary.org/obo/SO_0000785', 'http://purl.obolibrary.org/obo/SO_0000786', 'http://purl.obolibrary.org/obo/SO_0000787', 'http://purl.obolibrary.org/obo/SO_0000788', 'http://purl.obolibrary.org/obo/SO_0000789', 'http://purl.obolibrary.org/obo/SO_0000790', 'http://purl.obolibrary.org/obo/SO_0000791', 'http://purl.obolibrary.org/obo/SO_0000792', 'http://purl.obolibrary.org/obo/SO_0000793', 'http://purl.obolibrary.org/obo/SO_0000794', 'http://purl.obolibrary.org/obo/SO_0000795', 'http://purl.obolibrary.org/obo/SO_0000796', 'http://purl.obolibrary.org/obo/SO_0000797', 'http://purl.obolibrary.org/obo/SO_0000798', 'http://purl.obolibrary.org/obo/SO_0000799', 'http://purl.obolibrary.org/obo/SO_0000800', 'http://purl.obolibrary.org/obo/SO_0000801', 'http://purl.obolibrary.org/obo/SO_0000802', 'http://purl.obolibrary.org/obo/SO_0000803', 'http://purl.obolibrary.org/obo/SO_0000804', 'http://purl.obolibrary.org/obo/SO_0000805', 'http://purl.obolibrary.org/obo/SO_0000806', 'http://purl.obolibrary.org/obo/SO_0000807', 'http://purl.obolibrary.org/obo/SO_0000808', 'http://purl.obolibrary.org/obo/SO_0000809', 'http://purl.obolibrary.org/obo/SO_0000810', 'http://purl.obolibrary.org/obo/SO_0000811', 'http://purl.obolibrary.org/obo/SO_0000812', 'http://purl.obolibrary.org/obo/SO_0000813', 'http://purl.obolibrary.org/obo/SO_0000814', 'http://purl.obolibrary.org/obo/SO_0000815', 'http://purl.obolibrary.org/obo/SO_0000816', 'http://purl.obolibrary.org/obo/SO_0000817', 'http://purl.obolibrary.org/obo/SO_0000818', 'http://purl.obolibrary.org/obo/SO_0000819', 'http://purl.obolibrary.org/obo/SO_0000820', 'http://purl.obolibrary.org/obo/SO_0000821', 'http://purl.obolibrary.org/obo/SO_0000822', 'http://purl.obolibrary.org/obo/SO_0000823', 'http://purl.obolibrary.org/obo/SO_0000824', 'http://purl.obolibrary.org/obo/SO_0000825', 'http://purl.obolibrary.org/obo/SO_0000828', 'http://purl.obolibrary.org/obo/SO_0000829', 'http://purl.obolibrary.org/obo/SO_0000830', 'http://purl.obolibrary.org/obo/SO_0000831', 'http://purl.obolibrary.org/obo/SO_0000832', 'http://purl.obolibrary.org/obo/SO_0000833', 'http://purl.obolibrary.org/obo/SO_0000834', 'http://purl.obolibrary.org/obo/SO_0000835', 'http://purl.obolibrary.org/obo/SO_0000836', 'http://purl.obolibrary.org/obo/SO_0000837', 'http://purl.obolibrary.org/obo/SO_0000838', 'http://purl.obolibrary.org/obo/SO_0000839', 'http://purl.obolibrary.org/obo/SO_0000840', 'http://purl.obolibrary.org/obo/SO_0000841', 'http://purl.obolibrary.org/obo/SO_0000842', 'http://purl.obolibrary.org/obo/SO_0000843', 'http://purl.obolibrary.org/obo/SO_0000844', 'http://purl.obolibrary.org/obo/SO_0000845', 'http://purl.obolibrary.org/obo/SO_0000846', 'http://purl.obolibrary.org/obo/SO_0000847', 'http://purl.obolibrary.org/obo/SO_0000848', 'http://purl.obolibrary.org/obo/SO_0000849', 'http://purl.obolibrary.org/obo/SO_0000850', 'http://purl.obolibrary.org/obo/SO_0000851', 'http://purl.obolibrary.org/obo/SO_0000852', 'http://purl.obolibrary.org/obo/SO_0000853', 'http://purl.obolibrary.org/obo/SO_0000854', 'http://purl.obolibrary.org/obo/SO_0000855', 'http://purl.obolibrary.org/obo/SO_0000856', 'http://purl.obolibrary.org/obo/SO_0000857', 'http://purl.obolibrary.org/obo/SO_0000858', 'http://purl.obolibrary.org/obo/SO_0000859', 'http://purl.obolibrary.org/obo/SO_0000860', 'http://purl.obolibrary.org/obo/SO_0000861', 'http://purl.obolibrary.org/obo/SO_0000862', 'http://purl.obolibrary.org/obo/SO_0000863', 'http://purl.obolibrary.org/obo/SO_0000864', 'http://purl.obolibrary.org/obo/SO_0000865', 'http://purl.obolibrary.org/obo/SO_0000866', 'http://purl.obolibrary.org/obo/SO_0000867', 'http://purl.obolibrary.org/obo/SO_0000868', 'http://purl.obolibrary.org/obo/SO_0000869', 'http://purl.obolibrary.org/obo/SO_0000870', 'http://purl.obolibrary.org/obo/SO_0000871', 'http://purl.obolibrary.org/obo/SO_0000872', 'http://purl.obolibrary.org/obo/SO_0000873', 'http://purl.obolibrary.org/obo/SO_0000874', 'http://purl.obolibrary.org/obo/SO_0000875', 'http://purl.obolibrary.org/obo/SO_0000876', 'http://purl.obolibrary.org/obo/SO_0000877', 'http://purl.obolibrary.org/obo/SO_0000878', 'http://purl.obolibrary.org/obo/SO_0000879', 'http://purl.obolibrary.org/obo/SO_0000880', 'http://purl.obolibrary.org/obo/SO_0000881', 'http://purl.obolibrary.org/obo/SO_0000882', 'http://purl.obolibrary.org/obo/SO_0000883', 'http://purl.obolibrary.org/obo/SO_0000884', 'http://purl.obolibrary.org/obo/SO_0000885', 'http://purl.obolibrary.org/obo/SO_0000886', 'http://purl.obolibrary.org/obo/SO_0000887', 'http://purl.obolibrary.org/obo/SO_0000888', 'http://purl.obolibrary.org/obo/SO_0000889', 'http://purl.obolibrary.org/obo/SO_0000890', 'http://purl.obolibrary.org/obo/SO_0000891', 'http://purl.obolibrary.org/obo/SO_0000892', 'http://purl.obolibrary.org/obo/SO_0000893', 'http://purl.obolibrary.org/obo/SO_0000894', 'http://purl.obolibrary.org/obo/SO_0000895', 'http://purl.obolibrary.org/obo/SO_0000896', 'http://purl.obolibrary.org/obo/SO_0000897', 'http://purl.obolibrary.org/obo/SO_0000898', 'http://purl.obolibrary.org/obo/SO_0000899', 'http://purl.obolibrary.org/obo/SO_0000900', 'http://purl.obolibrary.org/obo/SO_0000901', 'http://purl.obolibrary.org/obo/SO_0000902', 'http://purl.obolibrary.org/obo/SO_0000903', 'http://purl.obolibrary.org/obo/SO_0000904', 'http://purl.obolibrary.org/obo/SO_0000905', 'http://purl.obolibrary.org/obo/SO_0000906', 'http://purl.obolibrary.org/obo/SO_0000907', 'http://purl.obolibrary.org/obo/SO_0000908', 'http://purl.obolibrary.org/obo/SO_0000909', 'http://purl.obolibrary.org/obo/SO_0000910', 'http://purl.obolibrary.org/obo/SO_0000911', 'http://purl.obolibrary.org/obo/SO_0000912', 'http://purl.obolibrary.org/obo/SO_0000913', 'http://purl.obolibrary.org/obo/SO_0000914', 'http://purl.obolibrary.org/obo/SO_0000915', 'http://purl.obolibrary.org/obo/SO_0000916', 'http://purl.obolibrary.org/obo/SO_0000917', 'http://purl.obolibrary.org/obo/SO_0000918', 'http://purl.obolibrary.org/obo/SO_0000919', 'http://purl.obolibrary.org/obo/SO_0000920', 'http://purl.obolibrary.org/obo/SO_0000921', 'http://purl.obolibrary.org/obo/SO_0000922', 'http://purl.obolibrary.org/obo/SO_0000923', 'http://purl.obolibrary.org/obo/SO_0000924', 'http://purl.obolibrary.org/obo/SO_0000925', 'http://purl.obolibrary.org/obo/SO_0000926', 'http://purl.obolibrary.org/obo/SO_0000927', 'http://purl.obolibrary.org/obo/SO_0000928', 'http://purl.obolibrary.org/obo/SO_0000929', 'http://purl.obolibrary.org/obo/SO_0000930', 'http://purl.obolibrary.org/obo/SO_0000931', 'http://purl.obolibrary.org/obo/SO_0000932', 'http://purl.obolibrary.org/obo/SO_0000933', 'http://purl.obolibrary.org/obo/SO_0000934', 'http://purl.obolibrary.org/obo/SO_0000935', 'http://purl.obolibrary.org/obo/SO_0000936', 'http://purl.obolibrary.org/obo/SO_0000937', 'http://purl.obolibrary.org/obo/SO_0000938', 'http://purl.obolibrary.org/obo/SO_0000939', 'http://purl.obolibrary.org/obo/SO_0000940', 'http://purl.obolibrary.org/obo/SO_0000941', 'http://purl.obolibrary.org/obo/SO_0000942', 'http://purl.obolibrary.org/obo/SO_0000943', 'http://purl.obolibrary.org/obo/SO_0000944', 'http://purl.obolibrary.org/obo/SO_0000945', 'http://purl.obolibrary.org/obo/SO_0000946', 'http://purl.obolibrary.org/obo/SO_0000947', 'http://purl.obolibrary.org/obo/SO_0000948', 'http://purl.obolibrary.org/obo/SO_0000949', 'http://purl.obolibrary.org/obo/SO_0000950', 'http://purl.obolibrary.org/obo/SO_0000951', 'http://purl.obolibrary.org/obo/SO_0000952', 'http://purl.obolibrary.org/obo/SO_0000953', 'http://purl.obolibrary.org/obo/SO_0000954', 'http://purl.obolibrary.org/obo/SO_0000955', 'http://purl.obolibrary.org/obo/SO_0000956', 'http://purl.obolibrary.org/obo/SO_0000957', 'http://purl.obolibrary.org/obo/SO_0000958', 'http://purl.obolibrary.org/obo/SO_0000959', 'http://purl.obolibrary.org/obo/SO_0000960', 'http://purl.obolibrary.org/obo/SO_0000961', 'http://purl.obolibrary.org/obo/SO_0000962', 'http://purl.obolibrary.org/obo/SO_0000963', 'http://purl.obolibrary.org/obo/SO_0000964', 'http://purl.obolibrary.org/obo/SO_0000965', 'http://purl.obolibrary.org/obo/SO_0000966', 'http://purl.obolibrary.org/obo/SO_0000967', 'http://purl.obolibrary.org/obo/SO_0000968', 'http://purl.obolibrary.org/obo/SO_0000969', 'http://purl.obolibrary.org/obo/SO_0000970', 'http://purl.obolibrary.org/obo/SO_0000971', 'http://purl.obolibrary.org/obo/SO_0000972', 'http://purl.obolibrary.org/obo/SO_0000973', 'http://purl.obolibrary.org/obo/SO_0000975', 'http://purl.obolibrary.org/obo/SO_0000976', 'http://purl.obolibrary.org/obo/SO_0000977', 'http://purl.obolibrary.org/obo/SO_0000978', 'http://purl.obolibrary.org/obo/SO_0000979', 'http://purl.obolibrary.org/obo/SO_0000980', 'http://purl.obolibrary.org/obo/SO_0000981', 'http://purl.obolibrary.org/obo/SO_0000982', 'http://purl.obolibrary.org/obo/SO_0000983', 'http://purl.obolibrary.org/obo/SO_0000984', 'http://purl.obolibrary.org/obo/SO_0000985', 'http://purl.obolibrary.org/obo/SO_0000986', 'http://purl.obolibrary.org/obo/SO_0000987', 'http://purl.obolibrary.org/obo/SO_0000988', 'http://purl.obolibrary.org/obo/SO_0000989', 'http://purl.obolibrary.org/obo/SO_0000990', 'http://purl.obolibrary.org/obo/SO_0000991', 'http://purl.obolibrary.org/obo/SO_0000992', 'http://purl.obolibrary.org/obo/SO_0000993', 'http://purl.obolibrary.org/obo/SO_0000994', 'http://purl.obolibrary.org/obo/SO_0000995', 'http://purl.obolibrary.org/obo/SO_0000996', 'http://purl.obolibrary.org/obo/SO_0000997', 'http://purl.obolibrary.org/obo/SO_0000998', 'http://purl.obolibrary.org/obo/SO_0000999', 'http://purl.obolibrary.org/obo/SO_0001000', 'http://purl.obolibrary.org/obo/SO_0001001', 'http://purl.obolibrary.org/obo/SO_0001002', 'http://purl.obolibrary.org/obo/SO_0001003', 'http://purl.obolibrary.org/obo/SO_0001004', 'http://purl.obolibrary.org/obo/SO_0001005', 'http://purl.obolibrary.org/obo/SO_0001006', 'http://purl.obolibrary.org/obo/SO_0001007', 'http://purl.obolibrary.org/obo/SO_0001008', 'http://purl.obolibrary.org/obo/SO_0001009', 'http://purl.obolibrary.org/obo/SO_0001010', 'http://purl.obolibrary.org/obo/SO_0001011', 'http://purl.obolibrary.org/obo/SO_0001012', 'http://purl.obolibrary.org/obo/SO_0001013', 'http://purl.obolibrary.org/obo/SO_0001014', 'http://purl.obolibrary.org/obo/SO_0001015', 'http://purl.obolibrary.org/obo/SO_0001016', 'http://purl.obolibrary.org/obo/SO_0001017', 'http://purl.obolibrary.org/obo/SO_0001018', 'http://purl.obolibrary.org/obo/SO_0001019', 'http://purl.obolibrary.org/obo/SO_0001020', 'http://purl.obolibrary.org/obo/SO_0001021', 'http://purl.obolibrary.org/obo/SO_0001022', 'http://purl.obolibrary.org/obo/SO_0001023', 'http://purl.obolibrary.org/obo/SO_0001024', 'http://purl.obolibrary.org/obo/SO_0001025', 'http://purl.obolibrary.org/obo/SO_0001026', 'http://purl.obolibrary.org/obo/SO_0001027', 'http://purl.obolibrary.org/obo/SO_0001028', 'http://purl.obolibrary.org/obo/SO_0001029', 'http://purl.obolibrary.org/obo/SO_0001030', 'http://purl.obolibrary.org/obo/SO_0001031', 'http://purl.obolibrary.org/obo/SO_0001032', 'http://purl.obolibrary.org/obo/SO_0001033', 'http://purl.obolibrary.org/obo/SO_0001034', 'http://purl.obolibrary.org/obo/SO_0001035', 'http://purl.obolibrary.org/obo/SO_0001036', 'http://purl.obolibrary.org/obo/SO_0001037', 'http://purl.obolibrary.org/obo/SO_0001038', 'http://purl.obolibrary.org/obo/SO_0001039', 'http://purl.obolibrary.org/obo/SO_0001040', 'http://purl.obolibrary.org/obo/SO_0001041', 'http://purl.obolibrary.org/obo/SO_0001042', 'http://purl.obolibrary.org/obo/SO_0001043', 'http://purl.obolibrary.org/obo/SO_0001044', 'http://purl.obolibrary.org/obo/SO_0001045', 'http://purl.obolibrary.org/obo/SO_0001046', 'http://purl.obolibrary.org/obo/SO_0001047', 'http://purl.obolibrary.org/obo/SO_0001048', 'http://purl.obolibrary.org/obo/SO_0001049', 'http://purl.obolibrary.org/obo/SO_0001050', 'http://purl.obolibrary.org/obo/SO_0001051', 'http://purl.obolibrary.org/obo/SO_0001052', 'http://purl.obolibrary.org/obo/SO_0001053', 'http://purl.obolibrary.org/obo/SO_0001054', 'http://purl.obolibrary.org/obo/SO_0001055', 'http://purl.obolibrary.org/obo/SO_0001056', 'http://purl.obolibrary.org/obo/SO_0001057', 'http://purl.obolibrary.org/obo/SO_0001058', 'http://purl.obolibrary.org/obo/SO_0001059', 'http://purl.obolibrary.org/obo/SO_0001061', 'http://purl.obolibrary.org/obo/SO_0001062', 'http://purl.obolibrary.org/obo/SO_0001063', 'http://purl.obolibrary.org/obo/SO_0001064', 'http://purl.obolibrary.org/obo/SO_0001066', 'http://purl.obolibrary.org/obo/SO_0001067', 'http://purl.obolibrary.org/obo/SO_0001068', 'http://purl.obolibrary.org/obo/SO_0001070', 'http://purl.obolibrary.org/obo/SO_0001071', 'http://purl.obolibrary.org/obo/SO_0001072', 'http://purl.obolibrary.org/obo/SO_0001073', 'http://purl.obolibrary.org/obo/SO_0001074', 'http://purl.obolibrary.org/obo/SO_0001075', 'http://purl.obolibrary.org/obo/SO_0001076', 'http://purl.obolibrary.org/obo/SO_0001077', 'http://purl.obolibrary.org/obo/SO_0001078', 'http://purl.obolibrary.org/obo/SO_0001079', 'http://purl.obolibrary.org/obo/SO_0001080', 'http://purl.obolibrary.org/obo/SO_0001081', 'http://purl.obolibrary.org/obo/SO_0001082', 'http://purl.obolibrary.org/obo/SO_0001083', 'http://purl.obolibrary.org/obo/SO_0001084', 'http://purl.obolibrary.org/obo/SO_0001085', 'http://purl.obolibrary.org/obo/SO_0001086', 'http://purl.obolibrary.org/obo/SO_0001087', 'http://purl.obolibrary.org/obo/SO_0001088', 'http://purl.obolibrary.org/obo/SO_0001089', 'http://purl.obolibrary.org/obo/SO_0001090', 'http://purl.obolibrary.org/obo/SO_0001091', 'http://purl.obolibrary.org/obo/SO_0001092', 'http://purl.obolibrary.org/obo/SO_0001093', 'http://purl.obolibrary.org/obo/SO_0001094', 'http://purl.obolibrary.org/obo/SO_0001095', 'http://purl.obolibrary.org/obo/SO_0001096', 'http://purl.obolibrary.org/obo/SO_0001097', 'http://purl.obolibrary.org/obo/SO_0001098', 'http://purl.obolibrary.org/obo/SO_0001099', 'http://purl.obolibrary.org/obo/SO_0001100', 'http://purl.obolibrary.org/obo/SO_0001101', 'http://purl.obolibrary.org/obo/SO_0001102', 'http://purl.obolibrary.org/obo/SO_0001103', 'http://purl.obolibrary.org/obo/SO_0001104', 'http://purl.obolibrary.org/obo/SO_0001105', 'http://purl.obolibrary.org/obo/SO_0001106', 'http://purl.obolibrary.org/obo/SO_0001107', 'http://purl.obolibrary.org/obo/SO_0001108', 'http://purl.obolibrary.org/obo/SO_0001109', 'http://purl.obolibrary.org/obo/SO_0001110', 'http://purl.obolibrary.org/obo/SO_0001111', 'http://purl.obolibrary.org/obo/SO_0001112', 'http://purl.obolibrary.org/obo/SO_0001113', 'http://purl.obolibrary.org/obo/SO_0001114', 'http://purl.obolibrary.org/obo/SO_0001115', 'http://purl.obolibrary.org/obo/SO_0001116', 'http://purl.obolibrary.org/obo/SO_0001117', 'http://purl.obolibrary.org/obo/SO_0001118', 'http://purl.obolibrary.org/obo/SO_0001119', 'http://purl.obolibrary.org/obo/SO_0001120', 'http://purl.obolibrary.org/obo/SO_0001121', 'http://purl.obolibrary.org/obo/SO_0001122', 'http://purl.obolibrary.org/obo/SO_0001123', 'http://purl.obolibrary.org/obo/SO_0001124', 'http://purl.obolibrary.org/obo/SO_0001125', 'http://purl.obolibrary.org/obo/SO_0001126', 'http://purl.obolibrary.org/obo/SO_0001127', 'http://purl.obolibrary.org/obo/SO_0001128', 'http://purl.obolibrary.org/obo/SO_0001129', 'http://purl.obolibrary.org/obo/SO_0001130', 'http://purl.obolibrary.org/obo/SO_0001131', 'http://purl.obolibrary.org/obo/SO_0001132', 'http://purl.obolibrary.org/obo/SO_0001133', 'http://purl.obolibrary.org/obo/SO_0001134', 'http://purl.obolibrary.org/obo/SO_0001135', 'http://purl.obolibrary.org/obo/SO_0001136', 'http://purl.obolibrary.org/obo/SO_0001137', 'http://purl.obolibrary.org/obo/SO_0001138', 'http://purl.obolibrary.org/obo/SO_0001139', 'http://purl.obolibrary.org/obo/SO_0001140', 'http://purl.obolibrary.org/obo/SO_0001141', 'http://purl.obolibrary.org/obo/SO_0001142', 'http://purl.obolibrary.org/obo/SO_0001143', 'http://purl.obolibrary.org/obo/SO_0001144', 'http://purl.obolibrary.org/obo/SO_0001145', 'http://purl.obolibrary.org/obo/SO_0001146', 'http://purl.obolibrary.org/obo/SO_0001147', 'http://purl.obolibrary.org/obo/SO_0001148', 'http://purl.obolibrary.org/obo/SO_0001149', 'http://purl.obolibrary.org/obo/SO_0001150', 'http://purl.obolibrary.org/obo/SO_0001151', 'http://purl.obolibrary.org/obo/SO_0001152', 'http://purl.obolibrary.org/obo/SO_0001153', 'http://purl.obolibrary.org/obo/SO_0001154', 'http://purl.obolibrary.org/obo/SO_0001155', 'http://purl.obolibrary.org/obo/SO_0001156', 'http://purl.obolibrary.org/obo/SO_0001157', 'http://purl.obolibrary.org/obo/SO_0001158', 'http://purl.obolibrary.org/obo/SO_0001159', 'http://purl.obolibrary.org/obo/SO_0001160', 'http://purl.obolibrary.org/obo/SO_0001161', 'http://purl.obolibrary.org/obo/SO_0001162', 'http://purl.obolibrary.org/obo/SO_0001163', 'http://purl.obolibrary.org/obo/SO_0001164', 'http://purl.obolibrary.org/obo/SO_0001165', 'http://purl.obolibrary.org/obo/SO_0001166', 'http://purl.obolibrary.org/obo/SO_0001167', 'http://purl.obolibrary.org/obo/SO_0001168', 'http://purl.obolibrary.org/obo/SO_0001169', 'http://purl.obolibrary.org/obo/SO_0001170', 'http://purl.obolibrary.org/obo/SO_0001171', 'http://purl.obolibrary.org/obo/SO_0001172', 'http://purl.obolibrary.org/obo/SO_0001173', 'http://purl.obolibrary.org/obo/SO_0001174', 'http://purl.obolibrary.org/obo/SO_0001175', 'http://purl.obolibrary.org/obo/SO_0001176', 'http://purl.obolibrary.org/obo/SO_0001177', 'http://purl.obolibrary.org/obo/SO_0001178', 'http://purl.obolibrary.org/obo/SO_0001179', 'http://purl.obolibrary.org/obo/SO_0001180', 'http://purl.obolibrary.org/obo/SO_0001181', 'http://purl.obolibrary.org/obo/SO_0001182', 'http://purl.obolibrary.org/obo/SO_0001183', 'http://purl.obolibrary.org/obo/SO_0001184', 'http://purl.obolibrary.org/obo/SO_0001185', 'http://purl.obolibrary.org/obo/SO_0001186', 'http://purl.obolibrary.org/obo/SO_0001187', 'http://purl.obolibrary.org/obo/SO_0001188', 'http://purl.obolibrary.org/obo/SO_0001189', 'http://purl.obolibrary.org/obo/SO_0001190', 'http://purl.obolibrary.org/obo/SO_0001191', 'http://purl.obolibrary.org/obo/SO_0001192', 'http://purl.obolibrary.org/obo/SO_0001193', 'http://purl.obolibrary.org/obo/SO_0001194', 'http://purl.obolibrary.org/obo/SO_0001195', 'http://purl.obolibrary.org/obo/SO_0001196', 'http://purl.obolibrary.org/obo/SO_0001197', 'http://purl.obolibrary.org/obo/SO_0001198', 'http://purl.obolibrary.org/obo/SO_0001199', 'http://purl.obolibrary.org/obo/SO_0001200', 'http://purl.obolibrary.org/obo/SO_0001201', 'http://purl.obolibrary.org/obo/SO_0001202', 'http://purl.obolibrary.org/obo/SO_0001203', 'http://purl.obolibrary.org/obo/SO_0001204', 'http://purl.obolibrary.org/obo/SO_0001205', 'http://purl.obolibrary.org/obo/SO_0001206', 'http://purl.obolibrary.org/obo/SO_0001207', 'http://purl.obolibrary.org/obo/SO_0001208', 'http://purl.obolibrary.org/obo/SO_0001209', 'http://purl.obolibrary.org/obo/SO_0001210', 'http://purl.obolibrary.org/obo/SO_0001211', 'http://purl.obolibrary.org/obo/SO_0001212', 'http://purl.obolibrary.org/obo/SO_0001213', 'http://purl.obolibrary.org/obo/SO_0001214', 'http://purl.obolibrary.org/obo/SO_0001215', 'http://purl.obolibrary.org/obo/SO_0001216', 'http://purl.obolibrary.org/obo/SO_0001217', 'http://purl.obolibrary.org/obo/SO_0001218', 'http://purl.obolibrary.org/obo/SO_0001219', 'http://purl.obolibrary.org/obo/SO_0001220', 'http://purl.obolibrary.org/obo/SO_0001221', 'http://purl.obolibrary.org/obo/SO_0001222', 'http://purl.obolibrary.org/obo/SO_0001223', 'http://purl.obolibrary.org/obo/SO_0001224', 'http://purl.obolibrary.org/obo/SO_0001225', 'http://purl.obolibrary.org/obo/SO_0001226', 'http://purl.obolibrary.org/obo/SO_0001227', 'http://purl.obolibrary.org/obo/SO_0001228', 'http://purl.obolibrary.org/obo/SO_0001229', 'http://purl.obolibrary.org/obo/SO_0001230', 'http://purl.obolibrary.org/obo/SO_0001231', 'http://purl.obolibrary.org/obo/SO_0001232', 'http://purl.obolibrary.org/obo/SO_0001233', 'http://purl.obolibrary.org/obo/SO_0001234', 'http://purl.obolibrary.org/obo/SO_0001235', 'http://purl.obolibrary.org/obo/SO_0001236', 'http://purl.obolibrary.org/obo/SO_0001237', 'http://purl.obolibrary.org/obo/SO_0001238', 'http://purl.obolibrary.org/obo/SO_0001239', 'http://purl.obolibrary.org/obo/SO_0001240', 'http://purl.obolibrary.org/obo/SO_0001241', 'http://purl.obolibrary.org/obo/SO_0001243', 'http://purl.obolibrary.org/obo/SO_0001244', 'http://purl.obolibrary.org/obo/SO_0001245', 'http://purl.obolibrary.org/obo/SO_0001246', 'http://purl.obolibrary.org/obo/SO_0001247', 'http://purl.obolibrary.org/obo/SO_0001248', 'http://purl.obolibrary.org/obo/SO_0001249', 'http://purl.obolibrary.org/obo/SO_0001250', 'http://purl.obolibrary.org/obo/SO_0001251', 'http://purl.obolibrary.org/obo/SO_0001252', 'http://purl.obolibrary.org/obo/SO_0001253', 'http://purl.obolibrary.org/obo/SO_0001254', 'http://purl.obolibrary.org/obo/SO_0001255', 'http://purl.obolibrary.org/obo/SO_0001256', 'http://purl.obolibrary.org/obo/SO_0001257', 'http://purl.obolibrary.org/obo/SO_0001258', 'http://purl.obolibrary.org/obo/SO_0001259', 'http://purl.obolibrary.org/obo/SO_0001260', 'http://purl.obolibrary.org/obo/SO_0001261', 'http://purl.obolibrary.org/obo/SO_0001262', 'http://purl.obolibrary.org/obo/SO_0001263', 'http://purl.obolibrary.org/obo/SO_0001264', 'http://purl.obolibrary.org/obo/SO_0001265', 'http://purl.obolibrary.org/obo/SO_0001266', 'http://purl.obolibrary.org/obo/SO_0001267', 'http://purl.obolibrary.org/obo/SO_0001268', 'http://purl.obolibrary.org/obo/SO_0001269', 'http://purl.obolibrary.org/obo/SO_0001270', 'http://purl.obolibrary.org/obo/SO_0001271', 'http://purl.obolibrary.org/obo/SO_0001272', 'http://purl.obolibrary.org/obo/SO_0001273', 'http://purl.obolibrary.org/obo/SO_0001274', 'http://purl.obolibrary.org/obo/SO_0001275', 'http://purl.obolibrary.org/obo/SO_0001276', 'http://purl.obolibrary.org/obo/SO_0001277', 'http://purl.obolibrary.org/obo/SO_0001278', 'http://purl.obolibrary.org/obo/SO_0001279', 'http://purl.obolibrary.org/obo/SO_0001280', 'http://purl.obolibrary.org/obo/SO_0001281', 'http://purl.obolibrary.org/obo/SO_0001282', 'http://purl.obolibrary.org/obo/SO_0001283', 'http://purl.obolibrary.org/obo/SO_0001284', 'http://purl.obolibrary.org/obo/SO_0001285', 'http://purl.obolibrary.org/obo/SO_0001286', 'http://purl.obolibrary.org/obo/SO_0001287', 'http://purl.obolibrary.org/obo/SO_0001288', 'http://purl.obolibrary.org/obo/SO_0001289', 'http://purl.obolibrary.org/obo/SO_0001290', 'http://purl.obolibrary.org/obo/SO_0001291', 'http://purl.obolibrary.org/obo/SO_0001292', 'http://purl.obolibrary.org/obo/SO_0001293', 'http://purl.obolibrary.org/obo/SO_0001294', 'http://purl.obolibrary.org/obo/SO_0001295', 'http://purl.obolibrary.org/obo/SO_0001296', 'http://purl.obolibrary.org/obo/SO_0001297', 'http://purl.obolibrary.org/obo/SO_0001298', 'http://purl.obolibrary.org/obo/SO_0001299', 'http://purl.obolibrary.org/obo/SO_0001300', 'http://purl.obolibrary.org/obo/SO_0001301', 'http://purl.obolibrary.org/obo/SO_0001302', 'http://purl.obolibrary.org/obo/SO_0001303', 'http://purl.obolibrary.org/obo/SO_0001304', 'http://purl.obolibrary.org/obo/SO_0001305', 'http://purl.obolibrary.org/obo/SO_0001306', 'http://purl.obolibrary.org/obo/SO_0001307', 'http://purl.obolibrary.org/obo/SO_0001308', 'http://purl.obolibrary.org/obo/SO_0001309', 'http://purl.obolibrary.org/obo/SO_0001310', 'http://purl.obolibrary.org/obo/SO_0001311', 'http://purl.obolibrary.org/obo/SO_0001312', 'http://purl.obolibrary.org/obo/SO_0001313', 'http://purl.obolibrary.org/obo/SO_0001314', 'http://purl.obolibrary.org/obo/SO_0001315', 'http://purl.obolibrary.org/obo/SO_0001316', 'http://purl.obolibrary.org/obo/SO_0001317', 'http://purl.obolibrary.org/obo/SO_0001318', 'http://purl.obolibrary.org/obo/SO_0001319', 'http://purl.obolibrary.org/obo/SO_0001320', 'http://purl.obolibrary.org/obo/SO_0001321', 'http://purl.obolibrary.org/obo/SO_0001322', 'http://purl.obolibrary.org/obo/SO_0001323', 'http://purl.obolibrary.org/obo/SO_0001324', 'http://purl.obolibrary.org/obo/SO_0001325', 'http://purl.obolibrary.org/obo/SO_0001326', 'http://purl.obolibrary.org/obo/SO_0001327', 'http://purl.obolibrary.org/obo/SO_0001328', 'http://purl.obolibrary.org/obo/SO_0001329', 'http://purl.obolibrary.org/obo/SO_0001330', 'http://purl.obolibrary.org/obo/SO_0001331', 'http://purl.obolibrary.org/obo/SO_0001332', 'http://purl.obolibrary.org/obo/SO_0001333', 'http://purl.obolibrary.org/obo/SO_0001334', 'http://purl.obolibrary.org/obo/SO_0001335', 'http://purl.obolibrary.org/obo/SO_0001336', 'http://purl.obolibrary.org/obo/SO_0001337', 'http://purl.obolibrary.org/obo/SO_0001338', 'http://purl.obolibrary.org/obo/SO_0001339', 'http://purl.obolibrary.org/obo/SO_0001340', 'http://purl.obolibrary.org/obo/SO_0001341', 'http://purl.obolibrary.org/obo/SO_0001342', 'http://purl.obolibrary.org/obo/SO_0001343', 'http://purl.obolibrary.org/obo/SO_0001344', 'http://purl.obolibrary.org/obo/SO_0001345', 'http://purl.obolibrary.org/obo/SO_0001346', 'http://purl.obolibrary.org/obo/SO_0001347', 'http://purl.obolibrary.org/obo/SO_0001348', 'http://purl.obolibrary.org/obo/SO_0001349', 'http://purl.obolibrary.org/obo/SO_0001350', 'http://purl.obolibrary.org/obo/SO_0001351', 'http://purl.obolibrary.org/obo/SO_0001352', 'http://purl.obolibrary.org/obo/SO_0001353', 'http://purl.obolibrary.org/obo/SO_0001354', 'http://purl.obolibrary.org/obo/SO_0001355', 'http://purl.obolibrary.org/obo/SO_0001356', 'http://purl.obolibrary.org/obo/SO_0001357', 'http://purl.obolibrary.org/obo/SO_0001358', 'http://purl.obolibrary.org/obo/SO_0001359', 'http://purl.obolibrary.org/obo/SO_0001360', 'http://purl.obolibrary.org/obo/SO_0001361', 'http://purl.obolibrary.org/obo/SO_0001362', 'http://purl.obolibrary.org/obo/SO_0001363', 'http://purl.obolibrary.org/obo/SO_0001364', 'http://purl.obolibrary.org/obo/SO_0001365', 'http://purl.obolibrary.org/obo/SO_0001366', 'http://purl.obolibrary.org/obo/SO_0001367', 'http://purl.obolibrary.org/obo/SO_0001368', 'http://purl.obolibrary.org/obo/SO_0001369', 'http://purl.obolibrary.org/obo/SO_0001370', 'http://purl.obolibrary.org/obo/SO_0001371', 'http://purl.obolibrary.org/obo/SO_0001372', 'http://purl.obolibrary.org/obo/SO_0001373', 'http://purl.obolibrary.org/obo/SO_0001374', 'http://purl.obolibrary.org/obo/SO_0001375', 'http://purl.obolibrary.org/obo/SO_0001376', 'http://purl.obolibrary.org/obo/SO_0001377', 'http://purl.obolibrary.org/obo/SO_0001378', 'http://purl.obolibrary.org/obo/SO_0001379', 'http://purl.obolibrary.org/obo/SO_0001380', 'http://purl.obolibrary.org/obo/SO_0001381', 'http://purl.obolibrary.org/obo/SO_0001382', 'http://purl.obolibrary.org/obo/SO_0001383', 'http://purl.obolibrary.org/obo/SO_0001384', 'http://purl.obolibrary.org/obo/SO_0001385', 'http://purl.obolibrary.org/obo/SO_0001386', 'http://purl.obolibrary.org/obo/SO_0001387', 'http://purl.obolibrary.org/obo/SO_0001388', 'http://purl.obolibrary.org/obo/SO_0001389', 'http://purl.obolibrary.org/obo/SO_0001390', 'http://purl.obolibrary.org/obo/SO_0001391', 'http://purl.obolibrary.org/obo/SO_0001392', 'http://purl.obolibrary.org/obo/SO_0001393', 'http://purl.obolibrary.org/obo/SO_0001394', 'http://purl.obolibrary.org/obo/SO_0001395', 'http://purl.obolibrary.org/obo/SO_0001396', 'http://purl.obolibrary.org/obo/SO_0001397', 'http://purl.obolibrary.org/obo/SO_0001398', 'http://purl.obolibrary.org/obo/SO_0001399', 'http://purl.obolibrary.org/obo/SO_0001400', 'http://purl.obolibrary.org/obo/SO_0001401', 'http://purl.obolibrary.org/obo/SO_0001402', 'http://purl.obolibrary.org/obo/SO_0001403', 'http://purl.obolibrary.org/obo/SO_0001404', 'http://purl.obolibrary.org/obo/SO_0001405', 'http://purl.obolibrary.org/obo/SO_0001406', 'http://purl.obolibrary.org/obo/SO_0001407', 'http://purl.obolibrary.org/obo/SO_0001408', 'http://purl.obolibrary.org/obo/SO_0001409', 'http://purl.obolibrary.org/obo/SO_0001410', 'http://purl.obolibrary.org/obo/SO_0001411', 'http://purl.obolibrary.org/obo/SO_0001412', 'http://purl.obolibrary.org/obo/SO_0001413', 'http://purl.obolibrary.org/obo/SO_0001414', 'http://purl.obolibrary.org/obo/SO_0001415', 'http://purl.obolibrary.org/obo/SO_0001416', 'http://purl.obolibrary.org/obo/SO_0001417', 'http://purl.obolibrary.org/obo/SO_0001418', 'http://purl.obolibrary.org/obo/SO_0001419', 'http://purl.obolibrary.org/obo/SO_0001420', 'http://purl.obolibrary.org/obo/SO_0001421', 'http://purl.obolibrary.org/obo/SO_0001422', 'http://purl.obolibrary.org/obo/SO_0001423', 'http://purl.obolibrary.org/obo/SO_0001424', 'http://purl.obolibrary.org/obo/SO_0001425', 'http://purl.obolibrary.org/obo/SO_0001426', 'http://purl.obolibrary.org/obo/SO_0001427', 'http://purl.obolibrary.org/obo/SO_0001428', 'http://purl.obolibrary.org/obo/SO_0001429', 'http://purl.obolibrary.org/obo/SO_0001431', 'http://purl.obolibrary.org/obo/SO_0001432', 'http://purl.obolibrary.org/obo/SO_0001433', 'http://purl.obolibrary.org/obo/SO_0001434', 'http://purl.obolibrary.org/obo/SO_0001435', 'http://purl.obolibrary.org/obo/SO_0001436', 'http://purl.obolibrary.org/obo/SO_0001437', 'http://purl.obolibrary.org/obo/SO_0001438', 'http://purl.obolibrary.org/obo/SO_0001439', 'http://purl.obolibrary.org/obo/SO_0001440', 'http://purl.obolibrary.org/obo/SO_0001441', 'http://purl.obolibrary.org/obo/SO_0001442', 'http://purl.obolibrary.org/obo/SO_0001443', 'http://purl.obolibrary.org/obo/SO_0001444', 'http://purl.obolibrary.org/obo/SO_0001445', 'http://purl.obolibrary.org/obo/SO_0001446', 'http://purl.obolibrary.org/obo/SO_0001447', 'http://purl.obolibrary.org/obo/SO_0001448', 'http://purl.obolibrary.org/obo/SO_0001449', 'http://purl.obolibrary.org/obo/SO_0001450', 'http://purl.obolibrary.org/obo/SO_0001451', 'http://purl.obolibrary.org/obo/SO_0001452', 'http://purl.obolibrary.org/obo/SO_0001453', 'http://purl.obolibrary.org/obo/SO_0001454', 'http://purl.obolibrary.org/obo/SO_0001455', 'http://purl.obolibrary.org/obo/SO_0001456', 'http://purl.obolibrary.org/obo/SO_0001457', 'http://purl.obolibrary.org/obo/SO_0001458', 'http://purl.obolibrary.org/obo/SO_0001459', 'http://purl.obolibrary.org/obo/SO_0001460', 'http://purl.obolibrary.org/obo/SO_0001461', 'http://purl.obolibrary.org/obo/SO_0001462', 'http://purl.obolibrary.org/obo/SO_0001463', 'http://purl.obolibrary.org/obo/SO_0001464', 'http://purl.obolibrary.org/obo/SO_0001465', 'http://purl.obolibrary.org/obo/SO_0001466', 'http://purl.obolibrary.org/obo/SO_0001467', 'http://purl.obolibrary.org/obo/SO_0001468', 'http://purl.obolibrary.org/obo/SO_0001469', 'http://purl.obolibrary.org/obo/SO_0001470', 'http://purl.obolibrary.org/obo/SO_0001471', 'http://purl.obolibrary.org/obo/SO_0001472', 'http://purl.obolibrary.org/obo/SO_0001473', 'http://purl.obolibrary.org/obo/SO_0001474', 'http://purl.obolibrary.org/obo/SO_0001475', 'http://purl.obolibrary.org/obo/SO_0001476', 'http://purl.obolibrary.org/obo/SO_0001477', 'http://purl.obolibrary.org/obo/SO_0001478', 'http://purl.obolibrary.org/obo/SO_0001479', 'http://purl.obolibrary.org/obo/SO_0001480', 'http://purl.obolibrary.org/obo/SO_0001481', 'http://purl.obolibrary.org/obo/SO_0001482', 'http://purl.obolibrary.org/obo/SO_0001483', 'http://purl.obolibrary.org/obo/SO_0001484', 'http://purl.obolibrary.org/obo/SO_0001485', 'http://purl.obolibrary.org/obo/SO_0001486', 'http://purl.obolibrary.org/obo/SO_0001487', 'http://purl.obolibrary.org/obo/SO_0001488', 'http://purl.obolibrary.org/obo/SO_0001489', 'http://purl.obolibrary.org/obo/SO_0001490', 'http://purl.obolibrary.org/obo/SO_0001491', 'http://purl.obolibrary.org/obo/SO_0001492', 'http://purl.obolibrary.org/obo/SO_0001493', 'http://purl.obolibrary.org/obo/SO_0001494', 'http://purl.obolibrary.org/obo/SO_0001495', 'http://purl.obolibrary.org/obo/SO_0001496', 'http://purl.obolibrary.org/obo/SO_0001497', 'http://purl.obolibrary.org/obo/SO_0001498', 'http://purl.obolibrary.org/obo/SO_0001499', 'http://purl.obolibrary.org/obo/SO_0001500', 'http://purl.obolibrary.org/obo/SO_0001501', 'http://purl.obolibrary.org/obo/SO_0001502', 'http://purl.obolibrary.org/obo/SO_0001503', 'http://purl.obolibrary.org/obo/SO_0001504', 'http://purl.obolibrary.org/obo/SO_0001505', 'http://purl.obolibrary.org/obo/SO_0001506', 'http://purl.obolibrary.org/obo/SO_0001507', 'http://purl.obolibrary.org/obo/SO_0001508', 'http://purl.obolibrary.org/obo/SO_0001509', 'http://purl.obolibrary.org/obo/SO_0001510', 'http://purl.obolibrary.org/obo/SO_0001511', 'http://purl.obolibrary.org/obo/SO_0001512', 'http://purl.obolibrary.org/obo/SO_0001513', 'http://purl.obolibrary.org/obo/SO_0001514', 'http://purl.obolibrary.org/obo/SO_0001515', 'http://purl.obolibrary.org/obo/SO_0001516', 'http://purl.obolibrary.org/obo/SO_0001517', 'http://purl.obolibrary.org/obo/SO_0001518', 'http://purl.obolibrary.org/obo/SO_0001519', 'http://purl.obolibrary.org/obo/SO_0001520', 'http://purl.obolibrary.org/obo/SO_0001521', 'http://purl.obolibrary.org/obo/SO_0001522', 'http://purl.obolibrary.org/obo/SO_0001523', 'http://purl.obolibrary.org/obo/SO_0001524', 'http://purl.obolibrary.org/obo/SO_0001525', 'http://purl.obolibrary.org/obo/SO_0001526', 'http://purl.obolibrary.org/obo/SO_0001527', 'http://purl.obolibrary.org/obo/SO_0001528', 'http://purl.obolibrary.org/obo/SO_0001529', 'http://purl.obolibrary.org/obo/SO_0001530', 'http://purl.obolibrary.org/obo/SO_0001531', 'http://purl.obolibrary.org/obo/SO_0001532', 'http://purl.obolibrary.org/obo/SO_0001533', 'http://purl.obolibrary.org/obo/SO_0001534', 'http://purl.obolibrary.org/obo/SO_0001535', 'http://purl.obolibrary.org/obo/SO_0001536', 'http://purl.obolibrary.org/obo/SO_0001537', 'http://purl.obolibrary.org/obo/SO_0001538', 'http://purl.obolibrary.org/obo/SO_0001539', 'http://purl.obolibrary.org/obo/SO_0001540', 'http://purl.obolibrary.org/obo/SO_0001541', 'http://purl.obolibrary.org/obo/SO_0001542', 'http://purl.obolibrary.org/obo/SO_0001543', 'http://purl.obolibrary.org/obo/SO_0001544', 'http://purl.obolibrary.org/obo/SO_0001545', 'http://purl.obolibrary.org/obo/SO_0001546', 'http://purl.obolibrary.org/obo/SO_0001547', 'http://purl.obolibrary.org/obo/SO_0001548', 'http://purl.obolibrary.org/obo/SO_0001549', 'http://purl.obolibrary.org/obo/SO_0001550', 'http://purl.obolibrary.org/obo/SO_0001551', 'http://purl.obolibrary.org/obo/SO_0001552', 'http://purl.obolibrary.org/obo/SO_0001553', 'http://purl.obolibrary.org/obo/SO_0001554', 'http://purl.obolibrary.org/obo/SO_0001555', 'http://purl.obolibrary.org/obo/SO_0001556', 'http://purl.obolibrary.org/obo/SO_0001557', 'http://purl.obolibrary.org/obo/SO_0001558', 'http://purl.obolibrary.org/obo/SO_0001559', 'http://purl.obolibrary.org/obo/SO_0001560', 'http://purl.obolibrary.org/obo/SO_0001561', 'http://purl.obolibrary.org/obo/SO_0001562', 'http://purl.obolibrary.org/obo/SO_0001563', 'http://purl.obolibrary.org/obo/SO_0001564', 'http://purl.obolibrary.org/obo/SO_0001565', 'http://purl.obolibrary.org/obo/SO_0001566', 'http://purl.obolibrary.org/obo/SO_0001567', 'http://purl.obolibrary.org/obo/SO_0001568', 'http://purl.obolibrary.org/obo/SO_0001569', 'http://purl.obolibrary.org/obo/SO_0001570', 'http://purl.obolibrary.org/obo/SO_0001571', 'http://purl.obolibrary.org/obo/SO_0001572', 'http://purl.obolibrary.org/obo/SO_0001573', 'http://purl.obolibrary.org/obo/SO_0001574', 'http://purl.obolibrary.org/obo/SO_0001575', 'http://purl.obolibrary.org/obo/SO_0001576', 'http://purl.obolibrary.org/obo/SO_0001577', 'http://purl.obolibrary.org/obo/SO_0001578', 'http://purl.obolibrary.org/obo/SO_0001579', 'http://purl.obolibrary.org/obo/SO_0001580', 'http://purl.obolibrary.org/obo/SO_0001582', 'http://purl.obolibrary.org/obo/SO_0001583', 'http://purl.obolibrary.org/obo/SO_0001585', 'http://purl.obolibrary.org/obo/SO_0001586', 'http://purl.obolibrary.org/obo/SO_0001587', 'http://purl.obolibrary.org/obo/SO_0001589', 'http://purl.obolibrary.org/obo/SO_0001590', 'http://purl.obolibrary.org/obo/SO_0001591', 'http://purl.obolibrary.org/obo/SO_0001592', 'http://purl.obolibrary.org/obo/SO_0001593', 'http://purl.obolibrary.org/obo/SO_0001594', 'http://purl.obolibrary.org/obo/SO_0001595', 'http://purl.obolibrary.org/obo/SO_0001596', 'http://purl.obolibrary.org/obo/SO_0001597', 'http://purl.obolibrary.org/obo/SO_0001598', 'http://purl.obolibrary.org/obo/SO_0001599', 'http://purl.obolibrary.org/obo/SO_0001600', 'http://purl.obolibrary.org/obo/SO_0001601', 'http://purl.obolibrary.org/obo/SO_0001602', 'http://purl.obolibrary.org/obo/SO_0001603', 'http://purl.obolibrary.org/obo/SO_0001604', 'http://purl.obolibrary.org/obo/SO_0001605', 'http://purl.obolibrary.org/obo/SO_0001606', 'http://purl.obolibrary.org/obo/SO_0001607', 'http://purl.obolibrary.org/obo/SO_0001608', 'http://purl.obolibrary.org/obo/SO_0001609', 'http://purl.obolibrary.org/obo/SO_0001610', 'http://purl.obolibrary.org/obo/SO_0001611', 'http://purl.obolibrary.org/obo/SO_0001612', 'http://purl.obolibrary.org/obo/SO_0001613', 'http://purl.obolibrary.org/obo/SO_0001614', 'http://purl.obolibrary.org/obo/SO_0001615', 'http://purl.obolibrary.org/obo/SO_0001616', 'http://purl.obolibrary.org/obo/SO_0001617', 'http://purl.obolibrary.org/obo/SO_0001618', 'http://purl.obolibrary.org/obo/SO_0001619', 'http://purl.obolibrary.org/obo/SO_0001620', 'http://purl.obolibrary.org/obo/SO_0001621', 'http://purl.obolibrary.org/obo/SO_0001622', 'http://purl.obolibrary.org/obo/SO_0001623', 'http://purl.obolibrary.org/obo/SO_0001624', 'http://purl.obolibrary.org/obo/SO_0001626', 'http://purl.obolibrary.org/obo/SO_0001627', 'http://purl.obolibrary.org/obo/SO_0001628', 'http://purl.obolibrary.org/obo/SO_0001629', 'http://purl.obolibrary.org/obo/SO_0001630', 'http://purl.obolibrary.org/obo/SO_0001631', 'http://purl.obolibrary.org/obo/SO_0001632', 'http://purl.obolibrary.org/obo/SO_0001633', 'http://purl.obolibrary.org/obo/SO_0001634', 'http://purl.obolibrary.org/obo/SO_0001635', 'http://purl.obolibrary.org/obo/SO_0001636', 'http://purl.obolibrary.org/obo/SO_0001637', 'http://purl.obolibrary.org/obo/SO_0001638', 'http://purl.obolibrary.org/obo/SO_0001639', 'http://purl.obolibrary.org/obo/SO_0001640', 'http://purl.obolibrary.org/obo/SO_0001641', 'http://purl.obolibrary.org/obo/SO_0001642', 'http://purl.obolibrary.org/obo/SO_0001643', 'http://purl.obolibrary.org/obo/SO_0001644', 'http://purl.obolibrary.org/obo/SO_0001645', 'http://purl.obolibrary.org/obo/SO_0001646', 'http://purl.obolibrary.org/obo/SO_0001647', 'http://purl.obolibrary.org/obo/SO_0001648', 'http://purl.obolibrary.org/obo/SO_0001649', 'http://purl.obolibrary.org/obo/SO_0001650', 'http://purl.obolibrary.org/obo/SO_0001653', 'http://purl.obolibrary.org/obo/SO_0001654', 'http://purl.obolibrary.org/obo/SO_0001655', 'http://purl.obolibrary.org/obo/SO_0001656', 'http://purl.obolibrary.org/obo/SO_0001657', 'http://purl.obolibrary.org/obo/SO_0001658', 'http://purl.obolibrary.org/obo/SO_0001659', 'http://purl.obolibrary.org/obo/SO_0001660', 'http://purl.obolibrary.org/obo/SO_0001661', 'http://purl.obolibrary.org/obo/SO_0001662', 'http://purl.obolibrary.org/obo/SO_0001663', 'http://purl.obolibrary.org/obo/SO_0001664', 'http://purl.obolibrary.org/obo/SO_0001665', 'http://purl.obolibrary.org/obo/SO_0001666', 'http://purl.obolibrary.org/obo/SO_0001667', 'http://purl.obolibrary.org/obo/SO_0001668', 'http://purl.obolibrary.org/obo/SO_0001669', 'http://purl.obolibrary.org/obo/SO_0001670', 'http://purl.obolibrary.org/obo/SO_0001671', 'http://purl.obolibrary.org/obo/SO_0001672', 'http://purl.obolibrary.org/obo/SO_0001673', 'http://purl.obolibrary.org/obo/SO_0001674', 'http://purl.obolibrary.org/obo/SO_0001675', 'http://purl.obolibrary.org/obo/SO_0001676', 'http://purl.obolibrary.org/obo/SO_0001677', 'http://purl.obolibrary.org/obo/SO_0001678', 'http://purl.obolibrary.org/obo/SO_0001679', 'http://purl.obolibrary.org/obo/SO_0001680', 'http://purl.obolibrary.org/obo/SO_0001681', 'http://purl.obolibrary.org/obo/SO_0001682', 'http://purl.obolibrary.org/obo/SO_0001683', 'http://purl.obolibrary.org/obo/SO_0001684', 'http://purl.obolibrary.org/obo/SO_0001685', 'http://purl.obolibrary.org/obo/SO_0001686', 'http://purl.obolibrary.org/obo/SO_0001687', 'http://purl.obolibrary.org/obo/SO_0001688', 'http://purl.obolibrary.org/obo/SO_0001689', 'http://purl.obolibrary.org/obo/SO_0001690', 'http://purl.obolibrary.org/obo/SO_0001691', 'http://purl.obolibrary.org/obo/SO_0001692', 'http://purl.obolibrary.org/obo/SO_0001693', 'http://purl.obolibrary.org/obo/SO_0001694', 'http://purl.obolibrary.org/obo/SO_0001695', 'http://purl.obolibrary.org/obo/SO_0001696', 'http://purl.obolibrary.org/obo/SO_0001697', 'http://purl.obolibrary.org/obo/SO_0001698', 'http://purl.obolibrary.org/obo/SO_0001699', 'http://purl.obolibrary.org/obo/SO_0001700', 'http://purl.obolibrary.org/obo/SO_0001701', 'http://purl.obolibrary.org/obo/SO_0001702', 'http://purl.obolibrary.org/obo/SO_0001703', 'http://purl.obolibrary.org/obo/SO_0001704', 'http://purl.obolibrary.org/obo/SO_0001705', 'http://purl.obolibrary.org/obo/SO_0001706', 'http://purl.obolibrary.org/obo/SO_0001707', 'http://purl.obolibrary.org/obo/SO_0001708', 'http://purl.obolibrary.org/obo/SO_0001709', 'http://purl.obolibrary.org/obo/SO_0001710', 'http://purl.obolibrary.org/obo/SO_0001711', 'http://purl.obolibrary.org/obo/SO_0001712', 'http://purl.obolibrary.org/obo/SO_0001713', 'http://purl.obolibrary.org/obo/SO_0001714', 'http://purl.obolibrary.org/obo/SO_0001715', 'http://purl.obolibrary.org/obo/SO_0001716', 'http://purl.obolibrary.org/obo/SO_0001717', 'http://purl.obolibrary.org/obo/SO_0001718', 'http://purl.obolibrary.org/obo/SO_0001719', 'http://purl.obolibrary.org/obo/SO_0001720', 'http://purl.obolibrary.org/obo/SO_0001721', 'http://purl.obolibrary.org/obo/SO_0001722', 'http://purl.obolibrary.org/obo/SO_0001723', 'http://purl.obolibrary.org/obo/SO_0001724', 'http://purl.obolibrary.org/obo/SO_0001725', 'http://purl.obolibrary.org/obo/SO_0001726', 'http://purl.obolibrary.org/obo/SO_0001727', 'http://purl.obolibrary.org/obo/SO_0001728', 'http://purl.obolibrary.org/obo/SO_0001729', 'http://purl.obolibrary.org/obo/SO_0001730', 'http://purl.obolibrary.org/obo/SO_0001731', 'http://purl.obolibrary.org/obo/SO_0001732', 'http://purl.obolibrary.org/obo/SO_0001733', 'http://purl.obolibrary.org/obo/SO_0001734', 'http://purl.obolibrary.org/obo/SO_0001735', 'http://purl.obolibrary.org/obo/SO_0001736', 'http://purl.obolibrary.org/obo/SO_0001737', 'http://purl.obolibrary.org/obo/SO_0001738', 'http://purl.obolibrary.org/obo/SO_0001739', 'http://purl.obolibrary.org/obo/SO_0001740', 'http://purl.obolibrary.org/obo/SO_0001741', 'http://purl.obolibrary.org/obo/SO_0001742', 'http://purl.obolibrary.org/obo/SO_0001743', 'http://purl.obolibrary.org/obo/SO_0001744', 'http://purl.obolibrary.org/obo/SO_0001745', 'http://purl.obolibrary.org/obo/SO_0001746', 'http://purl.obolibrary.org/obo/SO_0001747', 'http://purl.obolibrary.org/obo/SO_0001748', 'http://purl.obolibrary.org/obo/SO_0001749', 'http://purl.obolibrary.org/obo/SO_0001750', 'http://purl.obolibrary.org/obo/SO_0001751', 'http://purl.obolibrary.org/obo/SO_0001752', 'http://purl.obolibrary.org/obo/SO_0001753', 'http://purl.obolibrary.org/obo/SO_0001754', 'http://purl.obolibrary.org/obo/SO_0001755', 'http://purl.obolibrary.org/obo/SO_0001756', 'http://purl.obolibrary.org/obo/SO_0001757', 'http://purl.obolibrary.org/obo/SO_0001758', 'http://purl.obolibrary.org/obo/SO_0001759', 'http://purl.obolibrary.org/obo/SO_0001760', 'http://purl.obolibrary.org/obo/SO_0001761', 'http://purl.obolibrary.org/obo/SO_0001762', 'http://purl.obolibrary.org/obo/SO_0001763', 'http://purl.obolibrary.org/obo/SO_0001764', 'http://purl.obolibrary.org/obo/SO_0001765', 'http://purl.obolibrary.org/obo/SO_0001766', 'http://purl.obolibrary.org/obo/SO_0001767', 'http://purl.obolibrary.org/obo/SO_0001768', 'http://purl.obolibrary.org/obo/SO_0001769', 'http://purl.obolibrary.org/obo/SO_0001770', 'http://purl.obolibrary.org/obo/SO_0001771', 'http://purl.obolibrary.org/obo/SO_0001772', 'http://purl.obolibrary.org/obo/SO_0001773', 'http://purl.obolibrary.org/obo/SO_0001774', 'http://purl.obolibrary.org/obo/SO_0001775', 'http://purl.obolibrary.org/obo/SO_0001776', 'http://purl.obolibrary.org/obo/SO_0001777', 'http://purl.obolibrary.org/obo/SO_0001778', 'http://purl.obolibrary.org/obo/SO_0001779', 'http://purl.obolibrary.org/obo/SO_0001780', 'http://purl.obolibrary.org/obo/SO_0001781', 'http://purl.obolibrary.org/obo/SO_0001782', 'http://purl.obolibrary.org/obo/SO_0001784', 'http://purl.obolibrary.org/obo/SO_0001785', 'http://purl.obolibrary.org/obo/SO_0001786', 'http://purl.obolibrary.org/obo/SO_0001787', 'http://purl.obolibrary.org/obo/SO_0001788', 'http://purl.obolibrary.org/obo/SO_0001789', 'http://purl.obolibrary.org/obo/SO_0001790', 'http://purl.obolibrary.org/obo/SO_0001791', 'http://purl.obolibrary.org/obo/SO_0001792', 'http://purl.obolibrary.org/obo/SO_0001793', 'http://purl.obolibrary.org/obo/SO_0001794', 'http://purl.obolibrary.org/obo/SO_0001795', 'http://purl.obolibrary.org/obo/SO_0001796', 'http://purl.obolibrary.org/obo/SO_0001797', 'http://purl.obolibrary.org/obo/SO_0001798', 'http://purl.obolibrary.org/obo/SO_0001799', 'http://purl.obolibrary.org/obo/SO_0001800', 'http://purl.obolibrary.org/obo/SO_0001801', 'http://purl.obolibrary.org/obo/SO_0001802', 'http://purl.obolibrary.org/obo/SO_0001803', 'http://purl.obolibrary.org/obo/SO_0001804', 'http://purl.obolibrary.org/obo/SO_0001805', 'http://purl.obolibrary.org/obo/SO_0001806', 'http://purl.obolibrary.org/obo/SO_0001807', 'http://purl.obolibrary.org/obo/SO_0001808', 'http://purl.obolibrary.org/obo/SO_0001809', 'http://purl.obolibrary.org/obo/SO_0001810', 'http://purl.obolibrary.org/obo/SO_0001811', 'http://purl.obolibrary.org/obo/SO_0001812', 'http://purl.obolibrary.org/obo/SO_0001813', 'http://purl.obolibrary.org/obo/SO_0001814', 'http://purl.obolibrary.org/obo/SO_0001815', 'http://purl.obolibrary.org/obo/SO_0001816', 'http://purl.obolibrary.org/obo/SO_0001817', 'http://purl.obolibrary.org/obo/SO_0001818', 'http://purl.obolibrary.org/obo/SO_0001819', 'http://purl.obolibrary.org/obo/SO_0001820', 'http://purl.obolibrary.org/obo/SO_0001821', 'http://purl.obolibrary.org/obo/SO_0001822', 'http://purl.obolibrary.org/obo/SO_0001823', 'http://purl.obolibrary.org/obo/SO_0001824', 'http://purl.obolibrary.org/obo/SO_0001825', 'http://purl.obolibrary.org/obo/SO_0001826', 'http://purl.obolibrary.org/obo/SO_0001827', 'http://purl.obolibrary.org/obo/SO_0001828', 'http://purl.obolibrary.org/obo/SO_0001829', 'http://purl.obolibrary.org/obo/SO_0001830', 'http://purl.obolibrary.org/obo/SO_0001831', 'http://purl.obolibrary.org/obo/SO_0001832', 'http://purl.obolibrary.org/obo/SO_0001833', 'http://purl.obolibrary.org/obo/SO_0001834', 'http://purl.obolibrary.org/obo/SO_0001835', 'http://purl.obolibrary.org/obo/SO_0001836', 'http://purl.obolibrary.org/obo/SO_0001837', 'http://purl.obolibrary.org/obo/SO_0001838', 'http://purl.obolibrary.org/obo/SO_0001839', 'http://purl.obolibrary.org/obo/SO_0001840', 'http://purl.obolibrary.org/obo/SO_0001841', 'http://purl.obolibrary.org/obo/SO_0001842', 'http://purl.obolibrary.org/obo/SO_0001843', 'http://purl.obolibrary.org/obo/SO_0001844', 'http://purl.obolibrary.org/obo/SO_0001845', 'http://purl.obolibrary.org/obo/SO_0001846', 'http://purl.obolibrary.org/obo/SO_0001847', 'http://purl.obolibrary.org/obo/SO_0001848', 'http://purl.obolibrary.org/obo/SO_0001849', 'http://purl.obolibrary.org/obo/SO_0001850', 'http://purl.obolibrary.org/obo/SO_0001851', 'http://purl.obolibrary.org/obo/SO_0001852', 'http://purl.obolibrary.org/obo/SO_0001853', 'http://purl.obolibrary.org/obo/SO_0001854', 'http://purl.obolibrary.org/obo/SO_0001855', 'http://purl.obolibrary.org/obo/SO_0001856', 'http://purl.obolibrary.org/obo/SO_0001857', 'http://purl.obolibrary.org/obo/SO_0001858', 'http://purl.obolibrary.org/obo/SO_0001859', 'http://purl.obolibrary.org/obo/SO_0001860', 'http://purl.obolibrary.org/obo/SO_0001861', 'http://purl.obolibrary.org/obo/SO_0001862', 'http://purl.obolibrary.org/obo/SO_0001863', 'http://purl.obolibrary.org/obo/SO_0001864', 'http://purl.obolibrary.org/obo/SO_0001865', 'http://purl.obolibrary.org/obo/SO_0001866', 'http://purl.obolibrary.org/obo/SO_0001867', 'http://purl.obolibrary.org/obo/SO_0001868', 'http://purl.obolibrary.org/obo/SO_0001869', 'http://purl.obolibrary.org/obo/SO_0001870', 'http://purl.obolibrary.org/obo/SO_0001871', 'http://purl.obolibrary.org/obo/SO_0001872', 'http://purl.obolibrary.org/obo/SO_0001873', 'http://purl.obolibrary.org/obo/SO_0001874', 'http://purl.obolibrary.org/obo/SO_0001875', 'http://purl.obolibrary.org/obo/SO_0001876', 'http://purl.obolibrary.org/obo/SO_0001877', 'http://purl.obolibrary.org/obo/SO_0001878', 'http://purl.obolibrary.org/obo/SO_0001879', 'http://purl.obolibrary.org/obo/SO_0001880', 'http://purl.obolibrary.org/obo/SO_0001881', 'http://purl.obolibrary.org/obo/SO_0001882', 'http://purl.obolibrary.org/obo/SO_0001883', 'http://purl.obolibrary.org/obo/SO_0001884', 'http://purl.obolibrary.org/obo/SO_0001885', 'http://purl.obolibrary.org/obo/SO_0001886', 'http://purl.obolibrary.org/obo/SO_0001887', 'http://purl.obolibrary.org/obo/SO_0001888', 'http://purl.obolibrary.org/obo/SO_0001889', 'http://purl.obolibrary.org/obo/SO_0001890', 'http://purl.obolibrary.org/obo/SO_0001891', 'http://purl.obolibrary.org/obo/SO_0001892', 'http://purl.obolibrary.org/obo/SO_0001893', 'http://purl.obolibrary.org/obo/SO_0001894', 'http://purl.obolibrary.org/obo/SO_0001895', 'http://purl.obolibrary.org/obo/SO_0001896', 'http://purl.obolibrary.org/obo/SO_0001897', 'http://purl.obolibrary.org/obo/SO_0001898', 'http://purl.obolibrary.org/obo/SO_0001899', 'http://purl.obolibrary.org/obo/SO_0001900', 'http://purl.obolibrary.org/obo/SO_0001901', 'http://purl.obolibrary.org/obo/SO_0001902', 'http://purl.obolibrary.org/obo/SO_0001903', 'http://purl.obolibrary.org/obo/SO_0001904', 'http://purl.obolibrary.org/obo/SO_0001905', 'http://purl.obolibrary.org/obo/SO_0001906', 'http://purl.obolibrary.org/obo/SO_0001907', 'http://purl.obolibrary.org/obo/SO_0001908', 'http://purl.obolibrary.org/obo/SO_0001909', 'http://purl.obolibrary.org/obo/SO_0001910', 'http://purl.obolibrary.org/obo/SO_0001911', 'http://purl.obolibrary.org/obo/SO_0001912', 'http://purl.obolibrary.org/obo/SO_0001913', 'http://purl.obolibrary.org/obo/SO_0001914', 'http://purl.obolibrary.org/obo/SO_0001915', 'http://purl.obolibrary.org/obo/SO_0001916', 'http://purl.obolibrary.org/obo/SO_0001917', 'http://purl.obolibrary.org/obo/SO_0001918', 'http://purl.obolibrary.org/obo/SO_0001919', 'http://purl.obolibrary.org/obo/SO_0001920', 'http://purl.obolibrary.org/obo/SO_0001921', 'http://purl.obolibrary.org/obo/SO_0001922', 'http://purl.obolibrary.org/obo/SO_0001923', 'http://purl.obolibrary.org/obo/SO_0001924', 'http://purl.obolibrary.org/obo/SO_0001925', 'http://purl.obolibrary.org/obo/SO_0001926', 'http://purl.obolibrary.org/obo/SO_0001927', 'http://purl.obolibrary.org/obo/SO_0001928', 'http://purl.obolibrary.org/obo/SO_0001929', 'http://purl.obolibrary.org/obo/SO_0001930', 'http://purl.obolibrary.org/obo/SO_0001931', 'http://purl.obolibrary.org/obo/SO_0001932', 'http://purl.obolibrary.org/obo/SO_0001933', 'http://purl.obolibrary.org/obo/SO_0001934', 'http://purl.obolibrary.org/obo/SO_0001935', 'http://purl.obolibrary.org/obo/SO_0001936', 'http://purl.obolibrary.org/obo/SO_0001937', 'http://purl.obolibrary.org/obo/SO_0001938', 'http://purl.obolibrary.org/obo/SO_0001939', 'http://purl.obolibrary.org/obo/SO_0001940', 'http://purl.obolibrary.org/obo/SO_0001941', 'http://purl.obolibrary.org/obo/SO_0001942', 'http://purl.obolibrary.org/obo/SO_0001943', 'http://purl.obolibrary.org/obo/SO_0001944', 'http://purl.obolibrary.org/obo/SO_0001945', 'http://purl.obolibrary.org/obo/SO_0001946', 'http://purl.obolibrary.org/obo/SO_0001947', 'http://purl.obolibrary.org/obo/SO_0001948', 'http://purl.obolibrary.org/obo/SO_0001949', 'http://purl.obolibrary.org/obo/SO_0001950', 'http://purl.obolibrary.org/obo/SO_0001951', 'http://purl.obolibrary.org/obo/SO_0001952', 'http://purl.obolibrary.org/obo/SO_0001953', 'http://purl.obolibrary.org/obo/SO_0001954', 'http://purl.obolibrary.org/obo/SO_0001955', 'http://purl.obolibrary.org/obo/SO_0001956', 'http://purl.obolibrary.org/obo/SO_0001957', 'http://purl.obolibrary.org/obo/SO_0001958', 'http://purl.obolibrary.org/obo/SO_0001959', 'http://purl.obolibrary.org/obo/SO_0001960', 'http://purl.obolibrary.org/obo/SO_0001961', 'http://purl.obolibrary.org/obo/SO_0001962', 'http://purl.obolibrary.org/obo/SO_0001963', 'http://purl.obolibrary.org/obo/SO_0001964', 'http://purl.obolibrary.org/obo/SO_0001965', 'http://purl.obolibrary.org/obo/SO_0001966', 'http://purl.obolibrary.org/obo/SO_0001967', 'http://purl.obolibrary.org/obo/SO_0001968', 'http://purl.obolibrary.org/obo/SO_0001969', 'http://purl.obolibrary.org/obo/SO_0001970', 'http://purl.obolibrary.org/obo/SO_0001971', 'http://purl.obolibrary.org/obo/SO_0001972', 'http://purl.obolibrary.org/obo/SO_0001973', 'http://purl.obolibrary.org/obo/SO_0001974', 'http://purl.obolibrary.org/obo/SO_0001975', 'http://purl.obolibrary.org/obo/SO_0001976', 'http://purl.obolibrary.org/obo/SO_0001977', 'http://purl.obolibrary.org/obo/SO_0001978', 'http://purl.obolibrary.org/obo/SO_0001979', 'http://purl.obolibrary.org/obo/SO_0001980', 'http://purl.obolibrary.org/obo/SO_0001981', 'http://purl.obolibrary.org/obo/SO_0001982', 'http://purl.obolibrary.org/obo/SO_0001983', 'http://purl.obolibrary.org/obo/SO_0001984', 'http://purl.obolibrary.org/obo/SO_0001985', 'http://purl.obolibrary.org/obo/SO_0001986', 'http://purl.obolibrary.org/obo/SO_0001987', 'http://purl.obolibrary.org/obo/SO_0001988', 'http://purl.obolibrary.org/obo/SO_0001989', 'http://purl.obolibrary.org/obo/SO_0001990', 'http://purl.obolibrary.org/obo/SO_0001991', 'http://purl.obolibrary.org/obo/SO_0001992', 'http://purl.obolibrary.org/obo/SO_0001993', 'http://purl.obolibrary.org/obo/SO_0001994', 'http://purl.obolibrary.org/obo/SO_0001995', 'http://purl.obolibrary.org/obo/SO_0001996', 'http://purl.obolibrary.org/obo/SO_0001997', 'http://purl.obolibrary.org/obo/SO_0001998', 'http://purl.obolibrary.org/obo/SO_0001999', 'http://purl.obolibrary.org/obo/SO_0002000', 'http://purl.obolibrary.org/obo/SO_0002001', 'http://purl.obolibrary.org/obo/SO_0002002', 'http://purl.obolibrary.org/obo/SO_0002003', 'http://purl.obolibrary.org/obo/SO_0002004', 'http://purl.obolibrary.org/obo/SO_0002005', 'http://purl.obolibrary.org/obo/SO_0002006', 'http://purl.obolibrary.org/obo/SO_0002007', 'http://purl.obolibrary.org/obo/SO_0005836', 'http://purl.obolibrary.org/obo/SO_0005837', 'http://purl.obolibrary.org/obo/SO_0005841', 'http://purl.obolibrary.org/obo/SO_0005843', 'http://purl.obolibrary.org/obo/SO_0005845', 'http://purl.obolibrary.org/obo/SO_0005847', 'http://purl.obolibrary.org/obo/SO_0005848', 'http://purl.obolibrary.org/obo/SO_0005849', 'http://purl.obolibrary.org/obo/SO_0005850', 'http://purl.obolibrary.org/obo/SO_0005851', 'http://purl.obolibrary.org/obo/SO_0005852', 'http://purl.obolibrary.org/obo/SO_0005853', 'http://purl.obolibrary.org/obo/SO_0005854', 'http://purl.obolibrary.org/obo/SO_0005855', 'http://purl.obolibrary.org/obo/SO_0005856', 'http://purl.obolibrary.org/obo/SO_0005857', 'http://purl.obolibrary.org/obo/SO_0005858', 'http://purl.obolibrary.org/obo/SO_0100001', 'http://purl.obolibrary.org/obo/SO_0100002', 'http://purl.obolibrary.org/obo/SO_0100003', 'http://purl.obolibrary.org/obo/SO_0100004', 'http://purl.obolibrary.org/obo/SO_0100005', 'http://purl.obolibrary.org/obo/SO_0100006', 'http://purl.obolibrary.org/obo/SO_0100007', 'http://purl.obolibrary.org/obo/SO_0100008', 'http://purl.obolibrary.org/obo/SO_0100009', 'http://purl.obolibrary.org/obo/SO_0100010', 'http://purl.obolibrary.org/obo/SO_0100011', 'http://purl.obolibrary.org/obo/SO_0100012', 'http://purl.obolibrary.org/obo/SO_0100013', 'http://purl.obolibrary.org/obo/SO_0100014', 'http://purl.obolibrary.org/obo/SO_0100015', 'http://purl.obolibrary.org/obo/SO_0100016', 'http://purl.obolibrary.org/obo/SO_0100017', 'http://purl.obolibrary.org/obo/SO_0100018', 'http://purl.obolibrary.org/obo/SO_0100019', 'http://purl.obolibrary.org/obo/SO_0100020', 'http://purl.obolibrary.org/obo/SO_0100021', 'http://purl.obolibrary.org/obo/SO_1000002', 'http://purl.obolibrary.org/obo/SO_1000005', 'http://purl.obolibrary.org/obo/SO_1000008', 'http://purl.obolibrary.org/obo/SO_1000009', 'http://purl.obolibrary.org/obo/SO_1000010', 'http://purl.obolibrary.org/obo/SO_1000011', 'http://purl.obolibrary.org/obo/SO_1000012', 'http://purl.obolibrary.org/obo/SO_1000013', 'http://purl.obolibrary.org/obo/SO_1000014', 'http://purl.obolibrary.org/obo/SO_1000015', 'http://purl.obolibrary.org/obo/SO_1000016', 'http://purl.obolibrary.org/obo/SO_1000017', 'http://purl.obolibrary.org/obo/SO_1000018', 'http://purl.obolibrary.org/obo/SO_1000019', 'http://purl.obolibrary.org/obo/SO_1000020', 'http://purl.obolibrary.org/obo/SO_1000021', 'http://purl.obolibrary.org/obo/SO_1000022', 'http://purl.obolibrary.org/obo/SO_1000023', 'http://purl.obolibrary.org/obo/SO_1000024', 'http://purl.obolibrary.org/obo/SO_1000025', 'http://purl.obolibrary.org/obo/SO_1000026', 'http://purl.obolibrary.org/obo/SO_1000027', 'http://purl.obolibrary.org/obo/SO_1000028', 'http://purl.obolibrary.org/obo/SO_1000029', 'http://purl.obolibrary.org/obo/SO_1000030', 'http://purl.obolibrary.org/obo/SO_1000031', 'http://purl.obolibrary.org/obo/SO_1000032', 'http://purl.obolibrary.org/obo/SO_1000035', 'http://purl.obolibrary.org/obo/SO_1000036', 'http://purl.obolibrary.org/obo/SO_1000037', 'http://purl.obolibrary.org/obo/SO_1000038', 'http://purl.obolibrary.org/obo/SO_1000039', 'http://purl.obolibrary.org/obo/SO_1000040', 'http://purl.obolibrary.org/obo/SO_1000041', 'http://purl.obolibrary.org/obo/SO_1000042', 'http://purl.obolibrary.org/obo/SO_1000043', 'http://purl.obolibrary.org/obo/SO_1000044', 'http://purl.obolibrary.org/obo/SO_1000045', 'http://purl.obolibrary.org/obo/SO_1000046', 'http://purl.obolibrary.org/obo/SO_1000047', 'http://purl.obolibrary.org/obo/SO_1000048', 'http://purl.obolibrary.org/obo/SO_1000049', 'http://purl.obolibrary.org/obo/SO_1000050', 'http://purl.obolibrary.org/obo/SO_1000054', 'http://purl.obolibrary.org/obo/SO_1000055', 'http://purl.obolibrary.org/obo/SO_1000056', 'http://purl.obolibrary.org/obo/SO_1000057', 'http://purl.obolibrary.org/obo/SO_1000058', 'http://purl.obolibrary.org/obo/SO_1000059', 'http://purl.obolibrary.org/obo/SO_1000060', 'http://purl.obolibrary.org/obo/SO_1000061', 'http://purl.obolibrary.org/obo/SO_1000062', 'http://purl.obolibrary.org/obo/SO_1000063', 'http://purl.obolibrary.org/obo/SO_1000064', 'http://purl.obolibrary.org/obo/SO_1000065', 'http://purl.obolibrary.org/obo/SO_1000066', 'http://purl.obolibrary.org/obo/SO_1000067', 'http://purl.obolibrary.org/obo/SO_1000068', 'http://purl.obolibrary.org/obo/SO_1000069', 'http://purl.obolibrary.org/obo/SO_1000070', 'http://purl.obolibrary.org/obo/SO_1000071', 'http://purl.obolibrary.org/obo/SO_1000072', 'http://purl.obolibrary.org/obo/SO_1000073', 'http://purl.obolibrary.org/obo/SO_1000074', 'http://purl.obolibrary.org/obo/SO_1000075', 'http://purl.obolibrary.org/obo/SO_1000076', 'http://purl.obolibrary.org/obo/SO_1000078', 'http://purl.obolibrary.org/obo/SO_1000079', 'http://purl.obolibrary.org/obo/SO_1000080', 'http://purl.obolibrary.org/obo/SO_1000081', 'http://purl.obolibrary.org/obo/SO_1000082', 'http://purl.obolibrary.org/obo/SO_1000083', 'http://purl.obolibrary.org/obo/SO_1000084', 'http://purl.obolibrary.org/obo/SO_1000085', 'http://purl.obolibrary.org/obo/SO_1000086', 'http://purl.obolibrary.org/obo/SO_1000087', 'http://purl.obolibrary.org/obo/SO_1000088', 'http://purl.obolibrary.org/obo/SO_1000089', 'http://purl.obolibrary.org/obo/SO_1000092', 'http://purl.obolibrary.org/obo/SO_1000093', 'http://purl.obolibrary.org/obo/SO_1000094', 'http://purl.obolibrary.org/obo/SO_1000095', 'http://purl.obolibrary.org/obo/SO_1000096', 'http://purl.obolibrary.org/obo/SO_1000097', 'http://purl.obolibrary.org/obo/SO_1000098', 'http://purl.obolibrary.org/obo/SO_1000099', 'http://purl.obolibrary.org/obo/SO_1000100', 'http://purl.obolibrary.org/obo/SO_1000101', 'http://purl.obolibrary.org/obo/SO_1000102', 'http://purl.obolibrary.org/obo/SO_1000103', 'http://purl.obolibrary.org/obo/SO_1000104', 'http://purl.obolibrary.org/obo/SO_1000105', 'http://purl.obolibrary.org/obo/SO_1000106', 'http://purl.obolibrary.org/obo/SO_1000107', 'http://purl.obolibrary.org/obo/SO_1000108', 'http://purl.obolibrary.org/obo/SO_1000109', 'http://purl.obolibrary.org/obo/SO_1000110', 'http://purl.obolibrary.org/obo/SO_1000111', 'http://purl.obolibrary.org/obo/SO_1000112', 'http://purl.obolibrary.org/obo/SO_1000115', 'http://purl.obolibrary.org/obo/SO_1000116', 'http://purl.obolibrary.org/obo/SO_1000117', 'http://purl.obolibrary.org/obo/SO_1000118', 'http://purl.obolibrary.org/obo/SO_1000119', 'http://purl.obolibrary.org/obo/SO_1000120', 'http://purl.obolibrary.org/obo/SO_1000121', 'http://purl.obolibrary.org/obo/SO_1000122', 'http://purl.obolibrary.org/obo/SO_1000123', 'http://purl.obolibrary.org/obo/SO_1000124', 'http://purl.obolibrary.org/obo/SO_1000125', 'http://purl.obolibrary.org/obo/SO_1000126', 'http://purl.obolibrary.org/obo/SO_1000127', 'http://purl.obolibrary.org/obo/SO_1000132', 'http://purl.obolibrary.org/obo/SO_1000134', 'http://purl.obolibrary.org/obo/SO_1000136', 'http://purl.obolibrary.org/obo/SO_1000138', 'http://purl.obolibrary.org/obo/SO_1000140', 'http://purl.obolibrary.org/obo/SO_1000141', 'http://purl.obolibrary.org/obo/SO_1000142', 'http://purl.obolibrary.org/obo/SO_1000143', 'http://purl.obolibrary.org/obo/SO_1000144', 'http://purl.obolibrary.org/obo/SO_1000145', 'http://purl.obolibrary.org/obo/SO_1000146', 'http://purl.obolibrary.org/obo/SO_1000147', 'http://purl.obolibrary.org/obo/SO_1000148', 'http://purl.obolibrary.org/obo/SO_1000149', 'http://purl.obolibrary.org/obo/SO_1000150', 'http://purl.obolibrary.org/obo/SO_1000151', 'http://purl.obolibrary.org/obo/SO_1000152', 'http://purl.obolibrary.org/obo/SO_1000153', 'http://purl.obolibrary.org/obo/SO_1000154', 'http://purl.obolibrary.org/obo/SO_1000155', 'http://purl.obolibrary.org/obo/SO_1000156', 'http://purl.obolibrary.org/obo/SO_1000157', 'http://purl.obolibrary.org/obo/SO_1000158', 'http://purl.obolibrary.org/obo/SO_1000159', 'http://purl.obolibrary.org/obo/SO_1000160', 'http://purl.obolibrary.org/obo/SO_1000161', 'http://purl.obolibrary.org/obo/SO_1000162', 'http://purl.obolibrary.org/obo/SO_1000170', 'http://purl.obolibrary.org/obo/SO_1000171', 'http://purl.obolibrary.org/obo/SO_1000173', 'http://purl.obolibrary.org/obo/SO_1000175', 'http://purl.obolibrary.org/obo/SO_1000180', 'http://purl.obolibrary.org/obo/SO_1000181', 'http://purl.obolibrary.org/obo/SO_1000182', 'http://purl.obolibrary.org/obo/SO_1000183', 'http://purl.obolibrary.org/obo/SO_1000184', 'http://purl.obolibrary.org/obo/SO_1000185', 'http://purl.obolibrary.org/obo/SO_1000186', 'http://purl.obolibrary.org/obo/SO_1001186', 'http://purl.obolibrary.org/obo/SO_1001187', 'http://purl.obolibrary.org/obo/SO_1001188', 'http://purl.obolibrary.org/obo/SO_1001189', 'http://purl.obolibrary.org/obo/SO_1001190', 'http://purl.obolibrary.org/obo/SO_1001191', 'http://purl.obolibrary.org/obo/SO_1001192', 'http://purl.obolibrary.org/obo/SO_1001193', 'http://purl.obolibrary.org/obo/SO_1001194', 'http://purl.obolibrary.org/obo/SO_1001195', 'http://purl.obolibrary.org/obo/SO_1001196', 'http://purl.obolibrary.org/obo/SO_1001197', 'http://purl.obolibrary.org/obo/SO_1001217', 'http://purl.obolibrary.org/obo/SO_1001244', 'http://purl.obolibrary.org/obo/SO_1001246', 'http://purl.obolibrary.org/obo/SO_1001247', 'http://purl.obolibrary.org/obo/SO_1001249', 'http://purl.obolibrary.org/obo/SO_1001251', 'http://purl.obolibrary.org/obo/SO_1001254', 'http://purl.obolibrary.org/obo/SO_1001255', 'http://purl.obolibrary.org/obo/SO_1001259', 'http://purl.obolibrary.org/obo/SO_1001260', 'http://purl.obolibrary.org/obo/SO_1001261', 'http://purl.obolibrary.org/obo/SO_1001262', 'http://purl.obolibrary.org/obo/SO_1001263', 'http://purl.obolibrary.org/obo/SO_1001264', 'http://purl.obolibrary.org/obo/SO_1001265', 'http://purl.obolibrary.org/obo/SO_1001266', 'http://purl.obolibrary.org/obo/SO_1001267', 'http://purl.obolibrary.org/obo/SO_1001268', 'http://purl.obolibrary.org/obo/SO_1001269', 'http://purl.obolibrary.org/obo/SO_1001270', 'http://purl.obolibrary.org/obo/SO_1001271', 'http://purl.obolibrary.org/obo/SO_1001272', 'http://purl.obolibrary.org/obo/SO_1001273', 'http://purl.obolibrary.org/obo/SO_1001274', 'http://purl.obolibrary.org/obo/SO_1001275', 'http://purl.obolibrary.org/obo/SO_1001277', 'http://purl.obolibrary.org/obo/SO_1001279', 'http://purl.obolibrary.org/obo/SO_1001280', 'http://purl.obolibrary.org/obo/SO_1001281', 'http://purl.obolibrary.org/obo/SO_1001282', 'http://purl.obolibrary.org/obo/SO_1001283', 'http://purl.obolibrary.org/obo/SO_1001284', 'http://purl.obolibrary.org/obo/SO_1001285', 'http://purl.obolibrary.org/obo/SO_1001286', 'http://purl.obolibrary.org/obo/SO_1001287', 'http://purl.obolibrary.org/obo/SO_1001288', 'http://purl.obolibrary.org/obo/SO_2000061', 'http://purl.obolibrary.org/obo/SO_3000000', 'http://purl.obolibrary.org/obo/SO_0000274', 'http://purl.obolibrary.org/obo/SO_0000655', 'http://purl.obolibrary.org/obo/SO_0000704', 'http://purl.obolibrary.org/obo/SO_0002012']}
   def __init__(self, evidence_codes = None, functional_consequence = None, urls = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -97,20 +103,26 @@ class Gene2Variant(evidence_core.Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['evidence_codes','functional_consequence','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Gene2Variant, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Gene2Variant.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Gene2Variant', invalid_fields, cls_keys)
+    obj = super(Gene2Variant, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Gene2Variant - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if  'functional_consequence' in dict_obj:
+    if  'functional_consequence' in dict_obj and (fields is None or 'functional_consequence' in fields):
         obj.functional_consequence = dict_obj['functional_consequence']
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Gene2Variant - invalid field - {0} found".format(key))
@@ -196,6 +208,10 @@ class Variant2Disease(evidence_core.Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['clinical_significance','gwas_panel_resolution','gwas_sample_size','evidence_codes','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'clinical_significance': 'string', 'gwas_panel_resolution': 'number', 'gwas_sample_size': 'number', 'evidence_codes': ['string'], 'urls': ['evidence_linkout.Linkout']}
+  cls_enums = {'clinical_significance': ['Pathogenic', 'Likely pathogenic', 'protective', 'association', 'risk_factor', 'Affects', 'drug response'], 'evidence_codes': ['http://identifiers.org/eco/GWAS', 'http://identifiers.org/eco/PheWAS', 'http://purl.obolibrary.org/obo/ECO_0000205']}
   def __init__(self, clinical_significance = None, gwas_panel_resolution = None, gwas_sample_size = None, evidence_codes = None, urls = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -259,24 +275,30 @@ class Variant2Disease(evidence_core.Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['clinical_significance','gwas_panel_resolution','gwas_sample_size','evidence_codes','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Variant2Disease, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Variant2Disease.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Variant2Disease', invalid_fields, cls_keys)
+    obj = super(Variant2Disease, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Variant2Disease - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'clinical_significance' in dict_obj:
+    if  'clinical_significance' in dict_obj and (fields is None or 'clinical_significance' in fields):
         obj.clinical_significance = dict_obj['clinical_significance']
-    if  'gwas_panel_resolution' in dict_obj:
+    if  'gwas_panel_resolution' in dict_obj and (fields is None or 'gwas_panel_resolution' in fields):
         obj.gwas_panel_resolution = dict_obj['gwas_panel_resolution']
-    if  'gwas_sample_size' in dict_obj:
+    if  'gwas_sample_size' in dict_obj and (fields is None or 'gwas_sample_size' in fields):
         obj.gwas_sample_size = dict_obj['gwas_sample_size']
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Variant2Disease - invalid field - {0} found".format(key))
@@ -23,6 +23,8 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
 
 __author__ = "Gautier Koscielny"
 __copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
@@ -45,6 +47,13 @@ class Linkout(object):
   :param nice_name = None
   :param url = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['nice_name','url']
+  cls_types = {'nice_name': 'string', 'url': 'string'}
+  cls_enums = {}
+  # opt-in cache.ValidationMemo replaying the validation of identical content
+  validation_memo = None
+
   def __init__(self, nice_name = None, url = None):
     
     """
@@ -74,15 +83,21 @@ class Linkout(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['nice_name','url']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Linkout.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Linkout', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Linkout - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'nice_name' in dict_obj:
+    if  'nice_name' in dict_obj and (fields is None or 'nice_name' in fields):
         obj.nice_name = dict_obj['nice_name']
-    if  'url' in dict_obj:
+    if  'url' in dict_obj and (fields is None or 'url' in fields):
         obj.url = dict_obj['url']
     return obj
   
@@ -91,6 +106,8 @@ class Linkout(object):
     Validate class Linkout
     :returns: number of errors found during validation
     """
+    if self.validation_memo is not None and not self.validation_memo.recording:
+      return self.validation_memo.validate(self, logger, path)
     error = 0
     # nice_name is mandatory
     if self.nice_name is None :
@@ -23,6 +23,8 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
 
 __author__ = "Gautier Koscielny"
 __copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
@@ -51,6 +53,10 @@ class Mutation(object):
   :param number_mutated_samples = None
   :param inheritance_pattern = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['role_in_cancer','preferred_name','alternative_names','functional_consequence','number_samples_tested','number_samples_with_mutation_type','number_mutated_samples','inheritance_pattern']
+  cls_types = {'role_in_cancer': 'string', 'preferred_name': 'string', 'alternative_names': ['string'], 'functional_consequence': 'string', 'number_samples_tested': 'number', 'number_samples_with_mutation_type': 'number', 'number_mutated_samples': 'number', 'inheritance_pattern': 'string'}
+  cls_enums = {'functional_consequence': ['http://purl.obolibrary.org/obo/SO_0001893', 'http://purl.obolibrary.org/obo/SO_0001632', 'http://purl.obolibrary.org/obo/SO_0001631', 'http://purl.obolibrary.org/obo/SO_0000159', 'http://purl.obolibrary.org/obo/SO_0001583', 'http://purl.obolibrary.org/obo/SO_0001587', 'http://purl.obolibrary.org/obo/SO_0001590', 'http://purl.obolibrary.org/obo/SO_1000065', 'http://purl.obolibrary.org/obo/SO_0001539', 'http://purl.obolibrary.org/obo/SO_0001605', 'http://purl.obolibrary.org/obo/SO_0001825', 'http://purl.obolibrary.org/obo/SO_0001553', 'http://purl.obolibrary.org/obo/SO_0001059', 'http://purl.obolibrary.org/obo/SO_0001821', 'http://purl.obolibrary.org/obo/SO_0001578', 'http://purl.obolibrary.org/obo/SO_0001630', 'http://purl.obolibrary.org/obo/SO_0001575', 'http://purl.obolibrary.org/obo/SO_0001589', 'http://targetvalidation.org/sequence/nearest_gene_five_prime_end', 'http://purl.obolibrary.org/obo/SO_0001574', 'http://purl.obolibrary.org/obo/SO_0001819', 'http://purl.obolibrary.org/obo/SO_0001822', 'http://purl.obolibrary.org/obo/SO_0001818', 'http://purl.obolibrary.org/obo/SO_0001564', 'http://purl.obolibrary.org/obo/SO_0001565', 'http://purl.obolibrary.org/obo/SO_0002012', 'http://purl.obolibrary.org/obo/SO_0001627', 'http://purl.obolibrary.org/obo/SO_0001060', 'http://purl.obolibrary.org/obo/SO_0001624', 'http://purl.obolibrary.org/obo/SO_0001623'], 'inheritance_pattern': ['unknown', 'dominant', 'semi-dominant', 'co-dominant', 'recessive', 'dominant/recessive', 'X-linked recessive']}
   def __init__(self, role_in_cancer = None, preferred_name = None, alternative_names = None, functional_consequence = None, number_samples_tested = None, number_samples_with_mutation_type = None, number_mutated_samples = None, inheritance_pattern = None):
     
     """
@@ -141,27 +147,33 @@ class Mutation(object):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['role_in_cancer','preferred_name','alternative_names','functional_consequence','number_samples_tested','number_samples_with_mutation_type','number_mutated_samples','inheritance_pattern']
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Mutation.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Mutation', invalid_fields, cls_keys)
     obj = cls()
     if not isinstance(dict_obj, dict):
       logger.warn("Mutation - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'role_in_cancer' in dict_obj:
+    if  'role_in_cancer' in dict_obj and (fields is None or 'role_in_cancer' in fields):
         obj.role_in_cancer = dict_obj['role_in_cancer']
-    if  'preferred_name' in dict_obj:
+    if  'preferred_name' in dict_obj and (fields is None or 'preferred_name' in fields):
         obj.preferred_name = dict_obj['preferred_name']
-    if  'alternative_names' in dict_obj:
+    if  'alternative_names' in dict_obj and (fields is None or 'alternative_names' in fields):
         obj.alternative_names = dict_obj['alternative_names']
-    if  'functional_consequence' in dict_obj:
+    if  'functional_consequence' in dict_obj and (fields is None or 'functional_consequence' in fields):
         obj.functional_consequence = dict_obj['functional_consequence']
-    if  'number_samples_tested' in dict_obj:
+    if  'number_samples_tested' in dict_obj and (fields is None or 'number_samples_tested' in fields):
         obj.number_samples_tested = dict_obj['number_samples_tested']
-    if  'number_samples_with_mutation_type' in dict_obj:
+    if  'number_samples_with_mutation_type' in dict_obj and (fields is None or 'number_samples_with_mutation_type' in fields):
         obj.number_samples_with_mutation_type = dict_obj['number_samples_with_mutation_type']
-    if  'number_mutated_samples' in dict_obj:
+    if  'number_mutated_samples' in dict_obj and (fields is None or 'number_mutated_samples' in fields):
         obj.number_mutated_samples = dict_obj['number_mutated_samples']
-    if  'inheritance_pattern' in dict_obj:
+    if  'inheritance_pattern' in dict_obj and (fields is None or 'inheritance_pattern' in fields):
         obj.inheritance_pattern = dict_obj['inheritance_pattern']
     return obj
   
@@ -23,6 +23,8 @@ import json
 import logging
 import six
 import collections
+from opentargets.model.fields import field_tree
+from opentargets.model.exceptions import InvalidFieldsException
 import opentargets.model.evidence.core
 import opentargets.model.evidence.linkout as evidence_linkout
 import opentargets.model.bioentity as bioentity
@@ -56,6 +58,10 @@ class Orthologs(evidence_core.Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['evidence_codes','human_gene_id','model_gene_id','species','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'evidence_codes': ['string'], 'human_gene_id': 'string', 'model_gene_id': 'string', 'species': 'string', 'urls': ['evidence_linkout.Linkout']}
+  cls_enums = {'evidence_codes': ['http://identifiers.org/eco/ECO:0000265'], 'species': ['mouse', 'human', 'rat', 'zebrafish', 'dog']}
   def __init__(self, evidence_codes = None, human_gene_id = None, model_gene_id = None, species = None, urls = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -122,24 +128,30 @@ class Orthologs(evidence_core.Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['evidence_codes','human_gene_id','model_gene_id','species','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Orthologs, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Orthologs.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Orthologs', invalid_fields, cls_keys)
+    obj = super(Orthologs, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Orthologs - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if  'human_gene_id' in dict_obj:
+    if  'human_gene_id' in dict_obj and (fields is None or 'human_gene_id' in fields):
         obj.human_gene_id = dict_obj['human_gene_id']
-    if  'model_gene_id' in dict_obj:
+    if  'model_gene_id' in dict_obj and (fields is None or 'model_gene_id' in fields):
         obj.model_gene_id = dict_obj['model_gene_id']
-    if  'species' in dict_obj:
+    if  'species' in dict_obj and (fields is None or 'species' in fields):
         obj.species = dict_obj['species']
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Orthologs - invalid field - {0} found".format(key))
@@ -257,6 +269,10 @@ class Biological_Model(evidence_core.Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['evidence_codes','model_gene_id','model_id','allelic_composition','genetic_background','allele_ids','zygosity','species','phenotypes','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'evidence_codes': ['string'], 'model_gene_id': 'string', 'model_id': 'string', 'allelic_composition': 'string', 'genetic_background': 'string', 'allele_ids': 'string', 'zygosity': 'string', 'species': 'string', 'phenotypes': ['bioentity.Phenotype'], 'urls': ['evidence_linkout.Linkout']}
+  cls_enums = {'evidence_codes': ['http://identifiers.org/eco/ECO:0000179'], 'zygosity': ['hom', 'het', 'hem', 'oth'], 'species': ['mouse', 'human', 'rat', 'zebrafish', 'dog']}
   def __init__(self, evidence_codes = None, model_gene_id = None, model_id = None, allelic_composition = None, genetic_background = None, allele_ids = None, zygosity = None, species = None, phenotypes = None, urls = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -377,36 +393,42 @@ class Biological_Model(evidence_core.Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['evidence_codes','model_gene_id','model_id','allelic_composition','genetic_background','allele_ids','zygosity','species','phenotypes','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Biological_Model, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Biological_Model.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Biological_Model', invalid_fields, cls_keys)
+    obj = super(Biological_Model, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Biological_Model - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if  'model_gene_id' in dict_obj:
+    if  'model_gene_id' in dict_obj and (fields is None or 'model_gene_id' in fields):
         obj.model_gene_id = dict_obj['model_gene_id']
-    if  'model_id' in dict_obj:
+    if  'model_id' in dict_obj and (fields is None or 'model_id' in fields):
         obj.model_id = dict_obj['model_id']
-    if  'allelic_composition' in dict_obj:
+    if  'allelic_composition' in dict_obj and (fields is None or 'allelic_composition' in fields):
         obj.allelic_composition = dict_obj['allelic_composition']
-    if  'genetic_background' in dict_obj:
+    if  'genetic_background' in dict_obj and (fields is None or 'genetic_background' in fields):
         obj.genetic_background = dict_obj['genetic_background']
-    if  'allele_ids' in dict_obj:
+    if  'allele_ids' in dict_obj and (fields is None or 'allele_ids' in fields):
         obj.allele_ids = dict_obj['allele_ids']
-    if  'zygosity' in dict_obj:
+    if  'zygosity' in dict_obj and (fields is None or 'zygosity' in fields):
         obj.zygosity = dict_obj['zygosity']
-    if  'species' in dict_obj:
+    if  'species' in dict_obj and (fields is None or 'species' in fields):
         obj.species = dict_obj['species']
-    if 'phenotypes' in dict_obj and isinstance(dict_obj['phenotypes'], list):
+    if 'phenotypes' in dict_obj and (fields is None or 'phenotypes' in fields) and isinstance(dict_obj['phenotypes'], list):
         obj.phenotypes = list()
         for item in dict_obj['phenotypes']:
-            obj.phenotypes.append(bioentity.Phenotype.fromDict(item))
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+            obj.phenotypes.append(bioentity.Phenotype.fromDict(item, strict = strict, fields = fields and fields['phenotypes'] or None))
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Biological_Model - invalid field - {0} found".format(key))
@@ -562,6 +584,10 @@ class Disease_Model_Association(evidence_core.Base):
   :param resource_score = None
   :param     provenance_type = None
   """
+  # schema fields, see fields.class_fields
+  cls_keys = ['evidence_codes','model_id','disease_id','human_phenotypes','model_phenotypes','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
+  cls_types = {'evidence_codes': ['string'], 'model_id': 'string', 'disease_id': 'string', 'human_phenotypes': ['bioentity.Phenotype'], 'model_phenotypes': ['bioentity.Phenotype'], 'urls': ['evidence_linkout.Linkout']}
+  cls_enums = {'evidence_codes': ['http://identifiers.org/eco/ECO:0000057']}
   def __init__(self, evidence_codes = None, model_id = None, disease_id = None, human_phenotypes = None, model_phenotypes = None, urls = None, unique_experiment_reference = None, is_associated = False, date_asserted = None, resource_score = None,     provenance_type = None):
     """
     Call super constructor
@@ -640,30 +666,36 @@ class Disease_Model_Association(evidence_core.Base):
     return obj
   
   @classmethod
-  def fromDict(cls, dict_obj):
-    cls_keys = ['evidence_codes','model_id','disease_id','human_phenotypes','model_phenotypes','urls','unique_experiment_reference','is_associated','date_asserted','resource_score','provenance_type']
-    obj = super(Disease_Model_Association, cls).fromDict(dict_obj)
+  def fromDict(cls, dict_obj, strict = False, fields = None):
+    cls_keys = Disease_Model_Association.cls_keys
+    fields = field_tree(fields)
+    if strict and isinstance(dict_obj, dict):
+      # reject unknown keys before any nested object is decoded
+      invalid_fields = sorted(key for key in dict_obj if not key in cls_keys)
+      if invalid_fields:
+        raise InvalidFieldsException('Disease_Model_Association', invalid_fields, cls_keys)
+    obj = super(Disease_Model_Association, cls).fromDict(dict_obj, strict = strict, fields = fields)
     if not isinstance(dict_obj, dict):
       logger.warn("Disease_Model_Association - DictType expected - {0} found\n".format(type(dict_obj)))
       return
-    if  'evidence_codes' in dict_obj:
+    if  'evidence_codes' in dict_obj and (fields is None or 'evidence_codes' in fields):
         obj.evidence_codes = dict_obj['evidence_codes']
-    if  'model_id' in dict_obj:
+    if  'model_id' in dict_obj and (fields is None or 'model_id' in fields):
         obj.model_id = dict_obj['model_id']
-    if  'disease_id' in dict_obj:
+    if  'disease_id' in dict_obj and (fields is None or 'disease_id' in fields):
         obj.disease_id = dict_obj['disease_id']
-    if 'human_phenotypes' in dict_obj and isinstance(dict_obj['human_phenotypes'], list):
+    if 'human_phenotypes' in dict_obj and (fields is None or 'human_phenotypes' in fields) and isinstance(dict_obj['human_phenotypes'], list):
         obj.human_phenotypes = list()
         for item in dict_obj['human_phenotypes']:
-            obj.human_phenotypes.append(bioentity.Phenotype.fromDict(item))
-    if 'model_phenotypes' in dict_obj and isinstance(dict_obj['model_phenotypes'], list):
+            obj.human_phenotypes.append(bioentity.Phenotype.fromDict(item, strict = strict, fields = fields and fields['human_phenotypes'] or None))
+    if 'model_phenotypes' in dict_obj and (fields is None or 'model_phenotypes' in fields) and isinstance(dict_obj['model_phenotypes'], list):
         obj.model_phenotypes = list()
         for item in dict_obj['model_phenotypes']:
-            obj.model_phenotypes.append(bioentity.Phenotype.fromDict(item))
-    if 'urls' in dict_obj and isinstance(dict_obj['urls'], list):
+            obj.model_phenotypes.append(bioentity.Phenotype.fromDict(item, strict = strict, fields = fields and fields['model_phenotypes'] or None))
+    if 'urls' in dict_obj and (fields is None or 'urls' in fields) and isinstance(dict_obj['urls'], list):
         obj.urls = list()
         for item in dict_obj['urls']:
-            obj.urls.append(evidence_linkout.Linkout.fromDict(item))
+            obj.urls.append(evidence_linkout.Linkout.fromDict(item, strict = strict, fields = fields and fields['urls'] or None))
     for key in dict_obj:
       if not key in cls_keys:
         logger.warn("Disease_Model_Association - invalid field - {0} found".format(key))
@@ -0,0 +1,50 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+class JSONException(Exception):
+  pass
+
+class InvalidFieldsException(JSONException):
+  """
+  Structured rejection raised by fromDict(strict = True) when a dict holds
+  keys unknown to the class, before any nested object is decoded
+  Arguments:
+  :param class_name = name of the rejecting class
+  :param fields = sorted list of the unknown keys
+  :param allowed = list of the keys accepted by the class
+  """
+  def __init__(self, class_name, fields, allowed):
+    self.class_name = class_name
+    self.fields = fields
+    self.allowed = allowed
+    super(InvalidFieldsException, self).__init__("{0} - invalid fields - {1} found".format(class_name, ', '.join(fields)))
+
+  def serialize(self):
+    return {'class': self.class_name, 'invalid_fields': self.fields, 'allowed_fields': self.allowed}
@@ -0,0 +1,223 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import sys
+import numbers
+import logging
+import collections
+import six
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+def split_path(path):
+  """
+  Split a dotted field path such as 'evidence.resource_score.value',
+  numeric segments index into arrays ('evidence.urls.0.url')
+  :returns: list of segments
+  """
+  if isinstance(path, (list, tuple)):
+    return list(path)
+  return [int(segment) if segment.isdigit() else segment for segment in path.split('.')]
+
+def get_field(obj, path, default = None):
+  """
+  Follow a dotted field path through raw dicts and model objects alike
+  :returns: the value found at path or default when any segment is missing
+  """
+  value = obj
+  for segment in split_path(path):
+    if value is None:
+      return default
+    if isinstance(segment, int):
+      if not isinstance(value, list) or segment >= len(value):
+        return default
+      value = value[segment]
+    elif isinstance(value, dict):
+      value = value.get(segment)
+    else:
+      value = getattr(value, segment, None)
+  return default if value is None else value
+
+_getters = dict()
+
+def compile_path(path):
+  """
+  Getter specialized for a dotted field path, with the semantics of
+  get_field: the segments are unrolled into straight-line code, built once
+  per path, instead of being split and looped over at each call.
+  compile_path('evidence.variant2disease.resource_score.value')(record) works
+  on raw dicts and model objects alike.
+  :returns: function of (record, default = None)
+  """
+  if isinstance(path, six.string_types) and path in _getters:
+    return _getters[path]
+  segments = tuple(split_path(path))
+  if segments in _getters:
+    return _getters[segments]
+  lines = ['def getter(value, default = None):']
+  for segment in segments:
+    lines.append('  if value is None: return default')
+    if isinstance(segment, int):
+      lines.append('  value = value[{0}] if isinstance(value, list) and len(value) > {0} else None'.format(segment))
+    else:
+      lines.append('  value = value.get({0!r}) if isinstance(value, dict) else getattr(value, {0!r}, None)'.format(segment))
+  lines.append('  return default if value is None else value')
+  namespace = dict()
+  exec('\n'.join(lines), namespace)
+  getter = namespace['getter']
+  getter.path = '.'.join(str(segment) for segment in segments)
+  _getters[segments] = getter
+  if isinstance(path, six.string_types):
+    _getters[path] = getter
+  return getter
+
+def holders(value, segments, label = ''):
+  """
+  Walk a path of segments through raw dicts and model objects alike, None
+  standing for the items of an array, e.g. ('evidence', 'urls', None)
+  Arguments:
+  :param segments = tuple of field names or None
+  :param label = path of value in the labels, e.g. 'root'
+  :returns: generator of (label, object) pairs of the objects found at the
+  end of the path, labelled as in the messages of the generated classes
+  ('root.evidence.urls[0]'), missing and None objects being skipped
+  """
+  if not segments:
+    yield label, value
+    return
+  head = segments[0]
+  if head is None:
+    if isinstance(value, list):
+      for i, item in enumerate(value):
+        if item is not None:
+          for pair in holders(item, segments[1:], '{0}[{1}]'.format(label, i)):
+            yield pair
+    return
+  child = value.get(head) if isinstance(value, dict) else getattr(value, head, None)
+  if child is not None:
+    for pair in holders(child, segments[1:], label + '.' + head):
+      yield pair
+
+def extract(records, paths, arrays = True):
+  """
+  Read field paths from raw dicts or model objects in a single pass. A path
+  whose values are all numbers (booleans excluded) gives a float numpy
+  array, missing values being NaN, when numpy is available and arrays is
+  True; any other path gives a list, missing values being None.
+  Arguments:
+  :param records = iterable of raw dicts or model objects, read once
+  :param paths = dotted field paths
+  :param arrays = False to always get lists
+  :returns: OrderedDict of path -> values, in records order
+  """
+  if isinstance(paths, six.string_types):
+    paths = [paths]
+  getters = [compile_path(path) for path in paths]
+  columns = [[] for path in paths]
+  for record in records:
+    for getter, column in zip(getters, columns):
+      column.append(getter(record))
+  result = collections.OrderedDict()
+  for path, column in zip(paths, columns):
+    if arrays and numpy is not None and all(value is None or (isinstance(value, numbers.Number) and not isinstance(value, bool)) for value in column):
+      column = numpy.array([numpy.nan if value is None else value for value in column], dtype=float)
+    result[path] = column
+  return result
+
+def field_tree(paths):
+  """
+  Turn dotted field paths into the nested mask taken by fromDict(fields = ...),
+  an empty dict standing for a whole sub-object. Array indices are dropped,
+  the mask below an array applies to each of its items:
+  ['target.id', 'evidence.urls.0.url'] gives {'target': {'id': {}}, 'evidence': {'urls': {'url': {}}}}
+  None and masks already in tree form are returned as is
+  :returns: nested dict of field names
+  """
+  if paths is None or isinstance(paths, dict):
+    return paths
+  if isinstance(paths, six.string_types):
+    paths = [paths]
+  tree = dict()
+  for path in paths:
+    node = tree
+    segments = [segment for segment in split_path(path) if not isinstance(segment, int)]
+    for i, segment in enumerate(segments):
+      if segment in node and not node[segment]:
+        # a shorter path already selects the whole sub-object
+        break
+      if i == len(segments) - 1:
+        node[segment] = dict()
+      else:
+        node = node.setdefault(segment, dict())
+  return tree
+
+JSON_TYPES = ('string', 'number', 'boolean', 'object', 'array')
+
+_class_fields = dict()
+
+def _resolve(cls, name):
+  """
+  :returns: the class named as in the module defining cls, e.g. 'evidence_drug.Diseasephase'
+  """
+  value = sys.modules[cls.__module__]
+  for segment in name.split('.'):
+    value = getattr(value, segment)
+  return value
+
+def _resolve_type(cls, kind):
+  if isinstance(kind, list):
+    return [_resolve_type(cls, kind[0])]
+  if isinstance(kind, tuple):
+    return tuple(_resolve_type(cls, name) for name in kind)
+  return kind if kind in JSON_TYPES else _resolve(cls, kind)
+
+def class_fields(cls):
+  """
+  Fields of a generated class, read from the cls_keys, cls_types and
+  cls_enums of the class and its bases. A type is a JSON type name, a
+  nested class, a tuple of candidate classes or a one element list holding
+  the type of array items.
+  :returns: list of (name, type, list of enumerated values or None) tuples
+  """
+  if cls in _class_fields:
+    return _class_fields[cls]
+  types = dict()
+  enums = dict()
+  for klass in reversed(cls.__mro__):
+    # names are resolved in the module of the class declaring them
+    for name, kind in klass.__dict__.get('cls_types', {}).items():
+      types[name] = _resolve_type(klass, kind)
+    enums.update(klass.__dict__.get('cls_enums', {}))
+  result = []
+  for name in getattr(cls, 'cls_keys', ()):
+    if name in types and not name in (field[0] for field in result):
+      result.append((name, types[name], enums.get(name)))
+  _class_fields[cls] = result
+  return result
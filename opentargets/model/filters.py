@@ -0,0 +1,198 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import ast
+import json
+import logging
+import operator
+import six
+import opentargets.model.fields as fields
+import opentargets.model.scanner as scanner
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+def _ordered(compare):
+  """
+  Ordering comparison failing, rather than raising, on missing values and mismatched types
+  """
+  def ordered(left, right):
+    if left is None or right is None:
+      return False
+    try:
+      return compare(left, right)
+    except TypeError:
+      return False
+  return ordered
+
+def _contains(left, right):
+  if left is None or right is None:
+    return False
+  try:
+    return left in right
+  except TypeError:
+    return False
+
+_COMPARISONS = {
+  ast.Eq: ('_eq', operator.eq),
+  ast.NotEq: ('_ne', operator.ne),
+  ast.Lt: ('_lt', _ordered(operator.lt)),
+  ast.LtE: ('_le', _ordered(operator.le)),
+  ast.Gt: ('_gt', _ordered(operator.gt)),
+  ast.GtE: ('_ge', _ordered(operator.ge)),
+  ast.In: ('_in', _contains),
+  ast.NotIn: ('_not_in', lambda left, right: not _contains(left, right)),
+  ast.Is: ('_is', operator.is_),
+  ast.IsNot: ('_is_not', operator.is_not),
+}
+
+_NAMED_CONSTANTS = {'True': True, 'False': False, 'None': None}
+
+"""
+Filter expression evaluated on raw evidence before any model object is built
+"""
+class Filter(object):
+  """
+  Boolean expression over dotted field paths, e.g.
+  'sourceID == "gwas_catalog" and evidence.resource_score.value < 1e-8 and target.target_type in {...}'
+  Supported are and/or/not, comparisons (==, !=, <, <=, >, >=, in, not in,
+  is None, is not None), constants, sets, lists and tuples of constants and
+  array indices ('evidence.urls[0].url'). Ordering comparisons and 'in' are
+  false when the field is missing. When every field is a shallow leaf the
+  filter is applied to raw lines through the header scanner, so rejected
+  lines are never parsed. Filters only hold their expression and pickle to
+  worker processes.
+  Arguments:
+  :param expression = the filter expression
+  """
+  def __init__(self, expression):
+    self.expression = expression
+    self._compile()
+
+  def _compile(self):
+    try:
+      tree = ast.parse(self.expression.strip(), mode='eval')
+    except SyntaxError as e:
+      raise ValueError("Filter - invalid expression '{0}': {1}".format(self.expression, e))
+    self.paths = []
+    self._constants = dict()
+    source = self._emit(tree.body)
+    namespace = dict((name, compare) for name, compare in _COMPARISONS.values())
+    namespace.update(self._constants)
+    self._function = eval('lambda get: ' + source, namespace)
+    self._getters = dict((path, fields.compile_path(path)) for path in self.paths)
+    try:
+      self._scanner = scanner.HeaderScanner(self.paths)
+    except ValueError:
+      self._scanner = None
+
+  def _emit(self, node):
+    if isinstance(node, ast.BoolOp):
+      joiner = ' and ' if isinstance(node.op, ast.And) else ' or '
+      return '(' + joiner.join(self._emit(value) for value in node.values) + ')'
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+      return '(not ' + self._emit(node.operand) + ')'
+    if isinstance(node, ast.Compare):
+      parts = []
+      left = node.left
+      for op, right in zip(node.ops, node.comparators):
+        parts.append('{0}({1}, {2})'.format(_COMPARISONS[type(op)][0], self._emit(left), self._emit(right)))
+        left = right
+      return '(' + ' and '.join(parts) + ')'
+    if isinstance(node, (ast.Name, ast.Attribute, ast.Subscript)):
+      path = self._path(node)
+      if path in _NAMED_CONSTANTS:
+        return repr(_NAMED_CONSTANTS[path])
+      if not path in self.paths:
+        self.paths.append(path)
+      return 'get({0!r})'.format(path)
+    if isinstance(node, (ast.Set, ast.List, ast.Tuple)):
+      values = [self._constant(element) for element in node.elts]
+      name = '_c{0}'.format(len(self._constants))
+      try:
+        self._constants[name] = frozenset(values)
+      except TypeError:
+        self._constants[name] = tuple(values)
+      return name
+    return repr(self._constant(node))
+
+  def _constant(self, node):
+    try:
+      return ast.literal_eval(node)
+    except ValueError:
+      raise ValueError("Filter - unsupported element '{0}' in '{1}'".format(type(node).__name__, self.expression))
+
+  def _path(self, node):
+    if isinstance(node, ast.Name):
+      return node.id
+    if isinstance(node, ast.Attribute):
+      return self._path(node.value) + '.' + node.attr
+    if isinstance(node, ast.Subscript):
+      index = node.slice.value if hasattr(ast, 'Index') and isinstance(node.slice, ast.Index) else node.slice
+      index = self._constant(index)
+      if not isinstance(index, six.integer_types):
+        raise ValueError("Filter - only integer indices are supported in '{0}'".format(self.expression))
+      return '{0}.{1}'.format(self._path(node.value), index)
+    raise ValueError("Filter - unsupported element '{0}' in '{1}'".format(type(node).__name__, self.expression))
+
+  def matches(self, record):
+    """
+    Evaluate the filter on a raw evidence dict or a model object
+    :returns: True when the record is kept
+    """
+    getters = self._getters
+    return bool(self._function(lambda path: getters[path](record)))
+
+  def matches_line(self, line):
+    """
+    Evaluate the filter on a raw JSON line, parsing it only when some field
+    is out of reach of the header scanner or the scan is ambiguous
+    :returns: tuple of (True when the line is kept, parsed record or None)
+    """
+    if self._scanner is not None:
+      values, record = self._scanner.scan_line(line)
+      return bool(self._function(values.get)), record
+    if isinstance(line, six.binary_type):
+      line = line.decode('utf-8')
+    record = json.loads(line)
+    return self.matches(record), record
+
+  def __getstate__(self):
+    return {'expression': self.expression}
+
+  def __setstate__(self, state):
+    self.expression = state['expression']
+    self._compile()
+
+  def __repr__(self):
+    return 'Filter({0!r})'.format(self.expression)
+
+def as_filter(where):
+  """
+  :returns: a Filter from an expression, None and filters being returned as is
+  """
+  if where is None or isinstance(where, Filter):
+    return where
+  return Filter(where)
@@ -0,0 +1,94 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+LEVELS = ('critical', 'error', 'warning', 'warn', 'info', 'debug')
+
+def _ignore(msg, *args, **kwargs):
+  pass
+
+"""
+Logger stand-in for the validate() methods, keeping the messages logged through it
+"""
+class Recorder(object):
+  """
+  Messages of the levels handled are formatted and given to handle(), which
+  keeps them as (level, message) pairs; the other levels are dropped.
+  Subclasses override handle() to send the messages elsewhere.
+  Arguments:
+  :param levels = levels handled, None for all of them
+  """
+  def __init__(self, levels = None):
+    self.levels = levels
+    self.messages = []
+
+  def handle(self, level, message):
+    self.messages.append((level, message))
+
+  def errors(self):
+    """
+    :returns: list of the error messages kept
+    """
+    return [message for level, message in self.messages if level == 'error']
+
+  def __getattr__(self, name):
+    if not name in LEVELS:
+      raise AttributeError(name)
+    if self.levels is not None and not name in self.levels:
+      log = _ignore
+    else:
+      def log(msg, *args, **kwargs):
+        self.handle(name, msg % args if args else msg)
+    # looked up once per level
+    self.__dict__[name] = log
+    return log
+
+"""
+Logger stand-in dropping every message, for validations run for their error count only
+"""
+class Silent(Recorder):
+
+  def __init__(self):
+    super(Silent, self).__init__(levels = ())
+
+"""
+Logger stand-in keeping the messages while passing them on to another logger
+"""
+class Tee(Recorder):
+  """
+  Arguments:
+  :param logger = logger receiving every message
+  """
+  def __init__(self, logger):
+    super(Tee, self).__init__()
+    self.logger = logger
+
+  def handle(self, level, message):
+    self.messages.append((level, message))
+    getattr(self.logger, level)(message)
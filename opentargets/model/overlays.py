@@ -0,0 +1,98 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+def _restore(cls, attributes):
+  obj = cls.__new__(cls)
+  obj.__dict__.update(attributes)
+  return obj
+
+"""
+Subclasses of the generated classes that their instances switch to in place
+"""
+class Overlay(object):
+  """
+  One subclass per generated class overriding some of its methods, for
+  instances to switch to and back from without being copied, as shared
+  flyweights, tracked instances and views are. The overriding methods reach
+  those of the generated class through base().
+  Arguments:
+  :param methods = attributes of every subclass, by name
+  :param attributes = function of the generated class returning the attributes of its own subclass, None for none
+  """
+  def __init__(self, methods, attributes = None):
+    self.methods = methods
+    self.attributes = attributes
+    self._subclasses = dict()
+    self._bases = dict()
+
+  def subclass(self, cls):
+    """
+    :returns: the subclass of the generated class cls
+    """
+    subclass = self._subclasses.get(cls)
+    if subclass is None:
+      namespace = dict(self.methods, __module__ = cls.__module__)
+      if self.attributes is not None:
+        namespace.update(self.attributes(cls))
+      subclass = type(cls.__name__, (cls,), namespace)
+      self._bases[subclass] = cls
+      self._subclasses[cls] = subclass
+    return subclass
+
+  def base(self, cls):
+    """
+    :returns: the generated class of the subclass cls, None when cls is not one of the subclasses
+    """
+    return self._bases.get(cls)
+
+  def __contains__(self, cls):
+    return cls in self._bases
+
+  def switch(self, obj):
+    """
+    Switch obj to the subclass of its class
+    :returns: obj
+    """
+    object.__setattr__(obj, '__class__', self.subclass(type(obj)))
+    return obj
+
+  def restore(self, obj):
+    """
+    Switch obj back to its generated class
+    :returns: obj
+    """
+    object.__setattr__(obj, '__class__', self._bases[type(obj)])
+    return obj
+
+  def reduce(self, obj):
+    """
+    :returns: the __reduce_ex__ value pickling obj as an instance of its generated class
+    """
+    return (_restore, (self._bases[type(obj)], obj.__dict__))
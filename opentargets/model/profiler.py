@@ -0,0 +1,184 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import numbers
+import logging
+import collections
+import six
+import opentargets.model.core as core
+import opentargets.model.fields as fields
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+_MISSING = object()
+
+def _matches(kind, value):
+  """
+  :returns: True when value is of the JSON type kind, a dict or an instance
+  of the class standing for a nested object
+  """
+  if kind == 'string':
+    return isinstance(value, six.string_types)
+  if kind == 'number':
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+  if kind == 'boolean':
+    return isinstance(value, bool)
+  if kind == 'object':
+    return isinstance(value, dict)
+  if kind == 'array':
+    return isinstance(value, list)
+  if isinstance(kind, tuple):
+    return isinstance(value, (dict,) + kind)
+  return isinstance(value, (dict, kind))
+
+def _candidate(candidates, value):
+  """
+  :returns: the class of a union matching value, by its enumerated type when it has one
+  """
+  if not isinstance(value, dict):
+    return type(value) if isinstance(value, candidates) else candidates[0]
+  for cls in candidates:
+    for name, kind, enum in fields.class_fields(cls):
+      if name == 'type' and enum is not None and value.get('type') in enum:
+        return cls
+  for cls in candidates:
+    if all(key in cls.cls_keys for key in value):
+      return cls
+  return candidates[0]
+
+"""
+Field coverage statistics of evidence objects or raw dicts
+"""
+class FieldProfiler(object):
+  """
+  Each record is walked once along the fields known to its classes
+  (fields.class_fields, i.e. cls_keys, cls_types and cls_enums), nested
+  objects and array items included, so that the fields of an object are
+  reported even when no record gives them. For each field path, e.g. 'evidence.variant2disease.gwas_sample_size'
+  or 'target.complex_members', the profiler counts:
+  - parents: times the object holding the field was seen
+  - present: times the field held a value
+  - null: times a raw dict held the field with a null value
+  - mismatch: times the value was not of the field type; it is not walked further
+  - values: frequencies of the values of enumerated fields
+  Array items share the path of their array. Profilers of parallel runs are
+  combined with merge().
+  """
+  def __init__(self):
+    self.records = collections.Counter()
+    self.counts = collections.defaultdict(lambda: [0, 0, 0, 0])
+    self.values = collections.defaultdict(collections.Counter)
+
+  def add(self, record):
+    """
+    Profile an evidence object or a raw evidence dict, the class of a dict
+    being found from its type; dicts of unknown type are only counted
+    """
+    if isinstance(record, dict):
+      cls = core.EVIDENCE_CLASSES.get(record.get('type'))
+      self.records[record.get('type') if cls is None else cls.__name__] += 1
+      if cls is None:
+        return
+    else:
+      cls = type(record)
+      self.records[cls.__name__] += 1
+    self._walk(cls, record, '')
+
+  def update(self, records):
+    for record in records:
+      self.add(record)
+    return self
+
+  def _walk(self, cls, obj, prefix):
+    is_dict = isinstance(obj, dict)
+    for name, kind, enum in fields.class_fields(cls):
+      path = prefix + name
+      counts = self.counts[path]
+      counts[0] += 1
+      value = obj.get(name, _MISSING) if is_dict else getattr(obj, name, None)
+      if value is _MISSING:
+        continue
+      if value is None:
+        if is_dict:
+          counts[2] += 1
+        continue
+      counts[1] += 1
+      if isinstance(kind, list):
+        if not isinstance(value, list) or not all(_matches(kind[0], item) for item in value):
+          counts[3] += 1
+          continue
+        items = value
+        kind = kind[0]
+      elif not _matches(kind, value):
+        counts[3] += 1
+        continue
+      else:
+        items = (value,)
+      if enum is not None:
+        values = self.values[path]
+        for item in items:
+          values[item if isinstance(item, six.string_types) else repr(item)] += 1
+      if isinstance(kind, tuple):
+        for item in items:
+          self._walk(_candidate(kind, item), item, path + '.')
+      elif not kind in fields.JSON_TYPES:
+        for item in items:
+          self._walk(kind, item, path + '.')
+
+  def merge(self, other):
+    """
+    Add the counts of another profiler, e.g. of another part of a release
+    :returns: self
+    """
+    self.records.update(other.records)
+    for path, counts in other.counts.items():
+      mine = self.counts[path]
+      for i, count in enumerate(counts):
+        mine[i] += count
+    for path, values in other.values.items():
+      self.values[path].update(values)
+    return self
+
+  def report(self):
+    """
+    :returns: dict of field path to dict of the counts, the coverage (present / parents) and the enumerated value frequencies
+    """
+    report = dict()
+    for path in sorted(self.counts):
+      parents, present, null, mismatch = self.counts[path]
+      report[path] = {'parents': parents, 'present': present, 'null': null, 'mismatch': mismatch,
+                      'coverage': float(present) / parents if parents else 0.0}
+      if path in self.values:
+        report[path]['values'] = dict(self.values[path])
+    return report
+
+  def __getstate__(self):
+    return {'records': self.records, 'counts': dict(self.counts), 'values': dict(self.values)}
+
+  def __setstate__(self, state):
+    self.__init__()
+    self.records.update(state['records'])
+    self.counts.update(state['counts'])
+    self.values.update(state['values'])
@@ -0,0 +1,168 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import numbers
+import logging
+import six
+import opentargets.model.core as core
+import opentargets.model.fields as fields
+import opentargets.model.evidence.core as evidence_core
+import opentargets.model.evidence.genetics as evidence_genetics
+import opentargets.model.evidence.mutation as evidence_mutation
+import opentargets.model.evidence.association_score as evidence_association_score
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+# numeric constraints of the schema, as checked by the generated validate() methods
+RANGES = {
+  evidence_association_score.Probability: {'value': {'minimum': 0, 'exclusiveMinimum': True, 'maximum': 1}},
+  evidence_association_score.Pvalue: {'value': {'minimum': 0, 'exclusiveMinimum': True, 'maximum': 1}},
+  evidence_association_score.Rank: {'position': {'minimum': 1}, 'sample_size': {'minimum': 1}},
+  evidence_association_score.Summed_Total: {'value': {'minimum': 0, 'exclusiveMinimum': True}},
+  evidence_core.Base_Mined_Sentences_Item: {'t_start': {'minimum': 0}, 't_end': {'minimum': 0}, 'd_start': {'minimum': 0}, 'd_end': {'minimum': 0}},
+  evidence_core.Expression: {'test_replicates_n': {'minimum': 1}, 'reference_replicates_n': {'minimum': 1}},
+  evidence_genetics.Variant2Disease: {'gwas_panel_resolution': {'minimum': 0, 'exclusiveMinimum': True}, 'gwas_sample_size': {'minimum': 0, 'exclusiveMinimum': True}},
+  evidence_mutation.Mutation: {'number_samples_tested': {'minimum': 0}, 'number_samples_with_mutation_type': {'minimum': 0}, 'number_mutated_samples': {'minimum': 0}},
+}
+
+_plans = dict()
+
+def _describe(bounds):
+  """
+  :returns: the wording of the generated messages, e.g. 'should be greater than 0 and should be lower than or equal to 1'
+  """
+  parts = []
+  if 'minimum' in bounds:
+    parts.append('should be greater than {0}{1}'.format('' if bounds.get('exclusiveMinimum') else 'or equal to ', bounds['minimum']))
+  if 'maximum' in bounds:
+    parts.append('should be lower than {0}{1}'.format('' if bounds.get('exclusiveMaximum') else 'or equal to ', bounds['maximum']))
+  return ' and '.join(parts)
+
+def plan(cls):
+  """
+  Ranged fields reachable from a generated class, array items included
+  :returns: list of (segments, type values, ranged class) tuples, None
+  standing for array items in segments; type values, when not None, are the
+  'type' values selecting the ranged class among the candidates of a union
+  """
+  if cls in _plans:
+    return _plans[cls]
+  result = []
+  def walk(klass, segments, guard, seen):
+    if klass in RANGES:
+      result.append((segments, guard, klass))
+    for name, kind, enum in fields.class_fields(klass):
+      path = segments + (name,)
+      if isinstance(kind, list):
+        kind, path = kind[0], path + (None,)
+      candidates = kind if isinstance(kind, tuple) else (kind,)
+      for i, candidate in enumerate(candidates):
+        if not isinstance(candidate, type) or candidate in seen:
+          continue
+        types = None
+        if len(candidates) > 1:
+          types = dict((field[0], field[2]) for field in fields.class_fields(candidate)).get('type')
+          if types is None and i > 0:
+            # as fromDict, the first candidate takes the values no type tells apart
+            continue
+        walk(candidate, path, types, seen + (candidate,))
+  walk(cls, (), None, (cls,))
+  _plans[cls] = result
+  return result
+
+def _outside(values, bounds):
+  """
+  :returns: indices of the values outside bounds, as array operations when numpy is available
+  """
+  if numpy is not None:
+    array = numpy.asarray(values, dtype=float)
+    bad = numpy.zeros(len(values), dtype=bool)
+    if 'minimum' in bounds:
+      bad |= (array <= bounds['minimum']) if bounds.get('exclusiveMinimum') else (array < bounds['minimum'])
+    if 'maximum' in bounds:
+      bad |= (array >= bounds['maximum']) if bounds.get('exclusiveMaximum') else (array > bounds['maximum'])
+    return numpy.flatnonzero(bad).tolist()
+  bad = []
+  for i, value in enumerate(values):
+    if 'minimum' in bounds and (value <= bounds['minimum'] if bounds.get('exclusiveMinimum') else value < bounds['minimum']):
+      bad.append(i)
+    elif 'maximum' in bounds and (value >= bounds['maximum'] if bounds.get('exclusiveMaximum') else value > bounds['maximum']):
+      bad.append(i)
+  return bad
+
+def check_ranges(records, logger = None, path = "root"):
+  """
+  Check the numeric fields of a chunk of evidence records, raw dicts or
+  model objects of any type, against the constraints of RANGES: the values
+  of each field are gathered over the chunk, array items included, and
+  compared with its bounds at once. Values that are not numbers (booleans
+  included) are reported too, where the generated validate() methods would
+  fail on the comparison. The candidate of a union (e.g. resource_score) is
+  chosen by its 'type' value. Required fields are left to validate().
+  Arguments:
+  :param records = list of evidence records
+  :param logger = logger receiving the messages, in the format of the generated classes
+  :param path = path of each record in the messages
+  :returns: list of (record index, field path, message) tuples, by record index
+  """
+  get_type = fields.compile_path('type')
+  groups = dict()
+  for index, record in enumerate(records):
+    cls = core.EVIDENCE_CLASSES.get(get_type(record))
+    if cls is not None:
+      groups.setdefault(cls, []).append(index)
+  violations = []
+  for cls, indices in groups.items():
+    for segments, types, klass in plan(cls):
+      holders = []
+      for index in indices:
+        for label, holder in fields.holders(records[index], segments, path):
+          if types is None or get_type(holder) in types:
+            holders.append((index, label, holder))
+      for name, bounds in sorted(RANGES[klass].items()):
+        get = fields.compile_path(name)
+        rows, labels, values = [], [], []
+        for index, label, holder in holders:
+          value = get(holder)
+          if value is None:
+            continue
+          if isinstance(value, numbers.Number) and not isinstance(value, bool):
+            rows.append(index)
+            labels.append(label)
+            values.append(value)
+          else:
+            violations.append((index, '{0}.{1}'.format(label, name), "{0} - {1}.{2} type should be a number".format(klass.__name__, label, name)))
+        for i in _outside(values, bounds):
+          violations.append((rows[i], '{0}.{1}'.format(labels[i], name), "{0} - {1}.{2}: {3} {4}".format(klass.__name__, labels[i], name, values[i], _describe(bounds))))
+  violations.sort(key=lambda violation: violation[0])
+  if logger is not None:
+    for index, field, message in violations:
+      logger.error(message)
+  return violations
@@ -0,0 +1,188 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import re
+import json
+import logging
+import six
+import opentargets.model.fields as fields
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+# fields needed to route an evidence line to its class or partition
+HEADER_FIELDS = ('type', 'sourceID', 'access_level', 'target.id', 'disease.id')
+
+# unrolled form, much faster than an alternation per character
+_STRING = b'"[^"\\\\]*(?:\\\\.[^"\\\\]*)*"'
+_STRING_ARRAY = b'\\[\\s*(?:' + _STRING + b'\\s*(?:,\\s*' + _STRING + b'\\s*)*)?\\]'
+_STRINGS = re.compile(_STRING)
+_TOKEN = re.compile(_STRING + b'|[][{}]')
+_KEY_VALUE = re.compile(_STRING + b'\\s*:\\s*(' + _STRING + b'|' + _STRING_ARRAY + b'|-?[0-9][0-9.eE+-]*|true|false|null)?')
+
+class AmbiguousField(Exception):
+  pass
+
+def _nesting(line, start, end):
+  """
+  Change of nesting depth between two positions lying outside of strings
+  """
+  segment = line[start:end]
+  if b'\\"' in segment:
+    segment = _STRINGS.sub(b'', segment)
+  else:
+    # without escaped quotes every other piece is the content of a string
+    segment = b''.join(segment.split(b'"')[0::2])
+  return segment.count(b'{') + segment.count(b'[') - segment.count(b'}') - segment.count(b']')
+
+def _object_end(line, start):
+  """
+  :returns: position after the object opening at start
+  """
+  depth = 0
+  for token in _TOKEN.finditer(line, start):
+    c = token.group(0)
+    if c in (b'{', b'['):
+      depth = depth + 1
+    elif c in (b'}', b']'):
+      depth = depth - 1
+      if depth == 0:
+        return token.end()
+  raise AmbiguousField('unterminated object')
+
+"""
+Byte-level extraction of a few routing fields from raw evidence lines
+"""
+class HeaderScanner(object):
+  """
+  Pull top-level and one-level-nested leaf fields (e.g. 'sourceID',
+  'target.id') out of a JSON evidence line without decoding it. Candidate
+  keys are located with plain byte searches and the nesting depth of each
+  one is obtained by counting brackets outside of strings, so the large
+  evidence subtree is never decoded. When a field is duplicated, does not
+  hold a string, a number or an array of strings, or the line is not a
+  JSON object, the line is fully parsed instead.
+  Arguments:
+  :param paths = dotted paths of the fields to extract, at most two levels deep
+  """
+  def __init__(self, paths = HEADER_FIELDS):
+    self.paths = list(paths)
+    self.fallbacks = 0
+    self._plan = []
+    names = set()
+    for path in self.paths:
+      segments = fields.split_path(path)
+      if len(segments) > 2 or not all(isinstance(s, six.string_types) for s in segments):
+        raise ValueError("HeaderScanner - only top-level and one-level-nested fields are supported ('{0}' given)".format(path))
+      self._plan.append((path, tuple(segments)))
+      names.update(segments)
+    self._parents = set(segments[0] for _, segments in self._plan if len(segments) == 2)
+    self._quoted = [(name, json.dumps(name).encode('utf-8')) for name in sorted(names)]
+
+  def scan(self, line):
+    """
+    :returns: dict of path to value, None standing for missing fields
+    """
+    return self.scan_line(line)[0]
+
+  def scan_line(self, line):
+    """
+    As scan, also giving the record when the line had to be parsed, so
+    that callers needing it do not parse the line again
+    :returns: tuple of (dict of path to value, parsed record or None)
+    """
+    if isinstance(line, six.text_type):
+      line = line.encode('utf-8')
+    try:
+      return self._scan(line), None
+    except AmbiguousField:
+      self.fallbacks = self.fallbacks + 1
+      record = json.loads(line.decode('utf-8'))
+      return dict((path, fields.get_field(record, path)) for path in self.paths), record
+
+  def _scan(self, line):
+    start = len(line) - len(line.lstrip())
+    if line[start:start + 1] != b'{':
+      raise AmbiguousField('not an object')
+    candidates = []
+    for name, quoted in self._quoted:
+      position = line.find(quoted, start)
+      while position != -1:
+        if line[position - 1:position] == b'\\':
+          # inside a string, after an escaped quote
+          raise AmbiguousField('escaped key')
+        candidates.append((position, name))
+        position = line.find(quoted, position + len(quoted))
+    candidates.sort()
+    found = dict()
+    level = 0
+    previous = start
+    parent = None
+    parent_end = 0
+    for position, name in candidates:
+      level = level + _nesting(line, previous, position)
+      previous = position
+      if level > 2 or (level == 2 and (parent is None or position >= parent_end)):
+        continue
+      match = _KEY_VALUE.match(line, position)
+      if match is None:
+        # a string value, not a key
+        continue
+      value = match.group(1)
+      if level == 1:
+        path = (name,)
+        if name in self._parents and value is None:
+          if line[match.end():match.end() + 1] != b'{':
+            raise AmbiguousField('not an object')
+          parent = name
+          parent_end = _object_end(line, match.end())
+      else:
+        path = (parent, name)
+      if path in found:
+        raise AmbiguousField('duplicated key')
+      found[path] = value
+    values = dict()
+    for path, segments in self._plan:
+      value = found.get(segments)
+      if value is None or value == b'null':
+        if segments in found and value is None and len(segments) == 1 and not segments[0] in self._parents:
+          raise AmbiguousField('not a leaf value')
+        values[path] = None
+      elif value[:1] == b'"' and not b'\\' in value:
+        # the common case needs no JSON decoding
+        values[path] = value[1:-1].decode('utf-8')
+      else:
+        values[path] = json.loads(value.decode('utf-8'))
+    return values
+
+_scanner = HeaderScanner()
+
+def peek_header(line):
+  """
+  Routing fields (type, sourceID, access_level, target.id and disease.id)
+  of a raw evidence line
+  :returns: dict of path to value
+  """
+  return _scanner.scan(line)
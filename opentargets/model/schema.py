@@ -0,0 +1,492 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import re
+import sys
+import json
+import types
+import marshal
+import hashlib
+import tempfile
+import logging
+import six
+from six.moves.urllib.parse import urljoin
+from six.moves.urllib.request import urlopen
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+# bump whenever the generated code changes so that cached validators are rebuilt
+COMPILER_VERSION = 2
+
+def load_schema(location):
+  """
+  Load a JSON schema document from a file path or an http(s) URL
+  :returns: the schema as a dict
+  """
+  if re.match('^https?://', location):
+    response = urlopen(location)
+    try:
+      return json.loads(response.read().decode('utf-8'))
+    finally:
+      response.close()
+  with open(location, 'rb') as f:
+    return json.loads(f.read().decode('utf-8'))
+
+def _class_name(uri):
+  """
+  Name reported in error messages, following the generated classes:
+  'src/bioentity/target.json' gives 'Target', '#/definitions/single_lit_reference' gives 'Single_Lit_Reference'
+  """
+  name = uri.rstrip('/').split('/')[-1]
+  if name.endswith('.json'):
+    name = name[:-len('.json')]
+  return '_'.join(part.capitalize() for part in name.split('_')) or 'Schema'
+
+def _literal(text):
+  """
+  Escape a string for use inside a str.format template
+  """
+  return text.replace('{', '{{').replace('}', '}}')
+
+"""
+Runtime compiler from JSON schema rules to flat python validators
+"""
+class SchemaCompiler(object):
+  """
+  Each object definition of a schema (the document itself, inner objects
+  and $ref targets) becomes one specialized function checking required,
+  type, enum, pattern, format, minimum/maximum, minLength/maxLength,
+  minItems/maxItems, uniqueItems, items, additionalProperties and
+  anyOf/oneOf rules. The functions accept raw dicts as well as instances
+  of the generated classes, log errors in the same format as the generated
+  validate() methods and return the number of errors found.
+  The generated module is compiled with compile() and, when cache_dir is
+  given, its code object is stored on disk keyed on the content of every
+  schema document involved, so a new schema version is picked up without
+  a package release.
+  Arguments:
+  :param cache_dir = directory holding compiled validators, None disables the cache
+  :param loader = callable loading a schema document from a path or URL
+  """
+  def __init__(self, cache_dir = None, loader = load_schema):
+    self.cache_dir = cache_dir
+    self.loader = loader
+    self.documents = dict()
+    self.cache_hits = 0
+    self.source = None
+
+  def compile_location(self, location, name = None):
+    """
+    Compile the schema found at a file path or URL
+    :returns: validator function (data, logger, path = "root") -> number of errors
+    """
+    if not re.match('^https?://', location):
+      location = os.path.abspath(location)
+    if not location in self.documents:
+      self.documents[location] = self.loader(location)
+    return self.compile(self.documents[location], name = name, base_uri = location)
+
+  def compile(self, schema, name = None, base_uri = ''):
+    """
+    Compile a schema document
+    :returns: validator function (data, logger, path = "root") -> number of errors
+    """
+    name = name or schema.get('title') or _class_name(base_uri)
+    documents = dict()
+    self._collect(schema, base_uri, documents)
+    key = self._key(schema, name, base_uri, documents)
+    code = self._load_cached(key)
+    if code is None:
+      self.source = _Generator(self, documents).module(schema, base_uri, name)
+      code = compile(self.source, '<schema {0}>'.format(name), 'exec')
+      self._store_cached(key, code)
+    else:
+      self.cache_hits = self.cache_hits + 1
+    namespace = dict()
+    six.exec_(code, namespace)
+    return namespace['validate']
+
+  def resolve(self, ref, base_uri, documents = None):
+    """
+    Resolve a $ref relative to the document it appears in
+    :returns: tuple of (schema, uri of the document holding it, uri of the schema)
+    """
+    location, _, pointer = ref.partition('#')
+    if location:
+      if re.match('^https?://', base_uri) or re.match('^https?://', location):
+        uri = urljoin(base_uri, location)
+      else:
+        uri = os.path.normpath(os.path.join(os.path.dirname(base_uri), location))
+    else:
+      uri = base_uri
+    if documents is not None and uri in documents:
+      schema = documents[uri]
+    else:
+      if not uri in self.documents:
+        self.documents[uri] = self.loader(uri)
+      schema = self.documents[uri]
+    for token in [t for t in pointer.split('/') if t]:
+      schema = schema[token.replace('~1', '/').replace('~0', '~')]
+    return schema, uri, uri + ('#' + pointer if pointer else '')
+
+  def _collect(self, schema, base_uri, documents):
+    """
+    Load every document reachable through $ref
+    """
+    if isinstance(schema, dict):
+      if isinstance(schema.get('$ref'), six.string_types):
+        location = schema['$ref'].partition('#')[0]
+        if location:
+          _, uri, _ = self.resolve(location, base_uri)
+          if not uri in documents:
+            documents[uri] = self.documents[uri]
+            self._collect(documents[uri], uri, documents)
+      for value in schema.values():
+        self._collect(value, base_uri, documents)
+    elif isinstance(schema, list):
+      for value in schema:
+        self._collect(value, base_uri, documents)
+
+  def _key(self, schema, name, base_uri, documents):
+    digest = hashlib.sha1()
+    parts = [str(COMPILER_VERSION), sys.version, name, base_uri, json.dumps(schema, sort_keys=True)]
+    for uri in sorted(documents):
+      parts.append(uri)
+      parts.append(json.dumps(documents[uri], sort_keys=True))
+    for part in parts:
+      digest.update(part.encode('utf-8'))
+    return digest.hexdigest()
+
+  def _load_cached(self, key):
+    if self.cache_dir is None:
+      return None
+    filename = os.path.join(self.cache_dir, key + '.code')
+    if not os.path.exists(filename):
+      return None
+    try:
+      with open(filename, 'rb') as f:
+        return marshal.load(f)
+    except (EOFError, ValueError, TypeError) as e:
+      logger.warn("SchemaCompiler - ignoring unreadable cache file {0}: {1}".format(filename, e))
+      return None
+
+  def _store_cached(self, key, code):
+    if self.cache_dir is None:
+      return
+    try:
+      os.makedirs(self.cache_dir)
+    except OSError:
+      if not os.path.isdir(self.cache_dir):
+        raise
+    filename = os.path.join(self.cache_dir, key)
+    # the source is written first, so that it is there for any code file found
+    if not os.path.exists(filename + '.py'):
+      _write_atomic(filename + '.py', self.source.encode('utf-8'))
+    _write_atomic(filename + '.code', marshal.dumps(code))
+
+def _write_atomic(filename, data):
+  """
+  Write data to a temporary file of the same directory renamed to filename,
+  so that concurrent workers never read or import a partial file
+  """
+  fd, tmp_filename = tempfile.mkstemp(prefix=os.path.basename(filename) + '.', suffix='.tmp', dir=os.path.dirname(filename))
+  try:
+    with os.fdopen(fd, 'wb') as f:
+      f.write(data)
+    os.rename(tmp_filename, filename)
+  except OSError:
+    if os.path.exists(tmp_filename):
+      os.remove(tmp_filename)
+    raise
+
+_PREAMBLE = '''import re
+import numbers
+import iso8601
+import six
+import opentargets.model.loggers as _loggers
+
+_silent = _loggers.Silent()
+
+def _as_dict(data):
+  if isinstance(data, dict):
+    return data
+  return getattr(data, '__dict__', None)
+
+def _is_object(value):
+  return isinstance(value, dict) or hasattr(value, '__dict__')
+
+def _is_date(value):
+  try:
+    iso8601.parse_date(value)
+    return True
+  except iso8601.ParseError:
+    return False
+
+def _unique(values):
+  seen = set()
+  for value in values:
+    if isinstance(value, (dict, list)) or hasattr(value, '__dict__'):
+      value = repr(_as_dict(value) if hasattr(value, '__dict__') else value)
+    if value in seen:
+      return False
+    seen.add(value)
+  return True
+'''
+
+_TYPE_CHECKS = {
+  'string': ('isinstance({0}, six.string_types)', 'a string'),
+  'number': ('isinstance({0}, numbers.Number) and not isinstance({0}, bool)', 'a number'),
+  'integer': ('isinstance({0}, six.integer_types) and not isinstance({0}, bool)', 'an integer'),
+  'boolean': ('isinstance({0}, bool)', 'a boolean'),
+  'array': ('isinstance({0}, list)', 'an array'),
+  'object': ('_is_object({0})', 'an object'),
+}
+
+class _Generator(object):
+  """
+  Emit the source of one python module holding a validator per object definition
+  """
+  def __init__(self, compiler, documents):
+    self.compiler = compiler
+    self.documents = documents
+    self.constants = []
+    self.functions = []
+    self.names = dict()
+    self.pending = []
+
+  def module(self, schema, base_uri, name):
+    root = self.object_function(schema, base_uri, name, base_uri or name)
+    while self.pending:
+      self.functions.extend(self.emit_object(*self.pending.pop(0)))
+    lines = [_PREAMBLE]
+    lines.extend(self.functions)
+    # constants are only read at call time, and may refer to the functions above
+    lines.extend(self.constants)
+    lines.append('')
+    lines.append('def validate(data, logger, path = "root"):')
+    lines.append('  return {0}(data, logger, path)'.format(root))
+    return '\n'.join(lines) + '\n'
+
+  def constant(self, value):
+    name = '_c{0}'.format(len(self.constants))
+    self.constants.append('{0} = {1}'.format(name, value))
+    return name
+
+  def object_function(self, schema, base_uri, name, key):
+    """
+    :returns: name of the function validating object schema, queuing its generation
+    """
+    if not key in self.names:
+      self.names[key] = '_validate_{0}_{1}'.format(len(self.names), re.sub('[^A-Za-z0-9_]', '_', name))
+      self.pending.append((self.names[key], schema, base_uri, name))
+    return self.names[key]
+
+  def value_function(self, schema, base_uri, name):
+    """
+    :returns: name of a function validating any value against schema, used for anyOf/oneOf alternatives
+    """
+    fname = '_check_{0}_{1}'.format(len(self.functions), re.sub('[^A-Za-z0-9_]', '_', name))
+    lines = ['def {0}(value, logger, path):'.format(fname), '  error = 0']
+    lines.extend(self.emit_value(schema, base_uri, name, 'value', '{0}', 'path', '  ', 0))
+    lines.extend(['  return error', ''])
+    self.functions.extend(lines)
+    return fname
+
+  def deref(self, schema, base_uri):
+    key = None
+    while isinstance(schema, dict) and '$ref' in schema:
+      schema, base_uri, key = self.compiler.resolve(schema['$ref'], base_uri, self.documents)
+    return schema, base_uri, key
+
+  def merged(self, schema, base_uri):
+    """
+    Flatten allOf parts into a single set of properties and required fields
+    :returns: tuple of (properties as list of (name, schema, base uri), required names, additionalProperties)
+    """
+    properties = []
+    required = set(schema.get('required', [])) if isinstance(schema.get('required'), list) else set()
+    additional = schema.get('additionalProperties', True)
+    for part in schema.get('allOf', []):
+      part, part_uri, _ = self.deref(part, base_uri)
+      part_properties, part_required, part_additional = self.merged(part, part_uri)
+      properties.extend(part_properties)
+      required.update(part_required)
+      if part_additional is False:
+        additional = False
+    for name, prop in schema.get('properties', {}).items():
+      properties = [p for p in properties if p[0] != name]
+      properties.append((name, prop, base_uri))
+      if isinstance(prop, dict) and prop.get('required') is True:
+        required.add(name)
+    return properties, required, additional
+
+  def emit_object(self, fname, schema, base_uri, name):
+    properties, required, additional = self.merged(schema, base_uri)
+    lines = ['def {0}(data, logger, path):'.format(fname),
+             '  values = _as_dict(data)',
+             '  if values is None:',
+             '    logger.error("{0} - {{0}} should be an object".format(path))'.format(_literal(name)),
+             '    return 1',
+             '  error = 0']
+    for prop_name, prop, prop_uri in sorted(properties, key=lambda p: p[0]):
+      label = '{0}.' + _literal(prop_name)
+      lines.append('  value = values.get({0!r})'.format(str(prop_name)))
+      lines.append('  if value is None:')
+      if prop_name in required:
+        lines.append('    logger.error("{0} - {1} is required".format(path))'.format(_literal(name), label))
+        lines.append('    error = error + 1')
+      else:
+        lines.append('    pass')
+      lines.append('  else:')
+      inner_name = name + prop_name[:1].upper() + prop_name[1:]
+      lines.extend(self.emit_value(prop, prop_uri, inner_name, 'value', label, 'path', '    ', 0, owner = name))
+    if additional is False:
+      allowed = self.constant('frozenset({0!r})'.format(sorted(str(p[0]) for p in properties)))
+      lines.append('  if isinstance(data, dict):')
+      lines.append('    for key in data:')
+      lines.append('      if not key in {0}:'.format(allowed))
+      lines.append('        logger.error("{0} - {{0}}.{{1}} is not an allowed field".format(path, key))'.format(_literal(name)))
+      lines.append('        error = error + 1')
+    lines.extend(['  return error', ''])
+    return lines
+
+  def emit_value(self, schema, base_uri, name, var, label, args, indent, depth, owner = None):
+    """
+    Lines checking var, known not to be None, against schema; errors are
+    reported as '<owner> - <label formatted with args> ...'
+    """
+    schema, base_uri, key = self.deref(schema, base_uri)
+    owner = owner or name
+    if key is not None:
+      name = _class_name(key)
+    prefix = _literal(owner) + ' - ' + label
+    lines = []
+    if not isinstance(schema, dict):
+      return [indent + 'pass']
+    path_expr = '"{0}".format({1})'.format(label, args)
+    if 'properties' in schema or 'allOf' in schema:
+      fname = self.object_function(schema, base_uri, name, key or (base_uri, id(schema)))
+      lines.append(indent + 'error = error + {0}({1}, logger, {2})'.format(fname, var, path_expr))
+      return lines
+    alternatives = schema.get('anyOf') or schema.get('oneOf')
+    if alternatives:
+      checks = self.constant('[{0}]'.format(', '.join(self.value_function(alternative, base_uri, name) for alternative in alternatives)))
+      lines.append(indent + 'matches = len([check for check in {0} if check({1}, _silent, "") == 0])'.format(checks, var))
+      lines.append(indent + 'if {0}:'.format('matches != 1' if 'oneOf' in schema else 'matches == 0'))
+      lines.append(indent + '  logger.error("{0} does not match {1} of the allowed schemas".format({2}))'.format(prefix, 'exactly one' if 'oneOf' in schema else 'any', args))
+      lines.append(indent + '  error = error + 1')
+      return lines
+    kinds = schema.get('type')
+    if isinstance(kinds, six.string_types):
+      kinds = [kinds]
+    kinds = [kind for kind in (kinds or []) if kind in _TYPE_CHECKS]
+    if not kinds:
+      lines.extend(self.emit_constraints(schema, base_uri, name, None, var, label, args, prefix, indent, depth))
+      return lines or [indent + 'pass']
+    for i, kind in enumerate(kinds):
+      condition = _TYPE_CHECKS[kind][0].format(var)
+      lines.append(indent + ('if {0}:' if i == 0 else 'elif {0}:').format(condition))
+      lines.extend(self.emit_constraints(schema, base_uri, name, kind, var, label, args, prefix, indent + '  ', depth) or [indent + '  pass'])
+    expected = ' or '.join(_TYPE_CHECKS[kind][1] for kind in kinds)
+    lines.append(indent + 'else:')
+    lines.append(indent + '  logger.error("{0} type should be {1}".format({2}))'.format(prefix, expected, args))
+    lines.append(indent + '  error = error + 1')
+    return lines
+
+  def emit_constraints(self, schema, base_uri, name, kind, var, label, args, prefix, indent, depth):
+    lines = []
+    n = len(args.split(','))
+    def error(message, extra = '', separator = ' '):
+      lines.append(indent + '  logger.error("{0}{1}{2}".format({3}{4}))'.format(prefix, separator, message, args, extra))
+      lines.append(indent + '  error = error + 1')
+    if 'enum' in schema:
+      values = schema['enum']
+      hashable = all(isinstance(v, (six.string_types, six.integer_types, float, bool)) or v is None for v in values)
+      enum = self.constant(('frozenset({0!r})'.format(list(values)) if hashable and kind in ('string', 'number', 'integer', 'boolean') else repr(list(values))))
+      lines.append(indent + 'if not {0} in {1}:'.format(var, enum))
+      error(_literal('value is restricted to the fixed set of values ' + ','.join(repr(v) for v in values)) + " ('{%d}' given)" % n, ', ' + var)
+    if kind in ('string', None):
+      guard = '' if kind == 'string' else 'isinstance({0}, six.string_types) and '.format(var)
+      if 'pattern' in schema:
+        regex = self.constant('re.compile({0!r})'.format(schema['pattern']))
+        lines.append(indent + 'if {0}not {1}.search({2}):'.format(guard, regex, var))
+        error("'{%d}' " % n + _literal('does not match pattern {0!r}'.format(schema['pattern'])), ', ' + var)
+      if 'minLength' in schema:
+        lines.append(indent + 'if {0}len({1}) < {2}:'.format(guard, var, int(schema['minLength'])))
+        error('should have at least {0} characters'.format(int(schema['minLength'])))
+      if 'maxLength' in schema:
+        lines.append(indent + 'if {0}len({1}) > {2}:'.format(guard, var, int(schema['maxLength'])))
+        error('should have at most {0} characters'.format(int(schema['maxLength'])))
+      if schema.get('format') == 'date-time':
+        lines.append(indent + 'if {0}not _is_date({1}):'.format(guard, var))
+        error("'{%d}' invalid ISO 8601 date (YYYY-MM-DDThh:mm:ss.sTZD expected)" % n, ', ' + var)
+    if kind in ('number', 'integer'):
+      bounds = [('minimum', 'exclusiveMinimum', '<', 'greater than'), ('maximum', 'exclusiveMaximum', '>', 'lower than')]
+      for bound, exclusive, operator, text in bounds:
+        limit = schema.get(bound)
+        strict = schema.get(exclusive)
+        if isinstance(strict, bool) or strict is None:
+          strict = bool(strict)
+        else:
+          # draft 6 and later, exclusive bounds are numbers on their own
+          limit, strict = strict, True
+        if limit is None:
+          continue
+        # an exclusive bound also rejects the limit itself
+        lines.append(indent + 'if {0} {1}{2} {3!r}:'.format(var, operator, '=' if strict else '', limit))
+        error(': {%d} should be %s%s %r' % (n, text, '' if strict else ' or equal to', limit), ', ' + var, '')
+    if kind == 'array':
+      if 'minItems' in schema:
+        lines.append(indent + 'if len({0}) < {1}:'.format(var, int(schema['minItems'])))
+        error('array should have at least {0} elements'.format(int(schema['minItems'])))
+      if 'maxItems' in schema:
+        lines.append(indent + 'if len({0}) > {1}:'.format(var, int(schema['maxItems'])))
+        error('array should have at most {0} elements'.format(int(schema['maxItems'])))
+      if schema.get('uniqueItems'):
+        lines.append(indent + 'if not _unique({0}):'.format(var))
+        error('array have duplicated elements')
+      items = schema.get('items')
+      if isinstance(items, dict) and items:
+        item, index = 'item{0}'.format(depth), 'i{0}'.format(depth)
+        item_label = label + '[{%d}]' % n
+        item_args = args + ', ' + index
+        lines.append(indent + 'for {0}, {1} in enumerate({2}):'.format(index, item, var))
+        lines.append(indent + '  if {0} is None:'.format(item))
+        lines.append(indent + '    logger.error("{0}[{{{1}}}] should not be null".format({2}))'.format(prefix, n, item_args))
+        lines.append(indent + '    error = error + 1')
+        lines.append(indent + '  else:')
+        lines.extend(self.emit_value(items, base_uri, name, item, item_label, item_args, indent + '    ', depth + 1, owner = prefix.split(' - ')[0]))
+    if kind == 'object':
+      additional = schema.get('additionalProperties')
+      if isinstance(additional, dict) and additional:
+        entry, key = 'entry{0}'.format(depth), 'key{0}'.format(depth)
+        entry_label = label + '.{%d}' % n
+        entry_args = args + ', ' + key
+        lines.append(indent + 'for {0}, {1} in _as_dict({2}).items():'.format(key, entry, var))
+        lines.append(indent + '  if {0} is not None:'.format(entry))
+        lines.extend(self.emit_value(additional, base_uri, name, entry, entry_label, entry_args, indent + '    ', depth + 1, owner = prefix.split(' - ')[0]))
+    return lines
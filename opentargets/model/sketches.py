@@ -0,0 +1,390 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import math
+import struct
+import hashlib
+import logging
+import numbers
+import six
+import opentargets.model.fields as fields
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+def hash64(value):
+  """
+  64 bit hash of a string, stable across processes and python versions,
+  unlike hash()
+  :returns: int
+  """
+  if isinstance(value, six.text_type):
+    value = value.encode('utf-8')
+  elif not isinstance(value, bytes):
+    value = repr(value).encode('utf-8')
+  return struct.unpack('<Q', hashlib.md5(value).digest()[:8])[0]
+
+"""
+HyperLogLog distinct count estimate
+"""
+class HyperLogLog(object):
+  """
+  Distinct values are estimated from 2^precision one byte registers, with a
+  relative standard error of about 1.04 / sqrt(2^precision), 0.8% for the
+  default precision of 14 (16KB per sketch).
+  Arguments:
+  :param precision = number of hash bits indexing the registers, from 4 to 18
+  """
+  def __init__(self, precision = 14):
+    if precision < 4 or precision > 18:
+      raise ValueError("HyperLogLog - precision should be between 4 and 18")
+    self.precision = precision
+    self.registers = bytearray(1 << precision)
+
+  def add(self, value):
+    h = hash64(value)
+    index = h >> (64 - self.precision)
+    width = 64 - self.precision
+    rank = width - (h & ((1 << width) - 1)).bit_length() + 1
+    if rank > self.registers[index]:
+      self.registers[index] = rank
+
+  def merge(self, other):
+    """
+    Merge the sketch of another partition of the values into this one
+    :returns: self
+    """
+    if other.precision != self.precision:
+      raise ValueError("HyperLogLog - can not merge sketches of precision {0} and {1}".format(self.precision, other.precision))
+    self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+    return self
+
+  def count(self):
+    """
+    :returns: estimated number of distinct values added
+    """
+    m = len(self.registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / sum(math.ldexp(1.0, -r) for r in self.registers)
+    zeros = self.registers.count(0)
+    if estimate <= 2.5 * m and zeros > 0:
+      # linear counting is more accurate on small cardinalities
+      estimate = m * math.log(float(m) / zeros)
+    return int(round(estimate))
+
+"""
+Count-min sketch of value frequencies keeping the most frequent values
+"""
+class CountMinSketch(object):
+  """
+  Frequencies are over-estimated by at most e * total / width with a
+  probability of 1 - exp(-depth); the top values by estimated frequency are
+  tracked as the values are added.
+  Arguments:
+  :param width = counters per row
+  :param depth = number of rows, i.e. of hash functions
+  :param top = number of heavy hitters tracked
+  """
+  def __init__(self, width = 2048, depth = 5, top = 100):
+    self.width = width
+    self.depth = depth
+    self.top = top
+    self.total = 0
+    self.table = [[0] * width for _ in range(depth)]
+    self.heavy = dict()
+    self._floor = 0
+
+  def _indices(self, value):
+    h = hash64(value)
+    low, high = h & 0xffffffff, h >> 32
+    return [(low + i * high) % self.width for i in range(self.depth)]
+
+  def add(self, value, count = 1):
+    estimate = None
+    for row, index in zip(self.table, self._indices(value)):
+      row[index] += count
+      if estimate is None or row[index] < estimate:
+        estimate = row[index]
+    self.total += count
+    self._track(value, estimate)
+
+  def _track(self, value, estimate):
+    if value in self.heavy or len(self.heavy) < self.top:
+      self.heavy[value] = estimate
+    elif estimate > self._floor:
+      smallest = min(self.heavy, key=self.heavy.get)
+      if estimate > self.heavy[smallest]:
+        del self.heavy[smallest]
+        self.heavy[value] = estimate
+      self._floor = min(self.heavy.values())
+
+  def estimate(self, value):
+    """
+    :returns: estimated number of times value was added, never lower than the true count
+    """
+    return min(row[index] for row, index in zip(self.table, self._indices(value)))
+
+  def heavy_hitters(self, n = None):
+    """
+    :returns: list of (value, estimated count) pairs, most frequent first
+    """
+    hitters = sorted(self.heavy.items(), key=lambda item: (-item[1], item[0]))
+    return hitters if n is None else hitters[:n]
+
+  def merge(self, other):
+    """
+    Merge the sketch of another partition of the values into this one
+    :returns: self
+    """
+    if (other.width, other.depth) != (self.width, self.depth):
+      raise ValueError("CountMinSketch - can not merge sketches of different dimensions")
+    for row, other_row in zip(self.table, other.table):
+      for index, count in enumerate(other_row):
+        if count:
+          row[index] += count
+    self.total += other.total
+    candidates = set(self.heavy) | set(other.heavy)
+    self.heavy = dict()
+    self._floor = 0
+    for value in sorted(candidates, key=lambda v: -self.estimate(v))[:self.top]:
+      self.heavy[value] = self.estimate(value)
+    if self.heavy:
+      self._floor = min(self.heavy.values())
+    return self
+
+"""
+t-digest quantile estimate
+"""
+class TDigest(object):
+  """
+  Merging t-digest: values are buffered then merged into centroids whose
+  size is bounded by the arcsine scale function, small near the tails, so
+  extreme quantiles stay accurate. Memory is in O(compression).
+  Arguments:
+  :param compression = accuracy parameter, about compression / 2 centroids are kept
+  """
+  def __init__(self, compression = 100):
+    self.compression = compression
+    self.centroids = []
+    self.count = 0
+    self.min = None
+    self.max = None
+    self._buffer = []
+
+  def add(self, value, weight = 1):
+    self._buffer.append((value, weight))
+    self.count += weight
+    if self.min is None or value < self.min:
+      self.min = value
+    if self.max is None or value > self.max:
+      self.max = value
+    if len(self._buffer) >= 5 * self.compression:
+      self._compress()
+
+  def _q_limit(self, q):
+    """
+    :returns: the quantile at which the centroid starting at q should end
+    """
+    k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+    if k >= self.compression / 4.0:
+      return 1.0
+    return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+  def _compress(self):
+    if not self._buffer:
+      return
+    items = sorted(self.centroids + self._buffer)
+    self._buffer = []
+    total = float(sum(weight for _, weight in items))
+    merged = []
+    mean, weight = items[0]
+    done = 0
+    limit = total * self._q_limit(0)
+    for value, w in items[1:]:
+      if done + weight + w <= limit:
+        weight += w
+        mean += (value - mean) * w / float(weight)
+      else:
+        merged.append((mean, weight))
+        done += weight
+        limit = total * self._q_limit(done / total)
+        mean, weight = value, w
+    merged.append((mean, weight))
+    self.centroids = merged
+
+  def quantile(self, q):
+    """
+    :returns: estimated value at quantile q (0 to 1), None when no value was added
+    """
+    self._compress()
+    if not self.centroids:
+      return None
+    if len(self.centroids) == 1:
+      return self.centroids[0][0]
+    target = q * self.count
+    # centroid centers, the extremes being the known min and max
+    previous_position, previous_value = 0, self.min
+    cumulated = 0
+    for mean, weight in self.centroids:
+      position = cumulated + weight / 2.0
+      if target <= position:
+        if position == previous_position:
+          return mean
+        return previous_value + (mean - previous_value) * (target - previous_position) / (position - previous_position)
+      previous_position, previous_value = position, mean
+      cumulated += weight
+    if self.count == previous_position:
+      return self.max
+    return previous_value + (self.max - previous_value) * (target - previous_position) / (self.count - previous_position)
+
+  def merge(self, other):
+    """
+    Merge the digest of another partition of the values into this one
+    :returns: self
+    """
+    other._compress()
+    self._buffer.extend(other.centroids)
+    self.count += other.count
+    for value in (other.min, other.max):
+      if value is not None:
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    self._compress()
+    return self
+
+"""
+Sketches of the evidence of one sourceID and type
+"""
+class PartitionSummary(object):
+  """
+  Arguments:
+  :param precision = HyperLogLog precision of the distinct target and disease counts
+  :param width = count-min width of the target frequencies
+  :param depth = count-min depth of the target frequencies
+  :param top = number of most frequent targets tracked
+  :param compression = t-digest compression of the resource scores
+  """
+  def __init__(self, precision = 14, width = 2048, depth = 5, top = 100, compression = 100):
+    self.count = 0
+    self.targets = HyperLogLog(precision)
+    self.diseases = HyperLogLog(precision)
+    self.target_counts = CountMinSketch(width, depth, top)
+    self.scores = TDigest(compression)
+
+  def add(self, target, disease, score):
+    self.count += 1
+    if target is not None:
+      self.targets.add(target)
+      self.target_counts.add(target)
+    if disease is not None:
+      self.diseases.add(disease)
+    if isinstance(score, numbers.Number) and not isinstance(score, bool) and not math.isnan(score):
+      self.scores.add(score)
+
+  def merge(self, other):
+    self.count += other.count
+    self.targets.merge(other.targets)
+    self.diseases.merge(other.diseases)
+    self.target_counts.merge(other.target_counts)
+    self.scores.merge(other.scores)
+    return self
+
+  def report(self, quantiles = (0.01, 0.25, 0.5, 0.75, 0.99), top = 10):
+    """
+    :returns: dict of the evidence count, estimated distinct targets and
+    diseases, most frequent targets and resource score quantiles
+    """
+    return {
+      'evidence': self.count,
+      'distinct_targets': self.targets.count(),
+      'distinct_diseases': self.diseases.count(),
+      'top_targets': self.target_counts.heavy_hitters(top),
+      'scored': self.scores.count,
+      'resource_score': dict((q, self.scores.quantile(q)) for q in quantiles)
+    }
+
+"""
+Single pass release statistics per sourceID and type
+"""
+class ReleaseSummary(object):
+  """
+  Evidence objects or raw dicts are summarized per (sourceID, type) in
+  sketches of bounded size: HyperLogLog distinct target and disease counts,
+  count-min target frequencies with heavy hitters and t-digest quantiles of
+  resource_score values. Summaries of partitions of a release, e.g. built
+  by parallel workers, are pickled and merged into the release report.
+  Arguments:
+  :param options = passed to each PartitionSummary
+  """
+  # where the resource score of each evidence type lies, evidence.resource_score.value otherwise
+  score_paths = {
+    'genetic_association': 'evidence.variant2disease.resource_score.value',
+    'known_drug': 'evidence.drug2clinic.resource_score.value',
+    'animal_model': 'evidence.disease_model_association.resource_score.value'
+  }
+  default_score_path = 'evidence.resource_score.value'
+
+  def __init__(self, **options):
+    self.options = options
+    self.partitions = dict()
+
+  def add(self, record):
+    """
+    Add an evidence object or raw evidence dict
+    """
+    source = fields.get_field(record, 'sourceID')
+    evidence_type = fields.get_field(record, 'type')
+    key = (source, evidence_type)
+    partition = self.partitions.get(key)
+    if partition is None:
+      partition = self.partitions[key] = PartitionSummary(**self.options)
+    partition.add(fields.get_field(record, 'target.id'),
+                  fields.get_field(record, 'disease.id'),
+                  fields.get_field(record, self.score_paths.get(evidence_type, self.default_score_path)))
+
+  def update(self, records):
+    for record in records:
+      self.add(record)
+    return self
+
+  def merge(self, other):
+    """
+    Merge the summary of another part of the release into this one
+    :returns: self
+    """
+    for key, partition in other.partitions.items():
+      if key in self.partitions:
+        self.partitions[key].merge(partition)
+      else:
+        self.partitions[key] = partition
+    return self
+
+  def report(self, **options):
+    """
+    :returns: dict of sourceID to dict of type to PartitionSummary.report(**options)
+    """
+    report = dict()
+    for (source, evidence_type), partition in sorted(self.partitions.items(), key=lambda item: tuple(str(k) for k in item[0])):
+      report.setdefault(source, dict())[evidence_type] = partition.report(**options)
+    return report
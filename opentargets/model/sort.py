@@ -0,0 +1,148 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import json
+import heapq
+import shutil
+import logging
+import tempfile
+import numbers
+import six
+import opentargets.model.stream as stream
+import opentargets.model.fields as fields
+import opentargets.model.scanner as scanner
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+def _rank(value):
+  if value is None:
+    return (0, 0)
+  elif isinstance(value, numbers.Number) and not isinstance(value, bool):
+    return (1, value)
+  elif isinstance(value, six.string_types):
+    return (2, value)
+  return (3, json.dumps(value, sort_keys=True))
+
+def sort_key(record, paths):
+  """
+  Sort key of a raw evidence dict: one (rank, value) pair per field path,
+  ranking missing values first, then numbers, then strings, so that records
+  with mixed or missing values still compare
+  :returns: tuple of pairs
+  """
+  return tuple(_rank(fields.compile_path(path)(record)) for path in paths)
+
+def external_sort(input_file, output_file, keys = ('target.id', 'disease.id'), max_memory = 1 << 28, fan_in = 64, tmp_dir = None):
+  """
+  Sort an evidence file (JSON lines, optionally gzipped) on field paths
+  without loading it in memory. Sort keys are extracted from the raw dicts,
+  runs holding about max_memory bytes of lines are sorted and spilled to
+  temporary files, then merged fan_in runs at a time. Records with equal
+  keys keep their input order.
+  :returns: number of records written to output_file
+  """
+  work_dir = tempfile.mkdtemp(prefix='evidence_sort_', dir=tmp_dir)
+  try:
+    try:
+      # shallow keys are read without parsing the whole line
+      header = scanner.HeaderScanner(keys)
+    except ValueError:
+      header = None
+    runs = []
+    run = []
+    run_size = 0
+    with stream.open_file(input_file, 'rb') as f:
+      for line in f:
+        if not line.strip():
+          continue
+        if not line.endswith(b'\n'):
+          line = line + b'\n'
+        if header is not None:
+          values = header.scan(line)
+          key = tuple(_rank(values[path]) for path in keys)
+        else:
+          key = sort_key(json.loads(line.decode('utf-8')), keys)
+        run.append((key, line))
+        # account for the key and list overhead on top of the line itself
+        run_size = run_size + len(line) + 200
+        if run_size >= max_memory:
+          runs.append(_write_run(run, work_dir, len(runs)))
+          run = []
+          run_size = 0
+    count = 0
+    if not runs:
+      # everything fitted in memory, no merge needed
+      run.sort(key=lambda item: item[0])
+      with stream.open_file(output_file, 'wb') as out:
+        for _, line in run:
+          out.write(line)
+          count = count + 1
+      return count
+    if run:
+      runs.append(_write_run(run, work_dir, len(runs)))
+    while len(runs) > fan_in:
+      merged = []
+      for i in range(0, len(runs), fan_in):
+        filename = os.path.join(work_dir, 'merge_{0}_{1}'.format(len(runs), i))
+        with open(filename, 'wb') as out:
+          for key, line in _merge(runs[i:i + fan_in]):
+            out.write(key + b'\t' + line)
+        merged.append(filename)
+      runs = merged
+    with stream.open_file(output_file, 'wb') as out:
+      for _, line in _merge(runs):
+        out.write(line)
+        count = count + 1
+    return count
+  finally:
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+def _write_run(run, work_dir, index):
+  run.sort(key=lambda item: item[0])
+  filename = os.path.join(work_dir, 'run_{0}'.format(index))
+  with open(filename, 'wb') as out:
+    for key, line in run:
+      out.write(json.dumps(key).encode('utf-8') + b'\t' + line)
+  logger.debug("external_sort - run {0} of {1} records written".format(index, len(run)))
+  return filename
+
+def _read_run(filename, index):
+  """
+  Lines of a run are stored as '<json key>\t<record>'; JSON output never
+  contains a raw tab so the first tab always ends the key
+  """
+  with open(filename, 'rb') as f:
+    for line in f:
+      key, record = line.split(b'\t', 1)
+      yield _to_tuple(json.loads(key.decode('utf-8'))), index, key, record
+
+def _to_tuple(key):
+  return tuple(tuple(pair) for pair in key)
+
+def _merge(runs):
+  for _, _, key, line in heapq.merge(*[_read_run(filename, i) for i, filename in enumerate(runs)]):
+    yield key, line
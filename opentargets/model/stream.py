@@ -0,0 +1,368 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import re
+import sys
+import gzip
+import zlib
+import json
+import logging
+import six
+import collections
+import opentargets.model.scanner as scanner
+import opentargets.model.filters as filters
+import opentargets.model.core as core
+import opentargets.model.views as views
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+def open_file(filename, mode = 'rb', compresslevel = 6):
+  """
+  Open an evidence file in binary mode, through gzip when the name ends with .gz
+  :returns: a file object
+  """
+  if filename.endswith('.gz'):
+    return gzip.open(filename, mode, compresslevel)
+  return open(filename, mode)
+
+"""
+Line reader of plain or gzip files whose positions can be saved and resumed
+"""
+class LineReader(object):
+  """
+  A position is a pair (block, within): for a plain file the byte offset of
+  the next line and 0; for a gzip file the offset of the gzip member holding
+  the start of the next line and the number of uncompressed bytes of that
+  member before it. Resuming from a position seeks to the member, so files
+  made of many small members (block gzip) resume at once, while a single
+  member gzip file is decompressed, neither parsed nor kept, up to the position.
+  Arguments:
+  :param filename = plain or gzip file
+  :param position = position returned by tell() to resume from, None for the start
+  """
+  chunk_size = 1 << 16
+
+  def __init__(self, filename, position = None):
+    self.filename = filename
+    self._file = open(filename, 'rb')
+    self.compressed = self._file.read(2) == b'\x1f\x8b'
+    self.seek(position or (0, 0))
+
+  def seek(self, position):
+    block, within = position
+    self._file.seek(block)
+    self._offset = block
+    self._buffer = bytearray()
+    self._start = 0
+    self._scan = 0
+    # (index in the buffer, block, within) of the data appended from there
+    self._marks = [(0, block, within)]
+    self._eof = False
+    # uncompressed bytes still to drop before the position
+    self._skip = 0
+    if self.compressed:
+      self._decompressor = zlib.decompressobj(31)
+      self._skip = within
+      while self._skip and not self._eof:
+        self._fill()
+      if self._skip:
+        raise ValueError("LineReader - position {0} is past the end of {1}".format(position, self.filename))
+    elif within:
+      raise ValueError("LineReader - invalid position {0} in plain file {1}".format(position, self.filename))
+
+  def tell(self):
+    """
+    :returns: position of the next line
+    """
+    index, block, within = [mark for mark in self._marks if mark[0] <= self._start][-1]
+    if self.compressed:
+      return (block, within + self._start - index)
+    return (block + self._start - index, 0)
+
+  def _compact(self):
+    if self._start:
+      marks = [mark for mark in self._marks if mark[0] <= self._start][-1:] + [mark for mark in self._marks if mark[0] > self._start]
+      index, block, within = marks[0]
+      if self.compressed:
+        marks[0] = (self._start, block, within + self._start - index)
+      else:
+        marks[0] = (self._start, block + self._start - index, 0)
+      self._marks = [(i - self._start, b, w) for i, b, w in marks]
+      del self._buffer[:self._start]
+      self._scan -= self._start
+      self._start = 0
+
+  def _fill(self):
+    self._compact()
+    data = self._file.read(self.chunk_size)
+    if not data:
+      self._eof = True
+      return
+    offset = self._offset
+    self._offset += len(data)
+    if not self.compressed:
+      self._buffer += data
+      return
+    while data:
+      self._append(self._decompressor.decompress(data))
+      unused = self._decompressor.unused_data
+      if not unused and not getattr(self._decompressor, 'eof', False):
+        break
+      if self._skip:
+        raise ValueError("LineReader - position {0} is past the end of its gzip member in {1}".format((self._marks[0][1], self._marks[0][2]), self.filename))
+      # a new member starts after the end of this one
+      offset = offset + len(data) - len(unused)
+      self._marks.append((len(self._buffer), offset, 0))
+      self._decompressor = zlib.decompressobj(31)
+      data = unused
+
+  def _append(self, data):
+    # data before the position being sought is dropped as it comes
+    if self._skip:
+      dropped = min(self._skip, len(data))
+      self._skip -= dropped
+      data = data[dropped:]
+    self._buffer += data
+
+  def readline(self):
+    """
+    :returns: the next line, newline included, or an empty bytes at the end of the file
+    """
+    while True:
+      end = self._buffer.find(b'\n', self._scan)
+      if end >= 0:
+        line = bytes(self._buffer[self._start:end + 1])
+        self._start = self._scan = end + 1
+        return line
+      if self._eof:
+        line = bytes(self._buffer[self._start:])
+        self._start = self._scan = len(self._buffer)
+        return line
+      self._scan = len(self._buffer)
+      self._fill()
+
+  def __iter__(self):
+    while True:
+      line = self.readline()
+      if not line:
+        return
+      yield line
+
+  def close(self):
+    self._file.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+
+def to_line(obj):
+  """
+  Serialize a model object or a raw dict to a single utf-8 encoded JSON line
+  :returns: bytes terminated by a newline
+  """
+  if isinstance(obj, dict):
+    line = json.dumps(obj, sort_keys=True, check_circular=False)
+  else:
+    line = obj.to_JSON(indentation=None)
+  if isinstance(line, six.text_type):
+    line = line.encode('utf-8')
+  return line + b'\n'
+
+def read_evidence(filename, where = None, raw = False, strict = False, fields = None, view = False):
+  """
+  Stream the evidence of a JSON lines file (optionally gzipped). The where
+  filter is applied to the raw line or dict before any model object is
+  built, so rejected records cost at most a parse.
+  Arguments:
+  :param where = filters.Filter or filter expression string, None keeps everything
+  :param raw = True to yield the raw dicts instead of evidence objects
+  :param strict = passed to fromDict
+  :param fields = passed to fromDict
+  :param view = True to yield views of the dicts (views.evidence_view) instead of fromDict objects
+  :returns: generator of evidence objects or dicts
+  """
+  where = filters.as_filter(where)
+  with open_file(filename, 'rb') as f:
+    for line in f:
+      if not line.strip():
+        continue
+      record = None
+      if where is not None:
+        keep, record = where.matches_line(line)
+        if not keep:
+          continue
+      if record is None:
+        record = json.loads(line.decode('utf-8'))
+      if raw:
+        yield record
+        continue
+      if view:
+        obj = views.evidence_view(record)
+      else:
+        obj = core.evidence_fromDict(record, strict = strict, fields = fields)
+      if obj is not None:
+        yield obj
+
+"""
+Evidence sink writing one file per (sourceID, type, access_level) partition
+"""
+class PartitionedWriter(object):
+  """
+  Lines are buffered per partition and written in blocks through a bounded
+  LRU pool of open file handles. A partition whose handle was evicted is
+  reopened in append mode, so the number of partitions is not limited by
+  the number of file descriptors.
+  Arguments:
+  :param output_dir = directory receiving the partition files
+  :param compression = None for plain JSON lines, 'gzip' for gzip files
+  :param max_open_files = maximum number of file handles kept open
+  :param buffer_size = bytes buffered for a partition before it is flushed
+  :param max_buffered = bytes buffered over all partitions before everything is flushed
+  """
+  partition_fields = ['sourceID', 'type', 'access_level']
+  compressions = {None: '.json', 'gzip': '.json.gz'}
+
+  def __init__(self, output_dir, compression = None, max_open_files = 32, buffer_size = 1 << 20, max_buffered = 1 << 28):
+    if not compression in self.compressions:
+      raise ValueError("PartitionedWriter - unsupported compression '{0}'".format(compression))
+    if max_open_files < 1:
+      raise ValueError("PartitionedWriter - max_open_files should be greater than or equal to 1")
+    self.output_dir = output_dir
+    self.compression = compression
+    self.max_open_files = max_open_files
+    self.buffer_size = buffer_size
+    self.max_buffered = max_buffered
+    self.counts = collections.defaultdict(int)
+    self.filenames = dict()
+    self._buffers = collections.defaultdict(list)
+    self._buffered = collections.defaultdict(int)
+    self._total_buffered = 0
+    self._handles = collections.OrderedDict()
+    self._opened = set()
+    self._scanner = None
+    if not os.path.isdir(output_dir):
+      os.makedirs(output_dir)
+
+  def partition(self, obj):
+    """
+    Partition key of a model object or a raw dict
+    :returns: tuple of (sourceID, type, access_level), 'unknown' standing for missing values
+    """
+    if isinstance(obj, dict):
+      values = [obj.get(name) for name in self.partition_fields]
+    else:
+      values = [getattr(obj, name, None) for name in self.partition_fields]
+    return tuple(value if isinstance(value, six.string_types) and value else 'unknown' for value in values)
+
+  def filename(self, key):
+    """
+    :returns: path of the file holding partition key
+    """
+    if not key in self.filenames:
+      name = '-'.join(re.sub('[^A-Za-z0-9_.]', '_', value) for value in key)
+      self.filenames[key] = os.path.join(self.output_dir, name + self.compressions[self.compression])
+    return self.filenames[key]
+
+  def write(self, obj):
+    """
+    Buffer a model object or a raw dict in its partition
+    """
+    self.write_line(self.partition(obj), to_line(obj))
+
+  def write_raw(self, line):
+    """
+    Buffer a raw JSON evidence line, its partition being read with the
+    header scanner rather than a full parse
+    """
+    if self._scanner is None:
+      self._scanner = scanner.HeaderScanner(self.partition_fields)
+    header = self._scanner.scan(line)
+    key = tuple(header[name] if isinstance(header[name], six.string_types) and header[name] else 'unknown' for name in self.partition_fields)
+    if not line.endswith(b'\n'):
+      line = line + b'\n'
+    self.write_line(key, line)
+
+  def write_line(self, key, line):
+    """
+    Buffer an already serialized, newline terminated, line in partition key
+    """
+    self._buffers[key].append(line)
+    self._buffered[key] += len(line)
+    self._total_buffered += len(line)
+    self.counts[key] += 1
+    if self._buffered[key] >= self.buffer_size:
+      self._flush_partition(key)
+    elif self._total_buffered >= self.max_buffered:
+      self.flush()
+
+  def write_all(self, iterable):
+    for obj in iterable:
+      self.write(obj)
+
+  def flush(self):
+    """
+    Write every pending buffer to its partition file
+    """
+    for key in list(self._buffers):
+      self._flush_partition(key)
+    for handle in self._handles.values():
+      handle.flush()
+
+  def close(self):
+    self.flush()
+    while self._handles:
+      self._handles.popitem(last=False)[1].close()
+
+  def _flush_partition(self, key):
+    lines = self._buffers.pop(key, None)
+    if not lines:
+      return
+    self._total_buffered -= self._buffered.pop(key)
+    self._handle(key).write(b''.join(lines))
+
+  def _handle(self, key):
+    if key in self._handles:
+      # move to the most recently used end
+      handle = self._handles.pop(key)
+    else:
+      if len(self._handles) >= self.max_open_files:
+        self._handles.popitem(last=False)[1].close()
+      filename = self.filename(key)
+      # the first opening truncates any previous output, later ones append
+      mode = 'ab' if key in self._opened else 'wb'
+      self._opened.add(key)
+      handle = open_file(filename, mode)
+    self._handles[key] = handle
+    return handle
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
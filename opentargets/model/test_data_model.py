@@ -28,13 +28,39 @@ import logging
 logging.basicConfig()
 logger = logging.getLogger(__name__)
 import datetime
+import gc
+import os
+import gzip
+import io
+import shutil
+import tempfile
 import opentargets.model.core as opentargets
 import opentargets.model.bioentity as bioentity
 import opentargets.model.evidence.core as evidence_core
 import opentargets.model.evidence.genetics as evidence_genetics
+import opentargets.model.evidence.drug as evidence_drug
 import opentargets.model.evidence.association_score as evidence_score
 import opentargets.model.evidence.phenotype as evidence_phenotype
 import opentargets.model.evidence.linkout as evidence_linkout
+import opentargets.model.stream as stream
+import opentargets.model.sort as evidence_sort
+import opentargets.model.schema as schema
+import opentargets.model.scanner as scanner
+import opentargets.model.filters as filters
+import opentargets.model.cache as cache
+import opentargets.model.builders as builders
+import opentargets.model.sketches as sketches
+import opentargets.model.profiler as profiler
+import opentargets.model.validator as validator
+import opentargets.model.bgzf as bgzf
+import opentargets.model.fields as model_fields
+import opentargets.model.tracking as tracking
+import opentargets.model.views as views
+import opentargets.model.batch as evidence_batch
+import opentargets.model.ranges as ranges
+import opentargets.model.eco as eco
+import opentargets.model.loggers as loggers
+import pickle
 
 __author__ = "Gautier Koscielny"
 __copyright__ = "Copyright 2014-2017, The Centre for Therapeutic Target Validation (CTTV)"
@@ -411,3 +437,809 @@ def test_literature_mining_create_and_clone():
     logger.info(errors)
     assert not obj == None and errors == 0
 
+def _evidence_dicts():
+    """ small set of raw genetics evidence spanning several partitions """
+    records = []
+    for i, (source, access) in enumerate([('gwas_catalog', 'public'), ('eva', 'public'), ('gwas_catalog', 'private'),
+                                          ('gwas_catalog', 'public'), ('uniprot', 'public')]):
+        records.append({
+            "sourceID": source,
+            "access_level": access,
+            "type": "genetic_association",
+            "validated_against_schema_version": "1.2.8",
+            "unique_association_fields": {"target": "ENSG%011d" % i},
+            "target": {"id": "http://identifiers.org/ensembl/ENSG%011d" % (5 - i),
+                       "activity": "http://identifiers.org/cttv.activity/predicted_damaging",
+                       "target_type": "http://identifiers.org/cttv.target/gene_evidence"},
+            "disease": {"id": "http://www.ebi.ac.uk/efo/EFO_%07d" % (i % 2)},
+            "variant": {"id": "http://identifiers.org/dbsnp/rs%d" % i, "type": "snp single"},
+            "evidence": {
+                "gene2variant": {
+                    "evidence_codes": ["http://purl.obolibrary.org/obo/ECO_0000205"],
+                    "functional_consequence": "http://purl.obolibrary.org/obo/SO_0001631",
+                    "provenance_type": {"database": {"id": "GWAS Catalog", "version": "2018"}},
+                    "date_asserted": "2015-05-11T11:46:09+00:00",
+                    "is_associated": True,
+                    "resource_score": {"type": "pvalue", "value": 1e-3 * (i + 1)}},
+                "variant2disease": {
+                    "evidence_codes": ["http://identifiers.org/eco/GWAS"],
+                    "unique_experiment_reference": "http://europepmc.org/abstract/MED/23128233",
+                    "provenance_type": {"database": {"id": "GWAS Catalog", "version": "2018"}},
+                    "date_asserted": "2015-05-11T11:46:09+00:00",
+                    "is_associated": True,
+                    "gwas_sample_size": 200 + i,
+                    "resource_score": {"type": "pvalue", "value": 1e-8 * (i + 1)}}}})
+    return records
+
+def _evidence_dict(index, changes = None):
+    """ copy of one of the _evidence_dicts() with the values at the given dotted paths replaced """
+    record = _evidence_dicts()[index]
+    for path, value in sorted((changes or {}).items()):
+        holder = record
+        keys = path.split('.')
+        for key in keys[:-1]:
+            holder = holder[key]
+        holder[keys[-1]] = value
+    return record
+
+def _mixed_evidence(count):
+    """ count raw evidence cycling over _evidence_dicts(), every fourth one with an invalid access_level """
+    records = _evidence_dicts()
+    invalid = dict(records[0], access_level='secret')
+    return [invalid if i % 4 == 0 else records[i % 5] for i in range(count)]
+
+def _with_and_without_numpy(check, *modules):
+    """ runs check with numpy, when it is installed, then again on the pure python path of the modules """
+    check()
+    saved = [module.numpy for module in modules]
+    for module in modules:
+        module.numpy = None
+    try:
+        check()
+    finally:
+        for module, numpy in zip(modules, saved):
+            module.numpy = numpy
+
+def _secret_evidence(line):
+    """ raw evidence of the given line with an invalid access_level, and a missing sourceID every tenth line """
+    return _evidence_dict(line % 5, {'access_level': 'secret', 'sourceID': None if line % 10 == 0 else 'eva'})
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_partitioned_writer():
+    output_dir = tempfile.mkdtemp()
+    try:
+        # a single handle and tiny buffers force evictions and reopening in append mode
+        with stream.PartitionedWriter(output_dir, compression='gzip', max_open_files=1, buffer_size=1) as writer:
+            for record in _evidence_dicts():
+                writer.write(record)
+            writer.write(opentargets.Genetics.fromDict(_evidence_dicts()[0]))
+        assert sorted(os.listdir(output_dir)) == [
+            'eva-genetic_association-public.json.gz',
+            'gwas_catalog-genetic_association-private.json.gz',
+            'gwas_catalog-genetic_association-public.json.gz',
+            'uniprot-genetic_association-public.json.gz']
+        with gzip.open(os.path.join(output_dir, 'gwas_catalog-genetic_association-public.json.gz'), 'rb') as f:
+            lines = [json.loads(line.decode('utf-8')) for line in f]
+        assert len(lines) == 3 and all(line['sourceID'] == 'gwas_catalog' for line in lines)
+        assert writer.counts[('gwas_catalog', 'genetic_association', 'public')] == 3
+    finally:
+        shutil.rmtree(output_dir)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_external_sort():
+    work_dir = tempfile.mkdtemp()
+    try:
+        input_file = os.path.join(work_dir, 'evidence.json')
+        output_file = os.path.join(work_dir, 'sorted.json.gz')
+        with open(input_file, 'w') as f:
+            for record in _evidence_dicts():
+                f.write(json.dumps(record) + '\n')
+        # a tiny memory budget spills one run per record and forces several merge passes
+        count = evidence_sort.external_sort(input_file, output_file, max_memory=1, fan_in=2)
+        with gzip.open(output_file, 'rb') as f:
+            records = [json.loads(line.decode('utf-8')) for line in f]
+        keys = [(r['target']['id'], r['disease']['id']) for r in records]
+        assert count == 5 and keys == sorted(keys)
+        # in memory path gives the same order
+        evidence_sort.external_sort(input_file, output_file, keys=['target.id', 'disease.id'])
+        with gzip.open(output_file, 'rb') as f:
+            assert [json.loads(line.decode('utf-8')) for line in f] == records
+    finally:
+        shutil.rmtree(work_dir)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_schema_compiler():
+    work_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(work_dir, 'common.json'), 'w') as f:
+            json.dump({'definitions': {'score': {'type': 'number', 'minimum': 0, 'exclusiveMinimum': True, 'maximum': 1}}}, f)
+        target_schema = {
+            'title': 'Target', 'type': 'object', 'required': ['id', 'target_type'],
+            'properties': {
+                'id': {'type': 'array', 'minItems': 1, 'uniqueItems': True,
+                       'items': {'type': 'string', 'pattern': '^http://identifiers.org/ensembl/ENSG[0-9]{4,}$'}},
+                'target_type': {'type': 'string', 'enum': ['http://identifiers.org/cttv.target/gene_evidence']},
+                'score': {'$ref': 'common.json#/definitions/score'}}}
+        cache_dir = os.path.join(work_dir, 'cache')
+        compiler = schema.SchemaCompiler(cache_dir=cache_dir)
+        validate = compiler.compile(target_schema, base_uri=os.path.join(work_dir, 'target.json'))
+        target = {'id': ['http://identifiers.org/ensembl/ENSG00000213724'],
+                  'target_type': 'http://identifiers.org/cttv.target/gene_evidence', 'score': 0.5}
+        assert validate(target, logger) == 0
+        # generated classes are validated through their attributes
+        del target['score']
+        assert validate(bioentity.Target.fromDict(target), logger) == 0
+        assert validate({'id': ['ENSG1', 'ENSG1'], 'target_type': 'gene', 'score': 0}, logger) == 5
+        # a second compiler reuses the code cached on disk
+        cached = schema.SchemaCompiler(cache_dir=cache_dir)
+        assert cached.compile(target_schema, base_uri=os.path.join(work_dir, 'target.json'))({}, logger) == 2
+        assert cached.cache_hits == 1
+        # cache files are renamed into place, an unreadable one being replaced
+        names = sorted(os.listdir(cache_dir))
+        assert [os.path.splitext(name)[1] for name in names] == ['.code', '.py']
+        with open(os.path.join(cache_dir, names[0]), 'wb') as f:
+            f.write(b'partial')
+        rebuilt = schema.SchemaCompiler(cache_dir=cache_dir)
+        assert rebuilt.compile(target_schema, base_uri=os.path.join(work_dir, 'target.json'))({}, logger) == 2
+        assert rebuilt.cache_hits == 0 and sorted(os.listdir(cache_dir)) == names
+        assert schema.SchemaCompiler(cache_dir=cache_dir).compile(target_schema, base_uri=os.path.join(work_dir, 'target.json'))({}, logger) == 2
+    finally:
+        shutil.rmtree(work_dir)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_strict_unknown_keys():
+    record = _evidence_dicts()[0]
+    assert opentargets.Genetics.fromDict(record, strict=True).validate(logger) == 0
+    record['submitted_by'] = 'someone'
+    # the lenient mode keeps discarding the object after a full decode
+    assert opentargets.Genetics.fromDict(record) is None
+    try:
+        opentargets.Genetics.fromDict(record, strict=True)
+        assert False
+    except opentargets.InvalidFieldsException as e:
+        assert e.serialize()['class'] == 'Genetics' and e.fields == ['submitted_by']
+    # nested objects are checked too
+    record = _evidence_dict(0, {'target.symbol': 'BRAF'})
+    try:
+        opentargets.Genetics.fromDict(record, strict=True)
+        assert False
+    except opentargets.JSONException as e:
+        assert e.class_name == 'Target'
+    # classes the lenient mode lets unknown keys through are strict too
+    for path, name in (('evidence.note', 'GeneticsEvidence'), ('evidence.variant2disease.provenance_type.note', 'BaseProvenance_Type'), ('literature.note', 'BaseLiterature')):
+        record = _evidence_dict(0, {'literature': {'references': [{'lit_id': 'http://europepmc.org/abstract/MED/1'}]}, path: 'x'})
+        assert opentargets.Genetics.fromDict(record) is not None
+        try:
+            opentargets.Genetics.fromDict(record, strict=True)
+            assert False
+        except opentargets.InvalidFieldsException as e:
+            assert e.class_name == name and e.fields == ['note']
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_fields_mask():
+    record = _evidence_dicts()[0]
+    obj = opentargets.Genetics.fromDict(record, fields=['sourceID', 'target.id', 'disease.id', 'evidence.variant2disease.resource_score.value'])
+    assert obj.sourceID == 'gwas_catalog' and obj.type is None
+    assert obj.target.id == record['target']['id'] and obj.target.target_type is None
+    assert obj.disease.id == record['disease']['id']
+    assert obj.variant is None and obj.evidence.gene2variant is None
+    assert obj.evidence.variant2disease.resource_score.value == record['evidence']['variant2disease']['resource_score']['value']
+    assert obj.evidence.variant2disease.resource_score.method is None
+    assert obj.evidence.variant2disease.provenance_type is None
+    # a path ending on an object selects the whole sub-object
+    obj = opentargets.Genetics.fromDict(record, fields=['evidence.variant2disease', 'evidence.variant2disease.urls.0.url'])
+    assert obj.evidence.variant2disease.serialize() == opentargets.Genetics.fromDict(record).evidence.variant2disease.serialize()
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_header_scanner():
+    record = _evidence_dicts()[1]
+    header = scanner.peek_header(json.dumps(record).encode('utf-8'))
+    # nested 'type' keys of the variant and the scores are not taken for the top-level one
+    assert header == {'type': 'genetic_association', 'sourceID': 'eva', 'access_level': 'public',
+                      'target.id': record['target']['id'], 'disease.id': record['disease']['id']}
+    header_scanner = scanner.HeaderScanner(['type', 'target.id', 'variant.type'])
+    assert header_scanner.scan(json.dumps(record))['variant.type'] == 'snp single'
+    record['unique_association_fields'] = {'target': 'ENSG1', 'note': 'a \\"type\\" key'}
+    del record['type']
+    assert header_scanner.scan(json.dumps(record))['type'] is None
+    # duplicated keys are resolved by a full parse
+    assert header_scanner.scan('{"type": "a", "type": "b"}')['type'] == 'b' and header_scanner.fallbacks == 1
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_filters():
+    records = _evidence_dicts()
+    where = filters.Filter('sourceID == "gwas_catalog" and evidence.variant2disease.resource_score.value < 2.5e-8 '
+                           'and target.target_type in {"http://identifiers.org/cttv.target/gene_evidence"}')
+    assert [where.matches(record) for record in records] == [True, False, False, False, False]
+    assert where.matches(opentargets.Genetics.fromDict(records[0]))
+    # missing fields fail comparisons instead of raising
+    assert not filters.Filter('literature.references[0].lit_id > "a"').matches(records[0])
+    # a line the scanner has to parse is parsed once, the record coming back
+    duplicated = b'{"sourceID": "other", ' + stream.to_line(records[0])[1:]
+    keep, record = filters.Filter('sourceID == "gwas_catalog"').matches_line(duplicated)
+    assert keep and record == records[0]
+    assert filters.Filter('sourceID == "gwas_catalog"').matches_line(stream.to_line(records[0])) == (True, None)
+    # filters travel to worker processes
+    where = pickle.loads(pickle.dumps(filters.Filter('sourceID == "gwas_catalog" and access_level != "private"')))
+    work_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(work_dir, 'evidence.json.gz')
+        with gzip.open(filename, 'wb') as f:
+            for record in records:
+                f.write(stream.to_line(record))
+        kept = list(stream.read_evidence(filename, where=where))
+        assert [obj.target.id for obj in kept] == [records[0]['target']['id'], records[3]['target']['id']]
+        assert isinstance(kept[0], opentargets.Genetics)
+        assert len(list(stream.read_evidence(filename, where='evidence.variant2disease.gwas_sample_size >= 203', raw=True))) == 2
+    finally:
+        shutil.rmtree(work_dir)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_flyweight_cache():
+    records = _evidence_dicts()
+    with cache.FlyweightCache(max_size=4) as flyweights:
+        objs = [opentargets.Genetics.fromDict(record) for record in records + records]
+        assert objs[0].disease is objs[2].disease and objs[0].disease is objs[5].disease
+        assert objs[0].target is not objs[1].target
+        assert isinstance(objs[0].target, bioentity.Target) and objs[0].validate(logger) == 0
+        assert objs[0].serialize() == opentargets.Genetics.fromDict(records[0]).serialize()
+        try:
+            objs[0].disease.id = 'changed'
+            assert False
+        except AttributeError:
+            pass
+        clone = bioentity.Disease.cloneObject(objs[0].disease)
+        clone.id = 'changed'
+        # shared instances pickle and clone to mutable instances of their class
+        target = objs[0].target
+        for copy in (pickle.loads(pickle.dumps(target)), type(target).cloneObject(target), pickle.loads(pickle.dumps(objs[0])).target):
+            assert type(copy) is bioentity.Target and copy.serialize() == target.serialize()
+            copy.id = 'changed'
+        stats = flyweights.stats()
+        assert stats['hits'] + stats['misses'] == 22 and stats['size'] == 4 and stats['evictions'] > 0
+        # nested objects and lists are frozen too, the decoded dict staying mutable
+        payload = {'id': 'http://identifiers.org/ensembl/ENSG00000157764', 'target_type': 'http://identifiers.org/cttv.target/gene_evidence',
+                   'activity': 'http://identifiers.org/cttv.activity/up', 'target_class': ['kinase']}
+        target = bioentity.Target.fromDict(payload)
+        disease = bioentity.Disease.fromDict({'id': 'http://www.ebi.ac.uk/efo/EFO_0000270', 'biosample': {'name': 'lung', 'id': 'UBERON_0002048'}})
+        for change in (lambda: target.target_class.append('enzyme'), lambda: target.target_class.__setitem__(0, 'enzyme'),
+                       lambda: setattr(disease.biosample, 'name', 'liver')):
+            try:
+                change()
+                assert False
+            except (AttributeError, TypeError):
+                pass
+        payload['target_class'].append('enzyme')
+        assert bioentity.Target.fromDict(dict(payload, target_class=['kinase'])) is target and target.target_class == ['kinase']
+        assert isinstance(target.target_class, list) and target.validate(logger) == 0 and disease.validate(logger) == 0
+        for copy in (pickle.loads(pickle.dumps(disease)), bioentity.Disease.cloneObject(disease)):
+            copy.biosample.name = 'liver'
+        copy = bioentity.Target.cloneObject(target)
+        copy.target_class.append('enzyme')
+        assert type(pickle.loads(pickle.dumps(target)).target_class) is list and target.target_class == ['kinase']
+    assert bioentity.Target.flyweights is None
+    assert opentargets.Genetics.fromDict(records[0]).target is not opentargets.Genetics.fromDict(records[0]).target
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_validation_memo():
+    records = _evidence_dicts()
+    for record in records:
+        record['target']['target_type'] = 'protein'
+    objs = [opentargets.Genetics.fromDict(record) for record in records]
+    expected = loggers.Recorder()
+    counts = [obj.validate(expected, path='record{0}'.format(i)) for i, obj in enumerate(objs)]
+    memoized = loggers.Recorder()
+    with cache.ValidationMemo() as memo:
+        assert [obj.validate(memoized, path='record{0}'.format(i)) for i, obj in enumerate(objs)] == counts
+        # identical diseases and variants are validated once, messages follow the current path
+        assert memoized.messages == expected.messages
+        assert any(message.startswith('Target - record3.target.target_type') for message in memoized.errors())
+        assert memo.stats()['hits'] == 3 and memo.stats()['misses'] == 12
+    assert bioentity.Target.validation_memo is None
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_genetics_builder():
+    def check():
+        builder = builders.GeneticsBuilder('gwas_catalog', 'http://europepmc.org/abstract/MED/23128233', '2018-01-01T00:00:00+00:00')
+        columns = dict(
+            variant_id=['rs11010067', 'http://identifiers.org/dbsnp/rs12', 'esv3', 'rs4'],
+            gene_id=['ENSG00000213724', 'ENSG00000157764', 'ENSG00000157764', 'ENSG00000157764'],
+            efo_id=['EFO_0003767', 'EFO_0003767', 'http://www.orpha.net/ORDO/Orphanet_15', 'EFO_0003767'],
+            pvalue=[2e-25, 1e-8, 0.3, 0.5],
+            sample_size=[200, 300.0, float('nan'), 10],
+            functional_consequence=['SO_0001631', 'SO_0001631', 'SO_0001631', 'SO_9999999'])
+        lines = list(builder.lines(**columns))
+        # the last row has an unknown functional consequence, the third one goes through the objects
+        assert len(lines) == 3 and builder.fallbacks == 1 and builder.rejected == [(3, 1)]
+        for i, line in enumerate(lines):
+            row = dict((name, values[i]) for name, values in columns.items())
+            obj = builder.build_object(row)
+            assert line == stream.to_line(obj)
+            assert opentargets.Genetics.fromDict(json.loads(line.decode('utf-8'))).validate(logger) == 0
+        assert 'gwas_sample_size' not in json.loads(lines[2].decode('utf-8'))['evidence']['variant2disease']
+        assert all(json.loads(line.decode('utf-8'))['evidence']['variant2disease']['resource_score']['type'] == 'pvalue' for line in lines)
+        # rows failing a column check are rejected, not handed to validate()
+        rows = dict((name, values[:2]) for name, values in columns.items())
+        rows['pvalue'] = ['NA', 1e-8]
+        rows['gene_id'] = ['ENSG00000213724', 'ENSG12']
+        builder = builders.GeneticsBuilder('gwas_catalog', 'http://europepmc.org/abstract/MED/23128233', '2018-01-01T00:00:00+00:00', logger=loggers.Recorder())
+        assert list(builder.lines(**rows)) == [] and builder.fallbacks == 0 and builder.rejected == [(0, 1), (1, 1)]
+        assert builder.logger.errors() == ["GeneticsBuilder - row 0: invalid pvalue 'NA'", "GeneticsBuilder - row 1: invalid gene_id 'ENSG12'"]
+        # builders define how rows become objects and columns
+        try:
+            type('Incomplete', (builders.TemplateBuilder,), {'columns': ()})()
+            assert False
+        except TypeError:
+            pass
+        # cells read from text files are strings, blank ones standing for missing values
+        text = dict((name, [value if isinstance(value, str) else ('' if value != value else str(value)) for value in values]) for name, values in columns.items())
+        builder = builders.GeneticsBuilder('gwas_catalog', 'http://europepmc.org/abstract/MED/23128233', '2018-01-01T00:00:00+00:00')
+        assert list(builder.lines(**text)) == lines and builder.fallbacks == 1 and builder.rejected == [(3, 1)]
+    _with_and_without_numpy(check, builders)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_drug_builder():
+    def check():
+        builder = builders.DrugBuilder('chembl', '2018-01-01T00:00:00+00:00')
+        columns = dict(
+            molecule_id=['CHEMBL25', 'http://identifiers.org/chembl.compound/CHEMBL25', 'CHEMBL25', 'CHEMBL2', 'CHEMBL3'],
+            molecule_name=['ASPIRIN', 'ASPIRIN', 'ASPIRIN', 'IMATINIB', 'X'],
+            molecule_type=['Small molecule'] * 5,
+            target_id=['ENSG00000095303'] * 5,
+            disease_id=['EFO_0003767', 'EFO_0003767', 'EFO_0000270', 'EFO_0003767', 'EFO_0003767'],
+            phase=[2, 4.0, 3, 1, 9],
+            mechanism_of_action=['Cyclooxygenase inhibitor'] * 5,
+            action_type=['INHIBITOR'] * 5,
+            trial_url=['https://clinicaltrials.gov/a', 'https://clinicaltrials.gov/b', 'https://clinicaltrials.gov/a', None, 'u'])
+        lines = list(builder.lines(**columns))
+        # the first two rows are merged, the record without urls goes through the objects, phase 9 is unknown
+        assert len(lines) == 3 and builder.fallbacks == 1 and builder.rejected == [(3, 1)]
+        records, size = builder.prepare(columns, 5)
+        for i, line in enumerate(lines):
+            obj = builder.build_object(dict((name, values[i]) for name, values in records.items()))
+            assert line == stream.to_line(obj)
+            assert opentargets.Drug.fromDict(json.loads(line.decode('utf-8'))).validate(logger) == 0
+        first = json.loads(lines[0].decode('utf-8'))
+        assert [url['url'] for url in first['evidence']['drug2clinic']['urls']] == ['https://clinicaltrials.gov/a', 'https://clinicaltrials.gov/b']
+        assert first['evidence']['drug2clinic']['max_phase_for_disease'] == {'label': 'Phase IV', 'numeric_index': 4}
+        assert json.loads(lines[1].decode('utf-8'))['drug']['max_phase_for_all_diseases']['numeric_index'] == 4
+        # phases read from text files
+        builder = builders.DrugBuilder('chembl', '2018-01-01T00:00:00+00:00')
+        assert list(builder.lines(**dict(columns, phase=['2', '4.0', '3', '1', '9']))) == lines and builder.rejected == [(3, 1)]
+    _with_and_without_numpy(check, builders)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_expression_builder():
+    def check():
+        assert builders.format_numbers([0.5, 'NA', '', None, True, 2], minimum=0, maximum=1) == (['0.5', None, None, None, None, None], [True, False, False, False, False, False])
+        numeric_strings = (['0.25', '1.0', '0.001', None], [True, True, True, None])
+        assert builders.format_numbers(['0.25', ' 1 ', '1e-3', ''], minimum=0, maximum=1, required=False) == numeric_strings
+        values = [1.5, -4.0, float('nan'), 0.5, -1.5, 7]
+        assert builders.percentile_ranks(values) == [60, 80, None, 20, 60, 100]
+        assert builders.percentile_ranks(values, absolute=False) == [80, 20, None, 60, 40, 100]
+        assert builders.percentile_ranks([str(value) for value in values]) == [60, 80, None, 20, 60, 100]
+        builder = builders.ExpressionBuilder('expression_atlas', 'STUDYID_E-GEOD-25628', 'disease vs normal', '2018-01-01T00:00:00+00:00')
+        columns = dict(
+            gene_id=['ENSG00000157764'] * 4, efo_id=['EFO_0003767'] * 4, comparison_name=['disease vs normal'] * 4,
+            log2_fold_change=[1.5, -2.0, 'NA', 0.5], pvalue=[1e-5, 0.01, 0.02, 0.03],
+            test_sample=['disease'] * 4, reference_sample=['normal'] * 4,
+            test_replicates_n=[3, 3, 3, 0], reference_replicates_n=[3] * 4, confidence_level=['high', 'low', 'medium', 'medium'])
+        lines = list(builder.lines(**columns))
+        # no rank for a non-numeric fold change, which only rejects its row, no test replicate in the last row
+        assert len(lines) == 2 and builder.rejected == [(2, 1), (3, 1)]
+        records, size = builder.prepare(columns, 4)
+        for i, line in enumerate(lines):
+            obj = builder.build_object(dict((name, values[i]) for name, values in records.items()))
+            assert line == stream.to_line(obj)
+            assert opentargets.Expression.fromDict(json.loads(line.decode('utf-8'))).validate(logger) == 0
+        second = json.loads(lines[1].decode('utf-8'))
+        assert second['evidence']['log2_fold_change'] == {'value': -2.0, 'percentile_rank': 100}
+        assert second['target']['activity'] == 'http://identifiers.org/cttv.activity/decreased_transcript_level'
+    _with_and_without_numpy(check, builders)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_release_summary():
+    records = _evidence_dicts()
+    summary = sketches.ReleaseSummary(precision=10, width=256, top=3, compression=50)
+    summary.update(records)
+    report = summary.report(quantiles=(0.5,))
+    public = report['gwas_catalog']['genetic_association']
+    assert public['evidence'] == 3 and public['distinct_targets'] == 3 and public['distinct_diseases'] == 2
+    assert public['resource_score'][0.5] == records[2]['evidence']['variant2disease']['resource_score']['value']
+    # partial summaries of parallel workers merge into the same report
+    first = sketches.ReleaseSummary(precision=10, width=256, top=3, compression=50).update(records[:2])
+    second = sketches.ReleaseSummary(precision=10, width=256, top=3, compression=50).update(records[2:])
+    merged = pickle.loads(pickle.dumps(first)).merge(pickle.loads(pickle.dumps(second)))
+    assert merged.report(quantiles=(0.5,)) == report
+    hll = sketches.HyperLogLog(precision=12)
+    counts = sketches.CountMinSketch(width=512, top=2)
+    digest = sketches.TDigest()
+    for i in range(20000):
+        hll.add('ENSG%011d' % (i % 5000))
+        counts.add('ENSG%011d' % (i % 7 and i % 5000 or 1))
+        digest.add(i / 20000.0)
+    assert abs(hll.count() - 5000) < 5000 * 0.05
+    assert counts.heavy_hitters(1)[0][0] == 'ENSG00000000001' and counts.estimate('ENSG00000000001') >= 2861
+    assert abs(digest.quantile(0.99) - 0.99) < 0.005 and abs(digest.quantile(0.5) - 0.5) < 0.01
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_field_profiler():
+    assert ('max_phase_for_all_diseases', evidence_drug.Diseasephase, None) in model_fields.class_fields(bioentity.Drug)
+    records = [_evidence_dict(0, {'evidence.variant2disease.gwas_sample_size': 'large'}),
+               _evidence_dict(1, {'target.complex_members': ['ENSG00000157764']}),
+               _evidence_dict(2, {'literature': None})] + _evidence_dicts()[3:]
+    first = profiler.FieldProfiler().update(records[:3])
+    second = profiler.FieldProfiler().update(opentargets.Genetics.fromDict(record) for record in records[3:])
+    report = pickle.loads(pickle.dumps(first)).merge(second).report()
+    assert report['evidence.variant2disease.gwas_sample_size'] == {'parents': 5, 'present': 5, 'null': 0, 'mismatch': 1, 'coverage': 1.0}
+    assert report['target.complex_members']['present'] == 1 and report['target.complex_members']['coverage'] == 0.2
+    assert report['literature']['null'] == 1 and report['literature']['present'] == 0
+    assert report['access_level']['values'] == {'public': 4, 'private': 1}
+    # resource scores are profiled with the class matching their type
+    assert report['evidence.variant2disease.resource_score.type']['values'] == {'pvalue': 5}
+    assert report['evidence.gene2variant.provenance_type.database.version']['present'] == 5
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_validate_sample():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmp_dir, 'evidence.json')
+        with open(filename, 'wb') as f:
+            for record in _mixed_evidence(2000):
+                f.write(stream.to_line(record))
+        with open(filename, 'rb') as f, gzip.open(filename + '.gz', 'wb') as out:
+            out.write(f.read())
+        report = validator.validate_sample(filename + '.gz', n=400, seed=1)
+        assert report.method == 'reservoir' and report.lines == 2000 and report.sampled == 400
+        assert report.interval[0] < 0.25 < report.interval[1]
+        assert list(report.errors) == ["Base - root.access_level value is restricted to the fixed set of values '...','...' ('...' given)"]
+        report = validator.validate_sample(filename, n=400, seed=1)
+        assert report.method == 'seek' and report.sampled == 400 and abs(report.lines - 2000) < 100
+        assert report.interval[0] < 0.25 < report.interval[1]
+        # a sample larger than the file holds every line
+        report = validator.validate_sample(filename + '.gz', n=5000)
+        assert report.sampled == 2000 and report.error_rate == 0.25
+        # seeking is for files of more lines than the sample
+        report = validator.validate_sample(filename, n=5000)
+        assert report.method == 'reservoir' and report.sampled == 2000 and report.error_rate == 0.25
+        blank = os.path.join(tmp_dir, 'blank.json')
+        with open(blank, 'wb') as f:
+            f.write(b'\n' * 100000)
+        for method in ('auto', 'seek'):
+            report = validator.validate_sample(blank, n=10, method=method)
+            assert report.method == 'reservoir' and report.sampled == 0
+    finally:
+        shutil.rmtree(tmp_dir)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_checkpointed_validation():
+    lines = [stream.to_line(record) for record in _mixed_evidence(500)]
+    tmp_dir = tempfile.mkdtemp()
+    check_line = validator.check_line
+    try:
+        filename = os.path.join(tmp_dir, 'evidence.json.gz')
+        # several gzip members, as block gzip files are
+        with open(filename, 'wb') as f:
+            for i in range(0, 500, 60):
+                member = io.BytesIO()
+                with gzip.GzipFile(fileobj=member, mode='wb') as out:
+                    out.write(b''.join(lines[i:i + 60]))
+                f.write(member.getvalue())
+        expected = validator.validate_file(filename).serialize()
+        assert expected['lines'] == 500 and expected['invalid'] == 125 and expected['first_invalid'][:2] == [1, 5]
+        checkpoint = os.path.join(tmp_dir, 'evidence.checkpoint')
+        calls = []
+        def interrupted(line):
+            calls.append(line)
+            if len(calls) == 333:
+                raise KeyboardInterrupt()
+            return check_line(line)
+        validator.check_line = interrupted
+        try:
+            validator.validate_file(filename, checkpoint, every=50)
+        except KeyboardInterrupt:
+            pass
+        validator.check_line = check_line
+        saved = validator.load_checkpoint(checkpoint, filename)
+        assert saved.lines == 300 and not saved.complete
+        # the restart reads the remaining lines only
+        with stream.LineReader(filename, saved.position) as reader:
+            assert reader.readline() == lines[300]
+        assert validator.validate_file(filename, checkpoint, every=50).serialize() == expected
+        # a single member file drops the data before the position while seeking
+        single = os.path.join(tmp_dir, 'single.json.gz')
+        with gzip.open(single, 'wb') as f:
+            f.write(b''.join(lines))
+        with stream.LineReader(single) as reader:
+            for i in range(400):
+                reader.readline()
+            position = reader.tell()
+        chunk_size = stream.LineReader.chunk_size
+        stream.LineReader.chunk_size = 256
+        try:
+            with stream.LineReader(single, position) as reader:
+                assert len(reader._buffer) < len(b''.join(lines[:400]))
+                assert list(reader) == lines[400:]
+        finally:
+            stream.LineReader.chunk_size = chunk_size
+    finally:
+        validator.check_line = check_line
+        shutil.rmtree(tmp_dir)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_bgzf():
+    records = _mixed_evidence(3000)
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmp_dir, 'evidence.json.gz')
+        with bgzf.BgzfWriter(filename) as writer:
+            for i, record in enumerate(records):
+                writer.write(record if i % 4 == 0 else opentargets.Genetics.fromDict(record))
+        lines = [stream.to_line(record) for record in records]
+        # a plain gzip file to any gzip reader
+        with gzip.open(filename, 'rb') as f:
+            assert f.read() == b''.join(lines)
+        blocks = bgzf.read_index(filename)
+        assert len(blocks) > 4 and blocks == bgzf.build_index(filename)
+        # ranges hold every line once, whether blocks end on a line or not
+        data = b''.join(lines)
+        split = os.path.join(tmp_dir, 'split.json.gz')
+        with open(split, 'wb') as f:
+            for start in range(0, len(data), 40000):
+                f.write(bgzf.compress_block(data[start:start + 40000]))
+            f.write(bgzf.EOF_BLOCK)
+        for name in (filename, split):
+            for parts in (1, 3, 8):
+                ranges = bgzf.split_ranges(name, parts)
+                assert len(ranges) <= parts
+                assert [line for start, end in ranges for line in bgzf.read_range(name, start, end)] == lines
+        report = validator.validate_bgzf(split, processes=2)
+        assert report.serialize() == validator.validate_file(split).serialize()
+        assert report.invalid == 750 and report.first_invalid[:2] == [1, 5]
+        # the filter is sent to the processes and applied before parsing
+        where = filters.Filter('access_level == "secret"')
+        selected = [line for line in lines if b'"secret"' in line]
+        assert [line for start, end in bgzf.split_ranges(split, 3) for line in bgzf.read_range(split, start, end, where)] == selected
+        report = validator.validate_bgzf(split, processes=2, where=where)
+        assert report.lines == 750 and report.invalid == 750
+        assert validator.validate_bgzf(split, processes=2, where='access_level == "public"').invalid == 0
+    finally:
+        shutil.rmtree(tmp_dir)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_error_aggregator():
+    assert validator.classify("Target - root.target.id 'x' does not match pattern '^ENSG$'") == ('Target', 'root.target.id', 'pattern')
+    assert validator.classify("Genetics - root.evidence.urls[3].url is required") == ('Genetics', 'root.evidence.urls[].url', 'required')
+    assert validator.classify("Drug - row2.evidence.urls.12 should not be null") == ('Drug', 'row2.evidence.urls[]', 'null')
+    assert validator.classify("BaseExpert class instance expected for attribute - root.expert") == ('BaseExpert', 'root.expert', 'class')
+    assert validator.classify("invalid JSON: Expecting value") == (None, None, 'invalid JSON')
+    score = evidence_score.Pvalue(type='pvalue', value=2)
+    recorder = loggers.Recorder()
+    assert score.validate(recorder, path='root.evidence.resource_score') == 1
+    assert validator.classify(recorder.messages[0][1]) == ('Pvalue', 'root.evidence.resource_score.value', 'range')
+    assert validator.classify("Variant2Disease - root.evidence.variant2disease.gwas_sample_size: 0 should be greater than 0")[2] == 'minimum'
+    assert validator.classify("Schema - root.score: 3 should be lower than or equal to 1")[2] == 'maximum'
+    first, second = validator.ErrorAggregator(examples=2), validator.ErrorAggregator(examples=2)
+    for i in range(1, 101):
+        record = _secret_evidence(i)
+        obj = opentargets.Genetics.fromDict(record)
+        aggregator = first if i <= 60 else second
+        assert obj.validate(aggregator.logger(i if i <= 60 else i - 60, json.dumps(record))) > 0
+    merged = validator.ErrorAggregator.fromDict(json.loads(first.to_JSON()), examples=2).merge(second, line_offset=60)
+    report = merged.serialize()
+    assert [(group['path'], group['rule'], group['count']) for group in report['groups']] == [
+        ('root.access_level', 'enum', 100), ('root.sourceID', 'required', 10)]
+    enum = report['groups'][0]
+    assert enum['first_line'] == 1 and enum['last_line'] == 100 and len(enum['examples']) == 2
+    # bottom-k examples are those of a single aggregator over all the lines
+    whole = validator.ErrorAggregator(examples=2)
+    for i in range(1, 101):
+        record = _secret_evidence(i)
+        opentargets.Genetics.fromDict(record).validate(whole.logger(i, json.dumps(record)))
+    assert whole.serialize() == report
+    bounded = validator.ErrorAggregator(max_groups=1)
+    bounded.add(1, "Target - root.target.id is required")
+    bounded.add(2, "Disease - root.disease.id is required")
+    assert len(bounded.groups) == 1 and bounded.dropped == 1
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_change_tracking():
+    record = _evidence_dicts()[0]
+    plain = opentargets.Genetics.fromDict(record)
+    obj = tracking.track(opentargets.Genetics.fromDict(record))
+    assert tracking.is_tracked(obj) and tracking.is_tracked(obj.evidence.variant2disease)
+    serialized = obj.serialize()
+    assert obj.serialize() is serialized
+    assert obj.to_JSON(indentation=None) == plain.to_JSON(indentation=None)
+    # only the changed path is serialized again
+    evidence = serialized['evidence']
+    obj.disease.id = plain.disease.id = 'http://www.ebi.ac.uk/efo/EFO_0000999'
+    changed = obj.serialize()
+    assert changed is not serialized and changed['evidence'] is evidence
+    assert stream.to_line(obj) == stream.to_line(plain)
+    assert obj.to_JSON() == plain.to_JSON()
+    # in place changes of lists are marked with touch
+    for target in (obj, plain):
+        target.evidence.variant2disease.evidence_codes.append('http://purl.obolibrary.org/obo/ECO_0000205')
+    assert obj.to_JSON(indentation=None) != plain.to_JSON(indentation=None)
+    tracking.touch(obj.evidence.variant2disease)
+    assert obj.to_JSON(indentation=None) == plain.to_JSON(indentation=None)
+    # tracking is not pickled
+    copy = pickle.loads(pickle.dumps(obj))
+    assert type(copy) is opentargets.Genetics and copy.to_JSON() == plain.to_JSON()
+    assert type(tracking.untrack(obj).disease) is bioentity.Disease
+    # tracked graphs are freed with their objects
+    gc.collect()
+    before = len(tracking._states)
+    tracked = [tracking.track(opentargets.Genetics.fromDict(record)) for record in _evidence_dicts() * 20]
+    for item in tracked:
+        item.serialize()
+        item.disease.id = 'http://www.ebi.ac.uk/efo/EFO_0000999'
+    assert len(tracking._states) > before + 100
+    del tracked, item
+    gc.collect()
+    assert len(tracking._states) == before
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_incremental_validation():
+    record = _evidence_dicts()[0]
+    obj = tracking.track(opentargets.Genetics.fromDict(record))
+    log = validator.ErrorAggregator()
+    assert obj.validate(log.logger(1), incremental=True) == 0
+    assert tracking._states[obj.evidence].validated
+    obj.disease.id = 'EFO_0000999'
+    obj.access_level = 'secret'
+    # the unchanged evidence subtree keeps its outcome and is not checked again
+    assert tracking._states[obj.evidence].validated
+    assert not tracking._states[obj.disease].validated and not tracking._states[obj].validated
+    error = obj.validate(log.logger(2), incremental=True)
+    plain = opentargets.Genetics.fromDict(record)
+    plain.disease.id = 'EFO_0000999'
+    plain.access_level = 'secret'
+    full = validator.ErrorAggregator()
+    assert plain.validate(full.logger(2)) == error > 0
+    # replayed outcomes are logged again
+    replay = validator.ErrorAggregator()
+    assert obj.validate(replay.logger(2), incremental=True) == error
+    assert replay.serialize() == full.serialize() == validator.ErrorAggregator.fromDict(json.loads(log.to_JSON())).serialize()
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_views():
+    records = _evidence_dicts()
+    record = records[0]
+    obj = opentargets.Genetics.fromDict(record)
+    item = views.evidence_view(record)
+    assert isinstance(item, opentargets.Genetics) and not 'evidence' in vars(item)
+    assert item.evidence.variant2disease.resource_score.value == obj.evidence.variant2disease.resource_score.value
+    assert isinstance(item.disease, bioentity.Disease) and item.variant.type == 'snp single'
+    # untouched views give back the dict they wrap
+    assert item.serialize() is record
+    assert item.validate(logging.getLogger()) == obj.validate(logging.getLogger())
+    item.disease.id = obj.disease.id = 'http://www.ebi.ac.uk/efo/EFO_0000999'
+    assert item.serialize() is not record and record['disease']['id'] == 'http://www.ebi.ac.uk/efo/EFO_0000000'
+    assert item.to_JSON() == obj.to_JSON()
+    copy = pickle.loads(pickle.dumps(item))
+    assert copy.to_JSON() == obj.to_JSON()
+    assert views.view(bioentity.Target, 'x') is None and views.evidence_view({'type': 'unknown'}) is None
+    # union fields are read through the candidate of their type
+    ranked = _evidence_dict(1, {'evidence.gene2variant.resource_score': {'type': 'rank', 'position': 3, 'sample_size': 10},
+                                'evidence.variant2disease.resource_score': {'type': 'probability', 'value': 0.5}})
+    item = views.evidence_view(ranked)
+    score = item.evidence.gene2variant.resource_score
+    assert isinstance(score, evidence_score.Rank) and score.position == 3 and score.sample_size == 10
+    assert isinstance(item.evidence.variant2disease.resource_score, evidence_score.Probability)
+    assert item.serialize() is ranked and item.validate(logging.getLogger()) == opentargets.Genetics.fromDict(ranked).validate(logging.getLogger())
+    score.position = 4
+    assert item.serialize()['evidence']['gene2variant']['resource_score'] == {'type': 'rank', 'position': 4, 'sample_size': 10}
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, 'evidence.json')
+        with open(filename, 'wb') as f:
+            for record in records:
+                f.write(stream.to_line(record))
+        for item, record in zip(stream.read_evidence(filename, view=True), records):
+            assert item.serialize() == record and item.target.id == record['target']['id']
+    finally:
+        shutil.rmtree(tmpdir)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_compile_path():
+    def check():
+        records = _evidence_dicts()
+        objects = [opentargets.Genetics.fromDict(record) for record in records]
+        for path in ('evidence.variant2disease.resource_score.value', 'target.id', 'evidence.gene2variant.evidence_codes.0', 'evidence.urls.3.url', 'variant'):
+            getter = model_fields.compile_path(path)
+            assert getter is model_fields.compile_path(path) and getter.path == path
+            for record in records + objects + [None, {}]:
+                assert getter(record) == model_fields.get_field(record, path)
+        assert model_fields.compile_path('disease.name')(records[0], 'n/a') == 'n/a'
+        columns = model_fields.extract(records + objects[:1] + [{}], ['evidence.variant2disease.gwas_sample_size', 'disease.id'])
+        assert list(columns) == ['evidence.variant2disease.gwas_sample_size', 'disease.id']
+        sizes = columns['evidence.variant2disease.gwas_sample_size']
+        assert [record['evidence']['variant2disease']['gwas_sample_size'] for record in records[:1]] == list(sizes[:1])
+        assert columns['disease.id'][-1] is None and len(columns['disease.id']) == len(records) + 2
+        if model_fields.numpy is not None:
+            assert model_fields.numpy.isnan(sizes[-1]) and sizes.dtype == float
+        else:
+            assert sizes[-1] is None
+        assert model_fields.extract(records, 'evidence.variant2disease.gwas_sample_size', arrays=False)['evidence.variant2disease.gwas_sample_size'][-1] is not None
+    _with_and_without_numpy(check, model_fields)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_evidence_batch():
+    def check():
+        records = _evidence_dicts()
+        objects = [opentargets.Genetics.fromDict(record) for record in records]
+        batch = evidence_batch.EvidenceBatch(opentargets.Genetics, records[:3])
+        batch.extend(objects[3:])
+        assert len(batch) == len(records) and not batch.mismatches
+        for index, obj in enumerate(objects):
+            assert stream.to_line(batch.row(index)) == stream.to_line(obj)
+            assert batch[index].to_JSON() == obj.to_JSON()
+        scores = batch.column('evidence.variant2disease.resource_score.value')
+        assert list(scores) == [obj.evidence.variant2disease.resource_score.value for obj in objects]
+        assert batch.column('target.id') == [obj.target.id for obj in objects]
+        output = io.BytesIO()
+        assert batch.to_jsonl(output) == len(records)
+        assert output.getvalue() == b''.join(stream.to_line(obj) for obj in objects)
+        assert batch.validate(logging.getLogger()) == 0
+        # values not matching their field type are kept for validation
+        record = dict(records[0], disease='EFO_0000000', access_level=7)
+        invalid = evidence_batch.EvidenceBatch(opentargets.Genetics, [record])
+        assert invalid.row(0)['disease'] == 'EFO_0000000' and invalid.row(0)['access_level'] == 7
+        assert invalid.validate(logging.getLogger()) > 0
+    _with_and_without_numpy(check, model_fields, ranges)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_check_ranges():
+    def check():
+        records = _evidence_dicts()
+        assert ranges.check_ranges(records) == []
+        invalid = _evidence_dict(1, {'evidence.variant2disease.gwas_sample_size': 0,
+                                     'evidence.gene2variant.resource_score': {'type': 'rank', 'position': 0, 'sample_size': 'ten'}})
+        objects = [opentargets.Genetics.fromDict(record) for record in records[:1]] + [opentargets.Genetics.fromDict(invalid)]
+        recorder = loggers.Recorder()
+        violations = ranges.check_ranges([records[0], invalid] + objects, logger=recorder)
+        assert [(index, path) for index, path, message in violations] == [
+            (1, 'root.evidence.gene2variant.resource_score.position'), (1, 'root.evidence.gene2variant.resource_score.sample_size'),
+            (1, 'root.evidence.variant2disease.gwas_sample_size'), (3, 'root.evidence.gene2variant.resource_score.position'),
+            (3, 'root.evidence.gene2variant.resource_score.sample_size'), (3, 'root.evidence.variant2disease.gwas_sample_size')]
+        assert [message for level, message in recorder.messages] == [message for index, path, message in violations]
+        # same wording as the generated validate()
+        generated = loggers.Recorder()
+        objects[1].evidence.variant2disease.validate(generated, path='root.evidence.variant2disease')
+        assert violations[2][2] in [message for level, message in generated.messages]
+    _with_and_without_numpy(check, ranges)
+
+@with_setup(my_setup_function, my_teardown_function)
+def test_eco_bitsets():
+    registry = eco.CodeRegistry(['a', 'b'])
+    bits = registry.encode(['b', 'c'])
+    assert registry.uris == ['a', 'b', 'c'] and bits == 6 and registry.decode(bits) == ['b', 'c']
+    assert registry.is_canonical(['a', 'c']) and not registry.is_canonical(['c', 'a']) and not registry.is_canonical(['a', 'a'])
+    assert eco.has_any(bits, registry.encode(['a', 'b'])) and not eco.has_all(bits, registry.encode(['a', 'b']))
+    records = _evidence_dicts()
+    gwas = eco.ECO.encode(['http://identifiers.org/eco/GWAS'])
+    assert all(eco.has_any(eco.record_bits(record), gwas) for record in records)
+    assert eco.record_bits(opentargets.Genetics.fromDict(records[0])) == eco.record_bits(records[0])
+    assert eco.check_codes(records[0]) == 0
+    invalid = _evidence_dict(0, {'evidence.gene2variant.evidence_codes': ['http://purl.obolibrary.org/obo/ECO_0000205', 'http://identifiers.org/eco/GWAS']})
+    recorder, generated = loggers.Recorder(), loggers.Recorder()
+    assert eco.check_codes(invalid, logger=recorder) == 1
+    opentargets.Genetics.fromDict(invalid).validate(generated)
+    assert recorder.messages[0] in generated.messages
+    # batches hold enumerated arrays as bitsets and give the lists back
+    batch = evidence_batch.EvidenceBatch(opentargets.Genetics, records + [invalid])
+    codes = batch.bitsets('evidence.variant2disease.evidence_codes')
+    assert all(eco.has_any(bits, gwas) for bits in codes)
+    assert batch.row(len(records))['evidence']['gene2variant']['evidence_codes'] == invalid['evidence']['gene2variant']['evidence_codes']
+    assert stream.to_line(batch.row(0)) == stream.to_line(records[0])
+    # unknown codes are invalid, and the checks leave the registry as it is
+    size = len(eco.ECO)
+    unknown = _evidence_dict(0, {'evidence.variant2disease.evidence_codes': ['http://identifiers.org/eco/unknown_%d' % i for i in range(70)]})
+    assert eco.check_codes(unknown) == 70
+    assert eco.record_bits(unknown) == eco.ECO.lookup(unknown['evidence']['gene2variant']['evidence_codes'])
+    batch = evidence_batch.EvidenceBatch(opentargets.Genetics, [unknown] + records)
+    assert not isinstance(batch.bitsets('evidence.variant2disease.evidence_codes'), list)
+    assert batch.row(0)['evidence']['variant2disease']['evidence_codes'] == unknown['evidence']['variant2disease']['evidence_codes']
+    assert len(eco.ECO) == size and registry.lookup(['a', 'd']) == 1 and len(registry) == 3
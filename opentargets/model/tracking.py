@@ -0,0 +1,214 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import json
+import weakref
+import logging
+import threading
+import opentargets.model.loggers as loggers
+import opentargets.model.overlays as overlays
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+"""
+Cached serialization and validation of a tracked instance, empty when dirty
+"""
+class _State(object):
+  __slots__ = ('serialized', 'json', 'validated', 'parents', '__weakref__')
+
+  def __init__(self):
+    self.serialized = None
+    self.json = dict()
+    # path -> (number of errors, logged messages)
+    self.validated = dict()
+    # weak references, the parents holding their children already: strong
+    # ones would keep every tracked graph alive through _states
+    self.parents = []
+
+# kept out of the instance __dict__, which vars() based code such as
+# cache.structural_key walks
+_states = weakref.WeakKeyDictionary()
+# depth of the incremental validations in progress, nested validate() calls
+# of the generated classes not passing the flag down
+_incremental = threading.local()
+
+def _state(obj):
+  state = _states.get(obj)
+  if state is None:
+    state = _states[obj] = _State()
+  return state
+
+def _is_model(value):
+  return hasattr(value, 'serialize') and hasattr(type(value), 'cls_keys')
+
+def _invalidate(obj):
+  state = _states.get(obj)
+  if state is None:
+    return
+  state.serialized = None
+  state.json.clear()
+  state.validated.clear()
+  parents = [ref() for ref in state.parents]
+  state.parents = [ref for ref, parent in zip(state.parents, parents) if parent is not None]
+  for parent in parents:
+    if parent is not None:
+      _invalidate(parent)
+
+def _adopt(parent, value):
+  """
+  Track the model objects held by value, parent being invalidated with them
+  """
+  children = value if isinstance(value, list) else [value]
+  for child in children:
+    if _is_model(child):
+      track(child)
+      if not is_tracked(child):
+        continue
+      state = _state(child)
+      if not any(ref() is parent for ref in state.parents):
+        state.parents.append(weakref.ref(parent))
+
+def _tracked_setattr(self, name, value):
+  _tracked.base(type(self)).__setattr__(self, name, value)
+  _invalidate(self)
+  _adopt(self, value)
+
+def _tracked_delattr(self, name):
+  _tracked.base(type(self)).__delattr__(self, name)
+  _invalidate(self)
+
+def _tracked_serialize(self):
+  state = _state(self)
+  if state.serialized is None:
+    state.serialized = _tracked.base(type(self)).serialize(self)
+  return state.serialized
+
+def _tracked_to_JSON(self, indentation=4):
+  state = _state(self)
+  if not indentation in state.json:
+    serialized = self.serialize()
+    if indentation is None:
+      # composed from the cached JSON of the nested objects, as json.dumps(sort_keys=True) writes it
+      parts = []
+      for key in sorted(serialized):
+        value = getattr(self, key, None)
+        if _is_model(value) and type(value) in _tracked:
+          text = value.to_JSON(indentation=None)
+        elif isinstance(value, list) and value and all(_is_model(item) and type(item) in _tracked for item in value):
+          text = '[' + ', '.join(item.to_JSON(indentation=None) for item in value) + ']'
+        else:
+          text = json.dumps(serialized[key], sort_keys=True, check_circular=False)
+        parts.append(json.dumps(key) + ': ' + text)
+      state.json[indentation] = '{' + ', '.join(parts) + '}'
+    else:
+      state.json[indentation] = json.dumps(serialized, sort_keys=True, check_circular=False, indent=indentation)
+  return state.json[indentation]
+
+def _tracked_validate(self, logger, path = "root", incremental = False):
+  base = _tracked.base(type(self))
+  depth = getattr(_incremental, 'depth', 0)
+  if not (incremental or depth):
+    return base.validate(self, logger, path = path)
+  state = _state(self)
+  if path in state.validated:
+    error, messages = state.validated[path]
+    for level, message in messages:
+      getattr(logger, level)(message)
+    return error
+  tee = loggers.Tee(logger)
+  _incremental.depth = depth + 1
+  try:
+    error = base.validate(self, tee, path = path)
+  finally:
+    _incremental.depth = depth
+  state.validated[path] = (error, tee.messages)
+  return error
+
+def _tracked_reduce_ex(self, protocol):
+  # pickled as an untracked instance of the generated class
+  return _tracked.reduce(self)
+
+_tracked = overlays.Overlay({
+  '__setattr__': _tracked_setattr, '__delattr__': _tracked_delattr, 'serialize': _tracked_serialize,
+  'to_JSON': _tracked_to_JSON, 'validate': _tracked_validate, '__reduce_ex__': _tracked_reduce_ex})
+
+def tracked_class(cls):
+  """
+  :returns: the tracking subclass of a generated class
+  """
+  return _tracked.subclass(cls)
+
+def track(obj):
+  """
+  Opt an object graph into change tracking: obj and the model objects it
+  holds switch to a subclass of their class that caches serialize() and
+  to_JSON() output, assignments invalidating the cache of the assigned
+  instance and of the instances holding it, so that serializing again only
+  rebuilds the changed subtrees. Values assigned later are tracked too.
+  validate(logger, path, incremental=True) likewise replays the outcome of
+  the unchanged subtrees since their last validation at the same path and
+  only runs the checks of the changed instances and of their ancestors.
+  Cached dicts are shared between calls and with the cache of the holding
+  instances: they should not be modified, and in place changes of lists
+  (e.g. urls.append) should be followed by touch(). Instances overriding
+  assignment, such as shared flyweights, are left untracked.
+  :returns: obj
+  """
+  cls = type(obj)
+  if cls in _tracked:
+    return obj
+  if cls.__setattr__ is not object.__setattr__:
+    return obj
+  _tracked.switch(obj)
+  for name, value in list(obj.__dict__.items()):
+    _adopt(obj, value)
+  return obj
+
+def touch(obj):
+  """
+  Mark a tracked instance as changed, e.g. after a list it holds was changed in place
+  """
+  _invalidate(obj)
+  for value in list(obj.__dict__.values()):
+    _adopt(obj, value)
+
+def untrack(obj):
+  """
+  Switch obj and the model objects it holds back to their generated classes
+  :returns: obj
+  """
+  if not type(obj) in _tracked:
+    return obj
+  _tracked.restore(obj)
+  _states.pop(obj, None)
+  for value in list(obj.__dict__.values()):
+    for child in (value if isinstance(value, list) else [value]):
+      if _is_model(child):
+        untrack(child)
+  return obj
+
+def is_tracked(obj):
+  return type(obj) in _tracked
@@ -0,0 +1,574 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import re
+import json
+import math
+import random
+import logging
+import collections
+import six
+import opentargets.model.core as core
+import opentargets.model.stream as stream
+import opentargets.model.bgzf as bgzf
+import opentargets.model.loggers as loggers
+import opentargets.model.sketches as sketches
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+_QUOTED = re.compile("'[^']*'")
+
+_MESSAGE = re.compile(r"^([\w.]+) - (\S+?)('.*|:.*| .*)?$")
+_INSTANCE = re.compile(r"^([\w.]+) class instance expected for attribute - (\S+)$")
+_INDEX = re.compile(r"\[\d+\]|\.\d+(?=\.|\[|$)")
+_RULES = [
+  (' is required', 'required'),
+  (' should not be null', 'null'),
+  (' type should be', 'type'),
+  (' incorrect type', 'type'),
+  (' value is restricted to', 'enum'),
+  ('does not match pattern', 'pattern'),
+  # both bounds of a range are given in one message, whichever failed
+  (' and should be lower than', 'range'),
+  ('should be greater than', 'minimum'),
+  ('should be lower than', 'maximum'),
+  ('array should have elements of type', 'items'),
+  ('array should have at least', 'min_items'),
+  ('array should have at most', 'max_items'),
+  ('should have at least', 'min_length'),
+  ('should have at most', 'max_length'),
+]
+
+def classify(message):
+  """
+  Group key of a validation error message such as
+  "Target - root.target.id 'x' does not match pattern '...'"
+  :returns: tuple of (class name, field path with array indices as [], rule),
+  the class and path being None for messages about a whole line
+  """
+  match = _INSTANCE.match(message)
+  if match:
+    return (match.group(1), _INDEX.sub('[]', match.group(2)), 'class')
+  match = _MESSAGE.match(message)
+  if not match:
+    return (None, None, message.split(':', 1)[0][:100])
+  rest = match.group(3) or ''
+  for text, rule in _RULES:
+    if text in rest:
+      break
+  else:
+    rule = _QUOTED.sub("'...'", rest.strip(' :'))[:100]
+  return (match.group(1), _INDEX.sub('[]', match.group(2)), rule)
+
+class _LineLogger(loggers.Recorder):
+  """
+  Logger stand-in passing the errors of a line to an ErrorAggregator
+  """
+  def __init__(self, aggregator, line_number, line):
+    super(_LineLogger, self).__init__(levels = ('error',))
+    self.aggregator = aggregator
+    self.line_number = line_number
+    self.line = line
+
+  def handle(self, level, message):
+    self.aggregator.add(self.line_number, message, self.line)
+
+"""
+Bounded memory summary of the errors of a bulk validation
+"""
+class ErrorAggregator(object):
+  """
+  Errors are grouped by (class, field path, rule), see classify(); each
+  group keeps its count, first and last line numbers and a sample of
+  example messages. The sample keeps the examples of lowest hash of their
+  message and line content, or line number when the content is not given
+  (bottom-k): a uniform sample that does not depend on the order of the
+  lines, so that aggregators of parts of a file merge exactly. Errors of
+  groups beyond max_groups are only counted.
+  Arguments:
+  :param examples = number of example messages kept per group
+  :param max_groups = maximum number of groups
+  """
+  def __init__(self, examples = 5, max_groups = 10000):
+    self.examples = examples
+    self.max_groups = max_groups
+    self.groups = dict()
+    self.dropped = 0
+
+  def logger(self, line_number, line = None):
+    """
+    :returns: a logger to pass to validate(), adding its errors as those of line_number
+    """
+    return _LineLogger(self, line_number, line)
+
+  def add(self, line_number, message, line = None, count = 1):
+    """
+    Add an error message of a line, given by its number and optionally its content
+    """
+    key = classify(message)
+    group = self.groups.get(key)
+    if group is None:
+      if len(self.groups) >= self.max_groups:
+        self.dropped += count
+        return
+      group = self.groups[key] = {'count': 0, 'first_line': line_number, 'last_line': line_number, 'examples': []}
+    group['count'] += count
+    group['first_line'] = min(group['first_line'], line_number)
+    group['last_line'] = max(group['last_line'], line_number)
+    if line is None:
+      line = str(line_number)
+    if isinstance(line, six.text_type):
+      line = line.encode('utf-8')
+    self._sample(group, [(sketches.hash64(message.encode('utf-8') + b'\n' + line), line_number, message)])
+
+  def _sample(self, group, examples):
+    group['examples'] = sorted(set(group['examples'] + examples))[:self.examples]
+
+  def merge(self, other, line_offset = 0):
+    """
+    Add the groups of another aggregator, whose line numbers are shifted by line_offset
+    :returns: self
+    """
+    self.dropped += other.dropped
+    for key, theirs in other.groups.items():
+      examples = [(priority, line + line_offset, message) for priority, line, message in theirs['examples']]
+      group = self.groups.get(key)
+      if group is None:
+        if len(self.groups) >= self.max_groups:
+          self.dropped += theirs['count']
+          continue
+        self.groups[key] = {'count': theirs['count'], 'first_line': theirs['first_line'] + line_offset,
+                            'last_line': theirs['last_line'] + line_offset, 'examples': examples[:self.examples]}
+        continue
+      group['count'] += theirs['count']
+      group['first_line'] = min(group['first_line'], theirs['first_line'] + line_offset)
+      group['last_line'] = max(group['last_line'], theirs['last_line'] + line_offset)
+      self._sample(group, examples)
+    return self
+
+  def serialize(self):
+    classDict = collections.OrderedDict()
+    groups = []
+    for key in sorted(self.groups, key=lambda key: (-self.groups[key]['count'], tuple(str(k) for k in key))):
+      group = self.groups[key]
+      item = collections.OrderedDict()
+      item['class'], item['path'], item['rule'] = key
+      item['count'] = group['count']
+      item['first_line'] = group['first_line']
+      item['last_line'] = group['last_line']
+      item['examples'] = [[priority, line, message] for priority, line, message in group['examples']]
+      groups.append(item)
+    classDict['groups'] = groups
+    classDict['dropped'] = self.dropped
+    return classDict
+
+  @classmethod
+  def fromDict(cls, dict_obj, examples = 5, max_groups = 10000):
+    obj = cls(examples, max_groups)
+    obj.dropped = dict_obj.get('dropped', 0)
+    for item in dict_obj.get('groups', []):
+      obj.groups[(item['class'], item['path'], item['rule'])] = {
+        'count': item['count'], 'first_line': item['first_line'], 'last_line': item['last_line'],
+        'examples': [tuple(example) for example in item['examples']]}
+    return obj
+
+  def to_JSON(self, indentation=None):
+    return json.dumps(self.serialize(), check_circular=False, indent=indentation)
+
+def check_line(line):
+  """
+  Parse, build and validate one evidence line
+  :returns: list of error messages, empty when the line is valid
+  """
+  try:
+    record = json.loads(line.decode('utf-8') if isinstance(line, bytes) else line)
+  except ValueError as e:
+    return ["invalid JSON: {0}".format(e)]
+  collector = loggers.Recorder(levels = ('error',))
+  try:
+    obj = core.evidence_fromDict(record)
+    if obj is None:
+      return ["unknown evidence type or invalid evidence"]
+    if obj.validate(collector) == 0:
+      return []
+  except Exception as e:
+    # the generated code raises on some malformed values
+    collector.error("{0}: {1}".format(type(e).__name__, e))
+  return collector.errors() or ["invalid evidence"]
+
+def z_score(confidence):
+  """
+  :returns: the two-sided standard normal quantile of a confidence level, e.g. 1.96 for 0.95
+  """
+  low, high = 0.0, 10.0
+  for _ in range(60):
+    middle = (low + high) / 2
+    if math.erf(middle / math.sqrt(2)) < confidence:
+      low = middle
+    else:
+      high = middle
+  return (low + high) / 2
+
+def wilson_interval(rate, n, confidence = 0.95):
+  """
+  Wilson score interval of a proportion observed on n (possibly effective) trials
+  :returns: tuple of (lower, upper) bounds
+  """
+  if n <= 0:
+    return (0.0, 1.0)
+  z = z_score(confidence)
+  denominator = 1 + z * z / n
+  center = (rate + z * z / (2 * n)) / denominator
+  margin = z * math.sqrt(rate * (1 - rate) / n + z * z / (4 * n * n)) / denominator
+  return (max(0.0, center - margin), min(1.0, center + margin))
+
+def reservoir_sample(lines, n, rng = random):
+  """
+  Uniform sample of n non blank lines of an iterable, read once
+  :returns: tuple of (sampled lines, number of lines read)
+  """
+  sample = []
+  count = 0
+  for line in lines:
+    if not line.strip():
+      continue
+    count += 1
+    if len(sample) < n:
+      sample.append(line)
+    else:
+      index = rng.randrange(count)
+      if index < n:
+        sample[index] = line
+  return sample, count
+
+def seek_sample(f, size, n, rng = random, attempts = None):
+  """
+  Sample n lines of a seekable file by reading the line holding each of n
+  random byte offsets: a line is drawn with a probability proportional to
+  its length, which estimates weigh out with 1 / length. Offsets falling on
+  blank lines are drawn again, up to attempts offsets in all.
+  :returns: list of sampled lines, with replacement, shorter than n when attempts ran out
+  """
+  if attempts is None:
+    attempts = 10 * n + 100
+  sample = []
+  while len(sample) < n and attempts > 0:
+    attempts -= 1
+    offset = rng.randrange(size)
+    # back to the start of the line holding offset
+    start = offset
+    while start > 0:
+      step = min(start, 1 << 16)
+      f.seek(start - step)
+      block = f.read(step)
+      newline = block.rfind(b'\n')
+      if newline >= 0:
+        start = start - step + newline + 1
+        break
+      start -= step
+    f.seek(start)
+    line = f.readline()
+    if line.strip():
+      sample.append(line)
+  return sample
+
+def estimate_lines(f, size, block_size = 1 << 16):
+  """
+  Number of lines of a seekable file, from the mean line length of its first block
+  :returns: estimated number of lines, exact when the file fits in the block
+  """
+  f.seek(0)
+  block = f.read(block_size)
+  newlines = block.count(b'\n')
+  if len(block) >= size:
+    return newlines + (1 if block and not block.endswith(b'\n') else 0)
+  return int(size * max(newlines, 1) / len(block))
+
+def _is_gzip(filename):
+  with open(filename, 'rb') as f:
+    return f.read(2) == b'\x1f\x8b'
+
+"""
+Error rate estimate of an evidence file from a sample of its lines
+"""
+class SampleReport(object):
+  """
+  Arguments:
+  :param method = 'reservoir' or 'seek'
+  :param lines = number of lines of the file, estimated when seeking
+  :param sampled = number of lines validated
+  :param invalid = number of invalid lines in the sample
+  :param error_rate = estimated fraction of invalid lines
+  :param interval = confidence interval of error_rate
+  :param errors = dict of error message to its estimated fraction of lines
+  """
+  def __init__(self, method, lines, sampled, invalid, error_rate, interval, errors, confidence):
+    self.method = method
+    self.lines = lines
+    self.sampled = sampled
+    self.invalid = invalid
+    self.error_rate = error_rate
+    self.interval = interval
+    self.errors = errors
+    self.confidence = confidence
+
+  def serialize(self):
+    classDict = collections.OrderedDict()
+    classDict['method'] = self.method
+    classDict['lines'] = self.lines
+    classDict['sampled'] = self.sampled
+    classDict['invalid'] = self.invalid
+    classDict['error_rate'] = self.error_rate
+    classDict['confidence'] = self.confidence
+    classDict['interval'] = list(self.interval)
+    classDict['errors'] = self.errors
+    return classDict
+
+  def to_JSON(self, indentation=4):
+    return json.dumps(self.serialize(), sort_keys=True, check_circular=False, indent=indentation)
+
+def validate_sample(filename, n = 10000, method = 'auto', confidence = 0.95, seed = None):
+  """
+  Quick validation of an evidence file from a sample of its lines, built
+  and validated as in a full validation. Gzipped files are sampled in one
+  sequential pass with a reservoir; uncompressed files of more than n lines
+  can be sampled by seeking to random offsets, reading n lines only. A seek
+  sample missing lines, e.g. in a file of blank lines, is replaced by a
+  reservoir sample.
+  Arguments:
+  :param filename = JSON lines evidence file, optionally gzipped
+  :param n = sample size
+  :param method = 'reservoir', 'seek' or 'auto' (seek when the file is not compressed and holds more than n lines)
+  :param confidence = confidence level of the error rate interval
+  :param seed = random seed, for reproducible samples
+  :returns: SampleReport
+  """
+  rng = random.Random(seed)
+  compressed = _is_gzip(filename)
+  size = os.path.getsize(filename)
+  if not method in ('auto', 'reservoir', 'seek'):
+    raise ValueError("validate_sample - unknown method '{0}'".format(method))
+  if method == 'seek' and compressed:
+    raise ValueError("validate_sample - can not seek in compressed file {0}".format(filename))
+  if method == 'auto':
+    method = 'reservoir'
+    if not compressed and size > 0:
+      with open(filename, 'rb') as f:
+        if estimate_lines(f, size) > n:
+          method = 'seek'
+  if method == 'seek':
+    with open(filename, 'rb') as f:
+      sample = seek_sample(f, size, n, rng)
+    if len(sample) < n:
+      method = 'reservoir'
+    else:
+      weights = [1.0 / len(line) for line in sample]
+      # size over the (harmonic) mean line length
+      lines = int(round(size * sum(weights) / len(weights)))
+  if method == 'reservoir':
+    with stream.open_file(filename, 'rb') as f:
+      sample, lines = reservoir_sample(f, n, rng)
+    weights = [1.0] * len(sample)
+  total = sum(weights)
+  invalid = 0
+  invalid_weight = 0.0
+  errors = collections.defaultdict(float)
+  for line, weight in zip(sample, weights):
+    messages = check_line(line)
+    if messages:
+      invalid += 1
+      invalid_weight += weight
+      for message in set(_QUOTED.sub("'...'", message) for message in messages):
+        errors[message] += weight
+  rate = invalid_weight / total if total else 0.0
+  # Kish effective size of the weighted sample
+  effective = total * total / sum(w * w for w in weights) if weights else 0
+  return SampleReport(method, lines, len(sample), invalid, rate, wilson_interval(rate, effective, confidence),
+                      dict((message, weight / total) for message, weight in errors.items()), confidence)
+
+"""
+Outcome of the validation of a whole evidence file
+"""
+class FileReport(object):
+  """
+  Arguments:
+  :param filename = validated file
+  :param lines = number of lines read
+  :param valid = number of valid evidence lines
+  :param invalid = number of invalid evidence lines
+  :param errors = ErrorAggregator of the errors
+  :param first_invalid = line numbers of the first invalid lines
+  :param position = LineReader position after the last line read
+  :param complete = False while the file is being validated
+  """
+  max_first_invalid = 100
+
+  def __init__(self, filename, lines = 0, valid = 0, invalid = 0, errors = None, first_invalid = None, position = (0, 0), complete = False):
+    self.filename = filename
+    self.lines = lines
+    self.valid = valid
+    self.invalid = invalid
+    self.errors = errors if errors is not None else ErrorAggregator()
+    self.first_invalid = first_invalid or []
+    self.position = tuple(position)
+    self.complete = complete
+
+  def add(self, line_number, messages, line = None):
+    """
+    Count the outcome of the validation of a line, given by its number and optionally its content
+    """
+    if not messages:
+      self.valid += 1
+      return
+    self.invalid += 1
+    if len(self.first_invalid) < self.max_first_invalid:
+      self.first_invalid.append(line_number)
+    for message in messages:
+      self.errors.add(line_number, message, line)
+
+  def serialize(self):
+    classDict = collections.OrderedDict()
+    classDict['filename'] = self.filename
+    classDict['lines'] = self.lines
+    classDict['valid'] = self.valid
+    classDict['invalid'] = self.invalid
+    classDict['errors'] = self.errors.serialize()
+    classDict['first_invalid'] = self.first_invalid
+    classDict['position'] = list(self.position)
+    classDict['complete'] = self.complete
+    return classDict
+
+  def merge(self, other):
+    """
+    Append the report of the lines following those of this report
+    :returns: self
+    """
+    for line_number in other.first_invalid:
+      if len(self.first_invalid) < self.max_first_invalid:
+        self.first_invalid.append(self.lines + line_number)
+    self.errors.merge(other.errors, line_offset = self.lines)
+    self.lines += other.lines
+    self.valid += other.valid
+    self.invalid += other.invalid
+    self.position = other.position
+    return self
+
+  @classmethod
+  def fromDict(cls, dict_obj):
+    dict_obj = dict(dict_obj)
+    dict_obj['errors'] = ErrorAggregator.fromDict(dict_obj.get('errors') or {})
+    return cls(**dict_obj)
+
+  def to_JSON(self, indentation=4):
+    return json.dumps(self.serialize(), sort_keys=True, check_circular=False, indent=indentation)
+
+def _signature(filename):
+  stat = os.stat(filename)
+  return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+def load_checkpoint(checkpoint, filename):
+  """
+  :returns: the FileReport saved in checkpoint for filename, None when
+  there is none or when it was saved for another version of the file
+  """
+  if checkpoint is None or not os.path.exists(checkpoint):
+    return None
+  with open(checkpoint) as f:
+    saved = json.load(f)
+  if saved.get('input') != _signature(filename) or saved['report'].get('filename') != filename:
+    logger.warn("load_checkpoint - {0} does not match {1}, validating from the start".format(checkpoint, filename))
+    return None
+  return FileReport.fromDict(saved['report'])
+
+def save_checkpoint(checkpoint, report):
+  """
+  Atomically replace checkpoint with report
+  """
+  tmp = checkpoint + '.tmp'
+  with open(tmp, 'w') as f:
+    json.dump({'input': _signature(report.filename), 'report': report.serialize()}, f, sort_keys=True)
+  if os.name == 'nt' and os.path.exists(checkpoint):
+    os.remove(checkpoint)
+  os.rename(tmp, checkpoint)
+
+def validate_file(filename, checkpoint = None, every = 100000):
+  """
+  Validate every line of an evidence file, counting errors rather than
+  logging them. With a checkpoint file, the position, counters and partial
+  report are saved every so many lines and at the end, and a run restarted
+  after an interruption resumes from the last checkpoint: a plain file is
+  seeked to, a block gzip file is seeked to the block holding the position
+  (see stream.LineReader).
+  Arguments:
+  :param filename = JSON lines evidence file, optionally gzipped
+  :param checkpoint = path of the checkpoint file, None for no checkpoint
+  :param every = number of lines between checkpoints
+  :returns: FileReport
+  """
+  report = load_checkpoint(checkpoint, filename)
+  if report is None:
+    report = FileReport(filename)
+  elif report.complete:
+    return report
+  else:
+    logger.info("validate_file - resuming {0} at line {1}".format(filename, report.lines + 1))
+  with stream.LineReader(filename, report.position) as reader:
+    for line in reader:
+      report.lines += 1
+      if line.strip():
+        report.add(report.lines, check_line(line), line)
+      if checkpoint is not None and report.lines % every == 0:
+        report.position = reader.tell()
+        save_checkpoint(checkpoint, report)
+    report.position = reader.tell()
+  report.complete = True
+  if checkpoint is not None:
+    save_checkpoint(checkpoint, report)
+  return report
+
+def _validate_range(filename, start, end, where = None):
+  report = FileReport(filename)
+  for line in bgzf.read_range(filename, start, end, where):
+    report.lines += 1
+    if line.strip():
+      report.add(report.lines, check_line(line), line)
+  return report
+
+def validate_bgzf(filename, processes = None, where = None):
+  """
+  Validate a BGZF evidence file with a pool of processes, each one
+  decompressing, parsing and validating its own range of blocks
+  Arguments:
+  :param where = filters.Filter or filter expression string restricting the
+  validation to the lines it keeps, which are then the lines counted and numbered
+  :returns: FileReport
+  """
+  report = FileReport(filename)
+  for part in bgzf.map_ranges(_validate_range, filename, processes, where):
+    report.merge(part)
+  report.position = (os.path.getsize(filename), 0)
+  report.complete = True
+  return report
@@ -0,0 +1,147 @@
+'''
+Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute
+
+This software was developed as part of the Open Targets project. For more information please see: http://www.opentargets.org
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import logging
+import opentargets.model.core as core
+import opentargets.model.fields as fields
+import opentargets.model.overlays as overlays
+
+__author__ = "Gautier Koscielny"
+__copyright__ = "Copyright 2014-2018 Biogen, Celgene Corporation, EMBL - European Bioinformatics Institute, GlaxoSmithKline, Takeda Pharmaceutical Company and Wellcome Sanger Institute"
+__credits__ = ["Gautier Koscielny", "Samiul Hasan"]
+__license__ = "Apache 2.0"
+__version__ = "1.2.8"
+__maintainer__ = "Gautier Koscielny"
+__email__ = "gautierk@targetvalidation.org"
+__status__ = "Production"
+
+logger = logging.getLogger(__name__)
+
+def _candidate(kinds, value):
+  """
+  :returns: the candidate class of a union reading the dict value: the one
+  whose 'type' enum holds the 'type' of value, as ranges.plan selects it,
+  else the first one knowing every key of value, as fromDict keeps it
+  """
+  candidates = [(kind, dict((field[0], field[2]) for field in fields.class_fields(kind))) for kind in kinds if isinstance(kind, type)]
+  for candidate, enums in candidates:
+    if enums.get('type') and value.get('type') in enums['type']:
+      return candidate
+  for candidate, enums in candidates:
+    if all(key in enums for key in value):
+      return candidate
+  return candidates[0][0] if candidates else None
+
+def _wrap(kind, value):
+  """
+  :returns: value as read through a field of type kind, nested objects becoming views
+  """
+  if isinstance(kind, list):
+    if isinstance(value, list) and not kind[0] in fields.JSON_TYPES:
+      return [_wrap(kind[0], item) for item in value]
+    return value
+  if isinstance(kind, tuple):
+    if not isinstance(value, dict):
+      return None
+    kind = _candidate(kind, value)
+  if isinstance(kind, type):
+    return view(kind, value) if isinstance(value, dict) else None
+  return value
+
+def _clean(value):
+  if isinstance(value, list):
+    return all(_clean(item) for item in value)
+  if type(value) in _views:
+    return value._view_clean()
+  return True
+
+def _view_getattr(self, name):
+  kinds = type(self)._view_fields
+  if not name in kinds:
+    raise AttributeError("{0} has no attribute '{1}'".format(type(self).__name__, name))
+  value = _wrap(kinds[name], self.__dict__['_view_data'].get(name))
+  self.__dict__[name] = value
+  return value
+
+def _view_setattr(self, name, value):
+  self.__dict__[name] = value
+  self.__dict__['_view_touched'] = True
+
+def _view_delattr(self, name):
+  del self.__dict__[name]
+  self.__dict__['_view_touched'] = True
+
+def _view_clean(self):
+  if self.__dict__['_view_touched']:
+    return False
+  kinds = type(self)._view_fields
+  return all(_clean(value) for name, value in self.__dict__.items() if name in kinds)
+
+def _view_serialize(self):
+  if self._view_clean():
+    return self.__dict__['_view_data']
+  for name in type(self)._view_fields:
+    getattr(self, name)
+  return _views.base(type(self)).serialize(self)
+
+def _view_reduce_ex(self, protocol):
+  return (view, (_views.base(type(self)), self.serialize()))
+
+_views = overlays.Overlay({
+  '__getattr__': _view_getattr, '__setattr__': _view_setattr, '__delattr__': _view_delattr,
+  '_view_clean': _view_clean, 'serialize': _view_serialize, '__reduce_ex__': _view_reduce_ex},
+  lambda cls: {'_view_fields': dict((name, kind) for name, kind, enum in fields.class_fields(cls))})
+
+def view_class(cls):
+  """
+  :returns: the view subclass of a generated class
+  """
+  return _views.subclass(cls)
+
+def view(cls, dict_obj):
+  """
+  Read-only access to a parsed JSON dict through the attributes of a
+  generated class, without building the object graph: a field is read from
+  the dict when it is first accessed, nested objects becoming views in
+  turn. Views are instances of cls, so validate(), to_JSON() and the other
+  methods work as on fromDict objects. serialize() returns the wrapped dict
+  itself, unknown keys included, as long as no attribute of the view or of
+  its nested views was assigned; in place changes of lists read from a view
+  are not seen and should be made by assigning the attribute.
+  Arguments:
+  :param cls = generated class
+  :param dict_obj = parsed JSON dict, not copied
+  :returns: the view, None when dict_obj is not a dict
+  """
+  if not isinstance(dict_obj, dict):
+    logger.warn("{0} - DictType expected - {1} found\n".format(cls.__name__, type(dict_obj)))
+    return
+  obj = object.__new__(view_class(cls))
+  obj.__dict__['_view_data'] = dict_obj
+  obj.__dict__['_view_touched'] = False
+  return obj
+
+def evidence_view(dict_obj):
+  """
+  View of a raw evidence dict through the class matching its type
+  :returns: the view, None when the type is unknown or the dict is invalid
+  """
+  cls = core.EVIDENCE_CLASSES.get(dict_obj.get('type')) if isinstance(dict_obj, dict) else None
+  if cls is None:
+    logger.warn("evidence_view - unknown evidence type {0}".format(dict_obj.get('type') if isinstance(dict_obj, dict) else type(dict_obj)))
+    return
+  return view(cls, dict_obj)
@@ -37,6 +37,9 @@ setup(
               'nose>=1.3.4',
               'tox>=1.7.0',
               'wheel>=0.22.0'
+              ],
+          'fast': [
+              'numpy'
               ]}
 )
 